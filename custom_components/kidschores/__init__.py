@@ -5,9 +5,9 @@ Handles setting up the integration, including loading configuration entries,
 initializing data storage, and preparing the coordinator for data handling.
 
 Key Features:
-- Config entry setup and unload support.
+- Config entry setup and unload support, for any number of entries.
 - Coordinator initialization for data synchronization.
-- Storage management for persistent data handling.
+- Storage management for persistent data handling, one store per entry.
 """
 
 from __future__ import annotations
@@ -15,6 +15,7 @@ from __future__ import annotations
 import asyncio
 
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.exceptions import ConfigEntryNotReady
@@ -23,21 +24,30 @@ from .const import (
     DOMAIN,
     LOGGER,
     NOTIFICATION_EVENT,
-    STORAGE_KEY,
-    PLATFORMS,
 )
 from .coordinator import KidsChoresDataCoordinator
+from .entry_router import async_get_entry_router
 from .notification_action_handler import async_handle_notification_action
-from .storage_manager import KidsChoresStorageManager
+from .storage_manager import KidsChoresStorageManager, storage_key_for_entry
 from .services import async_setup_services, async_unload_services
 
+# Supported Platforms
+PLATFORMS = [
+    Platform.BUTTON,
+    Platform.CALENDAR,
+    Platform.SELECT,
+    Platform.SENSOR,
+]
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up the integration from a config entry."""
     LOGGER.info("Starting setup for KidsChores entry: %s", entry.entry_id)
 
     # Initialize the storage manager to handle persistent data.
-    storage_manager = KidsChoresStorageManager(hass, STORAGE_KEY)
+    storage_manager = KidsChoresStorageManager(
+        hass, storage_key_for_entry(entry.entry_id)
+    )
     # Initialize new file.
     await storage_manager.async_initialize()
 
@@ -57,20 +67,31 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "storage_manager": storage_manager,
     }
 
-    # Set up services required by the integration.
-    async_setup_services(hass)
+    # Route the entry's kids and chores to its coordinator. Services and the
+    # notification action listener are shared, so only the first entry sets them up.
+    router = async_get_entry_router(hass)
+    if router.async_add_entry(coordinator):
+        async_setup_services(hass)
+
+        # Listen for notification actions from the companion app.
+        router.shared_listeners.append(
+            hass.bus.async_listen(
+                NOTIFICATION_EVENT,
+                lambda event: asyncio.run_coroutine_threadsafe(
+                    async_handle_notification_action(hass, event), hass.loop
+                ),
+            )
+        )
+
+    # Start the background referential-integrity checks.
+    coordinator.integrity_checker.async_start()
+
+    # Keep cached authorization in step with Home Assistant user changes.
+    coordinator.auth_cache.async_start()
 
     # Forward the setup to supported platforms (sensors, buttons, etc.).
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    # Listen for notification actions from the companion app.
-    hass.bus.async_listen(
-        NOTIFICATION_EVENT,
-        lambda event: asyncio.run_coroutine_threadsafe(
-            async_handle_notification_action(hass, event), hass.loop
-        ),
-    )
-
     LOGGER.info("KidsChores setup complete for entry: %s", entry.entry_id)
     return True
 
@@ -89,10 +110,18 @@ async def async_unload_entry(hass, entry):
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
+        coordinator: KidsChoresDataCoordinator = hass.data[DOMAIN][entry.entry_id][
+            "coordinator"
+        ]
+        coordinator.integrity_checker.async_stop()
+        coordinator.auth_cache.async_stop()
         hass.data[DOMAIN].pop(entry.entry_id)
 
-        # Await service unloading
-        await async_unload_services(hass)
+        # The last entry takes the shared services and listeners with it
+        router = async_get_entry_router(hass)
+        if router.async_remove_entry(entry.entry_id):
+            router.async_stop_shared_listeners()
+            await async_unload_services(hass)
 
     return unload_ok
 
@@ -101,11 +130,10 @@ async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle removal of a config entry."""
     LOGGER.info("Removing KidsChores entry: %s", entry.entry_id)
 
-    # Safely check if data exists before attempting to access it
-    if DOMAIN in hass.data and entry.entry_id in hass.data[DOMAIN]:
-        storage_manager: KidsChoresStorageManager = hass.data[DOMAIN][entry.entry_id][
-            "storage_manager"
-        ]
-        await storage_manager.async_delete_storage()
+    # The entry is unloaded by now, so open its store by key to delete it
+    storage_manager = KidsChoresStorageManager(
+        hass, storage_key_for_entry(entry.entry_id)
+    )
+    await storage_manager.async_delete_storage()
 
     LOGGER.info("KidsChores entry data cleared: %s", entry.entry_id)
@@ -0,0 +1,96 @@
+# File: auth_cache.py
+"""Authorization cache for KidsChores services and buttons.
+
+Maps each Home Assistant user id to what it may do in KidsChores: whether the
+user is an admin, whether it is linked to a parent, and which kids it is
+linked to. The cache is built once from the auth store and the coordinator's
+kids and parents, so authorization checks are a dict lookup. It is dropped
+whenever kids or parents are synced from config and whenever Home Assistant
+adds, updates or removes a user.
+
+Features:
+- One auth store read per rebuild instead of one per service call or press.
+- Parent and kid links resolved without scanning the parents on each check.
+- Invalidated on KidsChores kid/parent changes and HA user changes.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Optional
+
+from homeassistant.auth import EVENT_USER_ADDED, EVENT_USER_REMOVED, EVENT_USER_UPDATED
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+
+if TYPE_CHECKING:
+    from .coordinator import KidsChoresDataCoordinator
+
+
+class KidsChoresAuthCache:
+    """Home Assistant user id => {name, is_admin, is_parent, kid_ids}, built lazily."""
+
+    def __init__(self, hass: HomeAssistant, coordinator: KidsChoresDataCoordinator):
+        """Initialize the authorization cache."""
+        self.hass = hass
+        self._coordinator = coordinator
+        self._access: Optional[dict[str, dict[str, Any]]] = None
+        self._unsubs: list[CALLBACK_TYPE] = []
+
+    @callback
+    def async_start(self) -> None:
+        """Drop the cache whenever Home Assistant users change."""
+        if not self._unsubs:
+            self._unsubs = [
+                self.hass.bus.async_listen(event_type, self._async_user_changed)
+                for event_type in (
+                    EVENT_USER_ADDED,
+                    EVENT_USER_UPDATED,
+                    EVENT_USER_REMOVED,
+                )
+            ]
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop listening for user changes."""
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs = []
+
+    @callback
+    def _async_user_changed(self, event: Event) -> None:
+        """Handle a Home Assistant user being added, updated or removed."""
+        self.invalidate()
+
+    @callback
+    def invalidate(self) -> None:
+        """Drop the cache; the next lookup rebuilds it."""
+        self._access = None
+
+    async def async_get(self, user_id: str) -> Optional[dict[str, Any]]:
+        """Return the access of a user, or None if the user does not exist."""
+        if self._access is None:
+            self._access = await self._async_build()
+        return self._access.get(user_id)
+
+    async def _async_build(self) -> dict[str, dict[str, Any]]:
+        """Build the access of every user from the auth store and kids/parents."""
+        access = {
+            user.id: {
+                "name": user.name or "",
+                "is_admin": user.is_admin,
+                "is_parent": False,
+                "kid_ids": set(),
+            }
+            for user in await self.hass.auth.async_get_users()
+        }
+
+        for parent_info in self._coordinator.parents_data.values():
+            user_access = access.get(parent_info.get("ha_user_id"))
+            if user_access:
+                user_access["is_parent"] = True
+
+        for kid_id, kid_info in self._coordinator.kids_data.items():
+            user_access = access.get(kid_info.get("ha_user_id"))
+            if user_access:
+                user_access["kid_ids"].add(kid_id)
+
+        return access
@@ -0,0 +1,95 @@
+# File: badge_index.py
+"""Sorted badge-threshold index for the KidsChores coordinator.
+
+Badges are grouped by the kid counter they are measured against and kept
+sorted by threshold, so award checks and badge sensors can bisect instead of
+scanning every badge.
+
+Features:
+- Badges reached by a counter value are a prefix of their ladder.
+- The next threshold above a point total is a single bisect.
+- The highest earned badge is resolved by rank, with id and name lookups.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from typing import Any, Optional
+
+from .const import (
+    BADGE_THRESHOLD_TYPE_CHORE_COUNT,
+    BADGE_THRESHOLD_TYPE_POINTS,
+    FREQUENCY_DAILY,
+)
+
+
+def badge_metric_field(badge_info: dict[str, Any]) -> Optional[str]:
+    """Return the kid field a badge threshold is measured against."""
+    threshold_type = badge_info.get("threshold_type", BADGE_THRESHOLD_TYPE_POINTS)
+    if threshold_type == BADGE_THRESHOLD_TYPE_POINTS:
+        return "points"
+    if threshold_type == BADGE_THRESHOLD_TYPE_CHORE_COUNT:
+        count_type = badge_info.get("chore_count_type", FREQUENCY_DAILY)
+        return f"completed_chores_{count_type}"
+    return None
+
+
+class KidsChoresBadgeIndex:
+    """Badges sorted by threshold, overall and per metric field."""
+
+    def __init__(self, badges_data: dict[str, Any]):
+        """Build the index from the coordinator's badge data."""
+        ordered = sorted(
+            badges_data.items(),
+            key=lambda item: item[1].get("threshold_value", 0),
+        )
+
+        self._thresholds = [info.get("threshold_value", 0) for _, info in ordered]
+        self._rank = {badge_id: rank for rank, (badge_id, _) in enumerate(ordered)}
+        self._by_name = {info.get("name"): badge_id for badge_id, info in ordered}
+
+        # Per-field ladders of (thresholds, badge_ids), both ascending.
+        self._ladders: dict[str, tuple[list[Any], list[str]]] = {}
+        for badge_id, info in ordered:
+            field = badge_metric_field(info)
+            if field is None:
+                continue
+            thresholds, badge_ids = self._ladders.setdefault(field, ([], []))
+            thresholds.append(info.get("threshold_value", 0))
+            badge_ids.append(badge_id)
+
+    @property
+    def metric_fields(self) -> list[str]:
+        """Return the kid fields that at least one badge is measured against."""
+        return list(self._ladders)
+
+    def ladder(self, field: str) -> tuple[list[Any], list[str]]:
+        """Return the ascending thresholds and badge ids for a metric field."""
+        return self._ladders.get(field, ([], []))
+
+    def badges_reached(self, field: str, value: float) -> list[str]:
+        """Return the ids of badges on a field whose threshold is at most value."""
+        thresholds, badge_ids = self.ladder(field)
+        return badge_ids[: bisect_right(thresholds, value)]
+
+    def next_threshold(self, value: float) -> Optional[Any]:
+        """Return the lowest badge threshold strictly above value, if any."""
+        position = bisect_right(self._thresholds, value)
+        if position < len(self._thresholds):
+            return self._thresholds[position]
+        return None
+
+    def badge_id_for_name(self, badge_name: str) -> Optional[str]:
+        """Return the badge id for a badge name."""
+        return self._by_name.get(badge_name)
+
+    def highest_badge_id(self, badge_names: list[str]) -> Optional[str]:
+        """Return the id of the highest-threshold badge among the given names."""
+        highest_id = None
+        for badge_name in badge_names:
+            badge_id = self._by_name.get(badge_name)
+            if badge_id is None:
+                continue
+            if highest_id is None or self._rank[badge_id] > self._rank[highest_id]:
+                highest_id = badge_id
+        return highest_id
@@ -26,12 +26,13 @@ from .const import (
     BUTTON_DISAPPROVE_REWARD_PREFIX,
     BUTTON_PENALTY_PREFIX,
     BUTTON_REWARD_PREFIX,
+    CONF_COMPACT_ENTITIES,
     CONF_POINTS_LABEL,
     DATA_PENDING_CHORE_APPROVALS,
-    DATA_PENDING_REWARD_APPROVALS,
     DEFAULT_BONUS_ICON,
     DEFAULT_CHORE_APPROVE_ICON,
     DEFAULT_CHORE_CLAIM_ICON,
+    DEFAULT_COMPACT_ENTITIES,
     DEFAULT_DISAPPROVE_ICON,
     DEFAULT_PENALTY_ICON,
     DEFAULT_POINTS_ADJUST_MINUS_ICON,
@@ -65,139 +66,143 @@ async def async_setup_entry(
     - Kid points adjustments (e.g., +1, -1, +10, -10, etc.)
     - Approve Reward Workflow
 
+    In compact mode only the points adjustment buttons are created.
     """
     data = hass.data[DOMAIN][entry.entry_id]
     coordinator: KidsChoresDataCoordinator = data["coordinator"]
 
     points_label = entry.options.get(CONF_POINTS_LABEL, DEFAULT_POINTS_LABEL)
+    compact = entry.options.get(CONF_COMPACT_ENTITIES, DEFAULT_COMPACT_ENTITIES)
 
     entities = []
 
-    # Create buttons for chores (Claim, Approve & Disapprove)
-    for chore_id, chore_info in coordinator.chores_data.items():
-        chore_name = chore_info.get("name", f"Chore {chore_id}")
-        assigned_kids_ids = chore_info.get("assigned_kids", [])
-
-        # If user defined an icon, use it; else fallback to default for chore claim
-        chore_claim_icon = chore_info.get("icon", DEFAULT_CHORE_CLAIM_ICON)
-        # For "approve," use a distinct icon
-        chore_approve_icon = chore_info.get("icon", DEFAULT_CHORE_APPROVE_ICON)
-
-        for kid_id in assigned_kids_ids:
-            kid_name = coordinator._get_kid_name_by_id(kid_id) or f"Kid {kid_id}"
-            # Claim Button
-            entities.append(
-                ClaimChoreButton(
-                    coordinator=coordinator,
-                    entry=entry,
-                    kid_id=kid_id,
-                    kid_name=kid_name,
-                    chore_id=chore_id,
-                    chore_name=chore_name,
-                    icon=chore_claim_icon,
+    # Compact mode drops the per-item buttons; the KidsChores services replace them
+    if not compact:
+        # Create buttons for chores (Claim, Approve & Disapprove)
+        for chore_id, chore_info in coordinator.chores_data.items():
+            chore_name = chore_info.get("name", f"Chore {chore_id}")
+            assigned_kids_ids = chore_info.get("assigned_kids", [])
+
+            # If user defined an icon, use it; else fallback to default for chore claim
+            chore_claim_icon = chore_info.get("icon", DEFAULT_CHORE_CLAIM_ICON)
+            # For "approve," use a distinct icon
+            chore_approve_icon = chore_info.get("icon", DEFAULT_CHORE_APPROVE_ICON)
+
+            for kid_id in assigned_kids_ids:
+                kid_name = coordinator._get_kid_name_by_id(kid_id) or f"Kid {kid_id}"
+                # Claim Button
+                entities.append(
+                    ClaimChoreButton(
+                        coordinator=coordinator,
+                        entry=entry,
+                        kid_id=kid_id,
+                        kid_name=kid_name,
+                        chore_id=chore_id,
+                        chore_name=chore_name,
+                        icon=chore_claim_icon,
+                    )
                 )
-            )
-            # Approve Button
-            entities.append(
-                ApproveChoreButton(
-                    coordinator=coordinator,
-                    entry=entry,
-                    kid_id=kid_id,
-                    kid_name=kid_name,
-                    chore_id=chore_id,
-                    chore_name=chore_name,
-                    icon=chore_approve_icon,
+                # Approve Button
+                entities.append(
+                    ApproveChoreButton(
+                        coordinator=coordinator,
+                        entry=entry,
+                        kid_id=kid_id,
+                        kid_name=kid_name,
+                        chore_id=chore_id,
+                        chore_name=chore_name,
+                        icon=chore_approve_icon,
+                    )
                 )
-            )
-            # Disapprove Button
-            entities.append(
-                DisapproveChoreButton(
-                    coordinator=coordinator,
-                    entry=entry,
-                    kid_id=kid_id,
-                    kid_name=kid_name,
-                    chore_id=chore_id,
-                    chore_name=chore_name,
+                # Disapprove Button
+                entities.append(
+                    DisapproveChoreButton(
+                        coordinator=coordinator,
+                        entry=entry,
+                        kid_id=kid_id,
+                        kid_name=kid_name,
+                        chore_id=chore_id,
+                        chore_name=chore_name,
+                    )
                 )
-            )
 
-    # Create reward buttons (Redeem, Approve & Disapprove)
-    for kid_id, kid_info in coordinator.kids_data.items():
-        kid_name = kid_info.get("name", f"Kid {kid_id}")
-        for reward_id, reward_info in coordinator.rewards_data.items():
-            # If no user-defined icon, fallback to DEFAULT_REWARD_ICON
-            reward_icon = reward_info.get("icon", DEFAULT_REWARD_ICON)
-            # Redeem Reward Button
-            entities.append(
-                RewardButton(
-                    coordinator=coordinator,
-                    entry=entry,
-                    kid_id=kid_id,
-                    kid_name=kid_name,
-                    reward_id=reward_id,
-                    reward_name=reward_info.get("name", f"Reward {reward_id}"),
-                    icon=reward_icon,
+        # Create reward buttons (Redeem, Approve & Disapprove)
+        for kid_id, kid_info in coordinator.kids_data.items():
+            kid_name = kid_info.get("name", f"Kid {kid_id}")
+            for reward_id, reward_info in coordinator.rewards_data.items():
+                # If no user-defined icon, fallback to DEFAULT_REWARD_ICON
+                reward_icon = reward_info.get("icon", DEFAULT_REWARD_ICON)
+                # Redeem Reward Button
+                entities.append(
+                    RewardButton(
+                        coordinator=coordinator,
+                        entry=entry,
+                        kid_id=kid_id,
+                        kid_name=kid_name,
+                        reward_id=reward_id,
+                        reward_name=reward_info.get("name", f"Reward {reward_id}"),
+                        icon=reward_icon,
+                    )
                 )
-            )
-            # Approve Reward Button
-            entities.append(
-                ApproveRewardButton(
-                    coordinator=coordinator,
-                    entry=entry,
-                    kid_id=kid_id,
-                    kid_name=kid_name,
-                    reward_id=reward_id,
-                    reward_name=reward_info.get("name", f"Reward {reward_id}"),
-                    icon=reward_info.get("icon", DEFAULT_REWARD_ICON),
+                # Approve Reward Button
+                entities.append(
+                    ApproveRewardButton(
+                        coordinator=coordinator,
+                        entry=entry,
+                        kid_id=kid_id,
+                        kid_name=kid_name,
+                        reward_id=reward_id,
+                        reward_name=reward_info.get("name", f"Reward {reward_id}"),
+                        icon=reward_info.get("icon", DEFAULT_REWARD_ICON),
+                    )
                 )
-            )
-            # Disapprove Reward Button
-            entities.append(
-                DisapproveRewardButton(
-                    coordinator=coordinator,
-                    entry=entry,
-                    kid_id=kid_id,
-                    kid_name=kid_name,
-                    reward_id=reward_id,
-                    reward_name=reward_info.get("name", f"Reward {reward_id}"),
+                # Disapprove Reward Button
+                entities.append(
+                    DisapproveRewardButton(
+                        coordinator=coordinator,
+                        entry=entry,
+                        kid_id=kid_id,
+                        kid_name=kid_name,
+                        reward_id=reward_id,
+                        reward_name=reward_info.get("name", f"Reward {reward_id}"),
+                    )
                 )
-            )
 
-    # Create penalty buttons
-    for kid_id, kid_info in coordinator.kids_data.items():
-        kid_name = kid_info.get("name", f"Kid {kid_id}")
-        for penalty_id, penalty_info in coordinator.penalties_data.items():
-            # If no user-defined icon, fallback to DEFAULT_PENALTY_ICON
-            penalty_icon = penalty_info.get("icon", DEFAULT_PENALTY_ICON)
-            entities.append(
-                PenaltyButton(
-                    coordinator=coordinator,
-                    entry=entry,
-                    kid_id=kid_id,
-                    kid_name=kid_name,
-                    penalty_id=penalty_id,
-                    penalty_name=penalty_info.get("name", f"Penalty {penalty_id}"),
-                    icon=penalty_icon,
+        # Create penalty buttons
+        for kid_id, kid_info in coordinator.kids_data.items():
+            kid_name = kid_info.get("name", f"Kid {kid_id}")
+            for penalty_id, penalty_info in coordinator.penalties_data.items():
+                # If no user-defined icon, fallback to DEFAULT_PENALTY_ICON
+                penalty_icon = penalty_info.get("icon", DEFAULT_PENALTY_ICON)
+                entities.append(
+                    PenaltyButton(
+                        coordinator=coordinator,
+                        entry=entry,
+                        kid_id=kid_id,
+                        kid_name=kid_name,
+                        penalty_id=penalty_id,
+                        penalty_name=penalty_info.get("name", f"Penalty {penalty_id}"),
+                        icon=penalty_icon,
+                    )
                 )
-            )
 
-    # Create bonus buttons
-    for kid_id, kid_info in coordinator.kids_data.items():
-        kid_name = kid_info.get("name", f"Kid {kid_id}")
-        for bonus_id, bonus_info in coordinator.bonuses_data.items():
-            # If no user-defined icon, fallback to DEFAULT_BONUS_ICON
-            bonus_icon = bonus_info.get("icon", DEFAULT_BONUS_ICON)
-            entities.append(
-                BonusButton(
-                    coordinator=coordinator,
-                    entry=entry,
-                    kid_id=kid_id,
-                    kid_name=kid_name,
-                    bonus_id=bonus_id,
-                    bonus_name=bonus_info.get("name", f"Bonus {bonus_id}"),
-                    icon=bonus_icon,
+        # Create bonus buttons
+        for kid_id, kid_info in coordinator.kids_data.items():
+            kid_name = kid_info.get("name", f"Kid {kid_id}")
+            for bonus_id, bonus_info in coordinator.bonuses_data.items():
+                # If no user-defined icon, fallback to DEFAULT_BONUS_ICON
+                bonus_icon = bonus_info.get("icon", DEFAULT_BONUS_ICON)
+                entities.append(
+                    BonusButton(
+                        coordinator=coordinator,
+                        entry=entry,
+                        kid_id=kid_id,
+                        kid_name=kid_name,
+                        bonus_id=bonus_id,
+                        bonus_name=bonus_info.get("name", f"Bonus {bonus_id}"),
+                        icon=bonus_icon,
+                    )
                 )
-            )
 
     # Create "points adjustment" buttons for each kid (±1, ±2, ±10, etc.)
     POINT_DELTAS = [+1, -1, +2, -2, +10, -10]
@@ -265,7 +270,8 @@ class ClaimChoreButton(CoordinatorEntity, ButtonEntity):
             user_obj = await self.hass.auth.async_get_user(user_id) if user_id else None
             user_name = user_obj.name if user_obj else "Unknown"
 
-            self.coordinator.claim_chore(
+            await self.coordinator.command_queue.async_submit(
+                self.coordinator.claim_chore,
                 kid_id=self._kid_id,
                 chore_id=self._chore_id,
                 user_name=user_name,
@@ -276,7 +282,7 @@ class ClaimChoreButton(CoordinatorEntity, ButtonEntity):
                 self._kid_name,
                 user_name,
             )
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_request_refresh_if_needed()
 
         except HomeAssistantError as e:
             LOGGER.error(
@@ -346,7 +352,10 @@ class ApproveChoreButton(CoordinatorEntity, ButtonEntity):
         try:
             user_id = self._context.user_id if self._context else None
             if user_id and not await is_user_authorized_for_global_action(
-                self.hass, user_id, "approve_chore"
+                self.hass,
+                user_id,
+                "approve_chore",
+                entry_id=self.coordinator.config_entry.entry_id,
             ):
                 raise HomeAssistantError(
                     ERROR_NOT_AUTHORIZED_ACTION_FMT.format("approve chores")
@@ -355,7 +364,8 @@ class ApproveChoreButton(CoordinatorEntity, ButtonEntity):
             user_obj = await self.hass.auth.async_get_user(user_id) if user_id else None
             parent_name = user_obj.name if user_obj else "ParentOrAdmin"
 
-            self.coordinator.approve_chore(
+            await self.coordinator.command_queue.async_submit(
+                self.coordinator.approve_chore,
                 parent_name=parent_name,
                 kid_id=self._kid_id,
                 chore_id=self._chore_id,
@@ -365,7 +375,7 @@ class ApproveChoreButton(CoordinatorEntity, ButtonEntity):
                 self._chore_name,
                 self._kid_name,
             )
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_request_refresh_if_needed()
 
         except HomeAssistantError as e:
             LOGGER.error(
@@ -435,7 +445,7 @@ class DisapproveChoreButton(CoordinatorEntity, ButtonEntity):
         """Handle the button press event."""
         try:
             # Check if there's a pending approval for this kid and chore.
-            pending_approvals = self.coordinator._data.get(
+            pending_approvals = self.coordinator.engine.data.get(
                 DATA_PENDING_CHORE_APPROVALS, []
             )
             if not any(
@@ -449,7 +459,10 @@ class DisapproveChoreButton(CoordinatorEntity, ButtonEntity):
 
             user_id = self._context.user_id if self._context else None
             if user_id and not await is_user_authorized_for_global_action(
-                self.hass, user_id, "disapprove_chore"
+                self.hass,
+                user_id,
+                "disapprove_chore",
+                entry_id=self.coordinator.config_entry.entry_id,
             ):
                 raise HomeAssistantError(
                     ERROR_NOT_AUTHORIZED_ACTION_FMT.format("disapprove chores")
@@ -458,7 +471,8 @@ class DisapproveChoreButton(CoordinatorEntity, ButtonEntity):
             user_obj = await self.hass.auth.async_get_user(user_id) if user_id else None
             parent_name = user_obj.name if user_obj else "ParentOrAdmin"
 
-            self.coordinator.disapprove_chore(
+            await self.coordinator.command_queue.async_submit(
+                self.coordinator.disapprove_chore,
                 parent_name=parent_name,
                 kid_id=self._kid_id,
                 chore_id=self._chore_id,
@@ -469,7 +483,7 @@ class DisapproveChoreButton(CoordinatorEntity, ButtonEntity):
                 self._kid_name,
                 parent_name,
             )
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_request_refresh_if_needed()
 
         except HomeAssistantError as e:
             LOGGER.error(
@@ -550,7 +564,8 @@ class RewardButton(CoordinatorEntity, ButtonEntity):
             user_obj = await self.hass.auth.async_get_user(user_id) if user_id else None
             parent_name = user_obj.name if user_obj else "Unknown"
 
-            self.coordinator.redeem_reward(
+            await self.coordinator.command_queue.async_submit(
+                self.coordinator.redeem_reward,
                 parent_name=parent_name,
                 kid_id=self._kid_id,
                 reward_id=self._reward_id,
@@ -561,7 +576,7 @@ class RewardButton(CoordinatorEntity, ButtonEntity):
                 self._kid_name,
                 parent_name,
             )
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_request_refresh_if_needed()
 
         except HomeAssistantError as e:
             LOGGER.error(
@@ -634,7 +649,10 @@ class ApproveRewardButton(CoordinatorEntity, ButtonEntity):
         try:
             user_id = self._context.user_id if self._context else None
             if user_id and not await is_user_authorized_for_global_action(
-                self.hass, user_id, "approve_reward"
+                self.hass,
+                user_id,
+                "approve_reward",
+                entry_id=self.coordinator.config_entry.entry_id,
             ):
                 raise HomeAssistantError(
                     ERROR_NOT_AUTHORIZED_ACTION_FMT.format("approve rewards")
@@ -644,7 +662,8 @@ class ApproveRewardButton(CoordinatorEntity, ButtonEntity):
             parent_name = user_obj.name if user_obj else "ParentOrAdmin"
 
             # Approve the reward
-            self.coordinator.approve_reward(
+            await self.coordinator.command_queue.async_submit(
+                self.coordinator.approve_reward,
                 parent_name=parent_name,
                 kid_id=self._kid_id,
                 reward_id=self._reward_id,
@@ -656,7 +675,7 @@ class ApproveRewardButton(CoordinatorEntity, ButtonEntity):
                 self._kid_name,
                 parent_name,
             )
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_request_refresh_if_needed()
 
         except HomeAssistantError as e:
             LOGGER.error(
@@ -740,13 +759,8 @@ class DisapproveRewardButton(CoordinatorEntity, ButtonEntity):
         """Handle the button press event."""
         try:
             # Check if there's a pending approval for this kid and reward.
-            pending_approvals = self.coordinator._data.get(
-                DATA_PENDING_REWARD_APPROVALS, []
-            )
-            if not any(
-                approval["kid_id"] == self._kid_id
-                and approval["reward_id"] == self._reward_id
-                for approval in pending_approvals
+            if not self.coordinator.get_pending_reward_count(
+                self._kid_id, self._reward_id
             ):
                 raise HomeAssistantError(
                     f"No pending approval found for reward '{self._reward_name}' for kid '{self._kid_name}'."
@@ -754,7 +768,10 @@ class DisapproveRewardButton(CoordinatorEntity, ButtonEntity):
 
             user_id = self._context.user_id if self._context else None
             if user_id and not await is_user_authorized_for_global_action(
-                self.hass, user_id, "disapprove_reward"
+                self.hass,
+                user_id,
+                "disapprove_reward",
+                entry_id=self.coordinator.config_entry.entry_id,
             ):
                 raise HomeAssistantError(
                     ERROR_NOT_AUTHORIZED_ACTION_FMT.format("disapprove rewards")
@@ -763,7 +780,8 @@ class DisapproveRewardButton(CoordinatorEntity, ButtonEntity):
             user_obj = await self.hass.auth.async_get_user(user_id) if user_id else None
             parent_name = user_obj.name if user_obj else "ParentOrAdmin"
 
-            self.coordinator.disapprove_reward(
+            await self.coordinator.command_queue.async_submit(
+                self.coordinator.disapprove_reward,
                 parent_name=parent_name,
                 kid_id=self._kid_id,
                 reward_id=self._reward_id,
@@ -774,7 +792,7 @@ class DisapproveRewardButton(CoordinatorEntity, ButtonEntity):
                 self._kid_name,
                 parent_name,
             )
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_request_refresh_if_needed()
 
         except HomeAssistantError as e:
             LOGGER.error(
@@ -850,7 +868,10 @@ class PenaltyButton(CoordinatorEntity, ButtonEntity):
         try:
             user_id = self._context.user_id if self._context else None
             if user_id and not await is_user_authorized_for_global_action(
-                self.hass, user_id, "apply_penalty"
+                self.hass,
+                user_id,
+                "apply_penalty",
+                entry_id=self.coordinator.config_entry.entry_id,
             ):
                 raise HomeAssistantError(
                     ERROR_NOT_AUTHORIZED_ACTION_FMT.format("apply penalties")
@@ -859,7 +880,8 @@ class PenaltyButton(CoordinatorEntity, ButtonEntity):
             user_obj = await self.hass.auth.async_get_user(user_id) if user_id else None
             parent_name = user_obj.name if user_obj else "Unknown"
 
-            self.coordinator.apply_penalty(
+            await self.coordinator.command_queue.async_submit(
+                self.coordinator.apply_penalty,
                 parent_name=parent_name,
                 kid_id=self._kid_id,
                 penalty_id=self._penalty_id,
@@ -870,7 +892,7 @@ class PenaltyButton(CoordinatorEntity, ButtonEntity):
                 self._kid_name,
                 parent_name,
             )
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_request_refresh_if_needed()
 
         except HomeAssistantError as e:
             LOGGER.error(
@@ -959,25 +981,28 @@ class PointsAdjustButton(CoordinatorEntity, ButtonEntity):
         try:
             user_id = self._context.user_id if self._context else None
             if user_id and not await is_user_authorized_for_global_action(
-                self.hass, user_id, "adjust_points"
+                self.hass,
+                user_id,
+                "adjust_points",
+                entry_id=self.coordinator.config_entry.entry_id,
             ):
                 raise HomeAssistantError(
                     ERROR_NOT_AUTHORIZED_ACTION_FMT.format("adjust points")
                 )
 
-            current_points = self.coordinator.kids_data[self._kid_id]["points"]
-            new_points = current_points + self._delta
-            self.coordinator.update_kid_points(
+            # Deltas (not absolute totals) are queued so rapid presses coalesce
+            await self.coordinator.command_queue.async_submit(
+                self.coordinator.adjust_kid_points,
                 kid_id=self._kid_id,
-                new_points=new_points,
+                delta=self._delta,
             )
             LOGGER.info(
                 "Adjusted points for kid '%s' by %d => total %d",
                 self._kid_name,
                 self._delta,
-                new_points,
+                self.coordinator.kids_data[self._kid_id]["points"],
             )
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_request_refresh_if_needed()
 
         except HomeAssistantError as e:
             LOGGER.error(
@@ -1036,7 +1061,10 @@ class BonusButton(CoordinatorEntity, ButtonEntity):
         try:
             user_id = self._context.user_id if self._context else None
             if user_id and not await is_user_authorized_for_global_action(
-                self.hass, user_id, "apply_bonus"
+                self.hass,
+                user_id,
+                "apply_bonus",
+                entry_id=self.coordinator.config_entry.entry_id,
             ):
                 raise HomeAssistantError(
                     ERROR_NOT_AUTHORIZED_ACTION_FMT.format("apply bonus")
@@ -1045,7 +1073,8 @@ class BonusButton(CoordinatorEntity, ButtonEntity):
             user_obj = await self.hass.auth.async_get_user(user_id) if user_id else None
             parent_name = user_obj.name if user_obj else "Unknown"
 
-            self.coordinator.apply_bonus(
+            await self.coordinator.command_queue.async_submit(
+                self.coordinator.apply_bonus,
                 parent_name=parent_name,
                 kid_id=self._kid_id,
                 bonus_id=self._bonus_id,
@@ -1056,7 +1085,7 @@ class BonusButton(CoordinatorEntity, ButtonEntity):
                 self._kid_name,
                 parent_name,
             )
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_request_refresh_if_needed()
 
         except HomeAssistantError as e:
             LOGGER.error(
@@ -156,7 +156,7 @@ class KidsChoresCalendarEntity(CalendarEntity):
                     gen_start = window_start
                     gen_end = min(
                         window_end,
-                        dt_util.as_local(datetime.datetime.now() + FOREVER_DURATION),
+                        dt_util.as_local(self.coordinator.now() + FOREVER_DURATION),
                     )
                     current = gen_start
                     while current <= gen_end:
@@ -262,7 +262,7 @@ class KidsChoresCalendarEntity(CalendarEntity):
 
         # --- Recurring chores without a due_date => next 3 months
         gen_start = window_start
-        future_limit = dt_util.as_local(datetime.datetime.now() + FOREVER_DURATION)
+        future_limit = dt_util.as_local(self.coordinator.now() + FOREVER_DURATION)
         cutoff = min(window_end, future_limit)
 
         if recurring == FREQUENCY_DAILY:
@@ -429,7 +429,7 @@ class KidsChoresCalendarEntity(CalendarEntity):
         Return a single "current" event (chore or challenge) if one is active now (±1h).
         Otherwise None.
         """
-        now = dt_util.as_local(datetime.datetime.utcnow())
+        now = dt_util.as_local(self.coordinator.now())
         window_start = now - datetime.timedelta(hours=1)
         window_end = now + datetime.timedelta(hours=1)
         all_events = self._generate_all_events(window_start, window_end)
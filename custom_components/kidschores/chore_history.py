@@ -0,0 +1,93 @@
+# File: chore_history.py
+"""Per-chore daily completion history for the KidsChores coordinator.
+
+Each kid keeps, per chore, a bitmap of the days the chore was approved:
+bit n is set when the chore was done n days before the bitmap's last day.
+Advancing a day is a single shift, and bits older than CHORE_HISTORY_DAYS are
+masked off. The bitmap is stored as a hex string, since it outgrows the 64-bit
+integers JSON storage can hold, so a chore costs about a byte of history per
+four days.
+
+Features:
+- Approvals mark their counting day; repeated approvals on a day are no-ops.
+- Completion rate and gaps over a date range from one shift and mask.
+- Completed days listed in chronological order.
+- Bitmaps stored as hex strings; integers from older versions still read.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import Any
+
+from .const import CHORE_HISTORY_DAYS
+
+HISTORY_MASK = (1 << CHORE_HISTORY_DAYS) - 1
+
+
+def bitmap_to_str(bits: int) -> str:
+    """Return a bitmap in its stored form, a hex string."""
+    return format(bits, "x")
+
+
+def bitmap_from_str(value: Any) -> int:
+    """Return a stored bitmap as an integer; older data stored plain integers."""
+    if isinstance(value, str):
+        return int(value, 16)
+    return value or 0
+
+
+class KidsChoresChoreHistory:
+    """A kid's completion bitmap for one chore, anchored on its last day ordinal."""
+
+    def __init__(self, history_data: dict[str, Any]):
+        """Wrap stored history data; changes are written through to it."""
+        self._data = history_data
+
+    @staticmethod
+    def new_history_data(day: int) -> dict[str, Any]:
+        """Return stored data for an empty history anchored on a day ordinal."""
+        return {"last_day": day, "days": bitmap_to_str(0)}
+
+    def mark(self, day: int) -> None:
+        """Mark the chore as done on a day ordinal."""
+        last_day = self._data["last_day"]
+        days = bitmap_from_str(self._data["days"])
+        if day > last_day:
+            days = (days << (day - last_day)) & HISTORY_MASK
+            self._data["last_day"] = last_day = day
+
+        offset = last_day - day
+        if offset < CHORE_HISTORY_DAYS:
+            days |= 1 << offset
+        self._data["days"] = bitmap_to_str(days)
+
+    def _window(self, start: int, end: int) -> int:
+        """Return the bits from start to end, with bit 0 for the end day."""
+        shift = self._data["last_day"] - end
+        days = bitmap_from_str(self._data["days"])
+        bits = days >> shift if shift >= 0 else days << -shift
+        return bits & ((1 << (end - start + 1)) - 1)
+
+    def summary(self, start: date, end: date) -> dict[str, Any]:
+        """Return completion rate, gaps and completed days from start to end."""
+        num_days = (end - start).days + 1
+        bits = self._window(start.toordinal(), end.toordinal())
+
+        # Chronological string of the window, '1' for each completed day
+        timeline = format(bits, f"0{num_days}b")
+        completed = bits.bit_count()
+        return {
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "days": num_days,
+            "completed": completed,
+            "completion_rate": round(completed / num_days * 100, 1),
+            "longest_gap": max(len(gap) for gap in timeline.split("1")),
+            "current_gap": num_days - len(timeline.rstrip("0")),
+            "completed_days": [
+                date.fromordinal(start.toordinal() + position).isoformat()
+                for position, done in enumerate(timeline)
+                if done == "1"
+            ],
+        }
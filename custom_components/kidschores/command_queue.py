@@ -0,0 +1,141 @@
+# File: command_queue.py
+"""Single-writer command queue for the KidsChores coordinator.
+
+Service handlers, buttons and notification actions submit their mutations here
+instead of calling the coordinator directly. Commands are executed on the event
+loop one batch at a time, so no two mutations interleave across awaits.
+
+A batch is not atomic: every command runs on its own, a failing command fails
+only its own callers, and the changes of the commands that succeeded are saved.
+Only commands whose outcome does not depend on the commands merged into them
+are coalesced, so every caller gets the result it would have had on its own.
+
+Features:
+- Consecutive point adjustments for the same kid are merged into one delta,
+  while the ledger still records each adjustment as its own transaction.
+- Each drained batch is committed with a single save and listener update.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, Optional
+
+from homeassistant.core import HomeAssistant
+
+from .const import LOGGER
+
+if TYPE_CHECKING:
+    from .coordinator import KidsChoresDataCoordinator
+
+
+class KidsChoresCommand:
+    """A queued coordinator mutation and the callers waiting on its result."""
+
+    def __init__(
+        self,
+        func: Callable[..., Any],
+        kwargs: dict[str, Any],
+        future: asyncio.Future,
+    ):
+        """Initialize the command."""
+        self.name = func.__name__
+        self.func = func
+        self.kwargs = kwargs
+        self.futures = [future]
+
+    @property
+    def kid_id(self) -> Optional[str]:
+        """Return the kid this command targets, if any."""
+        return self.kwargs.get("kid_id")
+
+    def merge(self, other: KidsChoresCommand) -> None:
+        """Attach another command's callers to this command."""
+        self.futures.extend(other.futures)
+
+
+class KidsChoresCommandQueue:
+    """Serializes, coalesces and batch-commits coordinator mutations."""
+
+    def __init__(self, hass: HomeAssistant, coordinator: KidsChoresDataCoordinator):
+        """Initialize the command queue."""
+        self.hass = hass
+        self._coordinator = coordinator
+        self._pending: list[KidsChoresCommand] = []
+        self._drain_task: Optional[asyncio.Task] = None
+
+    async def async_submit(self, func: Callable[..., Any], **kwargs) -> Any:
+        """Queue a coordinator mutation and wait until its batch is committed.
+
+        Returns the mutation's result, or raises the exception it raised.
+        """
+        future = self.hass.loop.create_future()
+        self._pending.append(KidsChoresCommand(func, dict(kwargs), future))
+
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = self.hass.async_create_task(self._async_drain())
+
+        return await future
+
+    async def _async_drain(self) -> None:
+        """Execute queued commands, one batch at a time, until the queue is empty."""
+        while self._pending:
+            batch = self._coalesce(self._pending)
+            self._pending = []
+
+            results: list[tuple[KidsChoresCommand, Any, Optional[Exception]]] = []
+            with self._coordinator.batched_commit():
+                for command in batch:
+                    try:
+                        results.append((command, command.func(**command.kwargs), None))
+                    except Exception as err:
+                        results.append((command, None, err))
+
+            LOGGER.debug(
+                "Committed command batch: %d command(s), %d caller(s)",
+                len(batch),
+                sum(len(command.futures) for command in batch),
+            )
+
+            for command, result, err in results:
+                for future in command.futures:
+                    if future.done():
+                        continue
+                    if err is not None:
+                        future.set_exception(err)
+                    else:
+                        future.set_result(result)
+
+            # Give callers woken by this batch a chance to queue the next one.
+            await asyncio.sleep(0)
+
+    def _coalesce(self, commands: list[KidsChoresCommand]) -> list[KidsChoresCommand]:
+        """Merge compatible commands while preserving the order of everything else.
+
+        Commands that can fail on their own, such as a repeated chore claim that
+        must report the chore as already claimed, are never merged.
+        """
+        coalesced: list[KidsChoresCommand] = []
+
+        for command in commands:
+            previous = coalesced[-1] if coalesced else None
+
+            # Consecutive point deltas for the same kid become a single delta;
+            # they only fail together, when the kid does not exist.
+            if (
+                command.name == "adjust_kid_points"
+                and previous is not None
+                and previous.name == "adjust_kid_points"
+                and previous.kid_id == command.kid_id
+            ):
+                previous.kwargs.setdefault(
+                    "ledger_deltas", [previous.kwargs["delta"]]
+                ).append(command.kwargs["delta"])
+                previous.kwargs["delta"] += command.kwargs["delta"]
+                previous.merge(command)
+                continue
+
+            coalesced.append(command)
+
+        return coalesced
@@ -15,8 +15,11 @@ from homeassistant.util import dt as dt_util
 from typing import Any, Optional
 
 from .const import (
+    ACHIEVEMENT_TYPE_RULE,
     ACHIEVEMENT_TYPE_STREAK,
+    CHALLENGE_TYPE_RULE,
     CHALLENGE_TYPE_TOTAL_WITHIN_WINDOW,
+    BADGE_THRESHOLD_TYPE_RULE,
     CONF_APPLICABLE_DAYS,
     CONF_ACHIEVEMENTS,
     CONF_BADGES,
@@ -38,6 +41,7 @@ from .const import (
     DEFAULT_NOTIFY_ON_DISAPPROVAL,
     DEFAULT_POINTS_ICON,
     DEFAULT_POINTS_LABEL,
+    DEFAULT_REWARD_EXPIRY_HOURS,
     FREQUENCY_CUSTOM,
     DOMAIN,
     LOGGER,
@@ -54,6 +58,7 @@ from .flow_helpers import (
     build_challenge_schema,
     ensure_utc_datetime,
     build_bonus_schema,
+    validate_rule_criteria,
 )
 
 
@@ -96,13 +101,10 @@ class KidsChoresConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._bonus_index: int = 0
 
     async def async_step_user(self, user_input: Optional[dict[str, Any]] = None):
-        """Start the config flow with an intro step."""
+        """Start the config flow with an intro step.
 
-        # Check if there's an existing KidsChores entry
-        if any(self._async_current_entries()):
-            return self.async_abort(reason="single_instance_allowed")
-
-        # Continue your normal flow
+        Each entry is an independent household with its own storage.
+        """
         return await self.async_step_intro()
 
     async def async_step_intro(self, user_input=None):
@@ -447,6 +449,7 @@ class KidsChoresConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors = {}
         if user_input is not None:
             badge_name = user_input["badge_name"].strip()
+            badge_criteria = user_input.get("badge_criteria", "").strip()
             internal_id = user_input.get("internal_id", str(uuid.uuid4()))
 
             if not badge_name:
@@ -456,6 +459,10 @@ class KidsChoresConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 for badge_data in self._badges_temp.values()
             ):
                 errors["badge_name"] = "duplicate_badge"
+            elif user_input["threshold_type"] == BADGE_THRESHOLD_TYPE_RULE and (
+                rule_error := validate_rule_criteria(badge_criteria)
+            ):
+                errors["badge_criteria"] = rule_error
             else:
                 self._badges_temp[internal_id] = {
                     "name": badge_name,
@@ -466,6 +473,7 @@ class KidsChoresConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     "internal_id": internal_id,
                     "description": user_input.get("badge_description", ""),
                     "badge_labels": user_input.get("badge_labels", []),
+                    "criteria": badge_criteria,
                 }
                 LOGGER.debug("Added badge: %s with ID: %s", badge_name, internal_id)
 
@@ -525,6 +533,9 @@ class KidsChoresConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     "cost": user_input["reward_cost"],
                     "description": user_input.get("reward_description", ""),
                     "reward_labels": user_input.get("reward_labels", []),
+                    "expiry_hours": user_input.get(
+                        "reward_expiry_hours", DEFAULT_REWARD_EXPIRY_HOURS
+                    ),
                     "icon": user_input.get("icon", ""),
                     "internal_id": internal_id,
                 }
@@ -713,6 +724,12 @@ class KidsChoresConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 else:
                     # Discard chore if not streak
                     final_chore_id = ""
+                    if _type == ACHIEVEMENT_TYPE_RULE and (
+                        rule_error := validate_rule_criteria(
+                            user_input.get("criteria", "")
+                        )
+                    ):
+                        errors["criteria"] = rule_error
 
                 if not errors:
                     internal_id = user_input.get("internal_id", str(uuid.uuid4()))
@@ -794,6 +811,12 @@ class KidsChoresConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 else:
                     # Discard chore if not "CHALLENGE_TYPE_TOTAL_WITHIN_WINDOW"
                     final_chore_id = ""
+                    if _type == CHALLENGE_TYPE_RULE and (
+                        rule_error := validate_rule_criteria(
+                            user_input.get("criteria", "")
+                        )
+                    ):
+                        errors["criteria"] = rule_error
 
                 # Process start_date and end_date using the helper:
                 start_date_input = user_input.get("start_date")
@@ -927,8 +950,13 @@ class KidsChoresConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         LOGGER.debug(
             "Creating entry with data=%s, options=%s", entry_data, entry_options
         )
+        # Number additional households so their entries can be told apart
+        existing_entries = len(self._async_current_entries())
+        title = (
+            f"KidsChores {existing_entries + 1}" if existing_entries else "KidsChores"
+        )
         return self.async_create_entry(
-            title="KidsChores", data=entry_data, options=entry_options
+            title=title, data=entry_data, options=entry_options
         )
 
     @staticmethod
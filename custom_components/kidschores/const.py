@@ -1,35 +1,34 @@
 # File: const.py
 """Constants for the KidsChores integration.
 
-This file centralizes configuration keys, defaults, labels, domain names,
-event names, and platform identifiers for consistency across the integration.
+This file centralizes configuration keys, defaults, labels, domain names
+and event names for consistency across the integration.
 It also supports localization by defining all labels and UI texts used in sensors,
-services, and options flow.
+services, and options flow. It does not import Home Assistant, so the engine
+and its helper modules can use it on their own.
 """
 
 import logging
 
-from homeassistant.const import Platform
-
 # -------------------- General --------------------
 # Integration Domain and Logging
 DOMAIN = "kidschores"
 LOGGER = logging.getLogger(__package__)
 
-# Supported Platforms
-PLATFORMS = [
-    Platform.BUTTON,
-    Platform.CALENDAR,
-    Platform.SELECT,
-    Platform.SENSOR,
-]
-
 # Storage and Versioning
-STORAGE_KEY = "kidschores_data"  # Persistent storage key
+STORAGE_KEY = "kidschores_data"  # Legacy storage key, prefix of per-entry keys
 STORAGE_VERSION = 1  # Storage version
 
+# Routing of kid and chore ids to config entries (hass.data key)
+ENTRY_ROUTER = f"{DOMAIN}_entry_router"
+
 # Update Interval
 UPDATE_INTERVAL = 5  # Update interval for coordinator (in minutes)
+REFRESH_DEBOUNCE_COOLDOWN = 10  # Cooldown for debounced full refreshes (in seconds)
+
+# Background Integrity Checker
+INTEGRITY_CHECK_INTERVAL = 60  # Interval between integrity check slices (in seconds)
+INTEGRITY_CHECK_BATCH_SIZE = 50  # Records validated per integrity check slice
 
 # -------------------- Configuration --------------------
 # Configuration Keys
@@ -38,6 +37,8 @@ CONF_APPLICABLE_DAYS = "applicable_days"
 CONF_BADGES = "badges"  # Key for badges configuration
 CONF_CHALLENGES = "challenges"
 CONF_CHORES = "chores"  # Key for chores configuration
+CONF_COMPACT_ENTITIES = "compact_entities"  # One summary sensor per kid
+CONF_ENABLED_ENTITY_FAMILIES = "enabled_entity_families"  # Optional sensor families
 CONF_GLOBAL = "global"
 CONF_KIDS = "kids"  # Key for kids configuration
 CONF_PARENTS = "parents"  # Key for parents configuration
@@ -81,12 +82,14 @@ ACHIEVEMENT_TYPE_TOTAL = "chore_total"  # e.g., "Complete 100 chores overall"
 ACHIEVEMENT_TYPE_DAILY_MIN = (
     "daily_minimum"  # e.g., "Complete minimum 5 chores in one day"
 )
+ACHIEVEMENT_TYPE_RULE = "rule"  # e.g., "chore_streak >= 7 and points >= 100"
 
 # Challenge types
 CHALLENGE_TYPE_TOTAL_WITHIN_WINDOW = (
     "total_within_window"  # e.g., "Complete 50 chores in 30 days"
 )
 CHALLENGE_TYPE_DAILY_MIN = "daily_minimum"  # e.g., "Do 2 chores each day for 14 days"
+CHALLENGE_TYPE_RULE = "rule"  # e.g., "completed_chores_weekly >= 15"
 
 
 # -------------------- Defaults --------------------
@@ -103,6 +106,7 @@ DEFAULT_CHORE_CLAIM_ICON = "mdi:clipboard-check-outline"
 DEFAULT_CHORE_SENSOR_ICON = (
     "mdi:checkbox-blank-circle-outline"  # For chore status sensor
 )
+DEFAULT_COMPACT_SUMMARY_ICON = "mdi:account-details"  # Kid summary sensor
 DEFAULT_DISAPPROVE_ICON = (
     "mdi:close-circle-outline"  # Default icon for disapprove buttons
 )
@@ -122,6 +126,8 @@ DEFAULT_TROPHY_OUTLINE = "mdi:trophy-outline"
 # Default Values
 DEFAULT_APPLICABLE_DAYS = []  # Empty means the chore applies every day.
 DEFAULT_BADGE_THRESHOLD = 50  # Default points threshold for badges
+DEFAULT_COMPACT_ENTITIES = False  # Full per-item entities by default
+DEFAULT_ENABLED_ENTITY_FAMILIES = []  # Optional sensor families start disabled
 DEFAULT_MULTIPLE_CLAIMS_PER_DAY = False  # Allow only one chore claim per day
 DEFAULT_PARTIAL_ALLOWED = False  # Partial points not allowed by default
 DEFAULT_POINTS = 5  # Default points awarded for each chore
@@ -131,6 +137,7 @@ DEFAULT_PENALTY_POINTS = 2  # Default points deducted for each penalty
 DEFAULT_BONUS_POINTS = 2  # Default points added for each bonus
 DEFAULT_REMINDER_DELAY = 30  # Default reminder delay in minutes
 DEFAULT_REWARD_COST = 10  # Default cost for each reward
+DEFAULT_REWARD_EXPIRY_HOURS = 0  # Pending reward claims never expire by default
 DEFAULT_DAILY_RESET_TIME = {
     "hour": 0,
     "minute": 0,
@@ -150,6 +157,30 @@ FREQUENCY_MONTHLY = "monthly"
 FREQUENCY_NONE = "none"
 FREQUENCY_WEEKLY = "weekly"
 
+# -------------------- Chore History --------------------
+CHORE_HISTORY_ATTRIBUTE_DAYS = 30  # Days summarized in chore status attributes
+CHORE_HISTORY_DAYS = 366  # Days of completion history kept per kid and chore
+
+# -------------------- Day Counters --------------------
+DAY_COUNTER_BUCKETS = 31  # Day buckets per rolling counter, enough for a month
+
+# -------------------- Simulation and Projection --------------------
+SIMULATION_MAX_DAYS = 3650  # Longest fast-forward the simulate service accepts
+PROJECTION_MAX_DAYS = 3650  # Longest horizon the project service accepts
+
+# -------------------- Points Ledger --------------------
+LEDGER_MAX_HISTORY_BUCKETS = 400  # Maximum buckets returned by a history query
+LEDGER_SNAPSHOT_INTERVAL = 50  # Ledger entries between running-total snapshots
+
+# Sources of points transactions
+POINTS_SOURCE_ACHIEVEMENT = "achievement"
+POINTS_SOURCE_BONUS = "bonus"
+POINTS_SOURCE_CHALLENGE = "challenge"
+POINTS_SOURCE_CHORE = "chore"
+POINTS_SOURCE_MANUAL = "manual"
+POINTS_SOURCE_PENALTY = "penalty"
+POINTS_SOURCE_REWARD = "reward"
+
 # -------------------- Data Keys --------------------
 # Data Keys for Coordinator and Storage
 DATA_ACHIEVEMENTS = "achievements"  # Key for storing achievements data
@@ -157,9 +188,11 @@ DATA_BADGES = "badges"  # Key for storing badges data
 DATA_CHALLENGES = "challenges"  # Key for storing challenges data
 DATA_CHORES = "chores"  # Key for storing chores data
 DATA_KIDS = "kids"  # Key for storing kids data in storage
+DATA_LAST_RESETS = "last_resets"  # Last completed reset boundary per frequency
 DATA_PARENTS = "parents"  # Key for storing parent data
 DATA_PENDING_CHORE_APPROVALS = "pending_chore_approvals"  # Pending chore approvals
 DATA_PENDING_REWARD_APPROVALS = "pending_reward_approvals"  # Pending reward approvals
+DATA_POINTS_LEDGER = "points_ledger"  # Points transactions and snapshots per kid
 DATA_PENALTIES = "penalties"  # Key for storing penalties data
 DATA_REWARDS = "rewards"  # Key for storing rewards data
 DATA_BONUSES = "bonuses"  # Key for storing bonuses data
@@ -170,6 +203,7 @@ BADGE_THRESHOLD_TYPE_CHORE_COUNT = (
     "chore_count"  # Badges for completing a number of chores
 )
 BADGE_THRESHOLD_TYPE_POINTS = "points"  # Badges awarded for reaching points
+BADGE_THRESHOLD_TYPE_RULE = "rule"  # Badges awarded when their criteria rule holds
 
 # Chore States
 CHORE_STATE_APPROVED = "approved"  # Chore fully approved
@@ -217,6 +251,7 @@ ATTR_AWARDED = "awarded"
 ATTR_ASSIGNED_KIDS = "assigned_kids"
 ATTR_ASSOCIATED_CHORE = "associated_chore"
 ATTR_BADGES = "badges"
+ATTR_BONUSES = "bonuses"
 ATTR_CHALLENGE_NAME = "challenge_name"
 ATTR_CHALLENGE_TYPE = "challenge_type"
 ATTR_CHORE_APPROVALS_COUNT = "chore_approvals_count"
@@ -225,6 +260,9 @@ ATTR_CHORE_CLAIMS_COUNT = "chore_claims_count"
 ATTR_CHORE_CURRENT_STREAK = "chore_current_streak"
 ATTR_CHORE_HIGHEST_STREAK = "chore_highest_streak"
 ATTR_CHORE_NAME = "chore_name"
+ATTR_CHORE_COMPLETION_RATE = "chore_completion_rate"
+ATTR_CHORE_LONGEST_GAP = "chore_longest_gap"
+ATTR_CHORES = "chores"
 ATTR_CLAIMED_ON = "Claimed on"
 ATTR_COST = "cost"
 ATTR_CRITERIA = "criteria"
@@ -241,9 +279,12 @@ ATTR_KID_STATE = "kid_state"
 ATTR_LABELS = "labels"
 ATTR_KIDS_EARNED = "kids_earned"
 ATTR_LAST_DATE = "last_date"
+ATTR_OPEN_CHORES = "open_chores"
 ATTR_PARTIAL_ALLOWED = "partial_allowed"
+ATTR_PENALTIES = "penalties"
 ATTR_PENALTY_NAME = "penalty_name"
 ATTR_PENALTY_POINTS = "penalty_points"
+ATTR_PENDING_REDEMPTIONS = "pending_redemptions"
 ATTR_POINTS_MULTIPLIER = "points_multiplier"
 ATTR_POINTS_TO_NEXT_BADGE = "points_to_next_badge"
 ATTR_RAW_PROGRESS = "raw_progress"
@@ -254,6 +295,7 @@ ATTR_REWARD_APPROVALS_COUNT = "reward_approvals_count"
 ATTR_REWARD_CLAIMS_COUNT = "reward_claims_count"
 ATTR_REWARD_NAME = "reward_name"
 ATTR_REWARD_POINTS = "reward_points"
+ATTR_REWARDS = "rewards"
 ATTR_BONUS_NAME = "bonus_name"
 ATTR_BONUS_POINTS = "bonus_points"
 ATTR_START_DATE = "start_date"
@@ -261,6 +303,7 @@ ATTR_SHARED_CHORE = "shared_chore"
 ATTR_TARGET_VALUE = "target_value"
 ATTR_THRESHOLD_TYPE = "threshold_type"
 ATTR_TYPE = "type"
+ATTR_VERSION = "version"
 
 # Calendar Attributes
 ATTR_CAL_SUMMARY = "summary"
@@ -296,6 +339,25 @@ SENSOR_TYPE_REWARD_CLAIMS = "reward_claims"  # Reward claims sensor
 SENSOR_TYPE_BONUS_APPLIES = "bonus_applies"  # Bonus applies sensor
 
 
+# Optional per kid and item sensor families, disabled unless enabled in the options
+ENTITY_FAMILY_BONUS_APPLIES = "bonus_applies"
+ENTITY_FAMILY_CHORE_APPROVALS = "chore_approvals"
+ENTITY_FAMILY_CHORE_CLAIMS = "chore_claims"
+ENTITY_FAMILY_CHORE_STREAK = "chore_streak"
+ENTITY_FAMILY_PENALTY_APPLIES = "penalty_applies"
+ENTITY_FAMILY_REWARD_APPROVALS = "reward_approvals"
+ENTITY_FAMILY_REWARD_CLAIMS = "reward_claims"
+ENTITY_FAMILIES = [
+    ENTITY_FAMILY_CHORE_CLAIMS,
+    ENTITY_FAMILY_CHORE_APPROVALS,
+    ENTITY_FAMILY_CHORE_STREAK,
+    ENTITY_FAMILY_REWARD_CLAIMS,
+    ENTITY_FAMILY_REWARD_APPROVALS,
+    ENTITY_FAMILY_PENALTY_APPLIES,
+    ENTITY_FAMILY_BONUS_APPLIES,
+]
+
+
 # -------------------- Services --------------------
 # Custom Services
 SERVICE_APPLY_PENALTY = "apply_penalty"  # Apply penalty service
@@ -316,16 +378,28 @@ SERVICE_APPLY_BONUS = "apply_bonus"  # Apply bonus service
 SERVICE_RESET_PENALTIES = "reset_penalties"  # Reset penalties service
 SERVICE_RESET_BONUSES = "reset_bonuses"  # Reset bonuses service
 SERVICE_RESET_REWARDS = "reset_rewards"  # Reset rewards service
+SERVICE_GET_POINTS_HISTORY = "get_points_history"  # Bucketed points history
+SERVICE_GET_CHORE_HISTORY = "get_chore_history"  # Daily chore completion history
+SERVICE_SIMULATE = "simulate"  # Fast-forward a copy of the household
+SERVICE_PROJECT = "project"  # What-if projection of points, badges and challenges
 
 # Field Names (for consistency across services)
 FIELD_CHORE_ID = "chore_id"
 FIELD_CHORE_NAME = "chore_name"
+FIELD_COMPLETE_CHORES = "complete_chores"
+FIELD_CONFIG_ENTRY_ID = "config_entry_id"
+FIELD_DAYS = "days"
 FIELD_DUE_DATE = "due_date"
+FIELD_END = "end"
+FIELD_EXPECTED_VERSION = "expected_version"
 FIELD_KID_NAME = "kid_name"
 FIELD_PARENT_NAME = "parent_name"
 FIELD_PENALTY_NAME = "penalty_name"
+FIELD_PERIOD = "period"
 FIELD_POINTS_AWARDED = "points_awarded"
+FIELD_REDEMPTION_ID = "redemption_id"
 FIELD_REWARD_NAME = "reward_name"
+FIELD_START = "start"
 FIELD_BONUS_NAME = "bonus_name"
 
 # -------------------- Labels --------------------
@@ -363,6 +437,9 @@ ERROR_PENALTY_NOT_FOUND = "Penalty not found."  # Error for missing penalty
 ERROR_PENALTY_NOT_FOUND_FMT = (
     "Penalty '{}' not found"  # Error format for missing penalty
 )
+ERROR_STALE_VERSION_FMT = (
+    "{} was changed by another action (version {}, expected {})."  # Stale version
+)
 ERROR_REWARD_NOT_FOUND = "Reward not found."  # Error for missing reward
 ERROR_REWARD_NOT_FOUND_FMT = "Reward '{}' not found"  # Error format for missing reward
 ERROR_BONUS_NOT_FOUND = "Bonus not found."  # Error for missing bonus
@@ -370,6 +447,10 @@ ERROR_BONUS_NOT_FOUND_FMT = "Bonus '{}' not found"  # Error format for missing b
 ERROR_USER_NOT_AUTHORIZED = (
     "User is not authorized to perform this action."  # Auth error
 )
+ERROR_ENTRY_AMBIGUOUS = (
+    "Several KidsChores entries match; set config_entry_id to choose one."
+)
+ERROR_ENTRY_NOT_FOUND_FMT = "KidsChores entry '{}' not found"  # Unknown entry
 MSG_NO_ENTRY_FOUND = "No KidsChores entry found"
 
 # Unknown States
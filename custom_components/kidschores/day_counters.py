@@ -0,0 +1,83 @@
+# File: day_counters.py
+"""Rolling-window day counters for the KidsChores coordinator.
+
+Each kid keeps a fixed ring of day buckets per counter (completed chores and
+points earned). Counting a value only touches today's bucket, zeroing any days
+skipped since the last count, and the daily, weekly and monthly totals are
+window sums over the ring. The windows are therefore always correct, even
+when a reset job was missed, and no kid record is rewritten at reset time.
+
+Features:
+- One bucket per counting day, DAY_COUNTER_BUCKETS days deep.
+- Window sums never mutate the stored buckets, so sensors can read freely.
+- Legacy per-period kid fields map onto a counter and a window.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from .const import (
+    DAY_COUNTER_BUCKETS,
+    FREQUENCY_DAILY,
+    FREQUENCY_MONTHLY,
+    FREQUENCY_WEEKLY,
+)
+
+COUNTER_CHORES = "chores"
+COUNTER_POINTS = "points"
+
+# Kid field => (counter, window period) it is computed from
+DAY_COUNTER_FIELDS = {
+    "completed_chores_today": (COUNTER_CHORES, FREQUENCY_DAILY),
+    "completed_chores_daily": (COUNTER_CHORES, FREQUENCY_DAILY),
+    "completed_chores_weekly": (COUNTER_CHORES, FREQUENCY_WEEKLY),
+    "completed_chores_monthly": (COUNTER_CHORES, FREQUENCY_MONTHLY),
+    "points_earned_today": (COUNTER_POINTS, FREQUENCY_DAILY),
+    "points_earned_weekly": (COUNTER_POINTS, FREQUENCY_WEEKLY),
+    "points_earned_monthly": (COUNTER_POINTS, FREQUENCY_MONTHLY),
+}
+
+
+class KidsChoresDayCounters:
+    """A kid's stored day-bucket rings, indexed by day ordinal modulo the depth."""
+
+    def __init__(self, counter_data: dict[str, Any]):
+        """Wrap stored counter data; changes are written through to it."""
+        self._data = counter_data
+
+    @staticmethod
+    def new_counter_data(day: int) -> dict[str, Any]:
+        """Return stored data for empty counters starting on a day ordinal."""
+        return {
+            "last_day": day,
+            COUNTER_CHORES: [0] * DAY_COUNTER_BUCKETS,
+            COUNTER_POINTS: [0.0] * DAY_COUNTER_BUCKETS,
+        }
+
+    def _advance(self, day: int) -> None:
+        """Move the ring forward to day, zeroing the buckets of skipped days."""
+        last_day = self._data["last_day"]
+        if day <= last_day:
+            return
+        for first in range(last_day + 1, min(day, last_day + DAY_COUNTER_BUCKETS) + 1):
+            for name in (COUNTER_CHORES, COUNTER_POINTS):
+                self._data[name][first % DAY_COUNTER_BUCKETS] = 0
+        self._data["last_day"] = day
+
+    def add(self, name: str, day: int, amount: float) -> None:
+        """Add an amount to a counter on a day ordinal."""
+        self._advance(day)
+        if day <= self._data["last_day"] - DAY_COUNTER_BUCKETS:
+            return  # Older than the ring
+        self._data[name][day % DAY_COUNTER_BUCKETS] += amount
+
+    def window(self, name: str, day: int, days: int) -> float:
+        """Return a counter's sum over the days ending on a day ordinal."""
+        last_day = self._data["last_day"]
+        buckets = self._data[name]
+        first = max(day - days + 1, last_day - DAY_COUNTER_BUCKETS + 1)
+        return sum(
+            buckets[each % DAY_COUNTER_BUCKETS]
+            for each in range(first, min(day, last_day) + 1)
+        )
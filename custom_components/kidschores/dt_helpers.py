@@ -0,0 +1,78 @@
+# File: dt_helpers.py
+"""Date and time helpers for the KidsChores engine, on the standard library only.
+
+They mirror the parts of homeassistant.util.dt the engine needs, so the engine
+and its helper modules run without Home Assistant installed. Local time is the
+default time zone set here, UTC until the coordinator sets it to the time zone
+Home Assistant is configured with.
+
+Features:
+- Aware UTC now, conversions to UTC and to local time, start of a local day.
+- ISO 8601 parsing that returns None instead of raising on invalid input.
+- Module level default time zone, like Home Assistant's.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time, timezone, tzinfo
+from typing import Optional
+
+UTC = timezone.utc
+
+_default_time_zone: tzinfo = UTC
+
+
+def set_default_time_zone(time_zone: tzinfo) -> None:
+    """Set the time zone local times are expressed in."""
+    global _default_time_zone
+    _default_time_zone = time_zone
+
+
+def get_default_time_zone() -> tzinfo:
+    """Return the time zone local times are expressed in."""
+    return _default_time_zone
+
+
+def utcnow() -> datetime:
+    """Return the current time as an aware UTC datetime."""
+    return datetime.now(UTC)
+
+
+def as_utc(moment: datetime) -> datetime:
+    """Return a datetime in UTC; naive values are taken as local time."""
+    if moment.tzinfo is UTC:
+        return moment
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=_default_time_zone)
+    return moment.astimezone(UTC)
+
+
+def as_local(moment: datetime) -> datetime:
+    """Return a datetime in local time; naive values are taken as local time."""
+    if moment.tzinfo == _default_time_zone:
+        return moment
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=_default_time_zone)
+    return moment.astimezone(_default_time_zone)
+
+
+def utc_from_timestamp(timestamp: float) -> datetime:
+    """Return an aware UTC datetime from epoch seconds."""
+    return datetime.fromtimestamp(timestamp, UTC)
+
+
+def start_of_local_day(day: Optional[date | datetime] = None) -> datetime:
+    """Return local midnight at the start of a day, today by default."""
+    if day is None:
+        day = as_local(utcnow()).date()
+    elif isinstance(day, datetime):
+        day = day.date()
+    return datetime.combine(day, time(), tzinfo=_default_time_zone)
+
+
+def parse_datetime(value: str) -> Optional[datetime]:
+    """Parse an ISO 8601 datetime string, or return None if it is not one."""
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
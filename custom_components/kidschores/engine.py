@@ -0,0 +1,4332 @@
+# File: engine.py
+"""Home Assistant independent core of the KidsChores integration.
+
+KidsChoresEngine holds the chores, rewards, points, badges, achievements,
+challenges, streaks and resets of one household as plain dicts, and applies
+every business rule to them. It does not import Home Assistant: time comes
+from an injected clock, saves go to an injected storage adapter, notifications
+to an injected sink and entity, config and publishing hooks to an injected
+adapter, and rejected commands raise KidsChoresError. The data coordinator
+wraps an engine instance and plugs Home Assistant storage, entities, config
+entries and notifications into it; scripts and benchmarks can drive the engine
+on its own.
+
+Features:
+- Injected clock (a callable returning an aware UTC datetime).
+- Storage adapter with a save(data) method; in-memory by default.
+- Notification sink with notify_kid() and notify_parents(); silent by default.
+- Adapter for entity cleanup, config write-back and publishing; no-op by default.
+- KidsChoresError for rejected commands, translated by the coordinator.
+"""
+
+from __future__ import annotations
+
+import heapq
+import uuid
+from calendar import monthrange
+from collections.abc import Callable
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from typing import Any, Optional
+
+from .const import (
+    ACHIEVEMENT_TYPE_DAILY_MIN,
+    ACHIEVEMENT_TYPE_STREAK,
+    ACHIEVEMENT_TYPE_TOTAL,
+    ACTION_APPROVE_CHORE,
+    ACTION_APPROVE_REWARD,
+    ACTION_DISAPPROVE_CHORE,
+    ACTION_DISAPPROVE_REWARD,
+    ACTION_REMIND_30,
+    ACTION_TITLE_APPROVE,
+    ACTION_TITLE_DISAPPROVE,
+    ACTION_TITLE_REMIND_30,
+    BADGE_THRESHOLD_TYPE_POINTS,
+    CHALLENGE_TYPE_DAILY_MIN,
+    CHALLENGE_TYPE_TOTAL_WITHIN_WINDOW,
+    CHORE_HISTORY_ATTRIBUTE_DAYS,
+    CHORE_HISTORY_DAYS,
+    CHORE_STATE_APPROVED,
+    CHORE_STATE_APPROVED_IN_PART,
+    CHORE_STATE_CLAIMED,
+    CHORE_STATE_CLAIMED_IN_PART,
+    CHORE_STATE_INDEPENDENT,
+    CHORE_STATE_OVERDUE,
+    CHORE_STATE_PENDING,
+    CHORE_STATE_UNKNOWN,
+    CONF_APPLICABLE_DAYS,
+    CONF_NOTIFY_ON_APPROVAL,
+    CONF_NOTIFY_ON_CLAIM,
+    CONF_NOTIFY_ON_DISAPPROVAL,
+    DATA_ACHIEVEMENTS,
+    DATA_BADGES,
+    DATA_CHALLENGES,
+    DATA_CHORES,
+    DATA_KIDS,
+    DATA_LAST_RESETS,
+    DATA_PARENTS,
+    DATA_PENDING_CHORE_APPROVALS,
+    DATA_PENDING_REWARD_APPROVALS,
+    DATA_POINTS_LEDGER,
+    DATA_PENALTIES,
+    DATA_REWARDS,
+    DATA_BONUSES,
+    DEFAULT_APPLICABLE_DAYS,
+    DEFAULT_BADGE_THRESHOLD,
+    DEFAULT_DAILY_RESET_TIME,
+    DEFAULT_ICON,
+    DEFAULT_MONTHLY_RESET_DAY,
+    DEFAULT_MULTIPLE_CLAIMS_PER_DAY,
+    DEFAULT_NOTIFY_ON_APPROVAL,
+    DEFAULT_NOTIFY_ON_CLAIM,
+    DEFAULT_NOTIFY_ON_DISAPPROVAL,
+    DEFAULT_PARTIAL_ALLOWED,
+    DEFAULT_PENALTY_ICON,
+    DEFAULT_PENALTY_POINTS,
+    DEFAULT_POINTS,
+    DEFAULT_POINTS_MULTIPLIER,
+    DEFAULT_REWARD_COST,
+    DEFAULT_REWARD_EXPIRY_HOURS,
+    DEFAULT_REWARD_ICON,
+    DEFAULT_BONUS_ICON,
+    DEFAULT_BONUS_POINTS,
+    DEFAULT_WEEKLY_RESET_DAY,
+    ERROR_STALE_VERSION_FMT,
+    FREQUENCY_BIWEEKLY,
+    FREQUENCY_CUSTOM,
+    FREQUENCY_DAILY,
+    FREQUENCY_MONTHLY,
+    FREQUENCY_NONE,
+    FREQUENCY_WEEKLY,
+    LEDGER_MAX_HISTORY_BUCKETS,
+    LOGGER,
+    POINTS_SOURCE_ACHIEVEMENT,
+    POINTS_SOURCE_BONUS,
+    POINTS_SOURCE_CHALLENGE,
+    POINTS_SOURCE_CHORE,
+    POINTS_SOURCE_MANUAL,
+    POINTS_SOURCE_PENALTY,
+    POINTS_SOURCE_REWARD,
+    WEEKDAY_OPTIONS,
+)
+
+from . import dt_helpers
+from .badge_index import KidsChoresBadgeIndex
+from .chore_history import KidsChoresChoreHistory, bitmap_from_str, bitmap_to_str
+from .day_counters import (
+    COUNTER_CHORES,
+    COUNTER_POINTS,
+    DAY_COUNTER_FIELDS,
+    KidsChoresDayCounters,
+)
+from .points_ledger import KidsChoresPointsLedger, period_start
+from .reference_index import (
+    KID_CHORE_DICT_FIELDS,
+    KID_CHORE_LIST_FIELDS,
+    KidsChoresReferenceIndex,
+)
+from .rule_index import KidsChoresRuleIndex
+from .rule_language import (
+    BADGE_INPUTS,
+    CHORE_INPUTS,
+    POINTS_INPUTS,
+    KidsChoresRuleSet,
+)
+
+
+class KidsChoresError(Exception):
+    """A command was rejected, e.g. for an unknown id or a stale version."""
+
+
+class KidsChoresMemoryStorage:
+    """Storage adapter that keeps the last saved data in memory."""
+
+    def __init__(self):
+        """Initialize with nothing saved."""
+        self.data: dict[str, Any] = {}
+
+    def save(self, data: dict[str, Any]) -> None:
+        """Keep the saved data."""
+        self.data = data
+
+
+class KidsChoresNotificationSink:
+    """Notification sink that drops every notification."""
+
+    def notify_kid(
+        self,
+        kid_id: str,
+        title: str,
+        message: str,
+        actions: Optional[list[dict[str, str]]] = None,
+        extra_data: Optional[dict] = None,
+    ) -> None:
+        """Notify a kid."""
+
+    def notify_parents(
+        self,
+        kid_id: str,
+        title: str,
+        message: str,
+        actions: Optional[list[dict[str, str]]] = None,
+        extra_data: Optional[dict] = None,
+    ) -> None:
+        """Notify the parents associated with a kid."""
+
+
+class KidsChoresAdapter:
+    """Adapter whose hooks do nothing; the coordinator plugs in Home Assistant."""
+
+    def on_entities_synced(self, section: str) -> None:
+        """Handle a data section having been synced from config."""
+
+    def remove_item_entities(self, section: str, item_id: str) -> None:
+        """Remove the platform entities of a removed item."""
+
+    def remove_kid_chore_entities(self, kid_id: str, chore_id: str) -> None:
+        """Remove the platform entities of a kid's chore."""
+
+    def sync_chore_due_date_to_config(
+        self,
+        chore_id: str,
+        due_date: Optional[str],
+        recurring_frequency: Optional[str] = None,
+        custom_interval: Optional[int] = None,
+        custom_interval_unit: Optional[str] = None,
+    ) -> None:
+        """Copy a chore's due date and frequency back to its configuration."""
+
+    def sync_chore_due_dates_to_config(
+        self, due_dates: dict[str, Optional[str]]
+    ) -> None:
+        """Copy the due dates of several chores back to their configuration."""
+
+    def publish_data(self, data: dict[str, Any]) -> None:
+        """Push updated data to whatever displays it."""
+
+
+class KidsChoresEngine:
+    """Business rules of KidsChores, free of Home Assistant.
+
+    Manages data primarily using internal_id for entities.
+    """
+
+    def __init__(
+        self,
+        clock: Optional[Callable[[], datetime]] = None,
+        storage: Optional[Any] = None,
+        notifier: Optional[Any] = None,
+        adapter: Optional[Any] = None,
+    ):
+        """Initialize the engine with its clock, storage, notifier and adapter."""
+        self._now = clock or dt_helpers.utcnow
+        self._storage = storage or KidsChoresMemoryStorage()
+        self._notifier = notifier or KidsChoresNotificationSink()
+        self._adapter = adapter or KidsChoresAdapter()
+        self._data: dict[str, Any] = {}
+
+        # Set when a change may affect overdue status (due dates, chores back to pending)
+        self._due_state_changed = False
+
+        # Saves and listener updates deferred by batched_commit()
+        self._batch_depth = 0
+        self._batch_persist_pending = False
+        self._batch_publish_pending = False
+
+        # Sorted badge thresholds, rebuilt lazily after badges change
+        self._badge_index: Optional[KidsChoresBadgeIndex] = None
+
+        # Achievements and challenges by type, kid and chore, rebuilt lazily
+        self._rule_index: Optional[KidsChoresRuleIndex] = None
+
+        # Compiled rule-type badges, achievements and challenges, rebuilt lazily
+        self._rule_set: Optional[KidsChoresRuleSet] = None
+
+        # Per-chore counts of assigned kids by state, maintained on transitions
+        self._chore_state_counts: dict[str, dict[str, int]] = {}
+
+        # Min-heap of (expires_at, redemption_id), rebuilt lazily after load
+        self._reward_expiry_heap: Optional[list[tuple[datetime, str]]] = None
+
+    # -------------------------------------------------------------------------------------
+    # Migrate Data and Converters
+    # -------------------------------------------------------------------------------------
+
+    def _migrate_datetime(self, dt_str: str) -> str:
+        """Convert a datetime string to a UTC-aware ISO string."""
+        if not isinstance(dt_str, str):
+            return dt_str
+
+        try:
+            # Try to parse using Home Assistant’s utility first:
+            dt_obj = dt_helpers.parse_datetime(dt_str)
+            if dt_obj is None:
+                # Fallback using fromisoformat
+                dt_obj = datetime.fromisoformat(dt_str)
+            # If naive, assume local time and make it aware:
+            if dt_obj.tzinfo is None:
+                dt_obj = dt_obj.replace(tzinfo=dt_helpers.get_default_time_zone())
+            # Convert to UTC
+            dt_obj_utc = dt_helpers.as_utc(dt_obj)
+            return dt_obj_utc.isoformat()
+        except Exception as err:
+            LOGGER.warning("Error migrating datetime '%s': %s", dt_str, err)
+            return dt_str
+
+    def _migrate_stored_datetimes(self):
+        """Walk through stored data and convert known datetime fields to UTC-aware ISO strings."""
+        # For each chore, migrate due_date, last_completed, and last_claimed
+        for chore in self._data.get(DATA_CHORES, {}).values():
+            if chore.get("due_date"):
+                chore["due_date"] = self._migrate_datetime(chore["due_date"])
+            if chore.get("last_completed"):
+                chore["last_completed"] = self._migrate_datetime(
+                    chore["last_completed"]
+                )
+            if chore.get("last_claimed"):
+                chore["last_claimed"] = self._migrate_datetime(chore["last_claimed"])
+        # Also, migrate timestamps in pending approvals
+        for approval in self._data.get(DATA_PENDING_CHORE_APPROVALS, []):
+            if approval.get("timestamp"):
+                approval["timestamp"] = self._migrate_datetime(approval["timestamp"])
+        reward_approvals = self._data.get(DATA_PENDING_REWARD_APPROVALS, [])
+        if isinstance(reward_approvals, dict):
+            reward_approvals = reward_approvals.values()
+        for approval in reward_approvals:
+            if approval.get("timestamp"):
+                approval["timestamp"] = self._migrate_datetime(approval["timestamp"])
+
+        # Migrate datetime on Challenges
+        for challenge in self._data.get(DATA_CHALLENGES, {}).values():
+            start_date = challenge.get("start_date")
+            if not isinstance(start_date, str) or not start_date.strip():
+                challenge["start_date"] = None
+            else:
+                challenge["start_date"] = self._migrate_datetime(start_date)
+
+            end_date = challenge.get("end_date")
+            if not isinstance(end_date, str) or not end_date.strip():
+                challenge["end_date"] = None
+            else:
+                challenge["end_date"] = self._migrate_datetime(end_date)
+
+    def _migrate_chore_data(self):
+        """Migrate each chore's data to include new fields if missing.
+
+        This method iterates over each chore entry in the stored data and ensures
+        that the following keys are present:
+        - CONF_APPLICABLE_DAYS (defaults to DEFAULT_APPLICABLE_DAYS)
+        - CONF_NOTIFY_ON_CLAIM (defaults to DEFAULT_NOTIFY_ON_CLAIM)
+        - CONF_NOTIFY_ON_APPROVAL (defaults to DEFAULT_NOTIFY_ON_APPROVAL)
+        - CONF_NOTIFY_ON_DISAPPROVAL (defaults to DEFAULT_NOTIFY_ON_DISAPPROVAL)
+        """
+        chores = self._data.get(DATA_CHORES, {})
+        for chore in chores.values():
+            chore.setdefault(CONF_APPLICABLE_DAYS, DEFAULT_APPLICABLE_DAYS)
+            chore.setdefault(CONF_NOTIFY_ON_CLAIM, DEFAULT_NOTIFY_ON_CLAIM)
+            chore.setdefault(CONF_NOTIFY_ON_APPROVAL, DEFAULT_NOTIFY_ON_APPROVAL)
+            chore.setdefault(CONF_NOTIFY_ON_DISAPPROVAL, DEFAULT_NOTIFY_ON_DISAPPROVAL)
+        LOGGER.info("Chore data migration complete.")
+
+    def _migrate_daily_min_progress(self):
+        """Convert daily-min 'daily_counts' and integer bitmaps into hex day bitmaps."""
+        today_iso = dt_helpers.as_local(self._now()).date().isoformat()
+        for challenge_id, challenge in self._data.get(DATA_CHALLENGES, {}).items():
+            if challenge.get("type") != CHALLENGE_TYPE_DAILY_MIN:
+                continue
+            required_daily = challenge.get("required_daily", 1)
+            for progress in challenge.get("progress", {}).values():
+                daily_counts = progress.pop("daily_counts", None)
+                if daily_counts is None:
+                    # Bitmaps were stored as integers before they were hex strings
+                    if isinstance(progress.get("satisfied_days"), int):
+                        progress["satisfied_days"] = bitmap_to_str(
+                            progress["satisfied_days"]
+                        )
+                    continue
+                progress["total_count"] = sum(daily_counts.values())
+                progress["day"] = today_iso
+                progress["day_count"] = daily_counts.get(today_iso, 0)
+                satisfied_days = 0
+                for day_iso, count in daily_counts.items():
+                    if count < required_daily:
+                        continue
+                    offset = self._daily_min_day_offset(
+                        challenge_id, datetime.fromisoformat(day_iso).date()
+                    )
+                    if offset is not None:
+                        satisfied_days |= 1 << offset
+                progress["satisfied_days"] = bitmap_to_str(satisfied_days)
+
+    def _migrate_streaks(self):
+        """Convert ISO streak dates to day ordinals and fold in the overall streak."""
+
+        def to_ordinal(value) -> Optional[int]:
+            if not value:
+                return None
+            try:
+                return datetime.fromisoformat(value).date().toordinal()
+            except (TypeError, ValueError):
+                return None
+
+        for kid_info in self._data.get(DATA_KIDS, {}).values():
+            for streak in kid_info.get("chore_streaks", {}).values():
+                if "last_date" in streak:
+                    streak["last_day"] = to_ordinal(streak.pop("last_date"))
+
+            if "overall_chore_streak" in kid_info or "last_chore_date" in kid_info:
+                current = kid_info.pop("overall_chore_streak", 0)
+                kid_info.setdefault(
+                    "overall_streak",
+                    {
+                        "current_streak": current,
+                        "max_streak": current,
+                        "last_day": to_ordinal(kid_info.get("last_chore_date")),
+                    },
+                )
+                kid_info.pop("last_chore_date", None)
+
+    # -------------------------------------------------------------------------------------
+    # Normalize Lists
+    # -------------------------------------------------------------------------------------
+
+    def _normalize_kid_lists(self, kid_info: dict[str, Any]) -> None:
+        "Normalize lists and ensuring they are not dict"
+        for key in [
+            "claimed_chores",
+            "approved_chores",
+            "redeemed_rewards",
+        ]:
+            if not isinstance(kid_info.get(key), list):
+                kid_info[key] = []
+        if not isinstance(kid_info.get("reward_queue"), dict):
+            kid_info["reward_queue"] = {}
+
+    # -------------------------------------------------------------------------------------
+    # Load and Config Sync
+    # Stored data is loaded once and migrated; config sections are then merged in by id.
+    # -------------------------------------------------------------------------------------
+
+    def load(self, stored_data: Optional[dict[str, Any]]) -> None:
+        """Load stored data, migrating older layouts, or start empty."""
+        if stored_data:
+            self._data = stored_data
+
+            # Migrate any datetime fields in stored data to UTC-aware strings
+            self._migrate_stored_datetimes()
+
+            # Migrate chore data and add new fields
+            self._migrate_chore_data()
+
+            # Roll daily-min challenge day counts into the compact progress form
+            self._migrate_daily_min_progress()
+
+            # Store streak dates as day ordinals
+            self._migrate_streaks()
+
+            # Give pending reward claims redemption ids and per-kid queues
+            self._migrate_reward_queue()
+
+            # Seed rolling day counters from the per-period counter fields
+            self._migrate_day_counters()
+
+            # Store chore history bitmaps as hex strings
+            self._migrate_chore_history()
+
+        else:
+            self._data = {
+                DATA_KIDS: {},
+                DATA_CHORES: {},
+                DATA_BADGES: {},
+                DATA_REWARDS: {},
+                DATA_PARENTS: {},
+                DATA_PENALTIES: {},
+                DATA_BONUSES: {},
+                DATA_ACHIEVEMENTS: {},
+                DATA_CHALLENGES: {},
+                DATA_PENDING_CHORE_APPROVALS: [],
+                DATA_PENDING_REWARD_APPROVALS: {},
+                DATA_POINTS_LEDGER: {},
+            }
+
+        if not isinstance(self._data.get(DATA_PENDING_CHORE_APPROVALS), list):
+            self._data[DATA_PENDING_CHORE_APPROVALS] = []
+        if not isinstance(self._data.get(DATA_PENDING_REWARD_APPROVALS), dict):
+            self._data[DATA_PENDING_REWARD_APPROVALS] = {}
+
+    def apply_config(self, config_sections: dict[str, dict[str, Any]]) -> None:
+        """Merge configured kids, chores, rewards, etc. into the data by internal_id."""
+        # Ensure minimal structure
+        self._ensure_minimal_structure()
+
+        # Initialize each section using private helper
+        for section_key, data_dict in config_sections.items():
+            init_func = getattr(self, f"_initialize_{section_key}", None)
+            if init_func:
+                init_func(data_dict)
+            else:
+                self._data.setdefault(section_key, data_dict)
+                LOGGER.warning("No initializer found for section '%s'", section_key)
+
+        # Recalculate Badges on reload
+        self._recalculate_all_badges()
+
+    def start(
+        self,
+        stored_data: Optional[dict[str, Any]],
+        config_sections: dict[str, dict[str, Any]],
+    ) -> None:
+        """Load stored data, merge the config and apply resets missed while stopped."""
+        self.load(stored_data)
+        self.apply_config(config_sections)
+
+        # Normalize all kids list fields
+        for kid in self._data.get(DATA_KIDS, {}).values():
+            self._normalize_kid_lists(kid)
+
+        self._catch_up_missed_resets()
+        self._persist()
+
+    def _ensure_minimal_structure(self):
+        """Ensure that all necessary data sections are present."""
+        for key in [
+            DATA_KIDS,
+            DATA_PARENTS,
+            DATA_CHORES,
+            DATA_BADGES,
+            DATA_REWARDS,
+            DATA_PENALTIES,
+            DATA_BONUSES,
+            DATA_ACHIEVEMENTS,
+            DATA_CHALLENGES,
+            DATA_POINTS_LEDGER,
+        ]:
+            self._data.setdefault(key, {})
+
+        if not isinstance(self._data.get(DATA_PENDING_CHORE_APPROVALS), list):
+            self._data[DATA_PENDING_CHORE_APPROVALS] = []
+        if not isinstance(self._data.get(DATA_PENDING_REWARD_APPROVALS), dict):
+            self._data[DATA_PENDING_REWARD_APPROVALS] = {}
+
+    def _mark_due_state_changed(self) -> None:
+        """Flag that the next refresh request needs a full overdue scan."""
+        self._due_state_changed = True
+
+    def _initialize_kids(self, kids_dict: dict[str, Any]):
+        self._sync_entities(DATA_KIDS, kids_dict, self._create_kid, self._update_kid)
+
+    def _initialize_parents(self, parents_dict: dict[str, Any]):
+        self._sync_entities(
+            DATA_PARENTS, parents_dict, self._create_parent, self._update_parent
+        )
+
+    def _initialize_chores(self, chores_dict: dict[str, Any]):
+        self._sync_entities(
+            DATA_CHORES, chores_dict, self._create_chore, self._update_chore
+        )
+
+    def _initialize_badges(self, badges_dict: dict[str, Any]):
+        self._sync_entities(
+            DATA_BADGES, badges_dict, self._create_badge, self._update_badge
+        )
+
+    def _initialize_rewards(self, rewards_dict: dict[str, Any]):
+        self._sync_entities(
+            DATA_REWARDS, rewards_dict, self._create_reward, self._update_reward
+        )
+
+    def _initialize_penalties(self, penalties_dict: dict[str, Any]):
+        self._sync_entities(
+            DATA_PENALTIES, penalties_dict, self._create_penalty, self._update_penalty
+        )
+
+    def _initialize_achievements(self, achievements_dict: dict[str, Any]):
+        self._sync_entities(
+            DATA_ACHIEVEMENTS,
+            achievements_dict,
+            self._create_achievement,
+            self._update_achievement,
+        )
+
+    def _initialize_challenges(self, challenges_dict: dict[str, Any]):
+        self._sync_entities(
+            DATA_CHALLENGES,
+            challenges_dict,
+            self._create_challenge,
+            self._update_challenge,
+        )
+
+    def _initialize_bonuses(self, bonuses_dict: dict[str, Any]):
+        self._sync_entities(
+            DATA_BONUSES, bonuses_dict, self._create_bonus, self._update_bonus
+        )
+
+    def _sync_entities(
+        self,
+        section: str,
+        config_data: dict[str, Any],
+        create_method,
+        update_method,
+    ):
+        """Synchronize entities in a given data section based on config_data."""
+        existing_ids = set(self._data[section].keys())
+        config_ids = set(config_data.keys())
+
+        # Identify entities to remove
+        entities_to_remove = existing_ids - config_ids
+        for entity_id in entities_to_remove:
+            # Remove entity from data
+            del self._data[section][entity_id]
+
+            # Remove the entity's platform entities
+            self._remove_entities_in_ha(section, entity_id)
+            if section == DATA_CHORES:
+                for kid_id in self.kids_data.keys():
+                    self._remove_kid_chore_entities(kid_id, entity_id)
+
+        # Cascade all removals through the records that referenced them
+        if entities_to_remove:
+            self._cleanup_deleted_references(entities_to_remove)
+
+        # Add or update entities
+        for entity_id, entity_body in config_data.items():
+            if entity_id not in self._data[section]:
+                create_method(entity_id, entity_body)
+            else:
+                update_method(entity_id, entity_body)
+
+        if section == DATA_BADGES:
+            self._badge_index = None
+        if section in (DATA_KIDS, DATA_CHORES, DATA_ACHIEVEMENTS, DATA_CHALLENGES):
+            self._rule_index = None
+        if section in (DATA_KIDS, DATA_BADGES, DATA_ACHIEVEMENTS, DATA_CHALLENGES):
+            self._rule_set = None
+        if section in (DATA_KIDS, DATA_CHORES):
+            self._chore_state_counts.clear()
+
+        self._on_entities_synced(section)
+
+    def _cleanup_chore_from_kid(self, kid_id: str, chore_id: str) -> None:
+        """Remove references to a specific chore from a kid's data."""
+        kid = self.kids_data.get(kid_id)
+        if not kid:
+            return
+
+        # Remove from lists if present
+        for key in ["claimed_chores", "approved_chores"]:
+            if chore_id in kid.get(key, []):
+                kid[key] = [c for c in kid[key] if c != chore_id]
+                LOGGER.debug(
+                    "Removed chore '%s' from kid '%s' list '%s'", chore_id, kid_id, key
+                )
+
+        # Remove from dictionary fields if present
+        for dict_key in ["chore_claims", "chore_approvals"]:
+            if chore_id in kid.get(dict_key, {}):
+                kid[dict_key].pop(chore_id)
+                LOGGER.debug(
+                    "Removed chore '%s' from kid '%s' dict '%s'",
+                    chore_id,
+                    kid_id,
+                    dict_key,
+                )
+
+        # Remove from chore streaks if present
+        if "chore_streaks" in kid and chore_id in kid["chore_streaks"]:
+            kid["chore_streaks"].pop(chore_id)
+            LOGGER.debug(
+                "Removed chore streak for chore '%s' from kid '%s'", chore_id, kid_id
+            )
+
+        # Remove any pending chore approvals for this kid and chore
+        self._data[DATA_PENDING_CHORE_APPROVALS] = [
+            ap
+            for ap in self._data.get(DATA_PENDING_CHORE_APPROVALS, [])
+            if not (ap.get("kid_id") == kid_id and ap.get("chore_id") == chore_id)
+        ]
+
+    def _cleanup_deleted_references(self, removed_ids: set[str]) -> None:
+        """Remove references to deleted kids, chores or rewards in one pass.
+
+        A reverse reference index is built once for the whole batch, and only the
+        records that referenced one of the removed ids are visited.
+        """
+        referencing = KidsChoresReferenceIndex(self._data).referencing(removed_ids)
+
+        # Kids: chore lists, per-chore dicts and reward queues
+        for kid_id in referencing.get(DATA_KIDS, ()):
+            kid_info = self.kids_data[kid_id]
+            for key in KID_CHORE_LIST_FIELDS:
+                if key in kid_info:
+                    kid_info[key] = [
+                        chore_id
+                        for chore_id in kid_info[key]
+                        if chore_id not in removed_ids
+                    ]
+            for dict_key in KID_CHORE_DICT_FIELDS + ("reward_queue",):
+                for item_id in removed_ids.intersection(kid_info.get(dict_key, {})):
+                    del kid_info[dict_key][item_id]
+            LOGGER.debug("Cleaned up deleted references in kid '%s'", kid_info["name"])
+
+        # Chores: assigned kids
+        for chore_id in referencing.get(DATA_CHORES, ()):
+            chore_info = self.chores_data[chore_id]
+            chore_info["assigned_kids"] = [
+                kid_id
+                for kid_id in chore_info["assigned_kids"]
+                if kid_id not in removed_ids
+            ]
+            LOGGER.debug(
+                "Cleaned up assigned_kids in chore '%s'", chore_info.get("name")
+            )
+
+        # Achievements and challenges: assigned kids, progress and selected chore
+        for section in (DATA_ACHIEVEMENTS, DATA_CHALLENGES):
+            for rule_id in referencing.get(section, ()):
+                rule = self._data[section][rule_id]
+                if "assigned_kids" in rule:
+                    rule["assigned_kids"] = [
+                        kid_id
+                        for kid_id in rule["assigned_kids"]
+                        if kid_id not in removed_ids
+                    ]
+                progress = rule.get("progress", {})
+                for kid_id in removed_ids.intersection(progress):
+                    del progress[kid_id]
+                if rule.get("selected_chore_id") in removed_ids:
+                    rule["selected_chore_id"] = ""
+                LOGGER.debug(
+                    "Cleaned up deleted references in %s '%s'",
+                    section,
+                    rule.get("name"),
+                )
+
+        # Parents: associated kids
+        for parent_id in referencing.get(DATA_PARENTS, ()):
+            parent_info = self._data[DATA_PARENTS][parent_id]
+            parent_info["associated_kids"] = [
+                kid_id
+                for kid_id in parent_info["associated_kids"]
+                if kid_id not in removed_ids
+            ]
+            LOGGER.debug(
+                "Cleaned up associated_kids for parent '%s'. New list: %s",
+                parent_info.get("name"),
+                parent_info["associated_kids"],
+            )
+
+        # Pending approvals
+        stale_positions = referencing.get(DATA_PENDING_CHORE_APPROVALS)
+        if stale_positions:
+            self._data[DATA_PENDING_CHORE_APPROVALS] = [
+                ap
+                for position, ap in enumerate(self._data[DATA_PENDING_CHORE_APPROVALS])
+                if position not in stale_positions
+            ]
+        for redemption_id in referencing.get(DATA_PENDING_REWARD_APPROVALS, ()):
+            del self._data[DATA_PENDING_REWARD_APPROVALS][redemption_id]
+
+        # Points ledgers of deleted kids
+        ledgers = self._data.get(DATA_POINTS_LEDGER, {})
+        for kid_id in removed_ids.intersection(ledgers):
+            del ledgers[kid_id]
+
+    def repair_stale_references(self, stale_ids: set[str]) -> None:
+        """Drop references to kids, chores or rewards that no longer exist.
+
+        Called by the integrity checker; ids that exist again are left alone.
+        """
+        stale_ids = {
+            item_id
+            for item_id in stale_ids
+            if item_id not in self.kids_data
+            and item_id not in self.chores_data
+            and item_id not in self.rewards_data
+        }
+        if not stale_ids:
+            return
+
+        self._cleanup_deleted_references(stale_ids)
+        self._rule_index = None
+        self._rule_set = None
+        self._chore_state_counts.clear()
+
+        self._persist()
+        self._publish()
+
+    # -------------------------------------------------------------------------------------
+    # Create/Update Entities
+    # (Kids, Parents, Chores, Badges, Rewards, Penalties, Achievements and Challenges)
+    # -------------------------------------------------------------------------------------
+
+    # -- Kids
+    def _create_kid(self, kid_id: str, kid_data: dict[str, Any]):
+        self._data[DATA_KIDS][kid_id] = {
+            "name": kid_data.get("name", ""),
+            "points": kid_data.get("points", 0.0),
+            "badges": kid_data.get("badges", []),
+            "claimed_chores": kid_data.get("claimed_chores", []),
+            "approved_chores": kid_data.get("approved_chores", []),
+            "completed_chores_total": kid_data.get("completed_chores_total", 0),
+            "ha_user_id": kid_data.get("ha_user_id"),
+            "internal_id": kid_id,
+            "points_multiplier": kid_data.get("points_multiplier", 1.0),
+            "reward_claims": kid_data.get("reward_claims", {}),
+            "reward_approvals": kid_data.get("reward_approvals", {}),
+            "chore_claims": kid_data.get("chore_claims", {}),
+            "chore_approvals": kid_data.get("chore_approvals", {}),
+            "penalty_applies": kid_data.get("penalty_applies", {}),
+            "bonus_applies": kid_data.get("bonus_applies", {}),
+            "reward_queue": kid_data.get("reward_queue", {}),
+            "redeemed_rewards": kid_data.get("redeemed_rewards", []),
+            "day_counters": KidsChoresDayCounters.new_counter_data(
+                self._counting_day()
+            ),
+            "max_points_ever": kid_data.get("max_points_ever", 0.0),
+            "enable_notifications": kid_data.get("enable_notifications", True),
+            "mobile_notify_service": kid_data.get("mobile_notify_service", ""),
+            "use_persistent_notifications": kid_data.get(
+                "use_persistent_notifications", True
+            ),
+            "chore_streaks": {},
+            "chore_history": {},
+            "overall_streak": self._new_streak_record(),
+            "overdue_chores": [],
+            "overdue_notifications": {},
+        }
+
+        self._normalize_kid_lists(self._data[DATA_KIDS][kid_id])
+
+        LOGGER.debug(
+            "Added new kid '%s' with ID: %s",
+            self._data[DATA_KIDS][kid_id]["name"],
+            kid_id,
+        )
+
+    def _update_kid(self, kid_id: str, kid_data: dict[str, Any]):
+        kid_info = self._data[DATA_KIDS][kid_id]
+        # Overwrite or set default if not present
+        kid_info["name"] = kid_data.get("name", kid_info["name"])
+        kid_info["ha_user_id"] = kid_data.get("ha_user_id", kid_info["ha_user_id"])
+        kid_info.setdefault("reward_claims", kid_data.get("reward_claims", {}))
+        kid_info.setdefault("reward_approvals", kid_data.get("reward_approvals", {}))
+        kid_info.setdefault("chore_claims", kid_data.get("chore_claims", {}))
+        kid_info.setdefault("chore_approvals", kid_data.get("chore_approvals", {}))
+        kid_info.setdefault("penalty_applies", kid_data.get("penalty_applies", {}))
+        kid_info.setdefault("bonus_applies", kid_data.get("bonus_applies", {}))
+        kid_info.setdefault("reward_queue", kid_data.get("reward_queue", {}))
+        kid_info.setdefault("redeemed_rewards", kid_data.get("redeemed_rewards", []))
+        kid_info.setdefault(
+            "day_counters", KidsChoresDayCounters.new_counter_data(self._counting_day())
+        )
+        kid_info.setdefault("chore_history", {})
+        kid_info.setdefault("max_points_ever", kid_data.get("max_points_ever", 0.0))
+        kid_info.setdefault("points_multiplier", kid_data.get("points_multiplier", 1.0))
+        kid_info["enable_notifications"] = kid_data.get(
+            "enable_notifications", kid_info.get("enable_notifications", True)
+        )
+        kid_info["mobile_notify_service"] = kid_data.get(
+            "mobile_notify_service", kid_info.get("mobile_notify_service", "")
+        )
+        kid_info["use_persistent_notifications"] = kid_data.get(
+            "use_persistent_notifications",
+            kid_info.get("use_persistent_notifications", True),
+        )
+        kid_info.setdefault("chore_streaks", {})
+        kid_info.setdefault("overall_streak", self._new_streak_record())
+        kid_info.setdefault("overdue_chores", [])
+        kid_info.setdefault("overdue_notifications", {})
+
+        self._normalize_kid_lists(self._data[DATA_KIDS][kid_id])
+
+        LOGGER.debug("Updated kid '%s' with ID: %s", kid_info["name"], kid_id)
+
+    # -- Parents
+    def _create_parent(self, parent_id: str, parent_data: dict[str, Any]):
+        associated_kids_ids = []
+        for kid_id in parent_data.get("associated_kids", []):
+            if kid_id in self.kids_data:
+                associated_kids_ids.append(kid_id)
+            else:
+                LOGGER.warning(
+                    "Parent '%s': Kid ID '%s' not found. Skipping assignment to parent",
+                    parent_data.get("name", parent_id),
+                    kid_id,
+                )
+
+        self._data[DATA_PARENTS][parent_id] = {
+            "name": parent_data.get("name", ""),
+            "ha_user_id": parent_data.get("ha_user_id", ""),
+            "associated_kids": associated_kids_ids,
+            "enable_notifications": parent_data.get("enable_notifications", True),
+            "mobile_notify_service": parent_data.get("mobile_notify_service", ""),
+            "use_persistent_notifications": parent_data.get(
+                "use_persistent_notifications", True
+            ),
+            "internal_id": parent_id,
+        }
+        LOGGER.debug(
+            "Added new parent '%s' with ID: %s",
+            self._data[DATA_PARENTS][parent_id]["name"],
+            parent_id,
+        )
+
+    def _update_parent(self, parent_id: str, parent_data: dict[str, Any]):
+        parent_info = self._data[DATA_PARENTS][parent_id]
+        parent_info["name"] = parent_data.get("name", parent_info["name"])
+        parent_info["ha_user_id"] = parent_data.get(
+            "ha_user_id", parent_info["ha_user_id"]
+        )
+
+        # Update associated_kids
+        updated_kids = []
+        for kid_id in parent_data.get("associated_kids", []):
+            if kid_id in self.kids_data:
+                updated_kids.append(kid_id)
+            else:
+                LOGGER.warning(
+                    "Parent '%s': Kid ID '%s' not found. Skipping assignment",
+                    parent_info["name"],
+                    kid_id,
+                )
+        parent_info["associated_kids"] = updated_kids
+        parent_info["enable_notifications"] = parent_data.get(
+            "enable_notifications", parent_info.get("enable_notifications", True)
+        )
+        parent_info["mobile_notify_service"] = parent_data.get(
+            "mobile_notify_service", parent_info.get("mobile_notify_service", "")
+        )
+        parent_info["use_persistent_notifications"] = parent_data.get(
+            "use_persistent_notifications",
+            parent_info.get("use_persistent_notifications", True),
+        )
+
+        LOGGER.debug("Updated parent '%s' with ID: %s", parent_info["name"], parent_id)
+
+    # -- Chores
+    def _create_chore(self, chore_id: str, chore_data: dict[str, Any]):
+        assigned_kids_ids = []
+        for kid_name in chore_data.get("assigned_kids", []):
+            kid_id = self._get_kid_id_by_name(kid_name)
+            if kid_id:
+                assigned_kids_ids.append(kid_id)
+            else:
+                LOGGER.warning(
+                    "Chore '%s': Kid name '%s' not found. Skipping assignment",
+                    chore_data.get("name", chore_id),
+                    kid_name,
+                )
+
+        # If chore is recurring, set due_date to creation date if not set
+        freq = chore_data.get("recurring_frequency", FREQUENCY_NONE)
+        if freq != FREQUENCY_NONE and not chore_data.get("due_date"):
+            now_local = self._now().astimezone(dt_helpers.get_default_time_zone())
+            # Force the time to 23:59:00 (and zero microseconds)
+            default_due = now_local.replace(hour=23, minute=59, second=0, microsecond=0)
+            chore_data["due_date"] = default_due.isoformat()
+            LOGGER.debug(
+                "Chore '%s' has freq '%s' but no due_date. Defaulting to 23:59 local time: %s",
+                chore_data.get("name", chore_id),
+                freq,
+                chore_data["due_date"],
+            )
+
+        self._data[DATA_CHORES][chore_id] = {
+            "name": chore_data.get("name", ""),
+            "state": chore_data.get("state", CHORE_STATE_PENDING),
+            "default_points": chore_data.get("default_points", DEFAULT_POINTS),
+            "allow_multiple_claims_per_day": chore_data.get(
+                "allow_multiple_claims_per_day", DEFAULT_MULTIPLE_CLAIMS_PER_DAY
+            ),
+            "partial_allowed": chore_data.get(
+                "partial_allowed", DEFAULT_PARTIAL_ALLOWED
+            ),
+            "description": chore_data.get("description", ""),
+            "chore_labels": chore_data.get("chore_labels", []),
+            "icon": chore_data.get("icon", DEFAULT_ICON),
+            "shared_chore": chore_data.get("shared_chore", False),
+            "assigned_kids": assigned_kids_ids,
+            "recurring_frequency": chore_data.get(
+                "recurring_frequency", FREQUENCY_NONE
+            ),
+            "custom_interval": chore_data.get("custom_interval")
+            if chore_data.get("recurring_frequency") == FREQUENCY_CUSTOM
+            else None,
+            "custom_interval_unit": chore_data.get("custom_interval_unit")
+            if chore_data.get("recurring_frequency") == FREQUENCY_CUSTOM
+            else None,
+            "due_date": chore_data.get("due_date"),
+            "last_completed": chore_data.get("last_completed"),
+            "last_claimed": chore_data.get("last_claimed"),
+            "applicable_days": chore_data.get("applicable_days", []),
+            "notify_on_claim": chore_data.get(
+                "notify_on_claim", DEFAULT_NOTIFY_ON_CLAIM
+            ),
+            "notify_on_approval": chore_data.get(
+                "notify_on_approval", DEFAULT_NOTIFY_ON_APPROVAL
+            ),
+            "notify_on_disapproval": chore_data.get(
+                "notify_on_disapproval", DEFAULT_NOTIFY_ON_DISAPPROVAL
+            ),
+            "internal_id": chore_id,
+        }
+        LOGGER.debug(
+            "Added new chore '%s' with ID: %s",
+            self._data[DATA_CHORES][chore_id]["name"],
+            chore_id,
+        )
+
+        # Notify Kids of new chore
+        new_name = self._data[DATA_CHORES][chore_id]["name"]
+        due_date = self._data[DATA_CHORES][chore_id]["due_date"]
+        for kid_id in assigned_kids_ids:
+            due_str = due_date if due_date else "No due date set"
+            extra_data = {"kid_id": kid_id, "chore_id": chore_id}
+            self._notifier.notify_kid(
+                kid_id,
+                title="KidsChores: New Chore",
+                message=f"A new chore '{new_name}' was assigned to you! Due: {due_str}",
+                extra_data=extra_data,
+            )
+
+    def _update_chore(self, chore_id: str, chore_data: dict[str, Any]):
+        chore_info = self._data[DATA_CHORES][chore_id]
+        chore_info["name"] = chore_data.get("name", chore_info["name"])
+        chore_info["state"] = chore_data.get("state", chore_info["state"])
+        chore_info["default_points"] = chore_data.get(
+            "default_points", chore_info["default_points"]
+        )
+        chore_info["allow_multiple_claims_per_day"] = chore_data.get(
+            "allow_multiple_claims_per_day", chore_info["allow_multiple_claims_per_day"]
+        )
+        chore_info["partial_allowed"] = chore_data.get(
+            "partial_allowed", chore_info["partial_allowed"]
+        )
+        chore_info["description"] = chore_data.get(
+            "description", chore_info["description"]
+        )
+        chore_info["chore_labels"] = chore_data.get(
+            "chore_labels", chore_info.get("chore_labels", [])
+        )
+        chore_info["icon"] = chore_data.get("icon", chore_info["icon"])
+        chore_info["shared_chore"] = chore_data.get(
+            "shared_chore", chore_info["shared_chore"]
+        )
+
+        assigned_kids_ids = []
+        for kid_name in chore_data.get("assigned_kids", []):
+            kid_id = self._get_kid_id_by_name(kid_name)
+            if kid_id:
+                assigned_kids_ids.append(kid_id)
+            else:
+                LOGGER.warning(
+                    "Chore '%s': Kid name '%s' not found. Skipping assignment",
+                    chore_data.get("name", chore_id),
+                    kid_name,
+                )
+        old_assigned = set(chore_info.get("assigned_kids", []))
+        new_assigned = set(assigned_kids_ids)
+        removed_kids = old_assigned - new_assigned
+        for kid in removed_kids:
+            self._remove_kid_chore_entities(kid, chore_id)
+            self._cleanup_chore_from_kid(kid, chore_id)
+
+        # Update the chore's assigned kids list with the new assignments
+        chore_info["assigned_kids"] = list(new_assigned)
+
+        chore_info["recurring_frequency"] = chore_data.get(
+            "recurring_frequency", chore_info["recurring_frequency"]
+        )
+        chore_info["due_date"] = chore_data.get("due_date", chore_info["due_date"])
+        chore_info["last_completed"] = chore_data.get(
+            "last_completed", chore_info.get("last_completed")
+        )
+        chore_info["last_claimed"] = chore_data.get(
+            "last_claimed", chore_info.get("last_claimed")
+        )
+        chore_info["applicable_days"] = chore_data.get(
+            "applicable_days", chore_info.get("applicable_days", [])
+        )
+        chore_info["notify_on_claim"] = chore_data.get(
+            "notify_on_claim",
+            chore_info.get("notify_on_claim", DEFAULT_NOTIFY_ON_CLAIM),
+        )
+        chore_info["notify_on_approval"] = chore_data.get(
+            "notify_on_approval",
+            chore_info.get("notify_on_approval", DEFAULT_NOTIFY_ON_APPROVAL),
+        )
+        chore_info["notify_on_disapproval"] = chore_data.get(
+            "notify_on_disapproval",
+            chore_info.get("notify_on_disapproval", DEFAULT_NOTIFY_ON_DISAPPROVAL),
+        )
+        if chore_info["recurring_frequency"] == FREQUENCY_CUSTOM:
+            chore_info["custom_interval"] = chore_data.get("custom_interval")
+            chore_info["custom_interval_unit"] = chore_data.get("custom_interval_unit")
+        else:
+            chore_info["custom_interval"] = None
+            chore_info["custom_interval_unit"] = None
+
+        LOGGER.debug("Updated chore '%s' with ID: %s", chore_info["name"], chore_id)
+
+        self._check_overdue_chores()
+
+    # -- Badges
+    def _create_badge(self, badge_id: str, badge_data: dict[str, Any]):
+        self._data[DATA_BADGES][badge_id] = {
+            "name": badge_data.get("name", ""),
+            "threshold_type": badge_data.get(
+                "threshold_type", BADGE_THRESHOLD_TYPE_POINTS
+            ),
+            "threshold_value": badge_data.get(
+                "threshold_value", DEFAULT_BADGE_THRESHOLD
+            ),
+            "chore_count_type": badge_data.get("chore_count_type", FREQUENCY_DAILY),
+            "earned_by": badge_data.get("earned_by", []),
+            "points_multiplier": badge_data.get(
+                "points_multiplier", DEFAULT_POINTS_MULTIPLIER
+            ),
+            "icon": badge_data.get("icon", DEFAULT_ICON),
+            "description": badge_data.get("description", ""),
+            "badge_labels": badge_data.get("badge_labels", []),
+            "criteria": badge_data.get("criteria", ""),
+            "internal_id": badge_id,
+        }
+        LOGGER.debug(
+            "Added new badge '%s' with ID: %s",
+            self._data[DATA_BADGES][badge_id]["name"],
+            badge_id,
+        )
+
+    def _update_badge(self, badge_id: str, badge_data: dict[str, Any]):
+        badge_info = self._data[DATA_BADGES][badge_id]
+        badge_info["name"] = badge_data.get("name", badge_info["name"])
+        badge_info["threshold_type"] = badge_data.get(
+            "threshold_type",
+            badge_info.get("threshold_type", BADGE_THRESHOLD_TYPE_POINTS),
+        )
+        badge_info["threshold_value"] = badge_data.get(
+            "threshold_value",
+            badge_info.get("threshold_value", DEFAULT_BADGE_THRESHOLD),
+        )
+        badge_info["chore_count_type"] = badge_data.get(
+            "chore_count_type", badge_info.get("chore_count_type", FREQUENCY_NONE)
+        )
+        badge_info["points_multiplier"] = badge_data.get(
+            "points_multiplier",
+            badge_info.get("points_multiplier", DEFAULT_POINTS_MULTIPLIER),
+        )
+        badge_info["icon"] = badge_data.get(
+            "icon", badge_info.get("icon", DEFAULT_ICON)
+        )
+        badge_info["description"] = badge_data.get(
+            "description", badge_info.get("description", "")
+        )
+        badge_info["badge_labels"] = badge_data.get(
+            "badge_labels", badge_info.get("badge_labels", [])
+        )
+        badge_info["criteria"] = badge_data.get(
+            "criteria", badge_info.get("criteria", "")
+        )
+
+        LOGGER.debug("Updated badge '%s' with ID: %s", badge_info["name"], badge_id)
+
+    # -- Rewards
+    def _create_reward(self, reward_id: str, reward_data: dict[str, Any]):
+        self._data[DATA_REWARDS][reward_id] = {
+            "name": reward_data.get("name", ""),
+            "cost": reward_data.get("cost", DEFAULT_REWARD_COST),
+            "description": reward_data.get("description", ""),
+            "reward_labels": reward_data.get("reward_labels", []),
+            "icon": reward_data.get("icon", DEFAULT_REWARD_ICON),
+            "expiry_hours": reward_data.get(
+                "expiry_hours", DEFAULT_REWARD_EXPIRY_HOURS
+            ),
+            "internal_id": reward_id,
+        }
+        LOGGER.debug(
+            "Added new reward '%s' with ID: %s",
+            self._data[DATA_REWARDS][reward_id]["name"],
+            reward_id,
+        )
+
+    def _update_reward(self, reward_id: str, reward_data: dict[str, Any]):
+        reward_info = self._data[DATA_REWARDS][reward_id]
+        reward_info["name"] = reward_data.get("name", reward_info["name"])
+        reward_info["cost"] = reward_data.get("cost", reward_info["cost"])
+        reward_info["description"] = reward_data.get(
+            "description", reward_info["description"]
+        )
+        reward_info["reward_labels"] = reward_data.get(
+            "reward_labels", reward_info.get("reward_labels", [])
+        )
+        reward_info["icon"] = reward_data.get("icon", reward_info["icon"])
+        reward_info["expiry_hours"] = reward_data.get(
+            "expiry_hours", reward_info.get("expiry_hours", DEFAULT_REWARD_EXPIRY_HOURS)
+        )
+        LOGGER.debug("Updated reward '%s' with ID: %s", reward_info["name"], reward_id)
+
+    # -- Penalties
+    def _create_penalty(self, penalty_id: str, penalty_data: dict[str, Any]):
+        self._data[DATA_PENALTIES][penalty_id] = {
+            "name": penalty_data.get("name", ""),
+            "points": penalty_data.get("points", -DEFAULT_PENALTY_POINTS),
+            "description": penalty_data.get("description", ""),
+            "penalty_labels": penalty_data.get("penalty_labels", []),
+            "icon": penalty_data.get("icon", DEFAULT_PENALTY_ICON),
+            "internal_id": penalty_id,
+        }
+        LOGGER.debug(
+            "Added new penalty '%s' with ID: %s",
+            self._data[DATA_PENALTIES][penalty_id]["name"],
+            penalty_id,
+        )
+
+    def _update_penalty(self, penalty_id: str, penalty_data: dict[str, Any]):
+        penalty_info = self._data[DATA_PENALTIES][penalty_id]
+        penalty_info["name"] = penalty_data.get("name", penalty_info["name"])
+        penalty_info["points"] = penalty_data.get("points", penalty_info["points"])
+        penalty_info["description"] = penalty_data.get(
+            "description", penalty_info["description"]
+        )
+        penalty_info["penalty_labels"] = penalty_data.get(
+            "penalty_labels", penalty_info.get("penalty_labels", [])
+        )
+        penalty_info["icon"] = penalty_data.get("icon", penalty_info["icon"])
+        LOGGER.debug(
+            "Updated penalty '%s' with ID: %s", penalty_info["name"], penalty_id
+        )
+
+    # -- Bonuses
+    def _create_bonus(self, bonus_id: str, bonus_data: dict[str, Any]):
+        self._data[DATA_BONUSES][bonus_id] = {
+            "name": bonus_data.get("name", ""),
+            "points": bonus_data.get("points", DEFAULT_BONUS_POINTS),
+            "description": bonus_data.get("description", ""),
+            "bonus_labels": bonus_data.get("bonus_labels", []),
+            "icon": bonus_data.get("icon", DEFAULT_BONUS_ICON),
+            "internal_id": bonus_id,
+        }
+        LOGGER.debug(
+            "Added new bonus '%s' with ID: %s",
+            self._data[DATA_BONUSES][bonus_id]["name"],
+            bonus_id,
+        )
+
+    def _update_bonus(self, bonus_id: str, bonus_data: dict[str, Any]):
+        bonus_info = self._data[DATA_BONUSES][bonus_id]
+        bonus_info["name"] = bonus_data.get("name", bonus_info["name"])
+        bonus_info["points"] = bonus_data.get("points", bonus_info["points"])
+        bonus_info["description"] = bonus_data.get(
+            "description", bonus_info["description"]
+        )
+        bonus_info["bonus_labels"] = bonus_data.get(
+            "bonus_labels", bonus_info.get("bonus_labels", [])
+        )
+        bonus_info["icon"] = bonus_data.get("icon", bonus_info["icon"])
+        LOGGER.debug("Updated bonus '%s' with ID: %s", bonus_info["name"], bonus_id)
+
+    # -- Achievements
+    def _create_achievement(
+        self, achievement_id: str, achievement_data: dict[str, Any]
+    ):
+        self._data[DATA_ACHIEVEMENTS][achievement_id] = {
+            "name": achievement_data.get("name", ""),
+            "description": achievement_data.get("description", ""),
+            "achievement_labels": achievement_data.get("achievement_labels", []),
+            "icon": achievement_data.get("icon", ""),
+            "assigned_kids": achievement_data.get("assigned_kids", []),
+            "type": achievement_data.get("type", "individual"),
+            "selected_chore_id": achievement_data.get("selected_chore_id", ""),
+            "criteria": achievement_data.get("criteria", ""),
+            "target_value": achievement_data.get("target_value", 1),
+            "reward_points": achievement_data.get("reward_points", 0),
+            "progress": achievement_data.get("progress", {}),
+            "internal_id": achievement_id,
+        }
+        LOGGER.debug(
+            "Added new achievement '%s' with ID: %s",
+            self._data[DATA_ACHIEVEMENTS][achievement_id]["name"],
+            achievement_id,
+        )
+
+    def _update_achievement(
+        self, achievement_id: str, achievement_data: dict[str, Any]
+    ):
+        achievement_info = self._data[DATA_ACHIEVEMENTS][achievement_id]
+        achievement_info["name"] = achievement_data.get(
+            "name", achievement_info["name"]
+        )
+        achievement_info["description"] = achievement_data.get(
+            "description", achievement_info["description"]
+        )
+        achievement_info["achievement_labels"] = achievement_data.get(
+            "achievement_labels", achievement_info.get("achievement_labels", [])
+        )
+        achievement_info["icon"] = achievement_data.get(
+            "icon", achievement_info["icon"]
+        )
+        achievement_info["assigned_kids"] = achievement_data.get(
+            "assigned_kids", achievement_info["assigned_kids"]
+        )
+        achievement_info["type"] = achievement_data.get(
+            "type", achievement_info["type"]
+        )
+        achievement_info["selected_chore_id"] = achievement_data.get(
+            "selected_chore_id", achievement_info.get("selected_chore_id", "")
+        )
+        achievement_info["criteria"] = achievement_data.get(
+            "criteria", achievement_info["criteria"]
+        )
+        achievement_info["target_value"] = achievement_data.get(
+            "target_value", achievement_info["target_value"]
+        )
+        achievement_info["reward_points"] = achievement_data.get(
+            "reward_points", achievement_info["reward_points"]
+        )
+
+        LOGGER.debug(
+            "Updated achievement '%s' with ID: %s",
+            achievement_info["name"],
+            achievement_id,
+        )
+
+    # -- Challenges
+    def _create_challenge(self, challenge_id: str, challenge_data: dict[str, Any]):
+        self._data[DATA_CHALLENGES][challenge_id] = {
+            "name": challenge_data.get("name", ""),
+            "description": challenge_data.get("description", ""),
+            "challenge_labels": challenge_data.get("challenge_labels", []),
+            "icon": challenge_data.get("icon", ""),
+            "assigned_kids": challenge_data.get("assigned_kids", []),
+            "type": challenge_data.get("type", "individual"),
+            "selected_chore_id": challenge_data.get("selected_chore_id", ""),
+            "criteria": challenge_data.get("criteria", ""),
+            "target_value": challenge_data.get("target_value", 1),
+            "reward_points": challenge_data.get("reward_points", 0),
+            "start_date": challenge_data.get("start_date")
+            if challenge_data.get("start_date") not in [None, {}]
+            else None,
+            "end_date": challenge_data.get("end_date")
+            if challenge_data.get("end_date") not in [None, {}]
+            else None,
+            "progress": challenge_data.get("progress", {}),
+            "internal_id": challenge_id,
+        }
+        LOGGER.debug(
+            "Added new challenge '%s' with ID: %s",
+            self._data[DATA_CHALLENGES][challenge_id]["name"],
+            challenge_id,
+        )
+
+    def _update_challenge(self, challenge_id: str, challenge_data: dict[str, Any]):
+        challenge_info = self._data[DATA_CHALLENGES][challenge_id]
+        challenge_info["name"] = challenge_data.get("name", challenge_info["name"])
+        challenge_info["description"] = challenge_data.get(
+            "description", challenge_info["description"]
+        )
+        challenge_info["challenge_labels"] = challenge_data.get(
+            "challenge_labels", challenge_info.get("challenge_labels", [])
+        )
+        challenge_info["icon"] = challenge_data.get("icon", challenge_info["icon"])
+        challenge_info["assigned_kids"] = challenge_data.get(
+            "assigned_kids", challenge_info["assigned_kids"]
+        )
+        challenge_info["type"] = challenge_data.get("type", challenge_info["type"])
+        challenge_info["selected_chore_id"] = challenge_data.get(
+            "selected_chore_id", challenge_info.get("selected_chore_id", "")
+        )
+        challenge_info["criteria"] = challenge_data.get(
+            "criteria", challenge_info["criteria"]
+        )
+        challenge_info["target_value"] = challenge_data.get(
+            "target_value", challenge_info["target_value"]
+        )
+        challenge_info["reward_points"] = challenge_data.get(
+            "reward_points", challenge_info["reward_points"]
+        )
+        challenge_info["start_date"] = (
+            challenge_data.get("start_date")
+            if challenge_data.get("start_date") not in [None, {}]
+            else None
+        )
+        challenge_info["end_date"] = (
+            challenge_data.get("end_date")
+            if challenge_data.get("end_date") not in [None, {}]
+            else None
+        )
+        LOGGER.debug(
+            "Updated challenge '%s' with ID: %s", challenge_info["name"], challenge_id
+        )
+
+    # -------------------------------------------------------------------------------------
+    # Properties for Easy Access
+    # -------------------------------------------------------------------------------------
+
+    @property
+    def data(self) -> dict[str, Any]:
+        """Return all of the household's data, as stored."""
+        return self._data
+
+    @property
+    def due_state_changed(self) -> bool:
+        """Return True if a change since the last refresh may affect overdue status."""
+        return self._due_state_changed
+
+    @property
+    def kids_data(self) -> dict[str, Any]:
+        """Return the kids data."""
+        return self._data.get(DATA_KIDS, {})
+
+    @property
+    def parents_data(self) -> dict[str, Any]:
+        """Return the parents data."""
+        return self._data.get(DATA_PARENTS, {})
+
+    @property
+    def chores_data(self) -> dict[str, Any]:
+        """Return the chores data."""
+        return self._data.get(DATA_CHORES, {})
+
+    @property
+    def badges_data(self) -> dict[str, Any]:
+        """Return the badges data."""
+        return self._data.get(DATA_BADGES, {})
+
+    @property
+    def badge_index(self) -> KidsChoresBadgeIndex:
+        """Return the sorted badge-threshold index."""
+        if self._badge_index is None:
+            self._badge_index = KidsChoresBadgeIndex(self.badges_data)
+        return self._badge_index
+
+    @property
+    def rule_index(self) -> KidsChoresRuleIndex:
+        """Return the achievement and challenge rule index."""
+        if self._rule_index is None:
+            self._rule_index = KidsChoresRuleIndex(
+                self.achievements_data, self.challenges_data
+            )
+        return self._rule_index
+
+    @property
+    def rule_set(self) -> KidsChoresRuleSet:
+        """Return the compiled rule-type badges, achievements and challenges."""
+        if self._rule_set is None:
+            self._rule_set = KidsChoresRuleSet(
+                self.kids_data,
+                self.badges_data,
+                self.achievements_data,
+                self.challenges_data,
+            )
+        return self._rule_set
+
+    @property
+    def rewards_data(self) -> dict[str, Any]:
+        """Return the rewards data."""
+        return self._data.get(DATA_REWARDS, {})
+
+    @property
+    def penalties_data(self) -> dict[str, Any]:
+        """Return the penalties data."""
+        return self._data.get(DATA_PENALTIES, {})
+
+    @property
+    def achievements_data(self) -> dict[str, Any]:
+        """Return the achievements data."""
+        return self._data.get(DATA_ACHIEVEMENTS, {})  # New
+
+    @property
+    def challenges_data(self) -> dict[str, Any]:
+        """Return the challenges data."""
+        return self._data.get(DATA_CHALLENGES, {})
+
+    @property
+    def bonuses_data(self) -> dict[str, Any]:
+        """Return the bonuses data."""
+        return self._data.get(DATA_BONUSES, {})
+
+    # -------------------------------------------------------------------------------------
+    # Optimistic Concurrency Versions
+    # Every mutation bumps the version of the records it touches. Callers that pass an
+    # expected version have their command rejected if the record changed in between.
+    # -------------------------------------------------------------------------------------
+
+    def _bump_version(self, record: dict[str, Any]) -> int:
+        """Increment and return a record's version."""
+        record["version"] = record.get("version", 0) + 1
+        return record["version"]
+
+    def _bump_item_version(
+        self, kid_info: dict[str, Any], field: str, item_id: str
+    ) -> int:
+        """Increment and return a kid's version for one chore or reward."""
+        versions = kid_info.setdefault(field, {})
+        versions[item_id] = versions.get(item_id, 0) + 1
+        return versions[item_id]
+
+    def get_chore_version(self, kid_id: str, chore_id: str) -> int:
+        """Return the version of a kid's state on a chore."""
+        kid_info = self.kids_data.get(kid_id, {})
+        return kid_info.get("chore_versions", {}).get(chore_id, 0)
+
+    def get_reward_version(self, kid_id: str, reward_id: str) -> int:
+        """Return the version of a kid's state on a reward."""
+        kid_info = self.kids_data.get(kid_id, {})
+        return kid_info.get("reward_versions", {}).get(reward_id, 0)
+
+    def _check_version(
+        self, label: str, current: int, expected_version: Optional[int]
+    ) -> None:
+        """Reject a stale command whose expected version no longer matches."""
+        if expected_version is None or int(expected_version) == current:
+            return
+        LOGGER.warning(
+            "Rejected stale command for %s: version %s, expected %s",
+            label,
+            current,
+            expected_version,
+        )
+        raise KidsChoresError(
+            ERROR_STALE_VERSION_FMT.format(label, current, expected_version)
+        )
+
+    # -------------------------------------------------------------------------------------
+    # Parents: Add, Remove
+    # -------------------------------------------------------------------------------------
+
+    def add_parent(self, parent_def: dict[str, Any]):
+        """Add new parent at runtime if needed."""
+        parent_name = parent_def.get("name")
+        ha_user_id = parent_def.get("ha_user_id")
+        kid_ids = parent_def.get("associated_kids", [])
+
+        if not parent_name or not ha_user_id:
+            LOGGER.warning("Add parent: Parent must have a name and ha_user_id")
+            return
+
+        if any(p["ha_user_id"] == ha_user_id for p in self.parents_data.values()):
+            LOGGER.warning(
+                "Add parent: Parent with ha_user_id '%s' already exists", ha_user_id
+            )
+            return
+
+        valid_kids = []
+        for kid_id in kid_ids:
+            if kid_id in self.kids_data:
+                valid_kids.append(kid_id)
+            else:
+                LOGGER.warning(
+                    "Add parent: Kid ID '%s' not found. Skipping assignment to parent '%s'",
+                    kid_id,
+                    parent_name,
+                )
+
+        new_id = str(uuid.uuid4())
+        self.parents_data[new_id] = {
+            "name": parent_name,
+            "ha_user_id": ha_user_id,
+            "associated_kids": valid_kids,
+            "internal_id": new_id,
+        }
+        LOGGER.debug("Added new parent '%s' with ID: %s", parent_name, new_id)
+        self._persist()
+        self._publish()
+
+    def remove_parent(self, parent_id: str):
+        """Remove a parent by ID."""
+        if parent_id in self.parents_data:
+            parent_name = self.parents_data[parent_id]["name"]
+            del self.parents_data[parent_id]
+            LOGGER.debug("Removed parent '%s' with ID: %s", parent_name, parent_id)
+            self._persist()
+            self._publish()
+        else:
+            LOGGER.warning("Remove parent: Parent ID '%s' not found", parent_id)
+
+    # -------------------------------------------------------------------------------------
+    # Chores: Claim, Approve, Disapprove, Compute Global State for Shared Chores
+    # -------------------------------------------------------------------------------------
+
+    def claim_chore(self, kid_id: str, chore_id: str, user_name: str):
+        """Kid claims chore => state=claimed; parent must then approve."""
+        if chore_id not in self.chores_data:
+            LOGGER.warning("Chore ID '%s' not found for claim", chore_id)
+            raise KidsChoresError(f"Chore with ID '{chore_id}' not found.")
+
+        chore_info = self.chores_data[chore_id]
+        if kid_id not in chore_info.get("assigned_kids", []):
+            LOGGER.warning(
+                "Claim chore: Chore ID '%s' not assigned to kid ID '%s'",
+                chore_id,
+                kid_id,
+            )
+            raise KidsChoresError(
+                f"Chore '{chore_info.get('name')}' is not assigned to kid '{self.kids_data[kid_id]['name']}'."
+            )
+
+        if kid_id not in self.kids_data:
+            LOGGER.warning("Kid ID '%s' not found", kid_id)
+            raise KidsChoresError(f"Kid with ID '{kid_id}' not found.")
+
+        kid_info = self.kids_data.get(kid_id)
+
+        self._normalize_kid_lists(kid_info)
+
+        # With multiple claims allowed, the claim below clears any earlier approval
+        # so it can trigger a new approval flow.
+        allow_multiple = chore_info.get("allow_multiple_claims_per_day", False)
+        if not allow_multiple:
+            if chore_id in kid_info.get(
+                "claimed_chores", []
+            ) or chore_id in kid_info.get("approved_chores", []):
+                error_message = f"Chore '{chore_info['name']}' has already been claimed today and multiple claims are not allowed."
+                LOGGER.warning(error_message)
+                raise KidsChoresError(error_message)
+
+        self._process_chore_state(kid_id, chore_id, CHORE_STATE_CLAIMED)
+
+        # Send a notification to the parents that a kid claimed a chore
+        if chore_info.get(CONF_NOTIFY_ON_CLAIM, DEFAULT_NOTIFY_ON_CLAIM):
+            actions = [
+                {
+                    "action": f"{ACTION_APPROVE_CHORE}|{kid_id}|{chore_id}|{self.get_chore_version(kid_id, chore_id)}",
+                    "title": ACTION_TITLE_APPROVE,
+                },
+                {
+                    "action": f"{ACTION_DISAPPROVE_CHORE}|{kid_id}|{chore_id}|{self.get_chore_version(kid_id, chore_id)}",
+                    "title": ACTION_TITLE_DISAPPROVE,
+                },
+                {
+                    "action": f"{ACTION_REMIND_30}|{kid_id}|{chore_id}",
+                    "title": ACTION_TITLE_REMIND_30,
+                },
+            ]
+            # Pass extra context so the event handler can route the action.
+            extra_data = {
+                "kid_id": kid_id,
+                "chore_id": chore_id,
+            }
+            self._notifier.notify_parents(
+                kid_id,
+                title="KidsChores: Chore Claimed",
+                message=f"'{self.kids_data[kid_id]['name']}' claimed chore '{self.chores_data[chore_id]['name']}'",
+                actions=actions,
+                extra_data=extra_data,
+            )
+
+        self._persist()
+        self._publish()
+
+    def approve_chore(
+        self,
+        parent_name: str,
+        kid_id: str,
+        chore_id: str,
+        points_awarded: Optional[float] = None,
+        expected_version: Optional[int] = None,
+    ):
+        """Approve a chore for kid_id if assigned.
+
+        If expected_version is given, the approval is rejected when the kid's state on
+        the chore changed since that version (e.g. another parent already approved).
+        """
+        if chore_id not in self.chores_data:
+            raise KidsChoresError(f"Chore with ID '{chore_id}' not found.")
+
+        chore_info = self.chores_data[chore_id]
+        if kid_id not in chore_info.get("assigned_kids", []):
+            raise KidsChoresError(
+                f"Chore '{chore_info.get('name')}' is not assigned to kid '{self.kids_data[kid_id]['name']}'."
+            )
+
+        if kid_id not in self.kids_data:
+            raise KidsChoresError(f"Kid with ID '{kid_id}' not found.")
+
+        kid_info = self.kids_data.get(kid_id)
+
+        self._check_version(
+            f"Chore '{chore_info['name']}' for '{kid_info['name']}'",
+            self.get_chore_version(kid_id, chore_id),
+            expected_version,
+        )
+
+        allow_multiple = chore_info.get("allow_multiple_claims_per_day", False)
+        if not allow_multiple:
+            if chore_id in kid_info.get("approved_chores", []):
+                error_message = f"Chore '{chore_info['name']}' has already been approved today; multiple approvals not allowed."
+                LOGGER.warning(error_message)
+                raise KidsChoresError(error_message)
+
+        default_points = chore_info.get("default_points", DEFAULT_POINTS)
+        multiplier = kid_info.get("points_multiplier", 1.0)
+        awarded_points = (
+            points_awarded * multiplier
+            if points_awarded is not None
+            else default_points * multiplier
+        )
+
+        self._process_chore_state(
+            kid_id, chore_id, CHORE_STATE_APPROVED, points_awarded=awarded_points
+        )
+
+        # Remove to avoid awarding duplicated points
+        # old_points = float(kid_info["points"])
+        # new_points = old_points + awarded_points
+        # self.update_kid_points(kid_id, new_points)
+
+        # increment completed chores counters
+        self._count_day_counter(kid_info, COUNTER_CHORES, 1)
+        kid_info["completed_chores_total"] += 1
+        self._record_chore_history(kid_info, chore_id)
+
+        # Track today’s approvals for chores that allow multiple claims.
+        if chore_info.get("allow_multiple_claims_per_day", False):
+            self._count_today_chore_approval(kid_id, chore_id)
+
+        chore_info["last_completed"] = self._now().isoformat()
+
+        # remove from pending approvals
+        self._data[DATA_PENDING_CHORE_APPROVALS] = [
+            ap
+            for ap in self._data[DATA_PENDING_CHORE_APPROVALS]
+            if not (ap["kid_id"] == kid_id and ap["chore_id"] == chore_id)
+        ]
+
+        # increment chore approvals
+        if chore_id in kid_info["chore_approvals"]:
+            kid_info["chore_approvals"][chore_id] += 1
+        else:
+            kid_info["chore_approvals"][chore_id] = 1
+
+        # Manage Challenges (streak achievements read the streaks recorded above)
+        rule_index = self.rule_index
+        today = dt_helpers.as_local(self._now()).date()
+        now = self._now()
+        for challenge_id in rule_index.challenges.matching(
+            CHALLENGE_TYPE_TOTAL_WITHIN_WINDOW, kid_id
+        ):
+            start_date, end_date = rule_index.challenge_window(challenge_id)
+            if start_date and end_date and start_date <= now <= end_date:
+                progress = (
+                    self.challenges_data[challenge_id]
+                    .setdefault("progress", {})
+                    .setdefault(kid_id, {"count": 0, "awarded": False})
+                )
+                progress["count"] += 1
+
+        for challenge_id in rule_index.challenges.matching(
+            CHALLENGE_TYPE_DAILY_MIN, kid_id, chore_id
+        ):
+            self._record_daily_min_approval(challenge_id, kid_id, today)
+
+        # Rule-type awards reading the counters, streaks and approvals above
+        self._evaluate_rules(kid_id, CHORE_INPUTS)
+
+        # Send a notification to the kid that chore was approved
+        if chore_info.get(CONF_NOTIFY_ON_APPROVAL, DEFAULT_NOTIFY_ON_APPROVAL):
+            extra_data = {"kid_id": kid_id, "chore_id": chore_id}
+            self._notifier.notify_kid(
+                kid_id,
+                title="KidsChores: Chore Approved",
+                message=f"Your chore '{chore_info['name']}' was approved. You earned {awarded_points} points.",
+                extra_data=extra_data,
+            )
+
+        self._persist()
+        self._publish()
+
+    def disapprove_chore(
+        self,
+        parent_name: str,
+        kid_id: str,
+        chore_id: str,
+        expected_version: Optional[int] = None,
+    ):
+        """Disapprove a chore for kid_id."""
+        chore_info = self.chores_data.get(chore_id)
+        if not chore_info:
+            raise KidsChoresError(f"Chore with ID '{chore_id}' not found.")
+
+        kid_info = self.kids_data.get(kid_id)
+        if not kid_info:
+            raise KidsChoresError(f"Kid with ID '{kid_id}' not found.")
+
+        self._check_version(
+            f"Chore '{chore_info['name']}' for '{kid_info['name']}'",
+            self.get_chore_version(kid_id, chore_id),
+            expected_version,
+        )
+
+        self._process_chore_state(kid_id, chore_id, CHORE_STATE_PENDING)
+
+        # Send a notification to the kid that chore was disapproved
+        if chore_info.get(CONF_NOTIFY_ON_DISAPPROVAL, DEFAULT_NOTIFY_ON_DISAPPROVAL):
+            extra_data = {"kid_id": kid_id, "chore_id": chore_id}
+            self._notifier.notify_kid(
+                kid_id,
+                title="KidsChores: Chore Disapproved",
+                message=f"Your chore '{chore_info['name']}' was disapproved.",
+                extra_data=extra_data,
+            )
+
+        self._mark_due_state_changed()
+        self._persist()
+        self._publish()
+
+    def update_chore_state(self, chore_id: str, state: str):
+        """Manually override a chore's state."""
+        chore_info = self.chores_data.get(chore_id)
+        if not chore_info:
+            LOGGER.warning("Update chore state: Chore ID '%s' not found", chore_id)
+            return
+        # Set state for all kids assigned to the chore:
+        for kid_id in chore_info.get("assigned_kids", []):
+            if kid_id:
+                self._process_chore_state(kid_id, chore_id, state)
+        self._mark_due_state_changed()
+        self._persist()
+        self._publish()
+        LOGGER.debug(f"Chore ID '{chore_id}' state manually updated to '{state}'")
+
+    # -------------------------------------------------------------------------------------
+    # Chore State Processing: Centralized Function
+    # The most critical thing to understand when working on this function is that
+    # chore_info["state"] is actually the global state of the chore. The individual chore
+    # state per kid is always calculated based on whether they have any claimed, approved, or
+    # overdue chores listed for them.
+    #
+    # Global state will only match if a single kid is assigned to the chore, or all kids
+    # assigned are in the same state.
+    # -------------------------------------------------------------------------------------
+
+    def _process_chore_state(
+        self,
+        kid_id: str,
+        chore_id: str,
+        new_state: str,
+        *,
+        points_awarded: Optional[float] = None,
+    ) -> None:
+        LOGGER.debug(
+            "Entering _process_chore_state with kid_id=%s, chore_id=%s, new_state=%s, points_awarded=%s",
+            kid_id,
+            chore_id,
+            new_state,
+            points_awarded,
+        )
+
+        """Centralized function to update a chore’s state for a given kid."""
+        kid_info = self.kids_data.get(kid_id)
+        chore_info = self.chores_data.get(chore_id)
+
+        if not kid_info or not chore_info:
+            LOGGER.warning(
+                "State change skipped: Kid '%s' or Chore '%s' not found",
+                kid_id,
+                chore_id,
+            )
+            return
+
+        previous_state = self._kid_chore_state(kid_info, chore_id)
+
+        # Any state change invalidates commands issued against the previous version.
+        # Claims and approvals always change something (a pending approval, points);
+        # re-marking a chore that is already overdue or pending changes nothing.
+        if previous_state != new_state or new_state in (
+            CHORE_STATE_CLAIMED,
+            CHORE_STATE_APPROVED,
+        ):
+            self._bump_version(kid_info)
+            self._bump_version(chore_info)
+            self._bump_item_version(kid_info, "chore_versions", chore_id)
+
+        # Clear any overdue tracking.
+        kid_info.setdefault("overdue_chores", [])
+        kid_info.setdefault("overdue_notifications", {})
+
+        # Remove all instances of the chore from overdue lists.
+        kid_info["overdue_chores"] = [
+            entry for entry in kid_info.get("overdue_chores", []) if entry != chore_id
+        ]
+
+        if chore_id in kid_info["overdue_notifications"]:
+            kid_info["overdue_notifications"].pop(chore_id)
+
+        if new_state == CHORE_STATE_CLAIMED:
+            # Remove all previous approvals in case of duplicate, add to claimed.
+            kid_info["approved_chores"] = [
+                item for item in kid_info.get("approved_chores", []) if item != chore_id
+            ]
+
+            kid_info.setdefault("claimed_chores", [])
+
+            if chore_id not in kid_info["claimed_chores"]:
+                kid_info["claimed_chores"].append(chore_id)
+
+            chore_info["last_claimed"] = self._now().isoformat()
+
+            self._data.setdefault(DATA_PENDING_CHORE_APPROVALS, []).append(
+                {
+                    "kid_id": kid_id,
+                    "chore_id": chore_id,
+                    "timestamp": self._now().isoformat(),
+                }
+            )
+
+        elif new_state == CHORE_STATE_APPROVED:
+            # Remove all claims for chores in case of duplicates, add to approvals.
+            kid_info["claimed_chores"] = [
+                item for item in kid_info.get("claimed_chores", []) if item != chore_id
+            ]
+
+            kid_info.setdefault("approved_chores", [])
+
+            if chore_id not in kid_info["approved_chores"]:
+                kid_info["approved_chores"].append(chore_id)
+
+            chore_info["last_completed"] = self._now().isoformat()
+
+            # Streaks first, so achievement checks on the points change see today
+            today = dt_helpers.as_local(self._now()).date()
+            self._record_streaks(kid_id, chore_id, today)
+
+            if points_awarded is not None:
+                current_points = float(kid_info.get("points", 0))
+                self.update_kid_points(
+                    kid_id,
+                    current_points + points_awarded,
+                    source_type=POINTS_SOURCE_CHORE,
+                    source_id=chore_id,
+                )
+
+            self._data[DATA_PENDING_CHORE_APPROVALS] = [
+                ap
+                for ap in self._data.get(DATA_PENDING_CHORE_APPROVALS, [])
+                if not (ap.get("kid_id") == kid_id and ap.get("chore_id") == chore_id)
+            ]
+
+        elif new_state == CHORE_STATE_PENDING:
+            # Remove the chore from both claimed and approved lists.
+            for field in ["claimed_chores", "approved_chores"]:
+                if chore_id in kid_info.get(field, []):
+                    kid_info[field] = [c for c in kid_info[field] if c != chore_id]
+
+            # Remove from pending approvals.
+            self._data[DATA_PENDING_CHORE_APPROVALS] = [
+                ap
+                for ap in self._data.get(DATA_PENDING_CHORE_APPROVALS, [])
+                if not (ap.get("kid_id") == kid_id and ap.get("chore_id") == chore_id)
+            ]
+
+        elif new_state == CHORE_STATE_OVERDUE:
+            # Mark as overdue.
+            kid_info.setdefault("overdue_chores", [])
+
+            if chore_id not in kid_info["overdue_chores"]:
+                kid_info["overdue_chores"].append(chore_id)
+
+            kid_info.setdefault("overdue_notifications", {})
+            kid_info["overdue_notifications"][chore_id] = self._now().isoformat()
+
+        # Move this kid between the chore's state counters, then derive the global state.
+        assigned_kids = chore_info.get("assigned_kids", [])
+        counts = self._chore_state_counts.get(chore_id)
+        if counts is not None and kid_id in assigned_kids:
+            counts[previous_state] -= 1
+            counts[self._kid_chore_state(kid_info, chore_id)] += 1
+        counts = self.get_chore_state_counts(chore_id)
+
+        if len(assigned_kids) == 1:
+            # if only one kid is assigned to the chore, update the chore state to new state 1:1
+            chore_info["state"] = new_state
+        elif len(assigned_kids) > 1:
+            total = len(assigned_kids)
+
+            # If all kids are in the same state, update the chore state to new state 1:1
+            if total in (
+                counts[CHORE_STATE_PENDING],
+                counts[CHORE_STATE_CLAIMED],
+                counts[CHORE_STATE_APPROVED],
+                counts[CHORE_STATE_OVERDUE],
+            ):
+                chore_info["state"] = new_state
+
+            # For shared chores, recompute global state of a partial if they aren't all in the same state as checked above
+            elif chore_info.get("shared_chore", False):
+                if counts[CHORE_STATE_OVERDUE] > 0:
+                    chore_info["state"] = CHORE_STATE_OVERDUE
+                elif counts[CHORE_STATE_APPROVED] > 0:
+                    chore_info["state"] = CHORE_STATE_APPROVED_IN_PART
+                elif counts[CHORE_STATE_CLAIMED] > 0:
+                    chore_info["state"] = CHORE_STATE_CLAIMED_IN_PART
+                else:
+                    chore_info["state"] = CHORE_STATE_UNKNOWN
+
+            # For non-shared chores multiple assign it will be independent if they aren't all in the same state as checked above.
+            elif chore_info.get("shared_chore", False) is False:
+                chore_info["state"] = CHORE_STATE_INDEPENDENT
+
+        else:
+            chore_info["state"] = CHORE_STATE_UNKNOWN
+
+        LOGGER.debug(
+            "Chore '%s' global state computed as '%s'",
+            chore_id,
+            chore_info["state"],
+        )
+
+    # -------------------------------------------------------------------------------------
+    # Chore State Counters
+    # -------------------------------------------------------------------------------------
+
+    def _kid_chore_state(self, kid_info: dict[str, Any], chore_id: str) -> str:
+        """Return the state a kid's chore lists put the chore in."""
+        if chore_id in kid_info.get("overdue_chores", []):
+            return CHORE_STATE_OVERDUE
+        if chore_id in kid_info.get("approved_chores", []):
+            return CHORE_STATE_APPROVED
+        if chore_id in kid_info.get("claimed_chores", []):
+            return CHORE_STATE_CLAIMED
+        return CHORE_STATE_PENDING
+
+    def get_chore_state_counts(self, chore_id: str) -> dict[str, int]:
+        """Return how many assigned kids are in each state, plus today's approvals.
+
+        Counts are built once per chore and then kept current by _process_chore_state.
+        """
+        counts = self._chore_state_counts.get(chore_id)
+        if counts is None:
+            counts = {
+                CHORE_STATE_PENDING: 0,
+                CHORE_STATE_CLAIMED: 0,
+                CHORE_STATE_APPROVED: 0,
+                CHORE_STATE_OVERDUE: 0,
+                "approvals_today": 0,
+            }
+            chore_info = self.chores_data.get(chore_id, {})
+            for kid_id in chore_info.get("assigned_kids", []):
+                kid_info = self.kids_data.get(kid_id, {})
+                counts[self._kid_chore_state(kid_info, chore_id)] += 1
+                counts["approvals_today"] += kid_info.get(
+                    "today_chore_approvals", {}
+                ).get(chore_id, 0)
+            self._chore_state_counts[chore_id] = counts
+        return counts
+
+    def _count_today_chore_approval(self, kid_id: str, chore_id: str):
+        """Increment a kid's approvals today for a chore, and the chore's total."""
+        kid_info = self.kids_data[kid_id]
+        kid_info.setdefault("today_chore_approvals", {})
+        kid_info["today_chore_approvals"][chore_id] = (
+            kid_info["today_chore_approvals"].get(chore_id, 0) + 1
+        )
+        counts = self._chore_state_counts.get(chore_id)
+        assigned_kids = self.chores_data.get(chore_id, {}).get("assigned_kids", [])
+        if counts is not None and kid_id in assigned_kids:
+            counts["approvals_today"] += 1
+
+    # -------------------------------------------------------------------------------------
+    # Kids: Update Points
+    # -------------------------------------------------------------------------------------
+
+    def update_kid_points(
+        self,
+        kid_id: str,
+        new_points: float,
+        source_type: str = POINTS_SOURCE_MANUAL,
+        source_id: Optional[str] = None,
+        ledger_deltas: Optional[list[float]] = None,
+    ):
+        """Set a kid's points to 'new_points', updating daily/weekly/monthly counters.
+
+        The change is recorded in the kid's points ledger under the given source, as
+        one transaction or, if given, as the ledger_deltas it was merged from.
+        """
+        kid_info = self.kids_data.get(kid_id)
+        if not kid_info:
+            LOGGER.warning("Update kid points: Kid ID '%s' not found", kid_id)
+            return
+
+        old_points = float(kid_info["points"])
+        delta = new_points - old_points
+        if delta == 0 and not ledger_deltas:
+            LOGGER.debug("No change in points for kid '%s'. Skipping updates", kid_id)
+            return
+
+        self._bump_version(kid_info)
+        balance = old_points
+        for ledger_delta in ledger_deltas or [delta]:
+            self._record_points_transaction(
+                kid_id, balance, ledger_delta, source_type, source_id
+            )
+            balance += ledger_delta
+        kid_info["points"] = new_points
+        self._count_day_counter(kid_info, COUNTER_POINTS, delta)
+
+        # Update Max Points Ever
+        if new_points > kid_info.get("max_points_ever", 0):
+            kid_info["max_points_ever"] = new_points
+
+        # Check Badges
+        self._check_badges_for_kid(kid_id)
+        self._check_achievements_for_kid(kid_id)
+        self._check_challenges_for_kid(kid_id)
+        self._evaluate_rules(kid_id, POINTS_INPUTS)
+
+        self._persist()
+        self._publish()
+
+        LOGGER.debug(
+            "update_kid_points: Kid '%s' changed from %.2f to %.2f (delta=%.2f)",
+            kid_id,
+            old_points,
+            new_points,
+            delta,
+        )
+
+    def adjust_kid_points(
+        self, kid_id: str, delta: float, ledger_deltas: Optional[list[float]] = None
+    ):
+        """Add 'delta' (positive or negative) to a kid's current points.
+
+        A delta merged from several adjustments passes them as ledger_deltas, so
+        each is still recorded as its own ledger transaction.
+        """
+        kid_info = self.kids_data.get(kid_id)
+        if not kid_info:
+            raise KidsChoresError(f"Kid with ID '{kid_id}' not found.")
+
+        self.update_kid_points(
+            kid_id,
+            float(kid_info.get("points", 0)) + delta,
+            ledger_deltas=ledger_deltas,
+        )
+
+    # -------------------------------------------------------------------------------------
+    # Day Counters
+    # Completed chores and points earned are counted into per-kid day buckets; the
+    # daily, weekly and monthly totals are window sums ending on the counting day.
+    # -------------------------------------------------------------------------------------
+
+    def _counting_day(self, now: Optional[datetime] = None) -> int:
+        """Return the ordinal of the counting day, which starts at the daily reset."""
+        boundaries = self._get_reset_boundaries(now or self._now())
+        return boundaries[FREQUENCY_DAILY].date().toordinal()
+
+    def _count_day_counter(
+        self, kid_info: dict[str, Any], counter: str, amount: float
+    ) -> None:
+        """Add an amount to one of a kid's day counters on the counting day."""
+        day = self._counting_day()
+        counter_data = kid_info.setdefault(
+            "day_counters", KidsChoresDayCounters.new_counter_data(day)
+        )
+        KidsChoresDayCounters(counter_data).add(counter, day, amount)
+
+    def get_kid_counter(self, kid_id: str, field: str) -> float:
+        """Return a kid counter, computing per-period fields from the day counters."""
+        kid_info = self.kids_data.get(kid_id, {})
+        if field not in DAY_COUNTER_FIELDS:
+            return kid_info.get(field, 0)
+
+        counter_data = kid_info.get("day_counters")
+        if not counter_data:
+            return 0
+
+        counter, period = DAY_COUNTER_FIELDS[field]
+        boundaries = self._get_reset_boundaries(self._now())
+        day = boundaries[FREQUENCY_DAILY].date()
+        days = (day - boundaries[period].date()).days + 1
+        return KidsChoresDayCounters(counter_data).window(
+            counter, day.toordinal(), days
+        )
+
+    def _migrate_day_counters(self) -> None:
+        """Seed day counters so their windows match the stored per-period fields."""
+        boundaries = self._get_reset_boundaries(self._now())
+        today = boundaries[FREQUENCY_DAILY].date()
+
+        for kid_info in self.kids_data.values():
+            if "day_counters" in kid_info:
+                continue
+            counter_data = KidsChoresDayCounters.new_counter_data(today.toordinal())
+            counters = KidsChoresDayCounters(counter_data)
+
+            # Narrowest window first: each wider window adds only its remainder,
+            # placed on its first day so narrower windows are unaffected.
+            for counter, prefix in (
+                (COUNTER_CHORES, "completed_chores_"),
+                (COUNTER_POINTS, "points_earned_"),
+            ):
+                windows = sorted(
+                    (
+                        boundaries[period].date(),
+                        kid_info.pop(f"{prefix}{suffix}", 0) or 0,
+                    )
+                    for period, suffix in (
+                        (FREQUENCY_DAILY, "today"),
+                        (FREQUENCY_WEEKLY, "weekly"),
+                        (FREQUENCY_MONTHLY, "monthly"),
+                    )
+                )
+                counted = 0
+                for first_day, value in reversed(windows):
+                    remainder = value - counted
+                    if remainder:
+                        counters.add(counter, first_day.toordinal(), remainder)
+                        counted = value
+
+            kid_info["day_counters"] = counter_data
+
+    # -------------------------------------------------------------------------------------
+    # Chore History
+    # Each kid keeps a per-chore bitmap of the counting days a chore was approved on.
+    # -------------------------------------------------------------------------------------
+
+    def _migrate_chore_history(self) -> None:
+        """Convert integer chore history bitmaps to their hex string form."""
+        for kid_info in self._data.get(DATA_KIDS, {}).values():
+            for history_data in kid_info.get("chore_history", {}).values():
+                if isinstance(history_data.get("days"), int):
+                    history_data["days"] = bitmap_to_str(history_data["days"])
+
+    def _record_chore_history(self, kid_info: dict[str, Any], chore_id: str) -> None:
+        """Mark a chore as done on the counting day in the kid's history."""
+        day = self._counting_day()
+        history_data = kid_info.setdefault("chore_history", {}).setdefault(
+            chore_id, KidsChoresChoreHistory.new_history_data(day)
+        )
+        KidsChoresChoreHistory(history_data).mark(day)
+
+    def get_chore_history(
+        self,
+        kid_id: str,
+        chore_id: str,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+    ) -> dict[str, Any]:
+        """Return a kid's completion summary for a chore between start and end.
+
+        End defaults to the current counting day and start to 30 days before it.
+        """
+        kid_info = self.kids_data.get(kid_id)
+        if not kid_info:
+            raise KidsChoresError(f"Kid with ID '{kid_id}' not found.")
+        if chore_id not in self.chores_data:
+            raise KidsChoresError(f"Chore with ID '{chore_id}' not found.")
+
+        today = self._counting_day()
+        end = end or date.fromordinal(today)
+        start = start or end - timedelta(days=CHORE_HISTORY_ATTRIBUTE_DAYS - 1)
+        if start > end:
+            raise KidsChoresError("The history start must not be after its end.")
+        if start.toordinal() <= today - CHORE_HISTORY_DAYS:
+            raise KidsChoresError(
+                f"Chore history is only kept for the last {CHORE_HISTORY_DAYS} days."
+            )
+
+        history_data = kid_info.get("chore_history", {}).get(
+            chore_id, KidsChoresChoreHistory.new_history_data(today)
+        )
+        return KidsChoresChoreHistory(history_data).summary(start, end)
+
+    # -------------------------------------------------------------------------------------
+    # Points Ledger
+    # Every points change is appended to the kid's ledger; history queries bisect it.
+    # -------------------------------------------------------------------------------------
+
+    def _record_points_transaction(
+        self,
+        kid_id: str,
+        old_points: float,
+        delta: float,
+        source_type: str,
+        source_id: Optional[str],
+    ) -> None:
+        """Append a points change to a kid's ledger, opening it at old_points."""
+        now = self._now()
+        ledgers = self._data.setdefault(DATA_POINTS_LEDGER, {})
+        if kid_id not in ledgers:
+            ledgers[kid_id] = KidsChoresPointsLedger.new_ledger_data(old_points, now)
+        KidsChoresPointsLedger(ledgers[kid_id]).append(
+            now, delta, source_type, source_id
+        )
+
+    def get_points_history(
+        self,
+        kid_id: str,
+        period: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> list[dict[str, Any]]:
+        """Return a kid's points history between start and end, bucketed by period.
+
+        Start defaults to when the kid's ledger was opened, or to the start of the
+        period containing end if that is earlier, and end to now.
+        """
+        kid_info = self.kids_data.get(kid_id)
+        if not kid_info:
+            raise KidsChoresError(f"Kid with ID '{kid_id}' not found.")
+
+        now = self._now()
+        ledger_data = self._data.get(DATA_POINTS_LEDGER, {}).get(kid_id)
+        if ledger_data is None:
+            ledger_data = KidsChoresPointsLedger.new_ledger_data(
+                kid_info.get("points", 0.0), now
+            )
+        ledger = KidsChoresPointsLedger(ledger_data)
+
+        end = end or now
+        # A ledger opened moments ago still reports the current period's bucket
+        start = start or min(
+            dt_helpers.utc_from_timestamp(ledger.opened), period_start(end, period)
+        )
+        if start >= end:
+            raise KidsChoresError("The history start must be before its end.")
+        if ledger.count_buckets(start, end, period) > LEDGER_MAX_HISTORY_BUCKETS:
+            raise KidsChoresError(
+                f"The history range spans more than {LEDGER_MAX_HISTORY_BUCKETS} buckets."
+            )
+        return ledger.history(start, end, period)
+
+    # -------------------------------------------------------------------------------------
+    # Rewards: Redemption Queue
+    # Each kid keeps, per reward, the ids of open redemptions in claim order, and the
+    # global pending approvals map each redemption id to its details. Approve and
+    # disapprove close the oldest open redemption of a reward, or a given one.
+    # -------------------------------------------------------------------------------------
+
+    def _enqueue_reward_redemption(
+        self, kid_id: str, reward_id: str, timestamp: Optional[str] = None
+    ) -> str:
+        """Open a redemption of a reward for a kid and return its id."""
+        claimed_at = dt_helpers.parse_datetime(timestamp) if timestamp else None
+        claimed_at = dt_helpers.as_utc(claimed_at) if claimed_at else self._now()
+
+        expires_at = None
+        expiry_hours = self.rewards_data.get(reward_id, {}).get(
+            "expiry_hours", DEFAULT_REWARD_EXPIRY_HOURS
+        )
+        if expiry_hours:
+            expires_at = claimed_at + timedelta(hours=float(expiry_hours))
+
+        redemption_id = str(uuid.uuid4())
+        self._data[DATA_PENDING_REWARD_APPROVALS][redemption_id] = {
+            "redemption_id": redemption_id,
+            "kid_id": kid_id,
+            "reward_id": reward_id,
+            "timestamp": claimed_at.isoformat(),
+            "expires_at": expires_at.isoformat() if expires_at else None,
+        }
+        reward_queue = self.kids_data[kid_id].setdefault("reward_queue", {})
+        reward_queue.setdefault(reward_id, {})[redemption_id] = claimed_at.isoformat()
+
+        if expires_at and self._reward_expiry_heap is not None:
+            heapq.heappush(self._reward_expiry_heap, (expires_at, redemption_id))
+        return redemption_id
+
+    def _dequeue_reward_redemption(
+        self, kid_id: str, reward_id: str, redemption_id: Optional[str] = None
+    ) -> Optional[dict[str, Any]]:
+        """Close the oldest open redemption of a reward for a kid, or the given one.
+
+        Returns the removed pending approval, or None if nothing was open.
+        """
+        reward_queue = self.kids_data.get(kid_id, {}).get("reward_queue", {})
+        redemptions = reward_queue.get(reward_id)
+        if not redemptions:
+            return None
+        if redemption_id is None:
+            redemption_id = next(iter(redemptions))
+        elif redemption_id not in redemptions:
+            return None
+
+        del redemptions[redemption_id]
+        if not redemptions:
+            del reward_queue[reward_id]
+        return self._data[DATA_PENDING_REWARD_APPROVALS].pop(redemption_id, None)
+
+    def _check_pending_redemption(
+        self, kid_info: dict[str, Any], reward_id: str, redemption_id: Optional[str]
+    ) -> None:
+        """Raise if a given redemption id is not open for the kid and reward."""
+        if redemption_id is None:
+            return
+        if redemption_id not in kid_info.get("reward_queue", {}).get(reward_id, {}):
+            LOGGER.warning(
+                "Rejected stale command for redemption '%s' of reward '%s'",
+                redemption_id,
+                reward_id,
+            )
+            raise KidsChoresError(
+                f"Redemption '{redemption_id}' is not pending for '{kid_info['name']}'."
+            )
+
+    def get_pending_reward_count(self, kid_id: str, reward_id: str) -> int:
+        """Return how many redemptions of a reward await approval for a kid."""
+        kid_info = self.kids_data.get(kid_id, {})
+        return len(kid_info.get("reward_queue", {}).get(reward_id, {}))
+
+    def get_pending_redemption_ids(self, kid_id: str, reward_id: str) -> list[str]:
+        """Return the open redemption ids of a reward for a kid, oldest first."""
+        kid_info = self.kids_data.get(kid_id, {})
+        return list(kid_info.get("reward_queue", {}).get(reward_id, {}))
+
+    def _clear_reward_redemptions(
+        self, kid_id: Optional[str] = None, reward_id: Optional[str] = None
+    ) -> None:
+        """Drop open redemptions for a kid and/or reward, or all of them."""
+        approvals = self._data[DATA_PENDING_REWARD_APPROVALS]
+        kid_ids = [kid_id] if kid_id else list(self.kids_data)
+        for queue_kid_id in kid_ids:
+            reward_queue = self.kids_data.get(queue_kid_id, {}).get("reward_queue", {})
+            reward_ids = [reward_id] if reward_id else list(reward_queue)
+            for queue_reward_id in reward_ids:
+                for redemption_id in reward_queue.pop(queue_reward_id, {}):
+                    approvals.pop(redemption_id, None)
+
+    def _expire_reward_redemptions(self, now: datetime) -> bool:
+        """Drop open redemptions whose expiry has passed.
+
+        Entries for redemptions that were already closed are skipped when popped.
+        Returns True if any redemption expired.
+        """
+        if self._reward_expiry_heap is None:
+            heap = []
+            for redemption_id, approval in self._data.get(
+                DATA_PENDING_REWARD_APPROVALS, {}
+            ).items():
+                expires_at = dt_helpers.parse_datetime(approval.get("expires_at") or "")
+                if expires_at:
+                    heap.append((dt_helpers.as_utc(expires_at), redemption_id))
+            heapq.heapify(heap)
+            self._reward_expiry_heap = heap
+
+        heap = self._reward_expiry_heap
+        approvals = self._data.get(DATA_PENDING_REWARD_APPROVALS, {})
+        expired = False
+        while heap and heap[0][0] <= now:
+            _, redemption_id = heapq.heappop(heap)
+            approval = approvals.get(redemption_id)
+            if approval is None:
+                continue
+
+            kid_id = approval.get("kid_id")
+            reward_id = approval.get("reward_id")
+            self._dequeue_reward_redemption(kid_id, reward_id, redemption_id)
+            approvals.pop(redemption_id, None)
+
+            kid_info = self.kids_data.get(kid_id)
+            if kid_info:
+                self._bump_version(kid_info)
+                self._bump_item_version(kid_info, "reward_versions", reward_id)
+            LOGGER.info(
+                "Reward redemption '%s' of reward '%s' for kid '%s' expired",
+                redemption_id,
+                reward_id,
+                kid_id,
+            )
+            expired = True
+        return expired
+
+    def _migrate_reward_queue(self) -> None:
+        """Convert list-based pending reward approvals to queued redemptions."""
+        approvals = self._data.get(DATA_PENDING_REWARD_APPROVALS)
+        if isinstance(approvals, dict):
+            return
+
+        self._data[DATA_PENDING_REWARD_APPROVALS] = {}
+        for kid_info in self.kids_data.values():
+            kid_info.pop("pending_rewards", None)
+            kid_info["reward_queue"] = {}
+
+        for approval in approvals or []:
+            kid_id = approval.get("kid_id")
+            reward_id = approval.get("reward_id")
+            if kid_id in self.kids_data and reward_id in self.rewards_data:
+                self._enqueue_reward_redemption(
+                    kid_id, reward_id, approval.get("timestamp")
+                )
+
+    # -------------------------------------------------------------------------------------
+    # Rewards: Redeem, Approve, Disapprove
+    # -------------------------------------------------------------------------------------
+
+    def redeem_reward(self, parent_name: str, kid_id: str, reward_id: str):
+        """Kid claims a reward => mark as pending approval (no deduction yet)."""
+        reward = self.rewards_data.get(reward_id)
+        if not reward:
+            raise KidsChoresError(f"Reward with ID '{reward_id}' not found.")
+
+        kid_info = self.kids_data.get(kid_id)
+        if not kid_info:
+            raise KidsChoresError(f"Kid with ID '{kid_id}' not found.")
+
+        cost = reward.get("cost", 0.0)
+        if kid_info["points"] < cost:
+            raise KidsChoresError(
+                f"'{kid_info['name']}' does not have enough points ({cost} needed)."
+            )
+
+        kid_info.setdefault("redeemed_rewards", [])
+        self._bump_version(kid_info)
+        self._bump_item_version(kid_info, "reward_versions", reward_id)
+
+        # Queue the redemption for approval
+        redemption_id = self._enqueue_reward_redemption(kid_id, reward_id)
+
+        # increment reward_claims counter
+        if reward_id in kid_info["reward_claims"]:
+            kid_info["reward_claims"][reward_id] += 1
+        else:
+            kid_info["reward_claims"][reward_id] = 1
+
+        # Notify the parents; the actions act on this redemption only
+        actions = [
+            {
+                "action": f"{ACTION_APPROVE_REWARD}|{kid_id}|{reward_id}|{redemption_id}",
+                "title": ACTION_TITLE_APPROVE,
+            },
+            {
+                "action": f"{ACTION_DISAPPROVE_REWARD}|{kid_id}|{reward_id}|{redemption_id}",
+                "title": ACTION_TITLE_DISAPPROVE,
+            },
+            {
+                "action": f"{ACTION_REMIND_30}|{kid_id}|{reward_id}",
+                "title": ACTION_TITLE_REMIND_30,
+            },
+        ]
+        extra_data = {
+            "kid_id": kid_id,
+            "reward_id": reward_id,
+            "redemption_id": redemption_id,
+        }
+        self._notifier.notify_parents(
+            kid_id,
+            title="KidsChores: Reward Claimed",
+            message=f"'{kid_info['name']}' claimed reward '{reward['name']}'",
+            actions=actions,
+            extra_data=extra_data,
+        )
+
+        self._persist()
+        self._publish()
+
+    def approve_reward(
+        self,
+        parent_name: str,
+        kid_id: str,
+        reward_id: str,
+        expected_version: Optional[int] = None,
+        redemption_id: Optional[str] = None,
+    ):
+        """Parent approves the reward => deduct points.
+
+        Approves the given redemption, or the kid's oldest open redemption of the
+        reward. If expected_version is given, the approval is rejected when the kid's
+        state on the reward changed since that version (e.g. it was already approved).
+        """
+        kid_info = self.kids_data.get(kid_id)
+        if not kid_info:
+            raise KidsChoresError(f"Kid with ID '{kid_id}' not found.")
+
+        reward = self.rewards_data.get(reward_id)
+        if not reward:
+            raise KidsChoresError(f"Reward with ID '{reward_id}' not found.")
+
+        self._check_version(
+            f"Reward '{reward['name']}' for '{kid_info['name']}'",
+            self.get_reward_version(kid_id, reward_id),
+            expected_version,
+        )
+
+        self._check_pending_redemption(kid_info, reward_id, redemption_id)
+
+        cost = reward.get("cost", 0.0)
+        if kid_info["points"] < cost:
+            raise KidsChoresError(
+                f"'{kid_info['name']}' does not have enough points to redeem '{reward['name']}'."
+            )
+
+        # Deduct; without an open redemption this is a direct approval
+        new_points = float(kid_info["points"]) - cost
+        self.update_kid_points(
+            kid_id, new_points, source_type=POINTS_SOURCE_REWARD, source_id=reward_id
+        )
+
+        self._dequeue_reward_redemption(kid_id, reward_id, redemption_id)
+        kid_info["redeemed_rewards"].append(reward_id)
+        self._bump_version(kid_info)
+
+        self._bump_item_version(kid_info, "reward_versions", reward_id)
+        self._check_badges_for_kid(kid_id)
+
+        # increment reward_approvals
+        if reward_id in kid_info["reward_approvals"]:
+            kid_info["reward_approvals"][reward_id] += 1
+        else:
+            kid_info["reward_approvals"][reward_id] = 1
+
+        # Send a notification to the kid that reward was approved
+        extra_data = {"kid_id": kid_id, "reward_id": reward_id}
+        self._notifier.notify_kid(
+            kid_id,
+            title="KidsChores: Reward Approved",
+            message=f"Your reward '{reward['name']}' was approved.",
+            extra_data=extra_data,
+        )
+
+        self._persist()
+        self._publish()
+
+    def disapprove_reward(
+        self,
+        parent_name: str,
+        kid_id: str,
+        reward_id: str,
+        expected_version: Optional[int] = None,
+        redemption_id: Optional[str] = None,
+    ):
+        """Disapprove the given redemption, or the kid's oldest one of the reward."""
+
+        reward = self.rewards_data.get(reward_id)
+        if not reward:
+            raise KidsChoresError(f"Reward with ID '{reward_id}' not found.")
+
+        kid_info = self.kids_data.get(kid_id)
+        if kid_info:
+            self._check_version(
+                f"Reward '{reward['name']}' for '{kid_info['name']}'",
+                self.get_reward_version(kid_id, reward_id),
+                expected_version,
+            )
+            self._check_pending_redemption(kid_info, reward_id, redemption_id)
+            self._bump_version(kid_info)
+            self._bump_item_version(kid_info, "reward_versions", reward_id)
+
+        # remove from pending approvals
+        self._dequeue_reward_redemption(kid_id, reward_id, redemption_id)
+
+        # Send a notification to the kid that reward was disapproved
+        extra_data = {"kid_id": kid_id, "reward_id": reward_id}
+        self._notifier.notify_kid(
+            kid_id,
+            title="KidsChores: Reward Disapproved",
+            message=f"Your reward '{reward['name']}' was disapproved.",
+            extra_data=extra_data,
+        )
+
+        self._persist()
+        self._publish()
+
+    # -------------------------------------------------------------------------------------
+    # Badges: Add, Check, Award
+    # -------------------------------------------------------------------------------------
+
+    def add_badge(self, badge_def: dict[str, Any]):
+        """Add new badge at runtime if needed."""
+        badge_name = badge_def.get("name")
+        if not badge_name:
+            LOGGER.warning("Add badge: Badge must have a name")
+            return
+        if any(b["name"] == badge_name for b in self.badges_data.values()):
+            LOGGER.warning("Add badge: Badge '%s' already exists", badge_name)
+            return
+        internal_id = str(uuid.uuid4())
+        self.badges_data[internal_id] = {
+            "name": badge_name,
+            "threshold_type": badge_def.get(
+                "threshold_type", BADGE_THRESHOLD_TYPE_POINTS
+            ),
+            "threshold_value": badge_def.get(
+                "threshold_value", DEFAULT_BADGE_THRESHOLD
+            ),
+            "chore_count_type": badge_def.get("chore_count_type", FREQUENCY_DAILY),
+            "earned_by": [],
+            "points_multiplier": badge_def.get(
+                "points_multiplier", DEFAULT_POINTS_MULTIPLIER
+            ),
+            "icon": badge_def.get("icon", DEFAULT_ICON),
+            "description": badge_def.get("description", ""),
+            "criteria": badge_def.get("criteria", ""),
+            "internal_id": internal_id,
+        }
+        self._badge_index = None
+        self._rule_set = None
+        LOGGER.debug("Added new badge '%s' with ID: %s", badge_name, internal_id)
+        self._persist()
+        self._publish()
+
+    def _check_badges_for_kid(self, kid_id: str):
+        """Evaluate all badge thresholds for kid."""
+        kid_info = self.kids_data.get(kid_id)
+        if not kid_info:
+            return
+
+        badge_index = self.badge_index
+        for field in badge_index.metric_fields:
+            value = self.get_kid_counter(kid_id, field)
+            for badge_id in badge_index.badges_reached(field, value):
+                if kid_id in self.badges_data[badge_id].get("earned_by", []):
+                    continue  # already earned
+                self._award_badge(kid_id, badge_id)
+
+    def _award_badge(self, kid_id: str, badge_id: str):
+        """Add the badge to kid's 'earned_by' and kid's 'badges' list."""
+        badge = self.badges_data.get(badge_id)
+        if not badge:
+            LOGGER.error(
+                "Attempted to award non-existent badge ID '%s' to kid ID '%s'",
+                badge_id,
+                kid_id,
+            )
+            return
+
+        if kid_id in badge.get("earned_by", []):
+            return  # already earned
+
+        badge.setdefault("earned_by", []).append(kid_id)
+        kid_info = self.kids_data.get(kid_id, {})
+        if badge["name"] not in kid_info.get("badges", []):
+            kid_info.setdefault("badges", []).append(badge["name"])
+            self._update_kid_multiplier(kid_id)
+            self._evaluate_rules(kid_id, BADGE_INPUTS)
+
+            badge_name = badge["name"]
+            kid_name = kid_info["name"]
+
+            # Send a notification to the kid and parents that a new badge was earned
+            extra_data = {"kid_id": kid_id, "badge_id": badge_id}
+            self._notifier.notify_kid(
+                kid_id,
+                title="KidsChores: Badge Earned",
+                message=f"You earned a new badge: '{badge_name}'!",
+                extra_data=extra_data,
+            )
+            self._notifier.notify_parents(
+                kid_id,
+                title="KidsChores: Badge Earned",
+                message=f"'{kid_name}' earned a new badge: '{badge_name}'.",
+                extra_data=extra_data,
+            )
+
+            self._persist()
+            self._publish()
+
+    def _update_kid_multiplier(self, kid_id: str):
+        """Update the kid's points multiplier based on highest badge achieved."""
+        kid_info = self.kids_data.get(kid_id)
+        if not kid_info:
+            return
+        multipliers = []
+        for badge_name in kid_info.get("badges", []):
+            badge_id = self.badge_index.badge_id_for_name(badge_name)
+            if badge_id:
+                multipliers.append(
+                    self.badges_data[badge_id].get("points_multiplier", 1.0)
+                )
+        kid_info["points_multiplier"] = max(multipliers, default=1.0)
+
+    def _recalculate_all_badges(self):
+        """Global re-check of all badges for all kids."""
+        LOGGER.info("Starting global badge recalculation")
+
+        ## Clear current references
+        # for _, badge_info in self.badges_data.items():
+        #    badge_info["earned_by"] = []
+        # for _, kid_info in self.kids_data.items():
+        #    kid_info["badges"] = []
+
+        # Re-check thresholds: merge kids sorted by value against each badge ladder,
+        # awarding only the badges between a kid's held rank and its reached rank
+        badge_index = self.badge_index
+        with self.batched_commit():
+            for field in badge_index.metric_fields:
+                source = "max_points_ever" if field == "points" else field
+                thresholds, badge_ids = badge_index.ladder(field)
+                ladder_rank = {
+                    self.badges_data[badge_id]["name"]: rank + 1
+                    for rank, badge_id in enumerate(badge_ids)
+                }
+                kids_by_value = sorted(
+                    (self.get_kid_counter(kid_id, source), kid_id)
+                    for kid_id in self.kids_data
+                )
+                reached = 0
+                for value, kid_id in kids_by_value:
+                    while reached < len(thresholds) and thresholds[reached] <= value:
+                        reached += 1
+                    held = max(
+                        (
+                            ladder_rank.get(badge_name, 0)
+                            for badge_name in self.kids_data[kid_id].get("badges", [])
+                        ),
+                        default=0,
+                    )
+                    for badge_id in badge_ids[held:reached]:
+                        self._award_badge(kid_id, badge_id)
+
+            # Rules may be new or changed, so evaluate all of them once
+            for kid_id in self.kids_data:
+                self._evaluate_rules(kid_id)
+
+            self._persist()
+            self._publish()
+        LOGGER.info("Badge recalculation complete")
+
+    # -------------------------------------------------------------------------------------
+    # Rules: Evaluate
+    # Rule-type badges, achievements and challenges, compiled once by the rule set.
+    # -------------------------------------------------------------------------------------
+
+    def _rule_metric(self, kid_id: str, name: str, chore_id: Optional[str]) -> float:
+        """Return the value of a rule input for a kid and the rule's chore."""
+        kid_info = self.kids_data.get(kid_id, {})
+        if name in DAY_COUNTER_FIELDS:
+            return self.get_kid_counter(kid_id, name)
+        if name == "streak":
+            return self.get_streak(kid_id)
+        if name == "max_streak":
+            return self.get_streak_record(kid_id).get("max_streak", 0)
+        if name == "chore_streak":
+            return self.get_streak(kid_id, chore_id) if chore_id else 0
+        if name == "chore_approvals":
+            return kid_info.get("chore_approvals", {}).get(chore_id, 0)
+        if name == "badges":
+            return len(kid_info.get("badges", []))
+        return float(kid_info.get(name, 0))
+
+    def _evaluate_rules(self, kid_id: str, changed: Optional[frozenset] = None):
+        """Award the rule-type items whose changed inputs now satisfy their rule.
+
+        Only rules reading one of the changed inputs are evaluated; all of the
+        kid's rules when changed is None.
+        """
+        if kid_id not in self.kids_data:
+            return
+
+        active_ids = None
+        for section, item_id, predicate, chore_id in self.rule_set.affected(
+            kid_id, changed
+        ):
+            if section == DATA_BADGES:
+                if kid_id in self.badges_data[item_id].get("earned_by", []):
+                    continue
+            else:
+                item = self._data[section][item_id]
+                if item.get("progress", {}).get(kid_id, {}).get("awarded", False):
+                    continue
+                if section == DATA_CHALLENGES:
+                    if active_ids is None:
+                        active_ids = self.rule_index.active_challenge_ids(self._now())
+                    if item_id not in active_ids:
+                        continue
+
+            # Each input is read at most once per rule
+            values: dict[str, float] = {}
+
+            def metric(name: str) -> float:
+                if name not in values:
+                    values[name] = self._rule_metric(kid_id, name, chore_id)
+                return values[name]
+
+            if not predicate(metric):
+                continue
+
+            if section == DATA_BADGES:
+                self._award_badge(kid_id, item_id)
+            elif section == DATA_ACHIEVEMENTS:
+                self._award_achievement(kid_id, item_id)
+            else:
+                self._award_challenge(kid_id, item_id)
+
+    # -------------------------------------------------------------------------------------
+    # Penalties: Apply, Add
+    # -------------------------------------------------------------------------------------
+
+    def apply_penalty(self, parent_name: str, kid_id: str, penalty_id: str):
+        """Apply penalty => negative points to reduce kid's points."""
+        penalty = self.penalties_data.get(penalty_id)
+        if not penalty:
+            raise KidsChoresError(f"Penalty with ID '{penalty_id}' not found.")
+
+        kid_info = self.kids_data.get(kid_id)
+        if not kid_info:
+            raise KidsChoresError(f"Kid with ID '{kid_id}' not found.")
+
+        penalty_pts = penalty.get("points", 0)
+        new_points = float(kid_info["points"]) + penalty_pts
+        self.update_kid_points(
+            kid_id, new_points, source_type=POINTS_SOURCE_PENALTY, source_id=penalty_id
+        )
+
+        # increment penalty_applies
+        if penalty_id in kid_info["penalty_applies"]:
+            kid_info["penalty_applies"][penalty_id] += 1
+        else:
+            kid_info["penalty_applies"][penalty_id] = 1
+
+        # Send a notification to the kid that a penalty was applied
+        extra_data = {"kid_id": kid_id, "penalty_id": penalty_id}
+        self._notifier.notify_kid(
+            kid_id,
+            title="KidsChores: Penalty Applied",
+            message=f"A '{penalty['name']}' penalty was applied. Your points changed by {penalty_pts}.",
+            extra_data=extra_data,
+        )
+
+        self._persist()
+        self._publish()
+
+    def add_penalty(self, penalty_def: dict[str, Any]):
+        """Add new penalty at runtime if needed."""
+        penalty_name = penalty_def.get("name")
+        if not penalty_name:
+            LOGGER.warning("Add penalty: Penalty must have a name")
+            return
+        if any(p["name"] == penalty_name for p in self.penalties_data.values()):
+            LOGGER.warning("Add penalty: Penalty '%s' already exists", penalty_name)
+            return
+        internal_id = str(uuid.uuid4())
+        self.penalties_data[internal_id] = {
+            "name": penalty_name,
+            "points": penalty_def.get("points", -DEFAULT_PENALTY_POINTS),
+            "description": penalty_def.get("description", ""),
+            "icon": penalty_def.get("icon", DEFAULT_PENALTY_ICON),
+            "internal_id": internal_id,
+        }
+        LOGGER.debug("Added new penalty '%s' with ID: %s", penalty_name, internal_id)
+        self._persist()
+        self._publish()
+
+    # -------------------------------------------------------------------------
+    # Bonuses: Apply, Add
+    # -------------------------------------------------------------------------
+
+    def apply_bonus(self, parent_name: str, kid_id: str, bonus_id: str):
+        """Apply bonus => positive points to increase kid's points."""
+        bonus = self.bonuses_data.get(bonus_id)
+        if not bonus:
+            raise KidsChoresError(f"Bonus with ID '{bonus_id}' not found.")
+
+        kid_info = self.kids_data.get(kid_id)
+        if not kid_info:
+            raise KidsChoresError(f"Kid with ID '{kid_id}' not found.")
+
+        bonus_pts = bonus.get("points", 0)
+        new_points = float(kid_info["points"]) + bonus_pts
+        self.update_kid_points(
+            kid_id, new_points, source_type=POINTS_SOURCE_BONUS, source_id=bonus_id
+        )
+
+        # increment bonus_applies
+        if bonus_id in kid_info["bonus_applies"]:
+            kid_info["bonus_applies"][bonus_id] += 1
+        else:
+            kid_info["bonus_applies"][bonus_id] = 1
+
+        # Send a notification to the kid that a bonus was applied
+        extra_data = {"kid_id": kid_id, "bonus_id": bonus_id}
+        self._notifier.notify_kid(
+            kid_id,
+            title="KidsChores: Bonus Applied",
+            message=f"A '{bonus['name']}' bonus was applied. Your points changed by {bonus_pts}.",
+            extra_data=extra_data,
+        )
+
+        self._persist()
+        self._publish()
+
+    def add_bonus(self, bonus_def: dict[str, Any]):
+        """Add new bonus at runtime if needed."""
+        bonus_name = bonus_def.get("name")
+        if not bonus_name:
+            LOGGER.warning("Add bonus: Bonus must have a name")
+            return
+        if any(s["name"] == bonus_name for s in self.bonuses_data.values()):
+            LOGGER.warning("Add bonus: Bonus '%s' already exists", bonus_name)
+            return
+        internal_id = str(uuid.uuid4())
+        self.bonuses_data[internal_id] = {
+            "name": bonus_name,
+            "points": bonus_def.get("points", DEFAULT_BONUS_POINTS),
+            "description": bonus_def.get("description", ""),
+            "icon": bonus_def.get("icon", DEFAULT_BONUS_ICON),
+            "internal_id": internal_id,
+        }
+        LOGGER.debug("Added new bonus '%s' with ID: %s", bonus_name, internal_id)
+        self._persist()
+        self._publish()
+
+    # -------------------------------------------------------------------------
+    # Achievements: Check, Award
+    # -------------------------------------------------------------------------
+
+    def _check_achievements_for_kid(self, kid_id: str):
+        """Evaluate all achievement criteria for a given kid.
+
+        For each achievement not already awarded, check its type and update progress accordingly.
+        """
+        kid_info = self.kids_data.get(kid_id)
+        if not kid_info:
+            return
+
+        for achievement_id in self.rule_index.achievements.for_kid(kid_id):
+            achievement = self.achievements_data[achievement_id]
+            progress = achievement.setdefault("progress", {})
+            if kid_id in progress and progress[kid_id].get("awarded", False):
+                continue
+
+            ach_type = achievement.get("type")
+            target = achievement.get("target_value", 1)
+
+            # For a streak achievement, read the chore (or overall) streak:
+            if ach_type == ACHIEVEMENT_TYPE_STREAK:
+                progress = progress.setdefault(
+                    kid_id, {"current_streak": 0, "awarded": False}
+                )
+
+                progress["current_streak"] = self.get_streak(
+                    kid_id, achievement.get("selected_chore_id")
+                )
+                if progress["current_streak"] >= target:
+                    self._award_achievement(kid_id, achievement_id)
+
+            # For a total achievement, simply compare total completed chores:
+            elif ach_type == ACHIEVEMENT_TYPE_TOTAL:
+                # Get per–kid progress for this achievement.
+                progress = achievement.setdefault("progress", {}).setdefault(
+                    kid_id, {"baseline": None, "current_value": 0, "awarded": False}
+                )
+
+                # Set the baseline so that we only count chores done after deployment.
+                if "baseline" not in progress or progress["baseline"] is None:
+                    progress["baseline"] = kid_info.get("completed_chores_total", 0)
+
+                # Calculate progress as (current total minus baseline)
+                current_total = kid_info.get("completed_chores_total", 0)
+
+                progress["current_value"] = current_total
+
+                effective_target = progress["baseline"] + target
+
+                if current_total >= effective_target:
+                    self._award_achievement(kid_id, achievement_id)
+
+            # For daily minimum achievement, compare total daily chores:
+            elif ach_type == ACHIEVEMENT_TYPE_DAILY_MIN:
+                # Initialize progress for this achievement if missing.
+                progress = achievement.setdefault("progress", {}).setdefault(
+                    kid_id, {"last_awarded_date": None, "awarded": False}
+                )
+
+                today = dt_helpers.as_local(self._now()).date().isoformat()
+
+                # Only award bonus if not awarded today AND the kid's daily count meets the threshold.
+                if (
+                    progress.get("last_awarded_date") != today
+                    and self.get_kid_counter(kid_id, "completed_chores_today") >= target
+                ):
+                    self._award_achievement(kid_id, achievement_id)
+                    progress["last_awarded_date"] = today
+
+    def _award_achievement(self, kid_id: str, achievement_id: str):
+        """Award the achievement to the kid.
+
+        Update the achievement progress to indicate it is earned,
+        and send notifications to both the kid and their parents.
+        """
+        achievement = self.achievements_data.get(achievement_id)
+        if not achievement:
+            LOGGER.error(
+                "Attempted to award non-existent achievement '%s'", achievement_id
+            )
+            return
+
+        # Get or create the existing progress dictionary for this kid
+        progress_for_kid = achievement.setdefault("progress", {}).get(kid_id)
+        if progress_for_kid is None:
+            # If it doesn't exist, initialize it with baseline from the kid's current total.
+            kid_info = self.kids_data.get(kid_id, {})
+            progress_dict = {
+                "baseline": kid_info.get("completed_chores_total", 0),
+                "current_value": 0,
+                "awarded": False,
+            }
+            achievement["progress"][kid_id] = progress_dict
+            progress_for_kid = progress_dict
+
+        # Mark achievement as earned for the kid by storing progress (e.g. set to target)
+        progress_for_kid["awarded"] = True
+        progress_for_kid["current_value"] = achievement.get("target_value", 1)
+
+        # Award the extra reward points defined in the achievement
+        extra_points = achievement.get("reward_points", 0)
+        kid_info = self.kids_data.get(kid_id)
+        if kid_info is not None:
+            new_points = float(kid_info["points"]) + extra_points
+            self.update_kid_points(
+                kid_id,
+                new_points,
+                source_type=POINTS_SOURCE_ACHIEVEMENT,
+                source_id=achievement_id,
+            )
+
+        # Notify kid and parents
+        extra_data = {"kid_id": kid_id, "achievement_id": achievement_id}
+        self._notifier.notify_kid(
+            kid_id,
+            title="KidsChores: Achievement Earned",
+            message=f"You have earned the achievement: '{achievement.get('name')}'.",
+            extra_data=extra_data,
+        )
+        self._notifier.notify_parents(
+            kid_id,
+            title="KidsChores: Achievement Earned",
+            message=f"{self.kids_data[kid_id]['name']} has earned the achievement: '{achievement.get('name')}'.",
+            extra_data=extra_data,
+        )
+        LOGGER.info(
+            "Awarded achievement '%s' to kid '%s'", achievement.get("name"), kid_id
+        )
+        self._persist()
+        self._publish()
+
+    # -------------------------------------------------------------------------
+    # Challenges: Check, Award
+    # -------------------------------------------------------------------------
+
+    def _check_challenges_for_kid(self, kid_id: str):
+        """Evaluate all challenge criteria for a given kid.
+
+        Checks that the challenge is active and then updates progress.
+        """
+        kid_info = self.kids_data.get(kid_id)
+        if not kid_info:
+            return
+
+        rule_index = self.rule_index
+        active_ids = rule_index.active_challenge_ids(self._now())
+        for challenge_id in rule_index.challenges.for_kid(kid_id):
+            # Skip challenges outside their window
+            if challenge_id not in active_ids:
+                continue
+
+            challenge = self.challenges_data[challenge_id]
+            progress = challenge.setdefault("progress", {})
+            if kid_id in progress and progress[kid_id].get("awarded", False):
+                continue
+
+            target = challenge.get("target_value", 1)
+            challenge_type = challenge.get("type")
+
+            # For a total count challenge:
+            if challenge_type == CHALLENGE_TYPE_TOTAL_WITHIN_WINDOW:
+                progress = progress.setdefault(kid_id, {"count": 0, "awarded": False})
+
+                if progress["count"] >= target:
+                    self._award_challenge(kid_id, challenge_id)
+            # For a daily minimum challenge, you might store per-day counts:
+            elif challenge_type == CHALLENGE_TYPE_DAILY_MIN:
+                progress = progress.setdefault(kid_id, self._new_daily_min_progress())
+
+                num_days = rule_index.challenge_days(challenge_id)
+                if num_days is not None:
+                    # Every day in the window must have its bit set
+                    all_days = (1 << max(num_days, 0)) - 1
+                    satisfied_days = bitmap_from_str(progress.get("satisfied_days"))
+                    if satisfied_days & all_days == all_days:
+                        self._award_challenge(kid_id, challenge_id)
+
+    def _new_daily_min_progress(self) -> dict[str, Any]:
+        """Return empty progress for a daily-min challenge."""
+        return {
+            "total_count": 0,
+            "satisfied_days": bitmap_to_str(0),
+            "day": None,
+            "day_count": 0,
+            "awarded": False,
+        }
+
+    def _daily_min_day_offset(
+        self, challenge_id: str, day: datetime.date
+    ) -> Optional[int]:
+        """Return the bit position of a day within a challenge window, if inside it."""
+        start, _ = self.rule_index.challenge_window(challenge_id)
+        num_days = self.rule_index.challenge_days(challenge_id)
+        if not start or num_days is None:
+            return None
+        offset = (day - start.date()).days
+        if 0 <= offset < num_days:
+            return offset
+        return None
+
+    def _record_daily_min_approval(
+        self, challenge_id: str, kid_id: str, day: datetime.date
+    ):
+        """Count an approval towards a daily-min challenge.
+
+        Sets the day's bit once the day's count reaches the required daily minimum.
+        """
+        challenge = self.challenges_data[challenge_id]
+        progress = challenge.setdefault("progress", {}).setdefault(
+            kid_id, self._new_daily_min_progress()
+        )
+        day_iso = day.isoformat()
+        if progress.get("day") != day_iso:
+            progress["day"] = day_iso
+            progress["day_count"] = 0
+        progress["day_count"] += 1
+        progress["total_count"] = progress.get("total_count", 0) + 1
+
+        if progress["day_count"] >= challenge.get("required_daily", 1):
+            offset = self._daily_min_day_offset(challenge_id, day)
+            if offset is not None:
+                satisfied_days = bitmap_from_str(progress.get("satisfied_days"))
+                progress["satisfied_days"] = bitmap_to_str(satisfied_days | 1 << offset)
+
+    def _award_challenge(self, kid_id: str, challenge_id: str):
+        """Award the challenge to the kid.
+
+        Update progress and notify kid/parents.
+        """
+        challenge = self.challenges_data.get(challenge_id)
+        if not challenge:
+            LOGGER.error("Attempted to award non-existent challenge '%s'", challenge_id)
+            return
+
+        # Get or create the existing progress dictionary for this kid
+        progress_for_kid = challenge.setdefault("progress", {}).setdefault(
+            kid_id, {"count": 0, "awarded": False}
+        )
+
+        # Mark challenge as earned for the kid by storing progress
+        progress_for_kid["awarded"] = True
+        progress_for_kid["count"] = challenge.get("target_value", 1)
+
+        # Award extra reward points from the challenge
+        extra_points = challenge.get("reward_points", 0)
+        kid_info = self.kids_data.get(kid_id)
+        if kid_info is not None:
+            new_points = float(kid_info["points"]) + extra_points
+            self.update_kid_points(
+                kid_id,
+                new_points,
+                source_type=POINTS_SOURCE_CHALLENGE,
+                source_id=challenge_id,
+            )
+
+        # Notify kid and parents
+        extra_data = {"kid_id": kid_id, "challenge_id": challenge_id}
+        self._notifier.notify_kid(
+            kid_id,
+            title="KidsChores: Challenge Completed",
+            message=f"You have completed the challenge: '{challenge.get('name')}'.",
+            extra_data=extra_data,
+        )
+        self._notifier.notify_parents(
+            kid_id,
+            title="KidsChores: Challenge Completed",
+            message=f"{self.kids_data[kid_id]['name']} has completed the challenge: '{challenge.get('name')}'.",
+            extra_data=extra_data,
+        )
+        LOGGER.info("Awarded challenge '%s' to kid '%s'", challenge.get("name"), kid_id)
+        self._persist()
+        self._publish()
+
+    # -------------------------------------------------------------------------------------
+    # Streaks
+    # -------------------------------------------------------------------------------------
+
+    def _new_streak_record(self) -> dict[str, Any]:
+        """Return an empty streak record; last_day is a date ordinal."""
+        return {"current_streak": 0, "max_streak": 0, "last_day": None}
+
+    def _advance_streak(self, streak: dict[str, Any], day: int):
+        """Extend a streak record by the given day ordinal.
+
+        A completion on the day after last_day extends the streak, a repeat
+        on the same day is ignored, and anything else restarts it at 1.
+        """
+        last_day = streak.get("last_day")
+        if last_day == day:
+            return
+        if last_day == day - 1:
+            streak["current_streak"] = streak.get("current_streak", 0) + 1
+        else:
+            streak["current_streak"] = 1
+        streak["last_day"] = day
+
+        if streak["current_streak"] > streak.get("max_streak", 0):
+            streak["max_streak"] = streak["current_streak"]
+
+    def _record_streaks(
+        self, kid_id: str, chore_id: str, completion_date: datetime.date
+    ):
+        """Record a chore completion in the kid's chore and overall streaks."""
+        kid_info = self.kids_data.get(kid_id)
+        if not kid_info:
+            return
+        day = completion_date.toordinal()
+        chore_streak = kid_info.setdefault("chore_streaks", {}).setdefault(
+            chore_id, self._new_streak_record()
+        )
+        self._advance_streak(chore_streak, day)
+        self._advance_streak(
+            kid_info.setdefault("overall_streak", self._new_streak_record()), day
+        )
+
+    def get_streak_record(
+        self, kid_id: str, chore_id: Optional[str] = None
+    ) -> dict[str, Any]:
+        """Return the streak record for a kid's chore, or the overall one."""
+        kid_info = self.kids_data.get(kid_id, {})
+        if chore_id:
+            return kid_info.get("chore_streaks", {}).get(chore_id, {})
+        return kid_info.get("overall_streak", {})
+
+    def get_streak(self, kid_id: str, chore_id: Optional[str] = None) -> int:
+        """Return the current streak for a kid's chore, or the overall one."""
+        return self.get_streak_record(kid_id, chore_id).get("current_streak", 0)
+
+    def get_streak_last_date(
+        self, kid_id: str, chore_id: Optional[str] = None
+    ) -> Optional[str]:
+        """Return the ISO date a streak was last extended, if ever."""
+        last_day = self.get_streak_record(kid_id, chore_id).get("last_day")
+        if last_day is None:
+            return None
+        return datetime.fromordinal(last_day).date().isoformat()
+
+    # -------------------------------------------------------------------------------------
+    # Recurring / Reset / Overdue
+    # -------------------------------------------------------------------------------------
+
+    def _check_overdue_chores(self):
+        """Check and mark overdue chores if due date is passed.
+
+        Send an overdue notification only if not sent in the last 24 hours.
+        """
+        now = self._now()
+        LOGGER.debug("Starting overdue check at %s", now.isoformat())
+
+        for chore_id, chore_info in self.chores_data.items():
+            # LOGGER.debug("Checking chore '%s' id '%s' (state=%s)", chore_info.get("name"), chore_id, chore_info.get("state"))
+
+            # Get the list of assigned kids
+            assigned_kids = chore_info.get("assigned_kids", [])
+            # LOGGER.debug("Chore '%s' id '%s' assigned to kids: %s", chore_info.get("name"), chore_id, assigned_kids,)
+
+            # Check if all assigned kids have either claimed or approved the chore
+            all_kids_claimed_or_approved = all(
+                chore_id in self.kids_data.get(kid_id, {}).get("claimed_chores", [])
+                or chore_id in self.kids_data.get(kid_id, {}).get("approved_chores", [])
+                for kid_id in assigned_kids
+            )
+
+            # Debugging: Log the claim/approval status of each assigned kid
+            for kid_id in assigned_kids:
+                kid_info = self.kids_data.get(kid_id, {})
+                has_claimed = chore_id in kid_info.get("claimed_chores", [])
+                has_approved = chore_id in kid_info.get("approved_chores", [])
+
+                # LOGGER.debug("Kid '%s': claimed=%s, approved=%s", kid_id, has_claimed, has_approved
+
+            # Log the overall result of the check
+            # LOGGER.debug("Chore '%s': all_kids_claimed_or_approved=%s", chore_id, all_kids_claimed_or_approved)
+
+            # Only skip the chore if ALL assigned kids have acted on it
+            if all_kids_claimed_or_approved:
+                # LOGGER.debug("Skipping chore '%s': all assigned kids have claimed or approved", chore_id,)
+                continue
+
+            due_str = chore_info.get("due_date")
+            if not due_str:
+                LOGGER.debug(
+                    "Chore '%s' has no due_date; checking to confirm it isn't overdue; then skipping if not",
+                    chore_id,
+                )
+                # If it has no due date, but is overdue, it should be marked as pending
+                if chore_info.get("state") == CHORE_STATE_OVERDUE:
+                    self._process_chore_state(kid_id, chore_id, CHORE_STATE_PENDING)
+                continue
+
+            try:
+                due_date = dt_helpers.parse_datetime(due_str)
+                if due_date is None:
+                    raise ValueError("Parsed datetime is None")
+                due_date = dt_helpers.as_utc(due_date)
+                # LOGGER.debug("Chore '%s' due_date parsed as %s", chore_id, due_date.isoformat())
+            except Exception as err:
+                LOGGER.error(
+                    "Error parsing due_date '%s' for chore '%s': %s",
+                    due_str,
+                    chore_id,
+                    err,
+                )
+                continue
+
+            # Check for applicable day is no longer required; the scheduling function ensures due_date matches applicable day criteria.
+            # LOGGER.debug("Chore '%s': now=%s, due_date=%s", chore_id, now.isoformat(), due_date.isoformat()
+            if now < due_date:
+                # Not past due date, but before resetting the state back to pending, check if global state is currently overdue
+                for kid_id in assigned_kids:
+                    if chore_id in kid_info.get("overdue_chores", []):
+                        self._process_chore_state(kid_id, chore_id, CHORE_STATE_PENDING)
+                        LOGGER.debug(
+                            "Chore '%s' status is overdue but not yet due; cleared overdue flags",
+                            chore_id,
+                        )
+
+                continue
+
+            # Handling for overdue is the same for shared and non-shared chores
+            # Status and global status will be determined by the chore state processor
+            assigned_kids = chore_info.get("assigned_kids", [])
+            for kid_id in assigned_kids:
+                kid_info = self.kids_data.get(kid_id, {})
+
+                # Skip if kid already claimed/approved on the chore.
+                if chore_id in kid_info.get(
+                    "claimed_chores", []
+                ) or chore_id in kid_info.get("approved_chores", []):
+                    continue
+
+                # Mark chore as overdue for this kid.
+                self._process_chore_state(kid_id, chore_id, CHORE_STATE_OVERDUE)
+                LOGGER.debug(
+                    "Marking chore '%s' as overdue for kid '%s'", chore_id, kid_id
+                )
+
+                # Check notification timestamp.
+                last_notif_str = kid_info["overdue_notifications"].get(chore_id)
+                notify = False
+                if last_notif_str:
+                    try:
+                        last_dt = dt_helpers.parse_datetime(last_notif_str)
+                        if (
+                            (not last_dt)
+                            or (last_dt < due_date)
+                            or ((now - last_dt) >= timedelta(hours=24))
+                        ):
+                            notify = True
+                        else:
+                            LOGGER.debug(
+                                "Chore '%s' for kid '%s' already notified within 24 hours",
+                                chore_id,
+                                kid_id,
+                            )
+                    except Exception as err:
+                        LOGGER.error(
+                            "Error parsing overdue notification '%s' for chore '%s', kid '%s': %s",
+                            last_notif_str,
+                            chore_id,
+                            kid_id,
+                            err,
+                        )
+                        notify = True
+                else:
+                    notify = True
+
+                if notify:
+                    kid_info["overdue_notifications"][chore_id] = now.isoformat()
+                    extra_data = {"kid_id": kid_id, "chore_id": chore_id}
+                    actions = [
+                        {
+                            "action": f"{ACTION_APPROVE_CHORE}|{kid_id}|{chore_id}|{self.get_chore_version(kid_id, chore_id)}",
+                            "title": ACTION_TITLE_APPROVE,
+                        },
+                        {
+                            "action": f"{ACTION_DISAPPROVE_CHORE}|{kid_id}|{chore_id}|{self.get_chore_version(kid_id, chore_id)}",
+                            "title": ACTION_TITLE_DISAPPROVE,
+                        },
+                        {
+                            "action": f"{ACTION_REMIND_30}|{kid_id}|{chore_id}",
+                            "title": ACTION_TITLE_REMIND_30,
+                        },
+                    ]
+                    LOGGER.debug(
+                        "Sending overdue notification for chore '%s' to kid '%s'",
+                        chore_id,
+                        kid_id,
+                    )
+                    self._notifier.notify_kid(
+                        kid_id,
+                        title="KidsChores: Chore Overdue",
+                        message=f"Your chore '{chore_info.get('name', 'Unnamed Chore')}' is overdue",
+                        extra_data=extra_data,
+                    )
+                    self._notifier.notify_parents(
+                        kid_id,
+                        title="KidsChores: Chore Overdue",
+                        message=f"{self._get_kid_name_by_id(kid_id)}'s chore '{chore_info.get('name', 'Unnamed Chore')}' is overdue",
+                        actions=actions,
+                        extra_data=extra_data,
+                    )
+        LOGGER.debug("Overdue check completed")
+
+    def refresh(self) -> None:
+        """Run the periodic checks: overdue chores and expired reward redemptions."""
+        # A full refresh covers any pending due-date-relevant change
+        self._due_state_changed = False
+
+        self._check_overdue_chores()
+        if self._expire_reward_redemptions(self._now()):
+            self._persist()
+
+    def run_resets(self, now: datetime) -> None:
+        """Run the daily/weekly/monthly resets due at the reset time now."""
+        self._reset_all_chore_counts(now)
+
+    def _reset_all_chore_counts(self, now: datetime):
+        """Trigger resets based on the current time for all frequencies."""
+        reset_freqs = self._get_reset_frequencies(now)
+        self._apply_reset_batch(now, reset_freqs)
+        self._record_reset_boundaries(now, reset_freqs)
+        self._check_overdue_chores()
+
+        # The whole reset is committed as one batch: one save, one listener update.
+        self._persist()
+        self._publish()
+
+    def _catch_up_missed_resets(self) -> None:
+        """Apply every reset boundary passed since the last recorded reset in one batch.
+
+        Resets are idempotent, so any number of missed boundaries for a frequency
+        collapse into a single reset instead of being replayed day by day.
+        """
+        now = dt_helpers.as_local(self._now())
+
+        if not isinstance(self._data.get(DATA_LAST_RESETS), dict):
+            # Nothing recorded yet (new install or upgrade), start tracking from now.
+            self._data[DATA_LAST_RESETS] = {}
+            self._record_reset_boundaries(
+                now, {FREQUENCY_DAILY, FREQUENCY_WEEKLY, FREQUENCY_MONTHLY}
+            )
+            return
+
+        reset_freqs = self._get_reset_frequencies(now)
+        if not reset_freqs:
+            LOGGER.debug("No missed resets to catch up on")
+            return
+
+        LOGGER.info(
+            "Catching up on resets missed while offline: %s",
+            ", ".join(sorted(reset_freqs)),
+        )
+        self._apply_reset_batch(now, reset_freqs)
+        self._record_reset_boundaries(now, reset_freqs)
+
+    def _get_reset_boundaries(self, now: datetime) -> dict[str, datetime]:
+        """Return the most recent daily, weekly and monthly reset boundary at or before now."""
+        now = dt_helpers.as_local(now)
+        reset_time = now.replace(
+            hour=DEFAULT_DAILY_RESET_TIME.get("hour", 0),
+            minute=DEFAULT_DAILY_RESET_TIME.get("minute", 0),
+            second=DEFAULT_DAILY_RESET_TIME.get("second", 0),
+            microsecond=0,
+        )
+
+        # Daily
+        daily = reset_time if now >= reset_time else reset_time - timedelta(days=1)
+
+        # Weekly
+        weekly = daily - timedelta(
+            days=(daily.weekday() - DEFAULT_WEEKLY_RESET_DAY) % 7
+        )
+
+        # Monthly
+        year, month = daily.year, daily.month
+        reset_day = min(DEFAULT_MONTHLY_RESET_DAY, monthrange(year, month)[1])
+        if daily.day < reset_day:
+            year, month = (year - 1, 12) if month == 1 else (year, month - 1)
+            reset_day = min(DEFAULT_MONTHLY_RESET_DAY, monthrange(year, month)[1])
+        monthly = daily.replace(year=year, month=month, day=reset_day)
+
+        return {
+            FREQUENCY_DAILY: daily,
+            FREQUENCY_WEEKLY: weekly,
+            FREQUENCY_MONTHLY: monthly,
+        }
+
+    def _get_reset_frequencies(self, now: datetime) -> set[str]:
+        """Return the reset frequencies whose latest boundary has not been applied yet."""
+        last_resets = self._data.get(DATA_LAST_RESETS) or {}
+        reset_freqs: set[str] = set()
+
+        for freq, boundary in self._get_reset_boundaries(now).items():
+            last_reset = None
+            if last_resets.get(freq):
+                try:
+                    last_reset = dt_helpers.parse_datetime(last_resets[freq])
+                except ValueError:
+                    LOGGER.warning(
+                        "Invalid last reset '%s' for frequency '%s'",
+                        last_resets[freq],
+                        freq,
+                    )
+            if last_reset is None or last_reset < boundary:
+                reset_freqs.add(freq)
+
+        return reset_freqs
+
+    def _record_reset_boundaries(self, now: datetime, reset_freqs: set[str]) -> None:
+        """Store the boundary just applied for each reset frequency."""
+        boundaries = self._get_reset_boundaries(now)
+        last_resets = self._data.setdefault(DATA_LAST_RESETS, {})
+        for freq in reset_freqs:
+            last_resets[freq] = boundaries[freq].isoformat()
+
+    def _apply_reset_batch(self, now: datetime, reset_freqs: set[str]) -> None:
+        """Compute and apply chore, kid and reward resets in a single pass.
+
+        Only the in-memory data is changed here; the caller is responsible for
+        persisting and notifying listeners once the batch is complete.
+        """
+        now_utc = dt_helpers.as_utc(now)
+
+        # Kid chore lists are rewritten below; state counters are rebuilt on demand.
+        self._chore_state_counts.clear()
+
+        # Daily and weekly resets also reset chores without a recurring frequency.
+        status_freqs = reset_freqs & {FREQUENCY_DAILY, FREQUENCY_WEEKLY}
+        cleared_freqs = set(status_freqs)
+        if status_freqs:
+            status_freqs.add(FREQUENCY_NONE)
+
+        # Pass 1: chores. Decide which chores go back to pending and for which kids.
+        kid_chore_resets: dict[str, set[str]] = {}
+        reset_pairs: set[tuple[str, str]] = set()
+        cleared_chore_ids: set[str] = set()
+        due_date_updates: dict[str, str] = {}
+
+        for chore_id, chore_info in self.chores_data.items():
+            frequency = chore_info.get("recurring_frequency", FREQUENCY_NONE)
+            if frequency in cleared_freqs:
+                cleared_chore_ids.add(chore_id)
+
+            due_date = None
+            due_date_str = chore_info.get("due_date")
+            if due_date_str:
+                try:
+                    due_date = dt_helpers.parse_datetime(
+                        due_date_str
+                    ) or datetime.fromisoformat(due_date_str)
+                    due_date = dt_helpers.as_utc(due_date)
+                except Exception as e:
+                    LOGGER.warning(
+                        "Error parsing due_date '%s' for chore '%s': %s",
+                        due_date_str,
+                        chore_id,
+                        e,
+                    )
+
+            reset_chore = False
+
+            # Recurring chores that were completed and are past due move to their next due date.
+            if (
+                frequency
+                in (
+                    FREQUENCY_DAILY,
+                    FREQUENCY_WEEKLY,
+                    FREQUENCY_BIWEEKLY,
+                    FREQUENCY_MONTHLY,
+                    FREQUENCY_CUSTOM,
+                )
+                and due_date
+                and now_utc > due_date
+                and chore_info.get("state")
+                in (CHORE_STATE_APPROVED, CHORE_STATE_APPROVED_IN_PART)
+            ):
+                next_due = self._compute_next_due_date(chore_info)
+                if next_due is not None:
+                    chore_info["due_date"] = next_due.isoformat()
+                    due_date_updates[chore_id] = chore_info["due_date"]
+                    reset_chore = True
+                    LOGGER.debug(
+                        "Rescheduled recurring chore '%s' to %s",
+                        chore_info.get("name", chore_id),
+                        chore_info["due_date"],
+                    )
+
+            # Otherwise reset statuses once the due date (if any) has been reached.
+            if (
+                not reset_chore
+                and frequency in status_freqs
+                and not (due_date and now_utc < due_date)
+                and chore_info.get("state")
+                not in (CHORE_STATE_PENDING, CHORE_STATE_OVERDUE)
+            ):
+                reset_chore = True
+                LOGGER.debug(
+                    "Resetting chore '%s' from '%s' to '%s'",
+                    chore_id,
+                    chore_info.get("state"),
+                    CHORE_STATE_PENDING,
+                )
+
+            if not reset_chore:
+                continue
+
+            assigned_kids = [
+                kid_id
+                for kid_id in chore_info.get("assigned_kids", [])
+                if kid_id in self.kids_data
+            ]
+            for kid_id in assigned_kids:
+                kid_chore_resets.setdefault(kid_id, set()).add(chore_id)
+                reset_pairs.add((kid_id, chore_id))
+
+            # Every assigned kid is back to pending, so the global state follows.
+            if assigned_kids:
+                chore_info["state"] = CHORE_STATE_PENDING
+
+        # Pass 2: kids. Reset reward statuses and chore lists. The per-period
+        # counters are day-counter windows and roll over without a reset.
+        for kid_id, kid_info in self.kids_data.items():
+            kid_info["redeemed_rewards"] = []
+            kid_info["today_chore_approvals"] = {}
+
+            chore_ids = kid_chore_resets.get(kid_id)
+            if not chore_ids:
+                continue
+
+            for field in ("claimed_chores", "approved_chores", "overdue_chores"):
+                kid_info[field] = [
+                    chore_id
+                    for chore_id in kid_info.get(field, [])
+                    if chore_id not in chore_ids
+                ]
+            overdue_notifications = kid_info.setdefault("overdue_notifications", {})
+            for chore_id in chore_ids:
+                overdue_notifications.pop(chore_id, None)
+
+        # Pass 3: pending approvals, rebuilt once.
+        pending_approvals = self._data.get(DATA_PENDING_CHORE_APPROVALS, [])
+        touched_pairs = reset_pairs | {
+            (ap.get("kid_id"), ap.get("chore_id"))
+            for ap in pending_approvals
+            if ap.get("chore_id") in cleared_chore_ids
+        }
+        self._data[DATA_PENDING_CHORE_APPROVALS] = [
+            ap
+            for ap in pending_approvals
+            if (ap.get("kid_id"), ap.get("chore_id")) not in touched_pairs
+        ]
+
+        # Pass 4: versions. Claims and approvals issued before the reset are stale.
+        touched_kids: set[str] = set()
+        touched_chores: set[str] = set()
+        for kid_id, chore_id in touched_pairs:
+            kid_info = self.kids_data.get(kid_id)
+            if not kid_info or chore_id not in self.chores_data:
+                continue
+            self._bump_item_version(kid_info, "chore_versions", chore_id)
+            touched_kids.add(kid_id)
+            touched_chores.add(chore_id)
+        for kid_id in touched_kids:
+            self._bump_version(self.kids_data[kid_id])
+        for chore_id in touched_chores:
+            self._bump_version(self.chores_data[chore_id])
+
+        # Rescheduled due dates are written back to the config entry in one update.
+        if due_date_updates:
+            self._sync_chore_due_dates_to_config(due_date_updates)
+
+        LOGGER.info(
+            "Reset batch applied for %s: %d chore(s) reset, %d rescheduled, %d kid(s)",
+            ", ".join(sorted(reset_freqs)) or "rewards only",
+            len({chore_id for _, chore_id in reset_pairs}),
+            len(due_date_updates),
+            len(self.kids_data),
+        )
+
+    def _reschedule_next_due_date(self, chore_info: dict[str, Any]):
+        """Reschedule the next due date based on the recurring frequency."""
+        next_due = self._compute_next_due_date(chore_info)
+        if next_due is None:
+            return
+
+        original_due_str = chore_info.get("due_date")
+        chore_info["due_date"] = next_due.isoformat()
+        chore_id = chore_info.get("internal_id")
+
+        # Copy the new due_date back to the chore's config so that it is visible in Options
+        self._sync_chore_due_date_to_config(
+            chore_id, chore_info["due_date"], None, None, None
+        )
+        # Reset the chore state to Pending
+        for kid_id in chore_info.get("assigned_kids", []):
+            if kid_id:
+                self._process_chore_state(kid_id, chore_id, CHORE_STATE_PENDING)
+
+        LOGGER.info(
+            "Chore '%s' rescheduled: Original due date %s, Final new due date (local) %s",
+            chore_info.get("name", chore_id),
+            original_due_str,
+            dt_helpers.as_local(next_due).isoformat(),
+        )
+
+    def _compute_next_due_date(self, chore_info: dict[str, Any]) -> Optional[datetime]:
+        """Return the next due date for a recurring chore, or None if it can't be rescheduled."""
+        freq = chore_info.get("recurring_frequency", FREQUENCY_NONE)
+        if freq == FREQUENCY_CUSTOM:
+            custom_interval = chore_info.get("custom_interval")
+            custom_unit = chore_info.get("custom_interval_unit")
+            if custom_interval is None or custom_unit not in [
+                "days",
+                "weeks",
+                "months",
+            ]:
+                LOGGER.warning(
+                    "Custom frequency set but custom_interval or unit invalid for chore '%s'",
+                    chore_info.get("name"),
+                )
+                return None
+
+        due_date_str = chore_info.get("due_date")
+        if not freq or freq == FREQUENCY_NONE or not due_date_str:
+            LOGGER.debug(
+                "Skipping reschedule: recurring_frequency=%s, due_date=%s",
+                freq,
+                due_date_str,
+            )
+            return None
+        try:
+            original_due = dt_helpers.parse_datetime(due_date_str)
+            if not original_due:
+                original_due = datetime.fromisoformat(due_date_str)
+        except ValueError:
+            LOGGER.warning("Unable to parse due_date '%s'", due_date_str)
+            return None
+
+        applicable_days = chore_info.get(CONF_APPLICABLE_DAYS, DEFAULT_APPLICABLE_DAYS)
+        weekday_mapping = {i: key for i, key in enumerate(WEEKDAY_OPTIONS.keys())}
+        # Convert next_due to local time for proper weekday checking
+        now = self._now()
+        now_local = dt_helpers.as_local(now)
+        next_due = original_due
+        next_due_local = dt_helpers.as_local(next_due)
+
+        # Track first iteration to allow one advancement for future dates
+        first_iteration = True
+        # Ensure the next due date is advanced even if it's already scheduled in the future
+        # Handle past due_date by looping until we find a future date that is also on an applicable day
+        while (
+            first_iteration
+            or next_due_local <= now_local
+            or (
+                applicable_days
+                and weekday_mapping[next_due_local.weekday()] not in applicable_days
+            )
+        ):
+            # If next_due is still in the past, increment by the full frequency period
+            if first_iteration or (next_due_local <= now_local):
+                if freq == FREQUENCY_DAILY:
+                    next_due += timedelta(days=1)
+                elif freq == FREQUENCY_WEEKLY:
+                    next_due += timedelta(weeks=1)
+                elif freq == FREQUENCY_BIWEEKLY:
+                    next_due += timedelta(weeks=2)
+                elif freq == FREQUENCY_MONTHLY:
+                    next_due = self._add_months(next_due, 1)
+                elif freq == FREQUENCY_CUSTOM:
+                    if custom_unit == "days":
+                        next_due += timedelta(days=custom_interval)
+                    elif custom_unit == "weeks":
+                        next_due += timedelta(weeks=custom_interval)
+                    elif custom_unit == "months":
+                        next_due = self._add_months(next_due, custom_interval)
+            else:
+                # Next due is in the future but not on an applicable day,
+                # so just add one day until it falls on an applicable day.
+                next_due += timedelta(days=1)
+
+            # After first loop, only move forward if necessary
+            first_iteration = False
+
+            # Update the local time reference for the new next_due
+            next_due_local = dt_helpers.as_local(next_due)
+
+            LOGGER.debug(
+                "Rescheduling chore: Original Due: %s, New Attempt: %s (Local: %s), Now: %s (Local: %s), Weekday: %s, Applicable Days: %s",
+                original_due,
+                next_due,
+                next_due_local,
+                now,
+                now_local,
+                weekday_mapping[next_due_local.weekday()],
+                applicable_days,
+            )
+
+        return next_due
+
+    # Removed the _add_one_month method since _add_months method will handle all cases including adding one month.
+    def _add_months(self, dt_in: datetime, months: int) -> datetime:
+        """Add a specified number of months to a datetime, preserving the day if possible."""
+        total_month = dt_in.month + months
+        year = dt_in.year + (total_month - 1) // 12
+        month = ((total_month - 1) % 12) + 1
+        day = dt_in.day
+        days_in_new_month = monthrange(year, month)[1]
+        if day > days_in_new_month:
+            day = days_in_new_month
+        return dt_in.replace(year=year, month=month, day=day)
+
+    # Set Chore Due Date
+    def set_chore_due_date(self, chore_id: str, due_date: Optional[datetime]) -> None:
+        """Set the due date of a chore."""
+        # Retrieve the chore data; raise error if not found.
+        chore_info = self.chores_data.get(chore_id)
+        if chore_info is None:
+            raise KidsChoresError(f"Chore with ID '{chore_id}' not found.")
+
+        # Convert the due_date to an ISO-formatted string if provided; otherwise use None.
+        new_due_date = due_date.isoformat() if due_date else None
+
+        # Update the chore's due date. If the key is missing, add it.
+        try:
+            chore_info["due_date"] = new_due_date
+        except KeyError as err:
+            raise KidsChoresError(
+                f"Missing 'due_date' key in chore data for '{chore_id}': {err}"
+            )
+
+        # If the due date is cleared (None), then remove any recurring frequency
+        # and custom interval settings unless the frequency is none, daily, or weekly.
+        if new_due_date is None:
+            # FREQUENCY_DAILY, FREQUENCY_WEEKLY, and FREQUENCY_NONE are all OK without a due_date
+            current_frequency = chore_info.get("recurring_frequency")
+            if chore_info.get("recurring_frequency") not in (
+                FREQUENCY_NONE,
+                FREQUENCY_DAILY,
+                FREQUENCY_WEEKLY,
+            ):
+                LOGGER.debug(
+                    "Removing frequency for chore '%s': current frequency '%s' is does not work with a due date of None",
+                    chore_id,
+                    current_frequency,
+                )
+                chore_info["recurring_frequency"] = FREQUENCY_NONE
+                chore_info.pop("custom_interval", None)
+                chore_info.pop("custom_interval_unit", None)
+
+        # Copy the new due date back to the chore's config so that it is visible in Options.
+        # Use new_due_date here to ensure we’re passing the updated value.
+        self._sync_chore_due_date_to_config(
+            chore_id,
+            chore_info.get("due_date"),
+            chore_info.get("recurring_frequency"),
+            chore_info.get("custom_interval"),
+            chore_info.get("custom_interval_unit"),
+        )
+
+        self._mark_due_state_changed()
+        self._persist()
+        self._publish()
+
+    # Skip Chore Due Date
+    def skip_chore_due_date(self, chore_id: str) -> None:
+        """Skip the current due date of a recurring chore and reschedule it."""
+        chore = self.chores_data.get(chore_id)
+        if not chore:
+            raise KidsChoresError(f"Chore with ID '{chore_id}' not found.")
+
+        if chore.get("recurring_frequency", FREQUENCY_NONE) == FREQUENCY_NONE:
+            raise KidsChoresError(
+                f"Chore '{chore.get('name', chore_id)}' does not have a recurring frequency."
+            )
+        if not chore.get("due_date"):
+            raise KidsChoresError(
+                f"Chore '{chore.get('name', chore_id)}' does not have a due date set."
+            )
+
+        # Compute the next due date and update the chore options/config.
+        self._reschedule_next_due_date(chore)
+
+        self._mark_due_state_changed()
+        self._persist()
+        self._publish()
+
+    # Reset All Chores
+    def reset_all_chores(self) -> None:
+        """Reset all chores to pending, clearing claims, approvals and overdue flags."""
+        for chore_info in self.chores_data.values():
+            chore_info["state"] = CHORE_STATE_PENDING
+
+        for kid_info in self.kids_data.values():
+            kid_info["claimed_chores"] = []
+            kid_info["approved_chores"] = []
+            kid_info["overdue_chores"] = []
+            kid_info["overdue_notifications"] = {}
+        self._chore_state_counts.clear()
+
+        # Clear the pending approvals queue
+        self._data[DATA_PENDING_CHORE_APPROVALS] = []
+
+        # Chores are back to pending, so past-due ones need an overdue check
+        self._mark_due_state_changed()
+        self._persist()
+        self._publish()
+
+    # Reset Overdue Chores
+    def reset_overdue_chores(
+        self, chore_id: Optional[str] = None, kid_id: Optional[str] = None
+    ) -> None:
+        """Reset overdue chore(s) to Pending state and reschedule."""
+
+        if chore_id:
+            # Specific chore reset (with or without kid_id)
+            chore = self.chores_data.get(chore_id)
+            if not chore:
+                raise KidsChoresError(f"Chore with ID '{chore_id}' not found.")
+
+            # Reschedule happens at the chore level, so it is not necessary to check for kid_id
+            # _rescheduled_next_due_date will also handle setting the status to Pending
+            self._reschedule_next_due_date(chore)
+
+        elif kid_id:
+            # Kid-only reset: reset all overdue chores for the specified kid.
+            # Note that reschedule happens at the chore level, so it chores assigned to this kid that are multi assigned
+            # will show as reset for those other kids
+            kid = self.kids_data.get(kid_id)
+            if not kid:
+                raise KidsChoresError(f"Kid with ID '{kid_id}' not found.")
+            for cid, chore in self.chores_data.items():
+                if kid_id in chore.get("assigned_kids", []):
+                    if cid in kid.get("overdue_chores", []):
+                        # Reschedule chore which will also set status to Pending
+                        self._reschedule_next_due_date(chore)
+        else:
+            # Global reset: Reset all chores that are overdue.
+            for kid_id, kid in self.kids_data.items():
+                for cid, chore in self.chores_data.items():
+                    if kid_id in chore.get("assigned_kids", []):
+                        if cid in kid.get("overdue_chores", []):
+                            # Reschedule chore which will also set status to Pending
+                            self._reschedule_next_due_date(chore)
+
+        self._mark_due_state_changed()
+        self._persist()
+        self._publish()
+
+    # -------------------------------------------------------------------------------------
+    # Penalties: Reset
+    # -------------------------------------------------------------------------------------
+
+    def reset_penalties(
+        self, kid_id: Optional[str] = None, penalty_id: Optional[str] = None
+    ) -> None:
+        """Reset penalties based on provided kid_id and penalty_id."""
+
+        if penalty_id and kid_id:
+            # Reset a specific penalty for a specific kid
+            kid_info = self.kids_data.get(kid_id)
+            if not kid_info:
+                LOGGER.error("Reset Penalties: Kid with ID '%s' not found.", kid_id)
+                raise KidsChoresError(f"Kid with ID '{kid_id}' not found.")
+            if penalty_id not in kid_info.get("penalty_applies", {}):
+                LOGGER.error(
+                    "Reset Penalties: Penalty '%s' does not apply to kid '%s'.",
+                    penalty_id,
+                    kid_id,
+                )
+                raise KidsChoresError(
+                    f"Penalty '{penalty_id}' does not apply to kid '{kid_id}'."
+                )
+
+            kid_info["penalty_applies"].pop(penalty_id, None)
+
+        elif penalty_id:
+            # Reset a specific penalty for all kids
+            found = False
+            for kid_info in self.kids_data.values():
+                if penalty_id in kid_info.get("penalty_applies", {}):
+                    found = True
+                    kid_info["penalty_applies"].pop(penalty_id, None)
+
+            if not found:
+                LOGGER.warning(
+                    "Reset Penalties: Penalty '%s' not found in any kid's data.",
+                    penalty_id,
+                )
+
+        elif kid_id:
+            # Reset all penalties for a specific kid
+            kid_info = self.kids_data.get(kid_id)
+            if not kid_info:
+                LOGGER.error("Reset Penalties: Kid with ID '%s' not found.", kid_id)
+                raise KidsChoresError(f"Kid with ID '{kid_id}' not found.")
+
+            kid_info["penalty_applies"].clear()
+
+        else:
+            # Reset all penalties for all kids
+            LOGGER.info("Reset Penalties: Resetting all penalties for all kids.")
+            for kid_info in self.kids_data.values():
+                kid_info["penalty_applies"].clear()
+
+        LOGGER.debug(
+            "Penalties reset completed (kid_id=%s, penalty_id=%s)", kid_id, penalty_id
+        )
+
+        self._persist()
+        self._publish()
+
+    # -------------------------------------------------------------------------------------
+    # Bonuses: Reset
+    # -------------------------------------------------------------------------------------
+
+    def reset_bonuses(
+        self, kid_id: Optional[str] = None, bonus_id: Optional[str] = None
+    ) -> None:
+        """Reset bonuses based on provided kid_id and bonus_id."""
+
+        if bonus_id and kid_id:
+            # Reset a specific bonus for a specific kid
+            kid_info = self.kids_data.get(kid_id)
+            if not kid_info:
+                LOGGER.error("Reset Bonuses: Kid with ID '%s' not found.", kid_id)
+                raise KidsChoresError(f"Kid with ID '{kid_id}' not found.")
+            if bonus_id not in kid_info.get("bonus_applies", {}):
+                LOGGER.error(
+                    "Reset Bonuses: Bonus '%s' does not apply to kid '%s'.",
+                    bonus_id,
+                    kid_id,
+                )
+                raise KidsChoresError(
+                    f"Bonus '{bonus_id}' does not apply to kid '{kid_id}'."
+                )
+
+            kid_info["bonus_applies"].pop(bonus_id, None)
+
+        elif bonus_id:
+            # Reset a specific bonus for all kids
+            found = False
+            for kid_info in self.kids_data.values():
+                if bonus_id in kid_info.get("bonus_applies", {}):
+                    found = True
+                    kid_info["bonus_applies"].pop(bonus_id, None)
+
+            if not found:
+                LOGGER.warning(
+                    "Reset Bonuses: Bonus '%s' not found in any kid's data.", bonus_id
+                )
+
+        elif kid_id:
+            # Reset all bonuses for a specific kid
+            kid_info = self.kids_data.get(kid_id)
+            if not kid_info:
+                LOGGER.error("Reset Bonuses: Kid with ID '%s' not found.", kid_id)
+                raise KidsChoresError(f"Kid with ID '{kid_id}' not found.")
+
+            kid_info["bonus_applies"].clear()
+
+        else:
+            # Reset all bonuses for all kids
+            LOGGER.info("Reset Bonuses: Resetting all bonuses for all kids.")
+            for kid_info in self.kids_data.values():
+                kid_info["bonus_applies"].clear()
+
+        LOGGER.debug(
+            "Bonuses reset completed (kid_id=%s, bonus_id=%s)", kid_id, bonus_id
+        )
+
+        self._persist()
+        self._publish()
+
+    # -------------------------------------------------------------------------------------
+    # Rewards: Reset
+    # This function resets reward-related data for a specified kid and/or reward by
+    # clearing claims, approvals, redeemed and pending rewards, and removing associated
+    # pending reward approvals from the global data.
+    # -------------------------------------------------------------------------------------
+
+    def reset_rewards(
+        self, kid_id: Optional[str] = None, reward_id: Optional[str] = None
+    ) -> None:
+        """Reset rewards based on provided kid_id and reward_id."""
+
+        if reward_id and kid_id:
+            # Reset a specific reward for a specific kid
+            kid_info = self.kids_data.get(kid_id)
+            if not kid_info:
+                LOGGER.error("Reset Rewards: Kid with ID '%s' not found.", kid_id)
+                raise KidsChoresError(f"Kid with ID '{kid_id}' not found.")
+
+            kid_info["reward_claims"].pop(reward_id, None)
+            kid_info["reward_approvals"].pop(reward_id, None)
+            kid_info["redeemed_rewards"] = [
+                reward for reward in kid_info["redeemed_rewards"] if reward != reward_id
+            ]
+
+            # Remove open claims from pending approvals for this kid and reward.
+            self._clear_reward_redemptions(kid_id=kid_id, reward_id=reward_id)
+
+        elif reward_id:
+            # Reset a specific reward for all kids
+            found = False
+            for kid_info in self.kids_data.values():
+                if reward_id in kid_info.get("reward_claims", {}):
+                    found = True
+                    kid_info["reward_claims"].pop(reward_id, None)
+                if reward_id in kid_info.get("reward_approvals", {}):
+                    found = True
+                    kid_info["reward_approvals"].pop(reward_id, None)
+                kid_info["redeemed_rewards"] = [
+                    reward
+                    for reward in kid_info["redeemed_rewards"]
+                    if reward != reward_id
+                ]
+            # Remove open claims from pending approvals for this reward (all kids).
+            self._clear_reward_redemptions(reward_id=reward_id)
+            if not found:
+                LOGGER.warning(
+                    "Reset Rewards: Reward '%s' not found in any kid's data.",
+                    reward_id,
+                )
+
+        elif kid_id:
+            # Reset all rewards for a specific kid
+            kid_info = self.kids_data.get(kid_id)
+            if not kid_info:
+                LOGGER.error("Reset Rewards: Kid with ID '%s' not found.", kid_id)
+                raise KidsChoresError(f"Kid with ID '{kid_id}' not found.")
+
+            kid_info["reward_claims"].clear()
+            kid_info["reward_approvals"].clear()
+            kid_info["redeemed_rewards"].clear()
+
+            # Remove open claims from pending approvals for that kid.
+            self._clear_reward_redemptions(kid_id=kid_id)
+
+        else:
+            # Reset all rewards for all kids
+            LOGGER.info("Reset Rewards: Resetting all rewards for all kids.")
+            for kid_info in self.kids_data.values():
+                kid_info["reward_claims"].clear()
+                kid_info["reward_approvals"].clear()
+                kid_info["redeemed_rewards"].clear()
+
+            # Clear all pending reward approvals.
+            self._clear_reward_redemptions()
+
+        LOGGER.debug(
+            "Rewards reset completed (kid_id=%s, reward_id=%s)", kid_id, reward_id
+        )
+
+        self._persist()
+        self._publish()
+
+    # -------------------------------------------------------------------------------------
+    # Adapter Hooks
+    # Forwarded to the injected adapter; the Home Assistant coordinator is one.
+    # -------------------------------------------------------------------------------------
+
+    def _on_entities_synced(self, section: str) -> None:
+        """Handle a data section having been synced from config."""
+        self._adapter.on_entities_synced(section)
+
+    def _remove_entities_in_ha(self, section: str, item_id: str) -> None:
+        """Remove the platform entities of a removed item."""
+        self._adapter.remove_item_entities(section, item_id)
+
+    def _remove_kid_chore_entities(self, kid_id: str, chore_id: str) -> None:
+        """Remove the platform entities of a kid's chore."""
+        self._adapter.remove_kid_chore_entities(kid_id, chore_id)
+
+    def _sync_chore_due_date_to_config(
+        self,
+        chore_id: str,
+        due_date: Optional[str],
+        recurring_frequency: Optional[str] = None,
+        custom_interval: Optional[int] = None,
+        custom_interval_unit: Optional[str] = None,
+    ) -> None:
+        """Copy a chore's due date and frequency back to its configuration."""
+        self._adapter.sync_chore_due_date_to_config(
+            chore_id,
+            due_date,
+            recurring_frequency,
+            custom_interval,
+            custom_interval_unit,
+        )
+
+    def _sync_chore_due_dates_to_config(
+        self, due_dates: dict[str, Optional[str]]
+    ) -> None:
+        """Copy the due dates of several chores back to their configuration."""
+        self._adapter.sync_chore_due_dates_to_config(due_dates)
+
+    def _publish_data(self, data: dict[str, Any]) -> None:
+        """Push updated data to whatever displays it."""
+        self._adapter.publish_data(data)
+
+    # -------------------------------------------------------------------------------------
+    # Clock
+    # Everything time-dependent reads the injected clock, so a simulated clock can
+    # fast-forward the engine through days of resets in seconds.
+    # -------------------------------------------------------------------------------------
+
+    def now(self) -> datetime:
+        """Return the current time of the engine's clock, as an aware UTC datetime."""
+        return self._now()
+
+    # -------------------------------------------------------------------------------------
+    # Storage
+    # -------------------------------------------------------------------------------------
+
+    def _persist(self):
+        """Save to persistent storage."""
+        if self._batch_depth:
+            # Deferred until the enclosing batch commits
+            self._batch_persist_pending = True
+            return
+        self._storage.save(self._data)
+
+    def _publish(self) -> None:
+        """Publish updated data, deferring while a batch is open."""
+        if self._batch_depth:
+            self._batch_publish_pending = True
+            return
+        self._publish_data(self._data)
+
+    def publish(self) -> None:
+        """Publish the data now, or when the open batch commits."""
+        self._publish()
+
+    @contextmanager
+    def batched_commit(self):
+        """Collect saves and listener updates so a batch commits them only once."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                persist = self._batch_persist_pending
+                publish = self._batch_publish_pending
+                self._batch_persist_pending = False
+                self._batch_publish_pending = False
+                if persist:
+                    self._persist()
+                if publish:
+                    self._publish()
+
+    # -------------------------------------------------------------------------------------
+    # Internal Helper for kid <-> name lookups
+    # -------------------------------------------------------------------------------------
+
+    def _get_kid_id_by_name(self, kid_name: str) -> Optional[str]:
+        """Help function to get kid_id by kid_name."""
+        for kid_id, k_info in self.kids_data.items():
+            if k_info.get("name") == kid_name:
+                return kid_id
+        return None
+
+    def _get_kid_name_by_id(self, kid_id: str) -> Optional[str]:
+        """Help function to get kid_name by kid_id."""
+        kid_info = self.kids_data.get(kid_id)
+        if kid_info:
+            return kid_info.get("name")
+        return None
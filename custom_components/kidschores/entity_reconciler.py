@@ -0,0 +1,296 @@
+# File: entity_reconciler.py
+"""Single-pass removal of orphaned KidsChores entities from the entity registry.
+
+Every unique_id the platforms create is the config entry id followed by one of
+a fixed set of formats naming the kid, chore, reward, etc. it belongs to. The
+reconciler parses each unique_id into a (kind, ids) key once, then, after a
+config sync, walks only this config entry's registry entries and removes every
+entity whose key references an item that no longer exists, a kid no longer
+assigned to its chore, achievement or challenge, a chore no longer shared, or
+an entity of the other entity mode (per-item grids versus compact summaries).
+
+Features:
+- One walk of this entry's registry entries per sync, never the whole registry.
+- Unique_ids parsed into structured keys once and cached, no substring matching.
+- Reconcile requests during a sync coalesced into a single pass.
+- Optional sensor families enabled or disabled in the registry in one pass.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Any, Optional
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+
+from .const import (
+    BUTTON_BONUS_PREFIX,
+    BUTTON_DISAPPROVE_CHORE_PREFIX,
+    BUTTON_DISAPPROVE_REWARD_PREFIX,
+    BUTTON_PENALTY_PREFIX,
+    BUTTON_REWARD_PREFIX,
+    CONF_COMPACT_ENTITIES,
+    DATA_ACHIEVEMENTS,
+    DATA_BADGES,
+    DATA_BONUSES,
+    DATA_CHALLENGES,
+    DATA_CHORES,
+    DATA_KIDS,
+    DATA_PENALTIES,
+    DATA_REWARDS,
+    DEFAULT_COMPACT_ENTITIES,
+    ENTITY_FAMILIES,
+    LOGGER,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import KidsChoresDataCoordinator
+
+# Placeholder in a unique_id format => data section of the id it stands for
+ID_PLACEHOLDERS = {
+    "kid": DATA_KIDS,
+    "chore": DATA_CHORES,
+    "reward": DATA_REWARDS,
+    "penalty": DATA_PENALTIES,
+    "bonus": DATA_BONUSES,
+    "badge": DATA_BADGES,
+    "achievement": DATA_ACHIEVEMENTS,
+    "challenge": DATA_CHALLENGES,
+    "delta": None,
+}
+
+# (kind, unique_id format after the entry id); the first full match wins, so
+# single-id formats come before two-id formats that could also match them
+UNIQUE_ID_FORMATS = (
+    # Per config entry
+    ("chores_select", "chores_select"),
+    ("rewards_select", "rewards_select"),
+    ("penalties_select", "penalties_select"),
+    ("bonuses_select", "bonuses_select"),
+    ("pending_chore_approvals", "pending_chore_approvals"),
+    ("pending_reward_approvals", "pending_reward_approvals"),
+    # Prefixed buttons and selects
+    ("disapprove_chore", BUTTON_DISAPPROVE_CHORE_PREFIX + "{kid}_{chore}"),
+    ("disapprove_reward", BUTTON_DISAPPROVE_REWARD_PREFIX + "{kid}_{reward}"),
+    ("claim_reward", BUTTON_REWARD_PREFIX + "{kid}_{reward}"),
+    ("apply_penalty", BUTTON_PENALTY_PREFIX + "{kid}_{penalty}"),
+    ("apply_bonus", BUTTON_BONUS_PREFIX + "{kid}_{bonus}"),
+    ("kid_chores_select", "chores_select_{kid}"),
+    # Per kid
+    ("adjust_points", "{kid}_adjust_points_{delta}"),
+    ("calendar", "{kid}_calendar"),
+    ("points", "{kid}_points"),
+    ("max_points_ever", "{kid}_max_points_ever"),
+    ("completed_total", "{kid}_completed_total"),
+    ("completed_daily", "{kid}_completed_daily"),
+    ("completed_weekly", "{kid}_completed_weekly"),
+    ("completed_monthly", "{kid}_completed_monthly"),
+    ("points_earned_daily", "{kid}_points_earned_daily"),
+    ("points_earned_weekly", "{kid}_points_earned_weekly"),
+    ("points_earned_monthly", "{kid}_points_earned_monthly"),
+    ("kid_badges", "{kid}_badges"),
+    ("highest_badge", "{kid}_highest_badge"),
+    ("highest_streak", "{kid}_highest_streak"),
+    ("kid_summary", "{kid}_summary"),
+    # Per item
+    ("badge", "{badge}_badge_sensor"),
+    ("chore_global_state", "{chore}_global_state"),
+    ("achievement", "{achievement}_achievement"),
+    ("challenge", "{challenge}_challenge"),
+    # Per kid and item
+    ("claim_chore", "{kid}_{chore}_claim"),
+    ("approve_chore", "{kid}_{chore}_approve"),
+    ("chore_status", "{kid}_{chore}_status"),
+    ("chore_claims", "{kid}_{chore}_chore_claims"),
+    ("chore_approvals", "{kid}_{chore}_chore_approvals"),
+    ("chore_streak", "{kid}_{chore}_streak"),
+    ("approve_reward", "{kid}_{reward}_approve_reward"),
+    ("reward_claims", "{kid}_{reward}_reward_claims"),
+    ("reward_approvals", "{kid}_{reward}_reward_approvals"),
+    ("reward_status", "{kid}_{reward}_reward_status"),
+    ("penalty_applies", "{kid}_{penalty}_penalty_applies"),
+    ("bonus_applies", "{kid}_{bonus}_bonus_applies"),
+    ("achievement_progress", "{kid}_{achievement}_achievement_progress"),
+    ("challenge_progress", "{kid}_{challenge}_challenge_progress"),
+)
+
+# Per kid and item entities that compact mode replaces with the kid summary
+COMPACT_REPLACED_KINDS = frozenset(
+    {
+        "claim_chore",
+        "approve_chore",
+        "disapprove_chore",
+        "chore_status",
+        "chore_claims",
+        "chore_approvals",
+        "chore_streak",
+        "claim_reward",
+        "approve_reward",
+        "disapprove_reward",
+        "reward_claims",
+        "reward_approvals",
+        "reward_status",
+        "apply_penalty",
+        "penalty_applies",
+        "apply_bonus",
+        "bonus_applies",
+    }
+)
+
+# Sections whose items list the kids they apply to in assigned_kids
+ASSIGNABLE_SECTIONS = (DATA_CHORES, DATA_ACHIEVEMENTS, DATA_CHALLENGES)
+
+EntityKey = tuple[str, dict[str, str]]
+
+
+def _compile_format(unique_id_format: str) -> tuple[re.Pattern, list[Optional[str]]]:
+    """Compile a unique_id format into a regex and the sections of its groups."""
+    parts = re.split(r"\{(\w+)\}", unique_id_format)
+    pattern = ""
+    sections: list[Optional[str]] = []
+    for index, part in enumerate(parts):
+        if index % 2:
+            pattern += r"([^_]+)"
+            sections.append(ID_PLACEHOLDERS[part])
+        else:
+            pattern += re.escape(part)
+    return re.compile(pattern), sections
+
+
+_COMPILED_FORMATS = [
+    (kind, *_compile_format(unique_id_format))
+    for kind, unique_id_format in UNIQUE_ID_FORMATS
+]
+
+
+def parse_unique_id(entry_id: str, unique_id: str) -> Optional[EntityKey]:
+    """Parse a unique_id into (kind, {section: item id}), or None if unknown."""
+    prefix = f"{entry_id}_"
+    if not unique_id.startswith(prefix):
+        return None
+    core_id = unique_id[len(prefix) :]
+
+    for kind, pattern, sections in _COMPILED_FORMATS:
+        if match := pattern.fullmatch(core_id):
+            return kind, {
+                section: item_id
+                for section, item_id in zip(sections, match.groups())
+                if section is not None
+            }
+    return None
+
+
+def is_orphaned(key: EntityKey, data: dict[str, Any], compact: bool = False) -> bool:
+    """Return True if an entity's key no longer matches the data or entity mode."""
+    kind, ids = key
+    if kind == "kid_summary" and not compact:
+        return True
+    if kind in COMPACT_REPLACED_KINDS and compact:
+        return True
+
+    for section, item_id in ids.items():
+        if item_id not in data.get(section, {}):
+            return True
+
+    kid_id = ids.get(DATA_KIDS)
+    for section in ASSIGNABLE_SECTIONS:
+        if kid_id is None or section not in ids:
+            continue
+        item = data[section][ids[section]]
+        if kid_id not in item.get("assigned_kids", []):
+            return True
+
+    if kind == "chore_global_state":
+        return not data[DATA_CHORES][ids[DATA_CHORES]].get("shared_chore", False)
+
+    return False
+
+
+class KidsChoresEntityReconciler:
+    """Removes a config entry's orphaned entities in one registry pass."""
+
+    def __init__(self, hass: HomeAssistant, coordinator: KidsChoresDataCoordinator):
+        """Initialize the entity reconciler."""
+        self.hass = hass
+        self._coordinator = coordinator
+        self._scheduled = False
+
+        # unique_id => parsed key (None for formats we do not know)
+        self._keys: dict[str, Optional[EntityKey]] = {}
+
+    @callback
+    def async_schedule(self) -> None:
+        """Schedule a reconcile pass, once however often this is called."""
+        if self._scheduled:
+            return
+        self._scheduled = True
+        self.hass.async_create_task(self._async_run())
+
+    async def _async_run(self) -> None:
+        """Run the scheduled pass."""
+        self._scheduled = False
+        self.async_reconcile()
+
+    def _key(self, unique_id: str) -> Optional[EntityKey]:
+        """Return the cached parsed key of a unique_id."""
+        if unique_id not in self._keys:
+            self._keys[unique_id] = parse_unique_id(
+                self._coordinator.config_entry.entry_id, unique_id
+            )
+        return self._keys[unique_id]
+
+    @callback
+    def async_reconcile(self) -> int:
+        """Remove every orphaned entity of this config entry; return how many."""
+        ent_reg = er.async_get(self.hass)
+        data = self._coordinator.engine.data
+        compact = self._coordinator.config_entry.options.get(
+            CONF_COMPACT_ENTITIES, DEFAULT_COMPACT_ENTITIES
+        )
+        removed = 0
+
+        for entity_entry in er.async_entries_for_config_entry(
+            ent_reg, self._coordinator.config_entry.entry_id
+        ):
+            key = self._key(entity_entry.unique_id)
+            if key is None or not is_orphaned(key, data, compact):
+                continue
+
+            ent_reg.async_remove(entity_entry.entity_id)
+            self._keys.pop(entity_entry.unique_id, None)
+            removed += 1
+            LOGGER.debug(
+                "Removed orphaned entity '%s' (%s %s)",
+                entity_entry.entity_id,
+                key[0],
+                key[1],
+            )
+
+        if removed:
+            LOGGER.info("Removed %s orphaned KidsChores entities", removed)
+        return removed
+
+
+@callback
+def async_apply_entity_families(
+    hass: HomeAssistant, entry_id: str, enabled_families: list[str]
+) -> None:
+    """Enable or disable a config entry's optional sensors to match their families.
+
+    Called when the families change; sensors the user disabled stay disabled.
+    """
+    ent_reg = er.async_get(hass)
+    for entity_entry in er.async_entries_for_config_entry(ent_reg, entry_id):
+        key = parse_unique_id(entry_id, entity_entry.unique_id)
+        if key is None or key[0] not in ENTITY_FAMILIES:
+            continue
+
+        if key[0] in enabled_families:
+            if entity_entry.disabled_by is er.RegistryEntryDisabler.INTEGRATION:
+                ent_reg.async_update_entity(entity_entry.entity_id, disabled_by=None)
+        elif entity_entry.disabled_by is None:
+            ent_reg.async_update_entity(
+                entity_entry.entity_id,
+                disabled_by=er.RegistryEntryDisabler.INTEGRATION,
+            )
@@ -0,0 +1,91 @@
+# File: entry_router.py
+"""Routing of kid and chore ids to the KidsChores config entry that owns them.
+
+Every loaded config entry runs its own coordinator, storage and update cycle.
+The router keeps the loaded coordinators by entry id plus a map from each kid
+and chore id to its entry, so services and notification actions reach the
+right household with a dict lookup. Entries are added after their first
+refresh and removed on unload; options changes reload the entry, which
+refreshes its routes.
+
+Features:
+- Kid and chore id => coordinator, across all loaded entries.
+- Entry id => coordinator, for service calls that name their entry.
+- Listeners shared by all entries, stopped when the last entry unloads.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .const import DATA_CHORES, DATA_KIDS, ENTRY_ROUTER
+
+if TYPE_CHECKING:
+    from .coordinator import KidsChoresDataCoordinator
+
+
+class KidsChoresEntryRouter:
+    """Loaded coordinators by entry id, and kid/chore id => entry id."""
+
+    def __init__(self):
+        """Initialize an empty router."""
+        self._coordinators: dict[str, KidsChoresDataCoordinator] = {}
+        self._routes: dict[str, str] = {}
+
+        # Unsubscribe callbacks of listeners shared by all entries
+        self.shared_listeners: list[CALLBACK_TYPE] = []
+
+    @property
+    def coordinators(self) -> list[KidsChoresDataCoordinator]:
+        """Return the coordinators of all loaded entries."""
+        return list(self._coordinators.values())
+
+    @callback
+    def async_add_entry(self, coordinator: KidsChoresDataCoordinator) -> bool:
+        """Route a coordinator's kids and chores to it; True for the first entry."""
+        entry_id = coordinator.config_entry.entry_id
+        self.async_remove_entry(entry_id)
+        self._coordinators[entry_id] = coordinator
+        for section in (DATA_KIDS, DATA_CHORES):
+            for item_id in coordinator.engine.data.get(section, {}):
+                self._routes[item_id] = entry_id
+        return len(self._coordinators) == 1
+
+    @callback
+    def async_remove_entry(self, entry_id: str) -> bool:
+        """Drop an entry and its routes; True once no entries remain."""
+        if self._coordinators.pop(entry_id, None) is not None:
+            self._routes = {
+                item_id: owner
+                for item_id, owner in self._routes.items()
+                if owner != entry_id
+            }
+        return not self._coordinators
+
+    @callback
+    def async_stop_shared_listeners(self) -> None:
+        """Stop the listeners shared by all entries."""
+        for unsub in self.shared_listeners:
+            unsub()
+        self.shared_listeners = []
+
+    def coordinator_for_entry(
+        self, entry_id: str
+    ) -> Optional[KidsChoresDataCoordinator]:
+        """Return the coordinator of a loaded entry."""
+        return self._coordinators.get(entry_id)
+
+    def coordinator_for_id(self, item_id: str) -> Optional[KidsChoresDataCoordinator]:
+        """Return the coordinator of the entry owning a kid or chore id."""
+        entry_id = self._routes.get(item_id)
+        return self._coordinators.get(entry_id) if entry_id else None
+
+
+@callback
+def async_get_entry_router(hass: HomeAssistant) -> KidsChoresEntryRouter:
+    """Return the router shared by all KidsChores entries, creating it once."""
+    if ENTRY_ROUTER not in hass.data:
+        hass.data[ENTRY_ROUTER] = KidsChoresEntryRouter()
+    return hass.data[ENTRY_ROUTER]
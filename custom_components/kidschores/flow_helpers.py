@@ -6,6 +6,8 @@ Provides schema builders and input-processing logic for internal_id-based manage
 
 import datetime
 import uuid
+from typing import Optional
+
 import voluptuous as vol
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import selector, config_validation as cv
@@ -13,11 +15,15 @@ from homeassistant.util import dt as dt_util
 
 from .const import (
     ACHIEVEMENT_TYPE_DAILY_MIN,
+    ACHIEVEMENT_TYPE_RULE,
     ACHIEVEMENT_TYPE_STREAK,
     ACHIEVEMENT_TYPE_TOTAL,
     CHALLENGE_TYPE_DAILY_MIN,
+    CHALLENGE_TYPE_RULE,
     CHALLENGE_TYPE_TOTAL_WITHIN_WINDOW,
     CONF_APPLICABLE_DAYS,
+    CONF_COMPACT_ENTITIES,
+    CONF_ENABLED_ENTITY_FAMILIES,
     CONF_ENABLE_MOBILE_NOTIFICATIONS,
     CONF_ENABLE_PERSISTENT_NOTIFICATIONS,
     CONF_MOBILE_NOTIFY_SERVICE,
@@ -27,21 +33,26 @@ from .const import (
     CONF_POINTS_LABEL,
     CONF_POINTS_ICON,
     DEFAULT_APPLICABLE_DAYS,
+    DEFAULT_COMPACT_ENTITIES,
     DEFAULT_NOTIFY_ON_APPROVAL,
     DEFAULT_NOTIFY_ON_CLAIM,
     DEFAULT_NOTIFY_ON_DISAPPROVAL,
     DEFAULT_POINTS_MULTIPLIER,
     DEFAULT_POINTS_LABEL,
     DEFAULT_POINTS_ICON,
+    DEFAULT_REWARD_EXPIRY_HOURS,
     DOMAIN,
+    ENTITY_FAMILIES,
     FREQUENCY_BIWEEKLY,
     FREQUENCY_CUSTOM,
     FREQUENCY_DAILY,
     FREQUENCY_MONTHLY,
     FREQUENCY_NONE,
     FREQUENCY_WEEKLY,
+    LOGGER,
     WEEKDAY_OPTIONS,
 )
+from .rule_language import compile_rule
 
 
 def build_points_schema(
@@ -58,6 +69,30 @@ def build_points_schema(
     )
 
 
+def build_general_schema(
+    default_compact_entities=DEFAULT_COMPACT_ENTITIES,
+    default_enabled_entity_families=None,
+):
+    """Build a schema for integration-wide settings."""
+    return vol.Schema(
+        {
+            vol.Required(
+                CONF_COMPACT_ENTITIES, default=default_compact_entities
+            ): selector.BooleanSelector(),
+            vol.Optional(
+                CONF_ENABLED_ENTITY_FAMILIES,
+                default=default_enabled_entity_families or [],
+            ): selector.SelectSelector(
+                selector.SelectSelectorConfig(
+                    options=ENTITY_FAMILIES,
+                    multiple=True,
+                    translation_key="entity_families",
+                )
+            ),
+        }
+    )
+
+
 def build_kid_schema(
     hass,
     users,
@@ -317,7 +352,7 @@ def build_badge_schema(default=None):
                 default=default.get("threshold_type", "points"),
             ): selector.SelectSelector(
                 selector.SelectSelectorConfig(
-                    options=["points", "chore_count"],
+                    options=["points", "chore_count", "rule"],
                     translation_key="threshold_type",
                 )
             ),
@@ -330,6 +365,8 @@ def build_badge_schema(default=None):
                     step=0.1,
                 )
             ),
+            # For rule badges, e.g. "streak >= 7 and points >= 100":
+            vol.Optional("badge_criteria", default=default.get("criteria", "")): str,
             vol.Required(
                 "points_multiplier",
                 default=points_multiplier_default,
@@ -370,6 +407,16 @@ def build_reward_schema(default=None):
                     step=0.1,
                 )
             ),
+            vol.Optional(
+                "reward_expiry_hours",
+                default=default.get("expiry_hours", DEFAULT_REWARD_EXPIRY_HOURS),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    mode=selector.NumberSelectorMode.BOX,
+                    min=0,
+                    step=1,
+                )
+            ),
             vol.Optional(
                 "icon", default=default.get("icon", "")
             ): selector.IconSelector(),
@@ -434,6 +481,7 @@ def build_achievement_schema(kids_dict, chores_dict, default=None):
                             "value": ACHIEVEMENT_TYPE_DAILY_MIN,
                             "label": "Daily Minimum Chores",
                         },
+                        {"value": ACHIEVEMENT_TYPE_RULE, "label": "Rule (criteria)"},
                     ],
                     mode=selector.SelectSelectorMode.DROPDOWN,
                 )
@@ -530,6 +578,7 @@ def build_challenge_schema(kids_dict, chores_dict, default=None):
                             "value": CHALLENGE_TYPE_TOTAL_WITHIN_WINDOW,
                             "label": "Total Chores within Period",
                         },
+                        {"value": CHALLENGE_TYPE_RULE, "label": "Rule (criteria)"},
                     ],
                     mode=selector.SelectSelectorMode.DROPDOWN,
                 )
@@ -662,6 +711,17 @@ def process_penalty_form_input(user_input: dict) -> dict:
     return data
 
 
+# Validate the criteria of rule-type badges, achievements and challenges
+def validate_rule_criteria(criteria: str) -> Optional[str]:
+    """Return the form error key if a rule does not compile, else None."""
+    try:
+        compile_rule(criteria)
+    except ValueError as err:
+        LOGGER.debug("Rejected rule '%s': %s", criteria, err)
+        return "invalid_rule"
+    return None
+
+
 # Get notify services from HA
 def _get_notify_services(hass: HomeAssistant) -> list[dict[str, str]]:
     """Return a list of all notify.* services as [{'value': 'notify.foo', 'label': 'notify.foo'}, ...]."""
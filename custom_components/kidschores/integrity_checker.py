@@ -0,0 +1,212 @@
+# File: integrity_checker.py
+"""Background referential-integrity checker for the KidsChores coordinator.
+
+Each tick validates a bounded slice of records against the kids, chores,
+rewards and badges that currently exist. References to ids that no longer
+exist are dropped through the command queue; problems that cannot be repaired
+safely are reported as Home Assistant repair issues, which are removed again
+once a full round no longer finds them.
+
+Features:
+- Bounded work per tick, so large datasets never block the event loop.
+- Stale kid, chore and reward references repaired in one batched cleanup.
+- Unknown badge names on kids reported as repair issues.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Optional
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import issue_registry as ir
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import (
+    DATA_ACHIEVEMENTS,
+    DATA_CHALLENGES,
+    DATA_CHORES,
+    DATA_KIDS,
+    DATA_PARENTS,
+    DATA_PENDING_CHORE_APPROVALS,
+    DATA_PENDING_REWARD_APPROVALS,
+    DATA_REWARDS,
+    DOMAIN,
+    INTEGRITY_CHECK_BATCH_SIZE,
+    INTEGRITY_CHECK_INTERVAL,
+    LOGGER,
+)
+from .reference_index import KID_CHORE_DICT_FIELDS, KID_CHORE_LIST_FIELDS
+
+if TYPE_CHECKING:
+    from .coordinator import KidsChoresDataCoordinator
+
+# Sections walked by each round, in order
+CHECKED_SECTIONS = (
+    DATA_KIDS,
+    DATA_CHORES,
+    DATA_ACHIEVEMENTS,
+    DATA_CHALLENGES,
+    DATA_PARENTS,
+    DATA_PENDING_CHORE_APPROVALS,
+    DATA_PENDING_REWARD_APPROVALS,
+)
+
+
+class KidsChoresIntegrityChecker:
+    """Validates a slice of records per tick, repairing or reporting problems."""
+
+    def __init__(self, hass: HomeAssistant, coordinator: KidsChoresDataCoordinator):
+        """Initialize the integrity checker."""
+        self.hass = hass
+        self._coordinator = coordinator
+        self._unsub: Optional[CALLBACK_TYPE] = None
+
+        # (section, record id) still to check in the current round
+        self._pending: list[tuple[str, Any]] = []
+
+        # issue_id => (translation_key, placeholders), found this round / reported
+        self._round_issues: dict[str, tuple[str, dict[str, str]]] = {}
+        self._open_issues: set[str] = set()
+
+    @callback
+    def async_start(self) -> None:
+        """Start checking a slice of records on every interval."""
+        if self._unsub is None:
+            self._unsub = async_track_time_interval(
+                self.hass,
+                self._async_tick,
+                timedelta(seconds=INTEGRITY_CHECK_INTERVAL),
+            )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop the periodic checks."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    async def _async_tick(self, now: datetime) -> None:
+        """Check the next slice of records and repair stale references."""
+        if not self._pending:
+            self._pending = self._snapshot()
+
+        batch = self._pending[:INTEGRITY_CHECK_BATCH_SIZE]
+        del self._pending[:INTEGRITY_CHECK_BATCH_SIZE]
+
+        stale_ids: set[str] = set()
+        for section, record_id in batch:
+            stale_ids.update(self._check_record(section, record_id))
+
+        if not self._pending:
+            self._sync_issues()
+
+        if not stale_ids:
+            return
+
+        LOGGER.info(
+            "Integrity check: repairing references to %d missing id(s)", len(stale_ids)
+        )
+        try:
+            await self._coordinator.command_queue.async_submit(
+                self._coordinator.repair_stale_references, stale_ids=stale_ids
+            )
+        except HomeAssistantError as err:
+            LOGGER.warning("Integrity check: repair failed: %s", err)
+
+    def _snapshot(self) -> list[tuple[str, Any]]:
+        """Return the records to check in a new round."""
+        data = self._coordinator.engine.data
+        records: list[tuple[str, Any]] = []
+        for section in CHECKED_SECTIONS:
+            if section == DATA_PENDING_CHORE_APPROVALS:
+                approvals = data.get(section, [])
+                records.extend(
+                    (section, position) for position in range(len(approvals))
+                )
+            else:
+                records.extend(
+                    (section, record_id) for record_id in data.get(section, {})
+                )
+        return records
+
+    def _missing(self, ids: Iterable[Any], section: str) -> set[str]:
+        """Return the ids that do not exist in a section."""
+        existing = self._coordinator.engine.data.get(section, {})
+        return {item_id for item_id in ids if item_id and item_id not in existing}
+
+    def _check_record(self, section: str, record_id: Any) -> set[str]:
+        """Check one record and return the missing ids it references."""
+        data = self._coordinator.engine.data
+
+        if section == DATA_PENDING_CHORE_APPROVALS:
+            approvals = data.get(section, [])
+            if record_id >= len(approvals):
+                return set()
+            approval = approvals[record_id]
+            return self._missing([approval.get("kid_id")], DATA_KIDS) | self._missing(
+                [approval.get("chore_id")], DATA_CHORES
+            )
+
+        # Records deleted since the round started are skipped
+        record = data.get(section, {}).get(record_id)
+        if record is None:
+            return set()
+
+        if section == DATA_PENDING_REWARD_APPROVALS:
+            return self._missing([record.get("kid_id")], DATA_KIDS) | self._missing(
+                [record.get("reward_id")], DATA_REWARDS
+            )
+
+        if section == DATA_KIDS:
+            stale = self._missing(record.get("reward_queue", {}), DATA_REWARDS)
+            for field in KID_CHORE_LIST_FIELDS + KID_CHORE_DICT_FIELDS:
+                stale |= self._missing(record.get(field, []), DATA_CHORES)
+            self._check_kid_badges(record_id, record)
+            return stale
+
+        if section == DATA_PARENTS:
+            return self._missing(record.get("associated_kids", []), DATA_KIDS)
+
+        stale = self._missing(record.get("assigned_kids", []), DATA_KIDS)
+        if section in (DATA_ACHIEVEMENTS, DATA_CHALLENGES):
+            stale |= self._missing(record.get("progress", {}), DATA_KIDS)
+            stale |= self._missing([record.get("selected_chore_id")], DATA_CHORES)
+        return stale
+
+    def _check_kid_badges(self, kid_id: str, kid_info: dict[str, Any]) -> None:
+        """Report badge names on a kid that match no badge (renamed or deleted)."""
+        badge_index = self._coordinator.badge_index
+        unknown = [
+            badge_name
+            for badge_name in kid_info.get("badges", [])
+            if badge_index.badge_id_for_name(badge_name) is None
+        ]
+        if unknown:
+            self._round_issues[f"unknown_badges_{kid_id}"] = (
+                "unknown_badges",
+                {
+                    "kid_name": kid_info.get("name", kid_id),
+                    "badges": ", ".join(unknown),
+                },
+            )
+
+    def _sync_issues(self) -> None:
+        """Create the issues found this round and delete the ones that are gone."""
+        for issue_id, (translation_key, placeholders) in self._round_issues.items():
+            ir.async_create_issue(
+                self.hass,
+                DOMAIN,
+                issue_id,
+                is_fixable=False,
+                severity=ir.IssueSeverity.WARNING,
+                translation_key=translation_key,
+                translation_placeholders=placeholders,
+            )
+        for issue_id in self._open_issues - set(self._round_issues):
+            ir.async_delete_issue(self.hass, DOMAIN, issue_id)
+
+        self._open_issues = set(self._round_issues)
+        self._round_issues = {}
@@ -2,24 +2,30 @@
 """KidsChores helper functions and shared logic."""
 
 from homeassistant.core import HomeAssistant
-from homeassistant.auth.models import User
 from homeassistant.helpers.label_registry import async_get
 from typing import Optional
 
-from .const import LOGGER, DOMAIN
+from .const import (
+    CONF_ENABLED_ENTITY_FAMILIES,
+    DEFAULT_ENABLED_ENTITY_FAMILIES,
+    DOMAIN,
+    LOGGER,
+)
 from .coordinator import KidsChoresDataCoordinator
+from .entry_router import async_get_entry_router
 
 
 # -------- Get Coordinator --------
 def _get_kidschores_coordinator(
     hass: HomeAssistant,
+    entry_id: Optional[str] = None,
 ) -> KidsChoresDataCoordinator | None:
-    """Retrieve KidsChores coordinator from hass.data."""
+    """Retrieve a KidsChores coordinator from hass.data, by entry or the first one."""
     domain_entries = hass.data.get(DOMAIN, {})
     if not domain_entries:
         return None
 
-    entry_id = next(iter(domain_entries), None)
+    entry_id = entry_id or next(iter(domain_entries), None)
     if not entry_id:
         return None
 
@@ -30,39 +36,50 @@ def _get_kidschores_coordinator(
     return data["coordinator"]
 
 
+# -------- Optional Entity Families --------
+def is_entity_family_enabled(entry, family: str) -> bool:
+    """Return True if an optional sensor family is enabled in the entry options."""
+    return family in entry.options.get(
+        CONF_ENABLED_ENTITY_FAMILIES, DEFAULT_ENABLED_ENTITY_FAMILIES
+    )
+
+
 # -------- Authorization for General Actions --------
 async def is_user_authorized_for_global_action(
     hass: HomeAssistant,
     user_id: str,
     action: str,
+    entry_id: Optional[str] = None,
 ) -> bool:
     """Check if the user is allowed to do a global action (penalty, reward, points adjust) that doesn't require a specific kid_id.
 
     By default:
       - Admin users => authorized
+      - Parents of the entry's household => authorized
       - Everyone else => not authorized
 
     """
     if not user_id:
         return False  # no user context => not authorized
 
-    user: User = await hass.auth.async_get_user(user_id)
-    if not user:
+    coordinator = _get_kidschores_coordinator(hass, entry_id)
+    if not coordinator:
+        LOGGER.warning("%s: No KidsChores coordinator found", action)
+        return False
+
+    access = await coordinator.auth_cache.async_get(user_id)
+    if not access:
         LOGGER.warning("%s: Invalid user ID '%s'", action, user_id)
         return False
 
-    if user.is_admin:
+    # Admins and users registered as a parent in KidsChores are allowed.
+    if access["is_admin"] or access["is_parent"]:
         return True
 
-    # Allow non-admin users if they are registered as a parent in KidsChores.
-    coordinator = _get_kidschores_coordinator(hass)
-    if coordinator:
-        for parent in coordinator.parents_data.values():
-            if parent.get("ha_user_id") == user.id:
-                return True
-
     LOGGER.warning(
-        "%s: Non-admin user '%s' is not authorized in this logic", action, user.name
+        "%s: Non-admin user '%s' is not authorized in this logic",
+        action,
+        access["name"],
     )
     return False
 
@@ -83,27 +100,23 @@ async def is_user_authorized_for_kid(
     if not user_id:
         return False
 
-    user: User = await hass.auth.async_get_user(user_id)
-    if not user:
+    # Kids are checked against the household (entry) they belong to
+    coordinator = async_get_entry_router(hass).coordinator_for_id(kid_id)
+    if not coordinator:
+        LOGGER.warning(
+            "Authorization: Kid ID '%s' not found in any KidsChores entry", kid_id
+        )
+        return False
+
+    access = await coordinator.auth_cache.async_get(user_id)
+    if not access:
         LOGGER.warning("Authorization: Invalid user ID '%s'", user_id)
         return False
 
-    # Admin => automatically allowed
-    if user.is_admin:
+    # Admins and users registered as a parent in KidsChores are allowed.
+    if access["is_admin"] or access["is_parent"]:
         return True
 
-    # Allow non-admin users if they are registered as a parent in KidsChores.
-    coordinator = _get_kidschores_coordinator(hass)
-    if coordinator:
-        for parent in coordinator.parents_data.values():
-            if parent.get("ha_user_id") == user.id:
-                return True
-
-    coordinator: KidsChoresDataCoordinator = _get_kidschores_coordinator(hass)
-    if not coordinator:
-        LOGGER.warning("Authorization: No KidsChores coordinator found")
-        return False
-
     kid_info = coordinator.kids_data.get(kid_id)
     if not kid_info:
         LOGGER.warning(
@@ -111,13 +124,12 @@ async def is_user_authorized_for_kid(
         )
         return False
 
-    linked_ha_id = kid_info.get("ha_user_id")
-    if linked_ha_id and linked_ha_id == user.id:
+    if kid_id in access["kid_ids"]:
         return True
 
     LOGGER.warning(
         "Authorization: Non-admin user '%s' attempted to manage kid '%s' but is not linked",
-        user.name,
+        access["name"],
         kid_info.get("name"),
     )
     return False
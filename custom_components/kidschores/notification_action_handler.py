@@ -1,6 +1,8 @@
 # File: notification_action_handler.py
 """Handle notification actions from HA companion notifications."""
 
+from typing import Optional
+
 from homeassistant.core import HomeAssistant, Event
 from homeassistant.exceptions import HomeAssistantError
 
@@ -15,6 +17,7 @@ from .const import (
     LOGGER,
 )
 from .coordinator import KidsChoresDataCoordinator
+from .entry_router import async_get_entry_router
 
 
 async def async_handle_notification_action(hass: HomeAssistant, event: Event) -> None:
@@ -30,6 +33,8 @@ async def async_handle_notification_action(hass: HomeAssistant, event: Event) ->
     kid_id = None
     chore_id = None
     reward_id = None
+    redemption_id = None
+    expected_version = None
 
     # Decide what to expect based on the base action.
     if base_action in (ACTION_APPROVE_REWARD, ACTION_DISAPPROVE_REWARD):
@@ -38,6 +43,8 @@ async def async_handle_notification_action(hass: HomeAssistant, event: Event) ->
             return
         kid_id = parts[1]
         reward_id = parts[2]
+        # The redemption is stale once it left the queue; older actions have none
+        redemption_id = parts[3] if len(parts) > 3 else None
     elif base_action in (
         ACTION_APPROVE_CHORE,
         ACTION_DISAPPROVE_CHORE,
@@ -48,6 +55,7 @@ async def async_handle_notification_action(hass: HomeAssistant, event: Event) ->
             return
         kid_id = parts[1]
         chore_id = parts[2]
+        expected_version = _parse_version(parts)
     else:
         LOGGER.error("Unknown base action: %s", base_action)
         return
@@ -59,41 +67,46 @@ async def async_handle_notification_action(hass: HomeAssistant, event: Event) ->
         LOGGER.error("Notification action event missing required data: %s", event.data)
         return
 
-    # Retrieve the coordinator.
-    domain_data = hass.data.get("kidschores", {})
-    if not domain_data:
-        LOGGER.error("No KidsChores data found in hass.data")
-        return
-    entry_id = next(iter(domain_data))
-    coordinator: KidsChoresDataCoordinator = domain_data[entry_id].get("coordinator")
+    # Retrieve the coordinator of the entry the kid belongs to.
+    coordinator: KidsChoresDataCoordinator = async_get_entry_router(
+        hass
+    ).coordinator_for_id(kid_id)
     if not coordinator:
-        LOGGER.error("No coordinator found in KidsChores data")
+        LOGGER.error("No KidsChores entry found for kid ID '%s'", kid_id)
         return
 
     try:
         if base_action == ACTION_APPROVE_CHORE:
-            await coordinator.approve_chore(
+            await coordinator.command_queue.async_submit(
+                coordinator.approve_chore,
                 parent_name=parent_name,
                 kid_id=kid_id,
                 chore_id=chore_id,
+                expected_version=expected_version,
             )
         elif base_action == ACTION_DISAPPROVE_CHORE:
-            await coordinator.disapprove_chore(
+            await coordinator.command_queue.async_submit(
+                coordinator.disapprove_chore,
                 parent_name=parent_name,
                 kid_id=kid_id,
                 chore_id=chore_id,
+                expected_version=expected_version,
             )
         elif base_action == ACTION_APPROVE_REWARD:
-            await coordinator.approve_reward(
+            await coordinator.command_queue.async_submit(
+                coordinator.approve_reward,
                 parent_name=parent_name,
                 kid_id=kid_id,
                 reward_id=reward_id,
+                redemption_id=redemption_id,
             )
         elif base_action == ACTION_DISAPPROVE_REWARD:
-            await coordinator.disapprove_reward(
+            await coordinator.command_queue.async_submit(
+                coordinator.disapprove_reward,
                 parent_name=parent_name,
                 kid_id=kid_id,
                 reward_id=reward_id,
+                redemption_id=redemption_id,
             )
         elif base_action == ACTION_REMIND_30:
             await coordinator.remind_in_minutes(
@@ -106,3 +119,17 @@ async def async_handle_notification_action(hass: HomeAssistant, event: Event) ->
             LOGGER.error("Received unknown notification action: %s", base_action)
     except HomeAssistantError as err:
         LOGGER.error("Error processing notification action %s: %s", base_action, err)
+
+
+def _parse_version(parts: list[str]) -> Optional[int]:
+    """Return the record version embedded in an action field, if any.
+
+    Actions sent by older notifications have no version and are not checked.
+    """
+    if len(parts) < 4:
+        return None
+    try:
+        return int(parts[3])
+    except ValueError:
+        LOGGER.warning("Ignoring invalid version in notification action: %s", parts)
+        return None
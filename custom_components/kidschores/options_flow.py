@@ -13,13 +13,18 @@ from homeassistant.helpers import selector
 from homeassistant.util import dt as dt_util
 
 from .const import (
+    ACHIEVEMENT_TYPE_RULE,
     ACHIEVEMENT_TYPE_STREAK,
+    CHALLENGE_TYPE_RULE,
     CHALLENGE_TYPE_TOTAL_WITHIN_WINDOW,
     CONF_APPLICABLE_DAYS,
+    BADGE_THRESHOLD_TYPE_RULE,
     CONF_ACHIEVEMENTS,
     CONF_BADGES,
     CONF_CHALLENGES,
     CONF_CHORES,
+    CONF_COMPACT_ENTITIES,
+    CONF_ENABLED_ENTITY_FAMILIES,
     CONF_KIDS,
     CONF_NOTIFY_ON_APPROVAL,
     CONF_NOTIFY_ON_CLAIM,
@@ -31,17 +36,22 @@ from .const import (
     CONF_REWARDS,
     CONF_BONUSES,
     DEFAULT_APPLICABLE_DAYS,
+    DEFAULT_COMPACT_ENTITIES,
+    DEFAULT_ENABLED_ENTITY_FAMILIES,
     DEFAULT_NOTIFY_ON_APPROVAL,
     DEFAULT_NOTIFY_ON_CLAIM,
     DEFAULT_NOTIFY_ON_DISAPPROVAL,
     DEFAULT_POINTS_ICON,
     DEFAULT_POINTS_LABEL,
+    DEFAULT_REWARD_EXPIRY_HOURS,
     FREQUENCY_CUSTOM,
     DOMAIN,
     LOGGER,
 )
+from .entity_reconciler import async_apply_entity_families
 from .flow_helpers import (
     build_points_schema,
+    build_general_schema,
     build_kid_schema,
     build_parent_schema,
     build_chore_schema,
@@ -52,6 +62,7 @@ from .flow_helpers import (
     build_challenge_schema,
     ensure_utc_datetime,
     build_bonus_schema,
+    validate_rule_criteria,
 )
 
 
@@ -89,6 +100,9 @@ class KidsChoresOptionsFlowHandler(config_entries.OptionsFlow):
                 # If user chose manage_points
                 if self._entity_type == "points":
                     return await self.async_step_manage_points()
+                # If user chose manage_general
+                if self._entity_type == "general":
+                    return await self.async_step_manage_general()
                 # Else manage other entities
                 return await self.async_step_manage_entity()
             elif selection == "done":
@@ -105,6 +119,7 @@ class KidsChoresOptionsFlowHandler(config_entries.OptionsFlow):
             "manage_bonus",
             "manage_achievement",
             "manage_challenge",
+            "manage_general",
             "done",
         ]
 
@@ -154,6 +169,45 @@ class KidsChoresOptionsFlowHandler(config_entries.OptionsFlow):
             description_placeholders={},
         )
 
+    async def async_step_manage_general(self, user_input=None):
+        """Let user switch between per-item entities and compact per-kid summaries."""
+        if user_input is not None:
+            self._entry_options = dict(self.config_entry.options)
+            self._entry_options[CONF_COMPACT_ENTITIES] = user_input.get(
+                CONF_COMPACT_ENTITIES, DEFAULT_COMPACT_ENTITIES
+            )
+            enabled_families = user_input.get(
+                CONF_ENABLED_ENTITY_FAMILIES, DEFAULT_ENABLED_ENTITY_FAMILIES
+            )
+            self._entry_options[CONF_ENABLED_ENTITY_FAMILIES] = enabled_families
+
+            # Existing sensors follow their family before the entry reloads
+            async_apply_entity_families(
+                self.hass, self.config_entry.entry_id, enabled_families
+            )
+            LOGGER.debug(
+                "Before saving general settings, entry_options = %s",
+                self._entry_options,
+            )
+            await self._update_and_reload()
+
+            return await self.async_step_init()
+
+        general_schema = build_general_schema(
+            default_compact_entities=self._entry_options.get(
+                CONF_COMPACT_ENTITIES, DEFAULT_COMPACT_ENTITIES
+            ),
+            default_enabled_entity_families=self._entry_options.get(
+                CONF_ENABLED_ENTITY_FAMILIES, DEFAULT_ENABLED_ENTITY_FAMILIES
+            ),
+        )
+
+        return self.async_show_form(
+            step_id="manage_general",
+            data_schema=general_schema,
+            description_placeholders={},
+        )
+
     async def async_step_manage_entity(self, user_input=None):
         """Handle the management actions for a selected entity type.
 
@@ -483,12 +537,17 @@ class KidsChoresOptionsFlowHandler(config_entries.OptionsFlow):
 
         if user_input is not None:
             badge_name = user_input["badge_name"].strip()
+            badge_criteria = user_input.get("badge_criteria", "").strip()
             internal_id = user_input.get("internal_id", str(uuid.uuid4()))
 
             if any(
                 badge_data["name"] == badge_name for badge_data in badges_dict.values()
             ):
                 errors["badge_name"] = "duplicate_badge"
+            elif user_input["threshold_type"] == BADGE_THRESHOLD_TYPE_RULE and (
+                rule_error := validate_rule_criteria(badge_criteria)
+            ):
+                errors["badge_criteria"] = rule_error
             else:
                 badges_dict[internal_id] = {
                     "name": badge_name,
@@ -499,6 +558,7 @@ class KidsChoresOptionsFlowHandler(config_entries.OptionsFlow):
                     "internal_id": internal_id,
                     "description": user_input.get("badge_description", ""),
                     "badge_labels": user_input.get("badge_labels", []),
+                    "criteria": badge_criteria,
                 }
                 self._entry_options[CONF_BADGES] = badges_dict
 
@@ -533,6 +593,9 @@ class KidsChoresOptionsFlowHandler(config_entries.OptionsFlow):
                     "cost": user_input["reward_cost"],
                     "description": user_input.get("reward_description", ""),
                     "reward_labels": user_input.get("reward_labels", []),
+                    "expiry_hours": user_input.get(
+                        "reward_expiry_hours", DEFAULT_REWARD_EXPIRY_HOURS
+                    ),
                     "icon": user_input.get("icon", ""),
                     "internal_id": internal_id,
                 }
@@ -647,6 +710,10 @@ class KidsChoresOptionsFlowHandler(config_entries.OptionsFlow):
                     if not c or c == "None":
                         errors["selected_chore_id"] = "a_chore_must_be_selected"
                     chore_id = c
+                elif _type == ACHIEVEMENT_TYPE_RULE and (
+                    rule_error := validate_rule_criteria(user_input.get("criteria", ""))
+                ):
+                    errors["criteria"] = rule_error
 
                 if not errors:
                     internal_id = user_input.get("internal_id", str(uuid.uuid4()))
@@ -706,6 +773,10 @@ class KidsChoresOptionsFlowHandler(config_entries.OptionsFlow):
                     if not c or c == "None":
                         errors["selected_chore_id"] = "a_chore_must_be_selected"
                     chore_id = c
+                elif _type == CHALLENGE_TYPE_RULE and (
+                    rule_error := validate_rule_criteria(user_input.get("criteria", ""))
+                ):
+                    errors["criteria"] = rule_error
 
                 # Process start_date and end_date using the helper:
                 start_date_input = user_input.get("start_date")
@@ -1052,6 +1123,7 @@ class KidsChoresOptionsFlowHandler(config_entries.OptionsFlow):
 
         if user_input is not None:
             new_name = user_input["badge_name"].strip()
+            badge_criteria = user_input.get("badge_criteria", "").strip()
 
             # Check for duplicate names excluding current badge
             if any(
@@ -1059,6 +1131,10 @@ class KidsChoresOptionsFlowHandler(config_entries.OptionsFlow):
                 for eid, data in badges_dict.items()
             ):
                 errors["badge_name"] = "duplicate_badge"
+            elif user_input["threshold_type"] == BADGE_THRESHOLD_TYPE_RULE and (
+                rule_error := validate_rule_criteria(badge_criteria)
+            ):
+                errors["badge_criteria"] = rule_error
             else:
                 badge_data["name"] = new_name
                 badge_data["threshold_type"] = user_input["threshold_type"]
@@ -1067,6 +1143,7 @@ class KidsChoresOptionsFlowHandler(config_entries.OptionsFlow):
                 badge_data["icon"] = user_input.get("icon", "")
                 badge_data["description"] = user_input["badge_description"]
                 badge_data["badge_labels"] = user_input.get("badge_labels", [])
+                badge_data["criteria"] = badge_criteria
 
                 self._entry_options[CONF_BADGES] = badges_dict
 
@@ -1107,6 +1184,9 @@ class KidsChoresOptionsFlowHandler(config_entries.OptionsFlow):
                 reward_data["cost"] = user_input["reward_cost"]
                 reward_data["description"] = user_input.get("reward_description", "")
                 reward_data["reward_labels"] = user_input.get("reward_labels", [])
+                reward_data["expiry_hours"] = user_input.get(
+                    "reward_expiry_hours", DEFAULT_REWARD_EXPIRY_HOURS
+                )
                 reward_data["icon"] = user_input.get("icon", "")
 
                 self._entry_options[CONF_REWARDS] = rewards_dict
@@ -1242,6 +1322,10 @@ class KidsChoresOptionsFlowHandler(config_entries.OptionsFlow):
                     if not c or c == "None":
                         errors["selected_chore_id"] = "a_chore_must_be_selected"
                     chore_id = c
+                elif _type == ACHIEVEMENT_TYPE_RULE and (
+                    rule_error := validate_rule_criteria(user_input.get("criteria", ""))
+                ):
+                    errors["criteria"] = rule_error
 
                 if not errors:
                     achievement_data["name"] = new_name
@@ -1363,6 +1447,10 @@ class KidsChoresOptionsFlowHandler(config_entries.OptionsFlow):
                     if not c or c == "None":
                         errors["selected_chore_id"] = "a_chore_must_be_selected"
                     chore_id = c
+                elif _type == CHALLENGE_TYPE_RULE and (
+                    rule_error := validate_rule_criteria(user_input.get("criteria", ""))
+                ):
+                    errors["criteria"] = rule_error
 
                 if not errors:
                     challenge_data["name"] = new_name
@@ -0,0 +1,140 @@
+# File: points_ledger.py
+"""Append-only points transaction ledger for the KidsChores coordinator.
+
+Each change to a kid's points is appended as a compact entry
+[timestamp, delta, source type, source id], with the timestamp in epoch
+seconds. Every LEDGER_SNAPSHOT_INTERVAL entries the running [balance, earned,
+spent] totals are stored as a snapshot, so the totals at any moment are one
+bisect plus at most one snapshot interval of entries away.
+
+Features:
+- Entries are only ever appended, in timestamp order.
+- Totals at a moment come from the nearest snapshot and a bounded tail.
+- Range queries are split into daily, weekly or monthly buckets in local time.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from datetime import date, datetime, timedelta
+from operator import itemgetter
+from typing import Any, Optional
+
+from . import dt_helpers
+from .const import (
+    FREQUENCY_MONTHLY,
+    FREQUENCY_WEEKLY,
+    LEDGER_SNAPSHOT_INTERVAL,
+)
+
+
+def period_start(moment: datetime, period: str) -> datetime:
+    """Return the local start of the day, week or month containing moment."""
+    day = dt_helpers.as_local(moment).date()
+    if period == FREQUENCY_WEEKLY:
+        day -= timedelta(days=day.weekday())
+    elif period == FREQUENCY_MONTHLY:
+        day = day.replace(day=1)
+    return dt_helpers.start_of_local_day(day)
+
+
+def _next_period_start(period_start: datetime, period: str) -> datetime:
+    """Return the local start of the period following period_start."""
+    day: date = period_start.date()
+    if period == FREQUENCY_WEEKLY:
+        day += timedelta(days=7)
+    elif period == FREQUENCY_MONTHLY:
+        day = (day.replace(day=28) + timedelta(days=4)).replace(day=1)
+    else:
+        day += timedelta(days=1)
+    return dt_helpers.start_of_local_day(day)
+
+
+class KidsChoresPointsLedger:
+    """A kid's stored ledger: transaction entries plus running-total snapshots."""
+
+    def __init__(self, ledger_data: dict[str, Any]):
+        """Wrap stored ledger data; changes are written through to it."""
+        self._entries: list[list[Any]] = ledger_data["entries"]
+        self._snapshots: list[list[float]] = ledger_data["snapshots"]
+        self.opened: float = ledger_data["opened"]
+
+    @staticmethod
+    def new_ledger_data(balance: float, opened: datetime) -> dict[str, Any]:
+        """Return stored data for an empty ledger opening at a balance."""
+        return {
+            "opened": opened.timestamp(),
+            "entries": [],
+            "snapshots": [[float(balance), 0.0, 0.0]],
+        }
+
+    def append(
+        self,
+        timestamp: datetime,
+        delta: float,
+        source_type: str,
+        source_id: Optional[str] = None,
+    ) -> None:
+        """Append a transaction, taking a snapshot at each interval boundary."""
+        epoch = timestamp.timestamp()
+        if self._entries and epoch < self._entries[-1][0]:
+            # Keep entries sorted if the clock stepped back
+            epoch = self._entries[-1][0]
+        self._entries.append([epoch, delta, source_type, source_id])
+
+        if len(self._entries) % LEDGER_SNAPSHOT_INTERVAL == 0:
+            self._snapshots.append(list(self._totals_at_index(len(self._entries))))
+
+    def _totals_at_index(self, index: int) -> tuple[float, float, float]:
+        """Return (balance, earned, spent) after the first index entries."""
+        base = min(index // LEDGER_SNAPSHOT_INTERVAL, len(self._snapshots) - 1)
+        balance, earned, spent = self._snapshots[base]
+        for entry in self._entries[base * LEDGER_SNAPSHOT_INTERVAL : index]:
+            delta = entry[1]
+            balance += delta
+            if delta > 0:
+                earned += delta
+            else:
+                spent -= delta
+        return balance, earned, spent
+
+    def _index_at(self, moment: datetime) -> int:
+        """Return the number of entries recorded before moment."""
+        return bisect_left(self._entries, moment.timestamp(), key=itemgetter(0))
+
+    def count_buckets(self, start: datetime, end: datetime, period: str) -> int:
+        """Return how many buckets a history query would produce."""
+        count = 0
+        bucket_start = period_start(start, period)
+        while bucket_start < end:
+            count += 1
+            bucket_start = _next_period_start(bucket_start, period)
+        return count
+
+    def history(
+        self, start: datetime, end: datetime, period: str
+    ) -> list[dict[str, Any]]:
+        """Return per-bucket balances and totals between start and end."""
+        buckets: list[dict[str, Any]] = []
+        bucket_start = period_start(start, period)
+        start_index = self._index_at(bucket_start)
+        start_totals = self._totals_at_index(start_index)
+
+        while bucket_start < end:
+            bucket_end = _next_period_start(bucket_start, period)
+            end_index = self._index_at(bucket_end)
+            end_totals = self._totals_at_index(end_index)
+            buckets.append(
+                {
+                    "start": bucket_start.isoformat(),
+                    "end": bucket_end.isoformat(),
+                    "opening_balance": round(start_totals[0], 2),
+                    "closing_balance": round(end_totals[0], 2),
+                    "earned": round(end_totals[1] - start_totals[1], 2),
+                    "spent": round(end_totals[2] - start_totals[2], 2),
+                    "transactions": end_index - start_index,
+                }
+            )
+            bucket_start, start_index, start_totals = bucket_end, end_index, end_totals
+
+        return buckets
@@ -0,0 +1,387 @@
+# File: projection.py
+"""What-if projections of a kid's points, badges, streaks and challenges.
+
+Answers "when does a kid reach the next badge if they keep doing their
+chores?" without simulating events. A kid's assigned chores are expanded into day
+buckets over the horizon (chores and base points per day), running sums turn
+the buckets into cumulative totals, and crossings are found by bisecting
+those totals, one segment per points multiplier. A year-long projection is a
+few passes over a list per kid. The kid is assumed to complete every scheduled
+chore on its day and to spend nothing.
+
+Features:
+- Chore schedules expanded from recurrence, due date and applicable days.
+- Badge multipliers applied from the day after the badge is crossed.
+- Crossing dates of points and chore-count badges.
+- Overall streak and total/daily-minimum challenge outcomes at the horizon.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from datetime import date, datetime, time
+from itertools import accumulate
+from typing import TYPE_CHECKING, Any, Optional
+
+from . import dt_helpers
+from .badge_index import badge_metric_field
+from .chore_history import bitmap_from_str
+from .const import (
+    CHALLENGE_TYPE_DAILY_MIN,
+    CHALLENGE_TYPE_TOTAL_WITHIN_WINDOW,
+    CONF_APPLICABLE_DAYS,
+    DEFAULT_POINTS,
+    FREQUENCY_BIWEEKLY,
+    FREQUENCY_CUSTOM,
+    FREQUENCY_DAILY,
+    FREQUENCY_MONTHLY,
+    FREQUENCY_NONE,
+    FREQUENCY_WEEKLY,
+    WEEKDAY_OPTIONS,
+)
+from .day_counters import DAY_COUNTER_FIELDS
+
+if TYPE_CHECKING:
+    from .engine import KidsChoresEngine
+
+# Days between occurrences of the fixed-length recurrences
+_STEP_DAYS = {FREQUENCY_DAILY: 1, FREQUENCY_WEEKLY: 7, FREQUENCY_BIWEEKLY: 14}
+
+# Challenge outcomes
+OUTCOME_AWARDED = "awarded"  # Already awarded before the projection
+OUTCOME_COMPLETE = "complete"  # Completed within the horizon
+OUTCOME_SHORT = "short"  # Window ends within the horizon without completing
+OUTCOME_OPEN = "open"  # Window runs past the horizon, not completed yet
+
+
+def _due_day(due_date: Any) -> Optional[date]:
+    """Return the local day of a stored due date."""
+    if not isinstance(due_date, str):
+        return None
+    parsed = dt_helpers.parse_datetime(due_date)
+    return dt_helpers.as_local(parsed).date() if parsed else None
+
+
+def chore_occurrences(
+    engine: KidsChoresEngine, chore_info: dict[str, Any], today: date, days: int
+) -> list[int]:
+    """Return the day offsets from today on which a chore falls due within days.
+
+    Recurring chores stay in phase with their due date; an overdue chore is done
+    today. Occurrences on days outside applicable_days move to the next one.
+    """
+    freq = chore_info.get("recurring_frequency", FREQUENCY_NONE)
+    due = _due_day(chore_info.get("due_date"))
+    anchor = (due - today).days if due else 0
+
+    step_days = _STEP_DAYS.get(freq)
+    step_months = 1 if freq == FREQUENCY_MONTHLY else None
+    if freq == FREQUENCY_CUSTOM:
+        interval = chore_info.get("custom_interval") or 0
+        unit = chore_info.get("custom_interval_unit")
+        if interval > 0 and unit == "days":
+            step_days = interval
+        elif interval > 0 and unit == "weeks":
+            step_days = 7 * interval
+        elif interval > 0 and unit == "months":
+            step_months = interval
+
+    if step_days:
+        first = anchor % step_days if anchor < 0 else anchor
+        offsets = list(range(first, days, step_days))
+    elif step_months:
+        offsets = []
+        anchor_day = due or today
+        months = 0
+        while (offset := (engine._add_months(anchor_day, months) - today).days) < days:
+            if offset >= 0:
+                offsets.append(offset)
+            months += step_months
+    else:
+        offsets = [max(anchor, 0)] if anchor < days else []
+
+    # An overdue recurring chore is caught up today
+    if anchor < 0 and offsets and offsets[0] != 0:
+        offsets.insert(0, 0)
+
+    applicable_days = chore_info.get(CONF_APPLICABLE_DAYS) or []
+    if applicable_days:
+        weekday_keys = list(WEEKDAY_OPTIONS)
+        weekday = today.weekday()
+        shifted = []
+        for offset in offsets:
+            for shift in range(7):
+                if weekday_keys[(weekday + offset + shift) % 7] in applicable_days:
+                    shifted.append(offset + shift)
+                    break
+        offsets = sorted({offset for offset in shifted if offset < days})
+
+    return offsets
+
+
+def project_household(
+    engine: KidsChoresEngine, days: int, kid_ids: Optional[list[str]] = None
+) -> dict[str, Any]:
+    """Project every kid, or the given kids, over days starting today."""
+    today = date.fromordinal(engine._counting_day())
+    return {
+        "days": days,
+        "start": today.isoformat(),
+        "end": date.fromordinal(today.toordinal() + days - 1).isoformat(),
+        "kids": {
+            engine.kids_data[kid_id].get("name", kid_id): project_kid(
+                engine, kid_id, days
+            )
+            for kid_id in (kid_ids if kid_ids is not None else engine.kids_data)
+        },
+    }
+
+
+def project_kid(engine: KidsChoresEngine, kid_id: str, days: int) -> dict[str, Any]:
+    """Project a kid's points, badges, streak and challenges over days."""
+    kid_info = engine.kids_data[kid_id]
+    today = date.fromordinal(engine._counting_day())
+
+    # Day buckets: chores completed and base (unmultiplied) points per day
+    chores_per_day = [0] * days
+    base_points = [0.0] * days
+    occurrences_by_chore: dict[str, set[int]] = {}
+    for chore_id, chore_info in engine.chores_data.items():
+        if kid_id not in chore_info.get("assigned_kids", []):
+            continue
+        offsets = chore_occurrences(engine, chore_info, today, days)
+        if offsets and offsets[0] == 0:
+            if chore_id in kid_info.get("approved_chores", []):
+                offsets = offsets[1:]
+        occurrences_by_chore[chore_id] = set(offsets)
+        chore_points = chore_info.get("default_points", DEFAULT_POINTS)
+        for offset in offsets:
+            chores_per_day[offset] += 1
+            base_points[offset] += chore_points
+
+    cum_chores = list(accumulate(chores_per_day))
+    badge_days, points_by_end = _project_badges(
+        engine, kid_id, today, days, chores_per_day, base_points
+    )
+
+    # Streak: the engine's own streak rule over the days with any chore
+    streak = dict(engine.get_streak_record(kid_id))
+    for offset, count in enumerate(chores_per_day):
+        if count:
+            engine._advance_streak(streak, today.toordinal() + offset)
+
+    return {
+        "points": kid_info.get("points", 0),
+        "projected_points": round(points_by_end, 2),
+        "projected_chores": cum_chores[-1] if cum_chores else 0,
+        "streak": streak.get("current_streak", 0),
+        "max_streak": streak.get("max_streak", 0),
+        "badges": [
+            {
+                "name": engine.badges_data[badge_id].get("name"),
+                "date": date.fromordinal(today.toordinal() + day).isoformat(),
+                "points": round(points, 2),
+            }
+            for day, badge_id, points in badge_days
+        ],
+        "challenges": _project_challenges(
+            engine, kid_id, today, days, cum_chores, occurrences_by_chore
+        ),
+    }
+
+
+def _project_badges(
+    engine: KidsChoresEngine,
+    kid_id: str,
+    today: date,
+    days: int,
+    chores_per_day: list[int],
+    base_points: list[float],
+) -> tuple[list[tuple[int, str, float]], float]:
+    """Return (day, badge id, points) of each badge crossed, and the final points.
+
+    Chore-count crossings do not depend on points, so they come first; the
+    points pass then walks multiplier segments between crossings.
+    """
+    kid_info = engine.kids_data[kid_id]
+    points_ladder: list[tuple[float, str]] = []
+    count_events: list[tuple[int, str]] = []
+
+    windows: dict[str, list[float]] = {}
+    for badge_id, badge in engine.badges_data.items():
+        if kid_id in badge.get("earned_by", []):
+            continue
+        field = badge_metric_field(badge)
+        threshold = badge.get("threshold_value", 0)
+        if field == "points":
+            points_ladder.append((threshold, badge_id))
+        elif field in DAY_COUNTER_FIELDS and days:
+            if field not in windows:
+                windows[field] = _window_maxima(
+                    engine, kid_id, field, today, chores_per_day
+                )
+            day = bisect_left(windows[field], threshold)
+            if day < days:
+                count_events.append((day, badge_id))
+    points_ladder.sort()
+    count_events.sort()
+
+    cum_base = list(accumulate(base_points))
+    multiplier = kid_info.get("points_multiplier", 1.0) or 1.0
+    seg_start, seg_points, seg_base = 0, float(kid_info.get("points", 0)), 0.0
+
+    def points_at(day: int) -> float:
+        return seg_points + multiplier * (cum_base[day] - seg_base)
+
+    crossings: list[tuple[int, str, float]] = []
+    ladder_pos = event_pos = 0
+    while ladder_pos < len(points_ladder) or event_pos < len(count_events):
+        event_day = (
+            count_events[event_pos][0] if event_pos < len(count_events) else days
+        )
+        day = days
+        if ladder_pos < len(points_ladder):
+            threshold = points_ladder[ladder_pos][0]
+            if threshold <= seg_points:
+                day = max(seg_start - 1, 0)
+            else:
+                target = seg_base + (threshold - seg_points) / multiplier
+                day = bisect_left(
+                    cum_base, target, lo=seg_start, hi=min(event_day + 1, days)
+                )
+
+        if day < days and day <= event_day:
+            badge_id = points_ladder[ladder_pos][1]
+            ladder_pos += 1
+        elif event_pos < len(count_events):
+            day, badge_id = count_events[event_pos]
+            event_pos += 1
+        else:
+            break
+
+        crossed_points = points_at(day)
+        crossings.append((day, badge_id, crossed_points))
+
+        # The badge's multiplier applies from the next day
+        badge_multiplier = engine.badges_data[badge_id].get("points_multiplier", 1.0)
+        if badge_multiplier > multiplier:
+            seg_start, seg_points, seg_base = day + 1, crossed_points, cum_base[day]
+            multiplier = badge_multiplier
+
+    final_points = points_at(days - 1) if days else seg_points
+    return crossings, final_points
+
+
+def _window_maxima(
+    engine: KidsChoresEngine,
+    kid_id: str,
+    field: str,
+    today: date,
+    chores_per_day: list[int],
+) -> list[float]:
+    """Return the running maximum of a chore-count window total for each day."""
+    _, period = DAY_COUNTER_FIELDS[field]
+    total = engine.get_kid_counter(kid_id, field)
+    maxima: list[float] = []
+    for offset, count in enumerate(chores_per_day):
+        day = date.fromordinal(today.toordinal() + offset)
+        if offset:
+            moment = datetime.combine(day, time.max, dt_helpers.get_default_time_zone())
+            if engine._get_reset_boundaries(moment)[period].date() == day:
+                total = 0
+        total += count
+        maxima.append(max(total, maxima[-1]) if maxima else total)
+    return maxima
+
+
+def _project_challenges(
+    engine: KidsChoresEngine,
+    kid_id: str,
+    today: date,
+    days: int,
+    cum_chores: list[int],
+    occurrences_by_chore: dict[str, set[int]],
+) -> list[dict[str, Any]]:
+    """Return the projected outcome of each of a kid's challenges."""
+    rule_index = engine.rule_index
+    results = []
+    for challenge_id in rule_index.challenges.for_kid(kid_id):
+        challenge = engine.challenges_data[challenge_id]
+        challenge_type = challenge.get("type")
+        if challenge_type not in (
+            CHALLENGE_TYPE_TOTAL_WITHIN_WINDOW,
+            CHALLENGE_TYPE_DAILY_MIN,
+        ):
+            continue
+
+        start, end = rule_index.challenge_window(challenge_id)
+        progress = challenge.get("progress", {}).get(kid_id, {})
+        result = {"name": challenge.get("name"), "outcome": OUTCOME_OPEN, "date": None}
+        results.append(result)
+
+        if progress.get("awarded"):
+            result["outcome"] = OUTCOME_AWARDED
+            continue
+        if end and (end.date() - today).days < 0:
+            result["outcome"] = OUTCOME_SHORT
+            continue
+
+        if challenge_type == CHALLENGE_TYPE_TOTAL_WITHIN_WINDOW:
+            first = max((start.date() - today).days, 0) if start else 0
+            last = min((end.date() - today).days, days - 1) if end else days - 1
+            before = cum_chores[first - 1] if 0 < first <= days else 0
+            target = challenge.get("target_value", 1)
+            count = progress.get("count", 0)
+            day = (
+                bisect_left(cum_chores, before + target - count, lo=first, hi=last + 1)
+                if first <= last
+                else days
+            )
+            if day <= last:
+                result["outcome"] = OUTCOME_COMPLETE
+                result["date"] = date.fromordinal(today.toordinal() + day).isoformat()
+            else:
+                in_window = cum_chores[last] - before if first <= last else 0
+                result["projected_value"] = count + in_window
+                if end and (end.date() - today).days < days:
+                    result["outcome"] = OUTCOME_SHORT
+            result["target_value"] = target
+            continue
+
+        # Daily minimum: every window day needs the selected chore often enough
+        num_days = rule_index.challenge_days(challenge_id)
+        if not start or num_days is None:
+            continue
+        required = challenge.get("required_daily", 1)
+        occurrences = occurrences_by_chore.get(
+            challenge.get("selected_chore_id"), set()
+        )
+        satisfied = bitmap_from_str(progress.get("satisfied_days"))
+        today_count = (
+            progress.get("day_count", 0)
+            if progress.get("day") == today.isoformat()
+            else 0
+        )
+        start_offset = (start.date() - today).days
+        outcome = OUTCOME_COMPLETE
+        for window_day in range(num_days):
+            if satisfied & (1 << window_day):
+                continue
+            offset = start_offset + window_day
+            if offset >= days:
+                outcome = OUTCOME_OPEN
+                break
+            count = (offset in occurrences) + (today_count if offset == 0 else 0)
+            if offset < 0 or count < required:
+                outcome = OUTCOME_SHORT
+                result["date"] = date.fromordinal(
+                    today.toordinal() + offset
+                ).isoformat()
+                break
+        result["outcome"] = outcome
+        if outcome == OUTCOME_COMPLETE:
+            result["date"] = date.fromordinal(
+                today.toordinal() + start_offset + num_days - 1
+            ).isoformat()
+
+    return results
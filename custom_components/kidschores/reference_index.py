@@ -0,0 +1,106 @@
+# File: reference_index.py
+"""Reverse reference index for cascading deletions in the KidsChores coordinator.
+
+Every kid, chore and reward id is mapped to the records that mention it, so a
+batch of deleted ids is cleaned up by visiting only the records that referenced
+one of them instead of sweeping every section once per deleted item.
+
+Features:
+- Chores, achievements, challenges and parents that reference a kid.
+- Kids, achievements and challenges that reference a chore.
+- Kids that reference a reward in their redemption queue.
+- Pending chore and reward approvals that reference a kid, chore or reward.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from .const import (
+    DATA_ACHIEVEMENTS,
+    DATA_CHALLENGES,
+    DATA_CHORES,
+    DATA_KIDS,
+    DATA_PARENTS,
+    DATA_PENDING_CHORE_APPROVALS,
+    DATA_PENDING_REWARD_APPROVALS,
+)
+
+# Kid fields holding chore ids, as lists or as dict keys
+KID_CHORE_LIST_FIELDS = ("claimed_chores", "approved_chores", "overdue_chores")
+KID_CHORE_DICT_FIELDS = (
+    "chore_claims",
+    "chore_approvals",
+    "chore_streaks",
+    "chore_history",
+    "overdue_notifications",
+)
+
+
+class KidsChoresReferenceIndex:
+    """Referenced id => records that reference it, grouped by data section.
+
+    Pending chore approvals are identified by list position and pending reward
+    approvals by redemption id.
+    """
+
+    def __init__(self, data: dict[str, Any]):
+        """Build the index from the coordinator's data in a single pass."""
+        self._refs: dict[str, dict[str, set[Any]]] = {}
+
+        for kid_id, kid_info in data.get(DATA_KIDS, {}).items():
+            for field in KID_CHORE_LIST_FIELDS:
+                for chore_id in kid_info.get(field, []):
+                    self._add(chore_id, DATA_KIDS, kid_id)
+            for field in KID_CHORE_DICT_FIELDS:
+                for chore_id in kid_info.get(field, {}):
+                    self._add(chore_id, DATA_KIDS, kid_id)
+            for reward_id in kid_info.get("reward_queue", {}):
+                self._add(reward_id, DATA_KIDS, kid_id)
+
+        for chore_id, chore_info in data.get(DATA_CHORES, {}).items():
+            for kid_id in chore_info.get("assigned_kids", []):
+                self._add(kid_id, DATA_CHORES, chore_id)
+
+        for section in (DATA_ACHIEVEMENTS, DATA_CHALLENGES):
+            for rule_id, rule in data.get(section, {}).items():
+                for kid_id in rule.get("assigned_kids", []):
+                    self._add(kid_id, section, rule_id)
+                for kid_id in rule.get("progress", {}):
+                    self._add(kid_id, section, rule_id)
+                if rule.get("selected_chore_id"):
+                    self._add(rule["selected_chore_id"], section, rule_id)
+
+        for parent_id, parent_info in data.get(DATA_PARENTS, {}).items():
+            for kid_id in parent_info.get("associated_kids", []):
+                self._add(kid_id, DATA_PARENTS, parent_id)
+
+        for position, approval in enumerate(data.get(DATA_PENDING_CHORE_APPROVALS, [])):
+            self._add(approval.get("kid_id"), DATA_PENDING_CHORE_APPROVALS, position)
+            self._add(approval.get("chore_id"), DATA_PENDING_CHORE_APPROVALS, position)
+
+        for redemption_id, approval in data.get(
+            DATA_PENDING_REWARD_APPROVALS, {}
+        ).items():
+            self._add(
+                approval.get("kid_id"), DATA_PENDING_REWARD_APPROVALS, redemption_id
+            )
+            self._add(
+                approval.get("reward_id"), DATA_PENDING_REWARD_APPROVALS, redemption_id
+            )
+
+    def _add(self, referenced_id: Any, section: str, record_id: Any) -> None:
+        """Record that a record in a section references an id."""
+        if not referenced_id:
+            return
+        self._refs.setdefault(referenced_id, {}).setdefault(section, set()).add(
+            record_id
+        )
+
+    def referencing(self, referenced_ids: set[str]) -> dict[str, set[Any]]:
+        """Return, per section, the records that reference any of the given ids."""
+        records: dict[str, set[Any]] = {}
+        for referenced_id in referenced_ids:
+            for section, record_ids in self._refs.get(referenced_id, {}).items():
+                records.setdefault(section, set()).update(record_ids)
+        return records
@@ -0,0 +1,132 @@
+# File: rule_index.py
+"""Achievement and challenge rule index for the KidsChores coordinator.
+
+Rules are grouped by type and assigned kid, and further by selected chore, so a
+chore approval or points change only visits the rules it can affect. Challenge
+windows are parsed once and kept sorted by start for active-window lookups.
+
+Features:
+- Rules for a (type, kid) pair, optionally narrowed to one selected chore.
+- All rules assigned to a kid.
+- Pre-parsed challenge windows with a bisect-based active lookup.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from datetime import datetime
+from typing import Any, Optional
+
+from . import dt_helpers
+from .const import CHALLENGE_TYPE_DAILY_MIN, LOGGER
+
+
+def parse_challenge_datetime(value: Any) -> Optional[datetime]:
+    """Parse a stored challenge date, treating naive values as UTC."""
+    if not isinstance(value, str):
+        return None
+    parsed = dt_helpers.parse_datetime(value)
+    if parsed and parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=dt_helpers.UTC)
+    return parsed
+
+
+class _RuleGroup:
+    """Rule ids indexed by (type, kid) and by (type, kid, selected chore)."""
+
+    def __init__(self, rules_data: dict[str, Any]):
+        """Build the group from achievement or challenge data."""
+        self._by_type_kid: dict[tuple[str, str], list[str]] = {}
+        self._by_type_kid_chore: dict[tuple[str, str, str], list[str]] = {}
+        self._by_kid: dict[str, list[str]] = {}
+
+        for rule_id, rule in rules_data.items():
+            rule_type = rule.get("type")
+            chore_id = rule.get("selected_chore_id") or ""
+            for kid_id in rule.get("assigned_kids", []):
+                self._by_type_kid.setdefault((rule_type, kid_id), []).append(rule_id)
+                self._by_type_kid_chore.setdefault(
+                    (rule_type, kid_id, chore_id), []
+                ).append(rule_id)
+                self._by_kid.setdefault(kid_id, []).append(rule_id)
+
+    def for_kid(self, kid_id: str) -> list[str]:
+        """Return the rule ids assigned to a kid."""
+        return self._by_kid.get(kid_id, [])
+
+    def matching(
+        self, rule_type: str, kid_id: str, chore_id: Optional[str] = None
+    ) -> list[str]:
+        """Return rule ids of a type for a kid, optionally for one selected chore."""
+        if chore_id is None:
+            return self._by_type_kid.get((rule_type, kid_id), [])
+        return self._by_type_kid_chore.get((rule_type, kid_id, chore_id), [])
+
+
+class KidsChoresRuleIndex:
+    """Achievements and challenges indexed by type, assigned kid and chore."""
+
+    def __init__(
+        self, achievements_data: dict[str, Any], challenges_data: dict[str, Any]
+    ):
+        """Build the index from the coordinator's achievement and challenge data."""
+        self.achievements = _RuleGroup(achievements_data)
+        self.challenges = _RuleGroup(challenges_data)
+
+        self._windows: dict[str, tuple[Optional[datetime], Optional[datetime]]] = {}
+        for challenge_id, challenge in challenges_data.items():
+            self._windows[challenge_id] = (
+                parse_challenge_datetime(challenge.get("start_date")),
+                parse_challenge_datetime(challenge.get("end_date")),
+            )
+
+        # Challenges without a start are always started; the rest sorted by start.
+        self._open_start = [
+            challenge_id
+            for challenge_id, (start, _) in self._windows.items()
+            if start is None
+        ]
+        self._by_start = sorted(
+            (start, challenge_id)
+            for challenge_id, (start, _) in self._windows.items()
+            if start is not None
+        )
+        self._starts = [start for start, _ in self._by_start]
+
+        for challenge in challenges_data.values():
+            if challenge.get("type") == CHALLENGE_TYPE_DAILY_MIN and not challenge.get(
+                "selected_chore_id"
+            ):
+                LOGGER.warning(
+                    "Challenge '%s' of type daily_min has no selected_chore_id set. Progress will not be tracked.",
+                    challenge.get("name"),
+                )
+
+    def challenge_window(
+        self, challenge_id: str
+    ) -> tuple[Optional[datetime], Optional[datetime]]:
+        """Return the parsed (start, end) window of a challenge."""
+        return self._windows.get(challenge_id, (None, None))
+
+    def challenge_days(self, challenge_id: str) -> Optional[int]:
+        """Return the number of days in a challenge window, if it is bounded."""
+        start, end = self.challenge_window(challenge_id)
+        if not start or not end:
+            return None
+        return (end - start).days + 1
+
+    def active_challenge_ids(self, now: datetime) -> set[str]:
+        """Return ids of challenges whose window contains now.
+
+        Missing bounds are treated as open.
+        """
+        started = self._open_start + [
+            challenge_id
+            for _, challenge_id in self._by_start[: bisect_right(self._starts, now)]
+        ]
+        return {
+            challenge_id
+            for challenge_id in started
+            if self._windows[challenge_id][1] is None
+            or now <= self._windows[challenge_id][1]
+        }
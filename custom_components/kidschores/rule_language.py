@@ -0,0 +1,217 @@
+# File: rule_language.py
+"""Declarative award rules for KidsChores badges, achievements and challenges.
+
+A rule is a small expression over a kid's metrics, entered in the criteria
+field of a badge, achievement or challenge of type "rule", for example
+``chore_streak >= 7 and points >= 100`` or
+``completed_chores_weekly >= 10 or streak >= 14``. Each rule is parsed and
+compiled once into a predicate that reads only the metrics it names; those
+names are its declared inputs. The rule set groups compiled rules by kid and
+input, so the coordinator evaluates just the rules whose inputs changed.
+
+Supported syntax: numbers, metric names, + - * /, comparisons (< <= > >= ==
+!=, chainable), and/or/not and parentheses.
+
+Features:
+- Rules compiled to closures once per configuration change, never re-parsed.
+- Unknown names and unsupported syntax rejected when the rule is configured.
+- Rules looked up by (kid, changed input) instead of re-checking every rule.
+"""
+
+from __future__ import annotations
+
+import ast
+import operator
+from collections.abc import Callable, Iterable
+from typing import Any, Optional
+
+from .const import (
+    ACHIEVEMENT_TYPE_RULE,
+    BADGE_THRESHOLD_TYPE_RULE,
+    CHALLENGE_TYPE_RULE,
+    DATA_ACHIEVEMENTS,
+    DATA_BADGES,
+    DATA_CHALLENGES,
+    LOGGER,
+)
+
+# Metrics a rule can read, by what changes them
+POINTS_INPUTS = frozenset(
+    {
+        "points",
+        "max_points_ever",
+        "points_earned_today",
+        "points_earned_weekly",
+        "points_earned_monthly",
+    }
+)
+CHORE_INPUTS = frozenset(
+    {
+        "completed_chores_total",
+        "completed_chores_today",
+        "completed_chores_weekly",
+        "completed_chores_monthly",
+        "streak",
+        "max_streak",
+        "chore_streak",
+        "chore_approvals",
+    }
+)
+BADGE_INPUTS = frozenset({"badges"})
+RULE_INPUTS = POINTS_INPUTS | CHORE_INPUTS | BADGE_INPUTS
+
+# Metrics read for the rule's selected chore
+CHORE_SCOPED_INPUTS = frozenset({"chore_streak", "chore_approvals"})
+
+RulePredicate = Callable[[Callable[[str], float]], bool]
+
+_BIN_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: lambda left, right: left / right if right else 0.0,
+}
+_COMPARE_OPS = {
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+}
+
+
+def _compile_node(node: ast.AST, inputs: set[str]) -> Callable[[Callable], Any]:
+    """Compile one expression node into a closure over a metric resolver."""
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        value = float(node.value)
+        return lambda metric: value
+
+    if isinstance(node, ast.Name):
+        if node.id not in RULE_INPUTS:
+            raise ValueError(f"Unknown metric '{node.id}'")
+        name = node.id
+        inputs.add(name)
+        return lambda metric: metric(name)
+
+    if isinstance(node, ast.BinOp) and type(node.op) in _BIN_OPS:
+        bin_op = _BIN_OPS[type(node.op)]
+        left = _compile_node(node.left, inputs)
+        right = _compile_node(node.right, inputs)
+        return lambda metric: bin_op(left(metric), right(metric))
+
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.Not, ast.USub)):
+        operand = _compile_node(node.operand, inputs)
+        if isinstance(node.op, ast.Not):
+            return lambda metric: not operand(metric)
+        return lambda metric: -operand(metric)
+
+    if isinstance(node, ast.BoolOp):
+        values = [_compile_node(value, inputs) for value in node.values]
+        if isinstance(node.op, ast.And):
+            return lambda metric: all(value(metric) for value in values)
+        return lambda metric: any(value(metric) for value in values)
+
+    if isinstance(node, ast.Compare) and all(
+        type(op) in _COMPARE_OPS for op in node.ops
+    ):
+        operands = [_compile_node(node.left, inputs)] + [
+            _compile_node(comparator, inputs) for comparator in node.comparators
+        ]
+        compare_ops = [_COMPARE_OPS[type(op)] for op in node.ops]
+
+        def compare(metric):
+            left = operands[0](metric)
+            for compare_op, operand in zip(compare_ops, operands[1:]):
+                right = operand(metric)
+                if not compare_op(left, right):
+                    return False
+                left = right
+            return True
+
+        return compare
+
+    raise ValueError(f"Unsupported rule syntax: {ast.dump(node)[:40]}")
+
+
+def compile_rule(text: str) -> tuple[RulePredicate, frozenset[str]]:
+    """Compile rule text into a predicate and the metric names it reads.
+
+    Raises ValueError if the text is empty, malformed or names unknown metrics.
+    """
+    if not text or not text.strip():
+        raise ValueError("Rule is empty")
+    try:
+        tree = ast.parse(text.strip(), mode="eval")
+    except SyntaxError as err:
+        raise ValueError(f"Invalid rule: {err.msg}") from err
+
+    inputs: set[str] = set()
+    expression = _compile_node(tree.body, inputs)
+    return (lambda metric: bool(expression(metric))), frozenset(inputs)
+
+
+def is_rule_item(section: str, item: dict[str, Any]) -> bool:
+    """Return True if a badge, achievement or challenge is awarded by a rule."""
+    if section == DATA_BADGES:
+        return item.get("threshold_type") == BADGE_THRESHOLD_TYPE_RULE
+    if section == DATA_ACHIEVEMENTS:
+        return item.get("type") == ACHIEVEMENT_TYPE_RULE
+    return item.get("type") == CHALLENGE_TYPE_RULE
+
+
+class KidsChoresRuleSet:
+    """Compiled award rules indexed by kid and input metric."""
+
+    def __init__(
+        self,
+        kid_ids: Iterable[str],
+        badges_data: dict[str, Any],
+        achievements_data: dict[str, Any],
+        challenges_data: dict[str, Any],
+    ):
+        """Compile every rule-type badge, achievement and challenge once."""
+        kid_ids = list(kid_ids)
+
+        # (kid_id, input) => [(section, item_id, predicate, selected chore id)]
+        self._by_kid_input: dict[tuple[str, str], list[tuple]] = {}
+        self._by_kid: dict[str, list[tuple]] = {}
+
+        for section, items in (
+            (DATA_BADGES, badges_data),
+            (DATA_ACHIEVEMENTS, achievements_data),
+            (DATA_CHALLENGES, challenges_data),
+        ):
+            for item_id, item in items.items():
+                if not is_rule_item(section, item):
+                    continue
+                try:
+                    predicate, inputs = compile_rule(item.get("criteria", ""))
+                except ValueError as err:
+                    LOGGER.warning(
+                        "Rule of '%s' is not evaluated: %s", item.get("name"), err
+                    )
+                    continue
+
+                entry = (section, item_id, predicate, item.get("selected_chore_id"))
+                # Badges apply to every kid; the rest to their assigned kids
+                assigned = (
+                    kid_ids if section == DATA_BADGES else item.get("assigned_kids", [])
+                )
+                for kid_id in assigned:
+                    self._by_kid.setdefault(kid_id, []).append(entry)
+                    for name in inputs:
+                        self._by_kid_input.setdefault((kid_id, name), []).append(entry)
+
+    def affected(
+        self, kid_id: str, changed: Optional[Iterable[str]] = None
+    ) -> list[tuple[str, str, RulePredicate, Optional[str]]]:
+        """Return a kid's rules reading any changed input, or all if changed is None."""
+        if changed is None:
+            return list(self._by_kid.get(kid_id, []))
+
+        entries: dict[tuple[str, str], tuple] = {}
+        for name in changed:
+            for entry in self._by_kid_input.get((kid_id, name), []):
+                entries.setdefault(entry[:2], entry)
+        return list(entries.values())
@@ -32,6 +32,10 @@ Available Sensors:
 26. ChallengeProgressSensor ............ Progress (in %) toward a challenge per kid
 27. KidHighestStreakSensor ............. The highest current streak (in days) among streak-type achievements for a kid
 28.* ChoreStreakSensor .................. Current streak (in days) for a kid for a specific chore - DEPRECATE
+29. KidSummarySensor ................... Compact mode: one kid's chores, rewards, penalties and bonuses in one sensor
+
+Claims, approvals, streak, penalty and bonus count sensors per kid and item are
+optional families: they are only created once enabled in the general settings.
 """
 
 from homeassistant.config_entries import ConfigEntry
@@ -39,11 +43,13 @@ from homeassistant.const import PERCENTAGE, UnitOfTime
 from homeassistant.core import HomeAssistant
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
 from .const import (
     ACHIEVEMENT_TYPE_DAILY_MIN,
+    ACHIEVEMENT_TYPE_RULE,
     ACHIEVEMENT_TYPE_STREAK,
     ACHIEVEMENT_TYPE_TOTAL,
     ATTR_ACHIEVEMENT_NAME,
@@ -54,15 +60,19 @@ from .const import (
     ATTR_ASSOCIATED_CHORE,
     ATTR_AWARDED,
     ATTR_BADGES,
+    ATTR_BONUSES,
     ATTR_CHALLENGE_NAME,
     ATTR_CHALLENGE_TYPE,
     ATTR_CLAIMED_ON,
     ATTR_CHORE_APPROVALS_COUNT,
     ATTR_CHORE_APPROVALS_TODAY,
     ATTR_CHORE_CLAIMS_COUNT,
+    ATTR_CHORE_COMPLETION_RATE,
     ATTR_CHORE_CURRENT_STREAK,
     ATTR_CHORE_HIGHEST_STREAK,
+    ATTR_CHORE_LONGEST_GAP,
     ATTR_CHORE_NAME,
+    ATTR_CHORES,
     ATTR_COST,
     ATTR_CRITERIA,
     ATTR_CUSTOM_FREQUENCY_INTERVAL,
@@ -77,9 +87,12 @@ from .const import (
     ATTR_KIDS_EARNED,
     ATTR_LABELS,
     ATTR_LAST_DATE,
+    ATTR_OPEN_CHORES,
     ATTR_PARTIAL_ALLOWED,
     ATTR_PENALTY_NAME,
+    ATTR_PENALTIES,
     ATTR_PENALTY_POINTS,
+    ATTR_PENDING_REDEMPTIONS,
     ATTR_POINTS_MULTIPLIER,
     ATTR_POINTS_TO_NEXT_BADGE,
     ATTR_RECURRING_FREQUENCY,
@@ -90,6 +103,7 @@ from .const import (
     ATTR_REWARD_CLAIMS_COUNT,
     ATTR_REWARD_NAME,
     ATTR_REWARD_POINTS,
+    ATTR_REWARDS,
     ATTR_START_DATE,
     ATTR_SHARED_CHORE,
     ATTR_BONUS_NAME,
@@ -97,13 +111,16 @@ from .const import (
     ATTR_TARGET_VALUE,
     ATTR_THRESHOLD_TYPE,
     ATTR_TYPE,
+    ATTR_VERSION,
     CHALLENGE_TYPE_DAILY_MIN,
+    CHALLENGE_TYPE_RULE,
     CHALLENGE_TYPE_TOTAL_WITHIN_WINDOW,
     CHORE_STATE_APPROVED,
     CHORE_STATE_CLAIMED,
     CHORE_STATE_OVERDUE,
     CHORE_STATE_PENDING,
     CHORE_STATE_UNKNOWN,
+    CONF_COMPACT_ENTITIES,
     CONF_POINTS_ICON,
     CONF_POINTS_LABEL,
     DATA_PENDING_CHORE_APPROVALS,
@@ -112,6 +129,8 @@ from .const import (
     DEFAULT_BADGE_ICON,
     DEFAULT_CHALLENGES_ICON,
     DEFAULT_CHORE_SENSOR_ICON,
+    DEFAULT_COMPACT_ENTITIES,
+    DEFAULT_COMPACT_SUMMARY_ICON,
     DEFAULT_PENALTY_ICON,
     DEFAULT_PENALTY_POINTS,
     DEFAULT_POINTS_ICON,
@@ -125,6 +144,13 @@ from .const import (
     DEFAULT_TROPHY_OUTLINE,
     DOMAIN,
     DUE_DATE_NOT_SET,
+    ENTITY_FAMILY_BONUS_APPLIES,
+    ENTITY_FAMILY_CHORE_APPROVALS,
+    ENTITY_FAMILY_CHORE_CLAIMS,
+    ENTITY_FAMILY_CHORE_STREAK,
+    ENTITY_FAMILY_PENALTY_APPLIES,
+    ENTITY_FAMILY_REWARD_APPROVALS,
+    ENTITY_FAMILY_REWARD_CLAIMS,
     FREQUENCY_CUSTOM,
     LABEL_POINTS,
     REWARD_STATE_APPROVED,
@@ -135,7 +161,18 @@ from .const import (
     UNKNOWN_REWARD,
 )
 from .coordinator import KidsChoresDataCoordinator
-from .kc_helpers import get_friendly_label
+from .kc_helpers import get_friendly_label, is_entity_family_enabled
+
+# unique_id suffix of each optional sensor family
+OPTIONAL_SENSOR_SUFFIXES = {
+    ENTITY_FAMILY_CHORE_CLAIMS: "chore_claims",
+    ENTITY_FAMILY_CHORE_APPROVALS: "chore_approvals",
+    ENTITY_FAMILY_CHORE_STREAK: "streak",
+    ENTITY_FAMILY_REWARD_CLAIMS: "reward_claims",
+    ENTITY_FAMILY_REWARD_APPROVALS: "reward_approvals",
+    ENTITY_FAMILY_PENALTY_APPLIES: "penalty_applies",
+    ENTITY_FAMILY_BONUS_APPLIES: "bonus_applies",
+}
 
 
 async def async_setup_entry(
@@ -147,8 +184,24 @@ async def async_setup_entry(
 
     points_label = entry.options.get(CONF_POINTS_LABEL, DEFAULT_POINTS_LABEL)
     points_icon = entry.options.get(CONF_POINTS_ICON, DEFAULT_POINTS_ICON)
+    compact = entry.options.get(CONF_COMPACT_ENTITIES, DEFAULT_COMPACT_ENTITIES)
+    ent_reg = er.async_get(hass)
     entities = []
 
+    def optional_sensor_wanted(family: str, kid_id: str, item_id: str) -> bool:
+        """Return True if a sensor of a disabled-by-default family should be created.
+
+        Sensors of disabled families are not created at all, unless the user
+        enabled that one sensor in the entity registry.
+        """
+        if is_entity_family_enabled(entry, family):
+            return True
+        suffix = OPTIONAL_SENSOR_SUFFIXES[family]
+        entity_id = ent_reg.async_get_entity_id(
+            "sensor", DOMAIN, f"{entry.entry_id}_{kid_id}_{item_id}_{suffix}"
+        )
+        return entity_id is not None and not ent_reg.async_get(entity_id).disabled
+
     # Sensor to detail number of Chores pending approval
     entities.append(PendingChoreApprovalsSensor(coordinator, entry))
 
@@ -218,64 +271,90 @@ async def async_setup_entry(
             )
         )
 
-        # Reward Claims and Approvals
-        for reward_id, reward_info in coordinator.rewards_data.items():
-            reward_name = reward_info.get("name", f"Reward {reward_id}")
-            entities.append(
-                RewardClaimsSensor(
-                    coordinator, entry, kid_id, kid_name, reward_id, reward_name
-                )
-            )
+        if compact:
+            # One summary sensor replaces the per-item sensor grids below
+            entities.append(KidSummarySensor(coordinator, entry, kid_id, kid_name))
+        else:
+            # Reward Claims and Approvals
+            for reward_id, reward_info in coordinator.rewards_data.items():
+                reward_name = reward_info.get("name", f"Reward {reward_id}")
+                if optional_sensor_wanted(
+                    ENTITY_FAMILY_REWARD_CLAIMS, kid_id, reward_id
+                ):
+                    entities.append(
+                        RewardClaimsSensor(
+                            coordinator, entry, kid_id, kid_name, reward_id, reward_name
+                        )
+                    )
 
-            # Rewards Approval Sensor
-            entities.append(
-                RewardApprovalsSensor(
-                    coordinator, entry, kid_id, kid_name, reward_id, reward_name
-                )
-            )
+                # Rewards Approval Sensor
+                if optional_sensor_wanted(
+                    ENTITY_FAMILY_REWARD_APPROVALS, kid_id, reward_id
+                ):
+                    entities.append(
+                        RewardApprovalsSensor(
+                            coordinator, entry, kid_id, kid_name, reward_id, reward_name
+                        )
+                    )
 
-        # Chore Claims and Approvals
-        for chore_id, chore_info in coordinator.chores_data.items():
-            if kid_id not in chore_info.get("assigned_kids", []):
-                continue
-            chore_name = chore_info.get("name", f"Chore {chore_id}")
-            entities.append(
-                ChoreClaimsSensor(
-                    coordinator, entry, kid_id, kid_name, chore_id, chore_name
-                )
-            )
+            # Chore Claims and Approvals
+            for chore_id, chore_info in coordinator.chores_data.items():
+                if kid_id not in chore_info.get("assigned_kids", []):
+                    continue
+                chore_name = chore_info.get("name", f"Chore {chore_id}")
+                if optional_sensor_wanted(ENTITY_FAMILY_CHORE_CLAIMS, kid_id, chore_id):
+                    entities.append(
+                        ChoreClaimsSensor(
+                            coordinator, entry, kid_id, kid_name, chore_id, chore_name
+                        )
+                    )
 
-            # Chore Approvals Sensor
-            entities.append(
-                ChoreApprovalsSensor(
-                    coordinator, entry, kid_id, kid_name, chore_id, chore_name
-                )
-            )
+                # Chore Approvals Sensor
+                if optional_sensor_wanted(
+                    ENTITY_FAMILY_CHORE_APPROVALS, kid_id, chore_id
+                ):
+                    entities.append(
+                        ChoreApprovalsSensor(
+                            coordinator, entry, kid_id, kid_name, chore_id, chore_name
+                        )
+                    )
 
-            # Chore Streak per Kid
-            entities.append(
-                ChoreStreakSensor(
-                    coordinator, entry, kid_id, kid_name, chore_id, chore_name
-                )
-            )
+                # Chore Streak per Kid
+                if optional_sensor_wanted(ENTITY_FAMILY_CHORE_STREAK, kid_id, chore_id):
+                    entities.append(
+                        ChoreStreakSensor(
+                            coordinator, entry, kid_id, kid_name, chore_id, chore_name
+                        )
+                    )
 
-        # Penalty Applies
-        for penalty_id, penalty_info in coordinator.penalties_data.items():
-            penalty_name = penalty_info.get("name", f"Penalty {penalty_id}")
-            entities.append(
-                PenaltyAppliesSensor(
-                    coordinator, entry, kid_id, kid_name, penalty_id, penalty_name
-                )
-            )
+            # Penalty Applies
+            for penalty_id, penalty_info in coordinator.penalties_data.items():
+                penalty_name = penalty_info.get("name", f"Penalty {penalty_id}")
+                if optional_sensor_wanted(
+                    ENTITY_FAMILY_PENALTY_APPLIES, kid_id, penalty_id
+                ):
+                    entities.append(
+                        PenaltyAppliesSensor(
+                            coordinator,
+                            entry,
+                            kid_id,
+                            kid_name,
+                            penalty_id,
+                            penalty_name,
+                        )
+                    )
 
-        # Bonus Applies
-        for bonus_id, bonus_info in coordinator.bonuses_data.items():
-            bonus_name = bonus_info.get("name", f"Bonus {bonus_id}")
-            entities.append(
-                BonusAppliesSensor(
-                    coordinator, entry, kid_id, kid_name, bonus_id, bonus_name
-                )
-            )
+            # Bonus Applies
+            for bonus_id, bonus_info in coordinator.bonuses_data.items():
+                bonus_name = bonus_info.get("name", f"Bonus {bonus_id}")
+                if optional_sensor_wanted(
+                    ENTITY_FAMILY_BONUS_APPLIES, kid_id, bonus_id
+                ):
+                    entities.append(
+                        BonusAppliesSensor(
+                            coordinator, entry, kid_id, kid_name, bonus_id, bonus_name
+                        )
+                    )
 
         # Achivement Progress per Kid
         for achievement_id, achievement in coordinator.achievements_data.items():
@@ -313,16 +392,17 @@ async def async_setup_entry(
         entities.append(KidHighestStreakSensor(coordinator, entry, kid_id, kid_name))
 
     # For each chore assigned to each kid, add a ChoreStatusSensor
-    for chore_id, chore_info in coordinator.chores_data.items():
-        chore_name = chore_info.get("name", f"Chore {chore_id}")
-        assigned_kids_ids = chore_info.get("assigned_kids", [])
-        for kid_id in assigned_kids_ids:
-            kid_name = coordinator._get_kid_name_by_id(kid_id) or f"Kid {kid_id}"
-            entities.append(
-                ChoreStatusSensor(
-                    coordinator, entry, kid_id, kid_name, chore_id, chore_name
+    if not compact:
+        for chore_id, chore_info in coordinator.chores_data.items():
+            chore_name = chore_info.get("name", f"Chore {chore_id}")
+            assigned_kids_ids = chore_info.get("assigned_kids", [])
+            for kid_id in assigned_kids_ids:
+                kid_name = coordinator._get_kid_name_by_id(kid_id) or f"Kid {kid_id}"
+                entities.append(
+                    ChoreStatusSensor(
+                        coordinator, entry, kid_id, kid_name, chore_id, chore_name
+                    )
                 )
-            )
 
     # For each shared chore, add a global state sensor
     for chore_id, chore_info in coordinator.chores_data.items():
@@ -333,17 +413,18 @@ async def async_setup_entry(
             )
 
     # For each Reward, add a RewardStatusSensor
-    for reward_id, reward_info in coordinator.rewards_data.items():
-        reward_name = reward_info.get("name", f"Reward {reward_id}")
+    if not compact:
+        for reward_id, reward_info in coordinator.rewards_data.items():
+            reward_name = reward_info.get("name", f"Reward {reward_id}")
 
-        # For each kid, create the reward status sensor
-        for kid_id, kid_info in coordinator.kids_data.items():
-            kid_name = kid_info.get("name", f"Kid {kid_id}")
-            entities.append(
-                RewardStatusSensor(
-                    coordinator, entry, kid_id, kid_name, reward_id, reward_name
+            # For each kid, create the reward status sensor
+            for kid_id, kid_info in coordinator.kids_data.items():
+                kid_name = kid_info.get("name", f"Kid {kid_id}")
+                entities.append(
+                    RewardStatusSensor(
+                        coordinator, entry, kid_id, kid_name, reward_id, reward_name
+                    )
                 )
-            )
 
     # For each Badge, add a BadgeSensor
     for badge_id, badge_info in coordinator.badges_data.items():
@@ -453,6 +534,9 @@ class ChoreStatusSensor(CoordinatorEntity, SensorEntity):
             ),
             ATTR_ASSIGNED_KIDS: assigned_kids_names,
             ATTR_LABELS: friendly_labels,
+            ATTR_VERSION: self.coordinator.get_chore_version(
+                self._kid_id, self._chore_id
+            ),
         }
 
         if chore_info.get("allow_multiple_claims_per_day", False):
@@ -461,6 +545,12 @@ class ChoreStatusSensor(CoordinatorEntity, SensorEntity):
             )
             attributes[ATTR_CHORE_APPROVALS_TODAY] = today_approvals
 
+        # Completion rate and longest gap over the recent history window
+        if kid_info and chore_info:
+            history = self.coordinator.get_chore_history(self._kid_id, self._chore_id)
+            attributes[ATTR_CHORE_COMPLETION_RATE] = history["completion_rate"]
+            attributes[ATTR_CHORE_LONGEST_GAP] = history["longest_gap"]
+
         if chore_info.get("recurring_frequency") == FREQUENCY_CUSTOM:
             attributes[ATTR_CUSTOM_FREQUENCY_INTERVAL] = chore_info.get(
                 "custom_interval"
@@ -602,8 +692,7 @@ class CompletedChoresDailySensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self):
         """Return the number of chores completed today."""
-        kid_info = self.coordinator.kids_data.get(self._kid_id, {})
-        return kid_info.get("completed_chores_today", 0)
+        return self.coordinator.get_kid_counter(self._kid_id, "completed_chores_today")
 
 
 # ------------------------------------------------------------------------------------------
@@ -627,8 +716,7 @@ class CompletedChoresWeeklySensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self):
         """Return the number of chores completed this week."""
-        kid_info = self.coordinator.kids_data.get(self._kid_id, {})
-        return kid_info.get("completed_chores_weekly", 0)
+        return self.coordinator.get_kid_counter(self._kid_id, "completed_chores_weekly")
 
 
 # ------------------------------------------------------------------------------------------
@@ -652,8 +740,9 @@ class CompletedChoresMonthlySensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self):
         """Return the number of chores completed this month."""
-        kid_info = self.coordinator.kids_data.get(self._kid_id, {})
-        return kid_info.get("completed_chores_monthly", 0)
+        return self.coordinator.get_kid_counter(
+            self._kid_id, "completed_chores_monthly"
+        )
 
 
 # DEPRECATE --------------------------------------------------------------------------------
@@ -705,33 +794,14 @@ class KidHighestBadgeSensor(CoordinatorEntity, SensorEntity):
         self.entity_id = f"sensor.kc_{kid_name}_highest_badge"
 
     def _find_highest_badge(self):
-        """Determine which badge has the highest ranking."""
-
+        """Return the id and data of the highest-threshold badge the kid has earned."""
         kid_info = self.coordinator.kids_data.get(self._kid_id, {})
-        earned_badge_names = kid_info.get("badges", [])
-
-        highest_badge = None
-        highest_value = -1
-
-        for badge_name in earned_badge_names:
-            # Find badge by name
-            badge_data = next(
-                (
-                    info
-                    for bid, info in self.coordinator.badges_data.items()
-                    if info.get("name") == badge_name
-                ),
-                None,
-            )
-            if not badge_data:
-                continue  # skip if not found or invalid
-
-            threshold_val = badge_data.get("threshold_value", 0)
-            if threshold_val > highest_value:
-                highest_value = threshold_val
-                highest_badge = badge_name
-
-        return highest_badge, highest_value
+        badge_id = self.coordinator.badge_index.highest_badge_id(
+            kid_info.get("badges", [])
+        )
+        if not badge_id:
+            return None, {}
+        return badge_id, self.coordinator.badges_data.get(badge_id, {})
 
     @property
     def native_value(self) -> str:
@@ -739,22 +809,14 @@ class KidHighestBadgeSensor(CoordinatorEntity, SensorEntity):
 
         If the kid has none, return "None".
         """
-        highest_badge, _ = self._find_highest_badge()
-        return highest_badge if highest_badge else "None"
+        _, badge_data = self._find_highest_badge()
+        return badge_data.get("name") or "None"
 
     @property
     def icon(self):
         """Return the icon for the highest badge. Fall back if none found."""
-        highest_badge, _ = self._find_highest_badge()
+        highest_badge, badge_data = self._find_highest_badge()
         if highest_badge:
-            badge_data = next(
-                (
-                    info
-                    for bid, info in self.coordinator.badges_data.items()
-                    if info.get("name") == highest_badge
-                ),
-                {},
-            )
             return badge_data.get("icon", DEFAULT_TROPHY_ICON)
         return DEFAULT_TROPHY_OUTLINE
 
@@ -762,20 +824,12 @@ class KidHighestBadgeSensor(CoordinatorEntity, SensorEntity):
     def extra_state_attributes(self):
         """Provide additional details."""
         kid_info = self.coordinator.kids_data.get(self._kid_id, {})
-        highest_badge, highest_val = self._find_highest_badge()
+        highest_badge, badge_data = self._find_highest_badge()
 
         current_multiplier = 1.0
         friendly_labels = []
 
         if highest_badge:
-            badge_data = next(
-                (
-                    info
-                    for bid, info in self.coordinator.badges_data.items()
-                    if info.get("name") == highest_badge
-                ),
-                {},
-            )
             current_multiplier = badge_data.get("points_multiplier", 1.0)
             stored_labels = badge_data.get("badge_labels", [])
             friendly_labels = [
@@ -784,14 +838,8 @@ class KidHighestBadgeSensor(CoordinatorEntity, SensorEntity):
 
         # Compute points needed for next badge:
         current_points = kid_info.get("points", 0)
-        # Gather thresholds for badges that are higher than current points
-        thresholds = [
-            badge.get("threshold_value", 0)
-            for badge in self.coordinator.badges_data.values()
-            if badge.get("threshold_value", 0) > current_points
-        ]
-        if thresholds:
-            next_threshold = min(thresholds)
+        next_threshold = self.coordinator.badge_index.next_threshold(current_points)
+        if next_threshold is not None:
             points_to_next_badge = next_threshold - current_points
         else:
             points_to_next_badge = 0
@@ -799,7 +847,7 @@ class KidHighestBadgeSensor(CoordinatorEntity, SensorEntity):
         return {
             ATTR_KID_NAME: self._kid_name,
             ATTR_ALL_EARNED_BADGES: kid_info.get("badges", []),
-            ATTR_HIGHEST_BADGE_THRESHOLD_VALUE: highest_val if highest_badge else 0,
+            ATTR_HIGHEST_BADGE_THRESHOLD_VALUE: badge_data.get("threshold_value", 0),
             ATTR_POINTS_MULTIPLIER: current_multiplier,
             ATTR_POINTS_TO_NEXT_BADGE: points_to_next_badge,
             ATTR_LABELS: friendly_labels,
@@ -893,13 +941,13 @@ class PendingChoreApprovalsSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self):
         """Return a summary of pending chore approvals."""
-        approvals = self.coordinator._data.get(DATA_PENDING_CHORE_APPROVALS, [])
+        approvals = self.coordinator.engine.data.get(DATA_PENDING_CHORE_APPROVALS, [])
         return f"{len(approvals)} pending chores"
 
     @property
     def extra_state_attributes(self):
         """Return detailed pending chores."""
-        approvals = self.coordinator._data.get(DATA_PENDING_CHORE_APPROVALS, [])
+        approvals = self.coordinator.engine.data.get(DATA_PENDING_CHORE_APPROVALS, [])
         grouped_by_kid = {}
 
         for approval in approvals:
@@ -942,16 +990,16 @@ class PendingRewardApprovalsSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self):
         """Return a summary of pending reward approvals."""
-        approvals = self.coordinator._data.get(DATA_PENDING_REWARD_APPROVALS, [])
+        approvals = self.coordinator.engine.data.get(DATA_PENDING_REWARD_APPROVALS, {})
         return f"{len(approvals)} pending rewards"
 
     @property
     def extra_state_attributes(self):
         """Return detailed pending rewards."""
-        approvals = self.coordinator._data.get(DATA_PENDING_REWARD_APPROVALS, [])
+        approvals = self.coordinator.engine.data.get(DATA_PENDING_REWARD_APPROVALS, {})
         grouped_by_kid = {}
 
-        for approval in approvals:
+        for approval in approvals.values():
             kid_name = (
                 self.coordinator._get_kid_name_by_id(approval["kid_id"]) or UNKNOWN_KID
             )
@@ -989,6 +1037,9 @@ class RewardClaimsSensor(CoordinatorEntity, SensorEntity):
         self._reward_id = reward_id
         self._reward_name = reward_name
         self._attr_unique_id = f"{entry.entry_id}_{kid_id}_{reward_id}_reward_claims"
+        self._attr_entity_registry_enabled_default = is_entity_family_enabled(
+            entry, ENTITY_FAMILY_REWARD_CLAIMS
+        )
         self._attr_translation_placeholders = {
             "kid_name": kid_name,
             "reward_name": reward_name,
@@ -1024,6 +1075,9 @@ class RewardApprovalsSensor(CoordinatorEntity, SensorEntity):
         self._reward_id = reward_id
         self._reward_name = reward_name
         self._attr_unique_id = f"{entry.entry_id}_{kid_id}_{reward_id}_reward_approvals"
+        self._attr_entity_registry_enabled_default = is_entity_family_enabled(
+            entry, ENTITY_FAMILY_REWARD_APPROVALS
+        )
         self._attr_translation_placeholders = {
             "kid_name": kid_name,
             "reward_name": reward_name,
@@ -1089,12 +1143,8 @@ class SharedChoreGlobalStateSensor(CoordinatorEntity, SensorEntity):
             get_friendly_label(self.hass, label) for label in stored_labels
         ]
 
-        total_approvals_today = 0
-        for kid_id in assigned_kids_ids:
-            kid_data = self.coordinator.kids_data.get(kid_id, {})
-            total_approvals_today += kid_data.get("today_chore_approvals", {}).get(
-                self._chore_id, 0
-            )
+        chore_counts = self.coordinator.get_chore_state_counts(self._chore_id)
+        total_approvals_today = chore_counts["approvals_today"]
 
         attributes = {
             ATTR_CHORE_NAME: self._chore_name,
@@ -1164,7 +1214,7 @@ class RewardStatusSensor(CoordinatorEntity, SensorEntity):
     def native_value(self) -> str:
         """Return the current reward status: 'Not Claimed', 'Claimed', or 'Approved'."""
         kid_info = self.coordinator.kids_data.get(self._kid_id, {})
-        if self._reward_id in kid_info.get("pending_rewards", []):
+        if self.coordinator.get_pending_reward_count(self._kid_id, self._reward_id):
             return REWARD_STATE_CLAIMED
         if self._reward_id in kid_info.get("redeemed_rewards", []):
             return REWARD_STATE_APPROVED
@@ -1193,6 +1243,12 @@ class RewardStatusSensor(CoordinatorEntity, SensorEntity):
                 self._reward_id, 0
             ),
             ATTR_LABELS: friendly_labels,
+            ATTR_PENDING_REDEMPTIONS: self.coordinator.get_pending_redemption_ids(
+                self._kid_id, self._reward_id
+            ),
+            ATTR_VERSION: self.coordinator.get_reward_version(
+                self._kid_id, self._reward_id
+            ),
         }
 
         return attributes
@@ -1219,6 +1275,9 @@ class ChoreClaimsSensor(CoordinatorEntity, SensorEntity):
         self._chore_id = chore_id
         self._chore_name = chore_name
         self._attr_unique_id = f"{entry.entry_id}_{kid_id}_{chore_id}_chore_claims"
+        self._attr_entity_registry_enabled_default = is_entity_family_enabled(
+            entry, ENTITY_FAMILY_CHORE_CLAIMS
+        )
         self._attr_translation_placeholders = {
             "kid_name": kid_name,
             "chore_name": chore_name,
@@ -1253,6 +1312,9 @@ class ChoreApprovalsSensor(CoordinatorEntity, SensorEntity):
         self._chore_id = chore_id
         self._chore_name = chore_name
         self._attr_unique_id = f"{entry.entry_id}_{kid_id}_{chore_id}_chore_approvals"
+        self._attr_entity_registry_enabled_default = is_entity_family_enabled(
+            entry, ENTITY_FAMILY_CHORE_APPROVALS
+        )
         self._attr_translation_placeholders = {
             "kid_name": kid_name,
             "chore_name": chore_name,
@@ -1287,6 +1349,9 @@ class PenaltyAppliesSensor(CoordinatorEntity, SensorEntity):
         self._penalty_id = penalty_id
         self._penalty_name = penalty_name
         self._attr_unique_id = f"{entry.entry_id}_{kid_id}_{penalty_id}_penalty_applies"
+        self._attr_entity_registry_enabled_default = is_entity_family_enabled(
+            entry, ENTITY_FAMILY_PENALTY_APPLIES
+        )
         self._attr_translation_placeholders = {
             "kid_name": kid_name,
             "penalty_name": penalty_name,
@@ -1347,8 +1412,7 @@ class KidPointsEarnedDailySensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self):
         """Return how many net points the kid has earned so far today."""
-        kid_info = self.coordinator.kids_data.get(self._kid_id, {})
-        return kid_info.get("points_earned_today", 0)
+        return self.coordinator.get_kid_counter(self._kid_id, "points_earned_today")
 
     @property
     def native_unit_of_measurement(self):
@@ -1385,8 +1449,7 @@ class KidPointsEarnedWeeklySensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self):
         """Return how many net points the kid has earned this week."""
-        kid_info = self.coordinator.kids_data.get(self._kid_id, {})
-        return kid_info.get("points_earned_weekly", 0)
+        return self.coordinator.get_kid_counter(self._kid_id, "points_earned_weekly")
 
     @property
     def native_unit_of_measurement(self):
@@ -1423,8 +1486,7 @@ class KidPointsEarnedMonthlySensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self):
         """Return how many net points the kid has earned this month."""
-        kid_info = self.coordinator.kids_data.get(self._kid_id, {})
-        return kid_info.get("points_earned_monthly", 0)
+        return self.coordinator.get_kid_counter(self._kid_id, "points_earned_monthly")
 
     @property
     def native_unit_of_measurement(self):
@@ -1495,13 +1557,9 @@ class AchievementSensor(CoordinatorEntity, SensorEntity):
         elif ach_type == ACHIEVEMENT_TYPE_STREAK:
             total_current = 0
 
+            selected_chore_id = achievement.get("selected_chore_id")
             for kid_id in assigned_kids:
-                progress_data = achievement.get("progress", {}).get(kid_id, {})
-                total_current += (
-                    progress_data.get("current_streak", 0)
-                    if isinstance(progress_data, dict)
-                    else 0
-                )
+                total_current += self.coordinator.get_streak(kid_id, selected_chore_id)
 
             global_target = target * len(assigned_kids)
 
@@ -1511,8 +1569,8 @@ class AchievementSensor(CoordinatorEntity, SensorEntity):
             total_progress = 0
 
             for kid_id in assigned_kids:
-                daily = self.coordinator.kids_data.get(kid_id, {}).get(
-                    "completed_chores_today", 0
+                daily = self.coordinator.get_kid_counter(
+                    kid_id, "completed_chores_today"
                 )
                 kid_progress = (
                     100
@@ -1525,6 +1583,15 @@ class AchievementSensor(CoordinatorEntity, SensorEntity):
 
             percent = total_progress / len(assigned_kids)
 
+        elif ach_type == ACHIEVEMENT_TYPE_RULE:
+            progress = achievement.get("progress", {})
+            awarded_kids = sum(
+                1
+                for kid_id in assigned_kids
+                if progress.get(kid_id, {}).get("awarded", False)
+            )
+            percent = awarded_kids / len(assigned_kids) * 100
+
         else:
             percent = 0
 
@@ -1559,14 +1626,16 @@ class AchievementSensor(CoordinatorEntity, SensorEntity):
         for kid_id in assigned_kids_ids:
             kid_name = self.coordinator._get_kid_name_by_id(kid_id) or kid_id
             progress_data = achievement.get("progress", {}).get(kid_id, {})
-            if ach_type == ACHIEVEMENT_TYPE_TOTAL:
+            if ach_type in (ACHIEVEMENT_TYPE_TOTAL, ACHIEVEMENT_TYPE_RULE):
                 kids_progress[kid_name] = progress_data.get("current_value", 0)
             elif ach_type == ACHIEVEMENT_TYPE_STREAK:
-                kids_progress[kid_name] = progress_data.get("current_streak", 0)
+                kids_progress[kid_name] = self.coordinator.get_streak(
+                    kid_id, achievement.get("selected_chore_id")
+                )
             elif achievement.get("type") == ACHIEVEMENT_TYPE_DAILY_MIN:
-                kids_progress[kid_name] = self.coordinator.kids_data.get(
-                    kid_id, {}
-                ).get("completed_chores_today", 0)
+                kids_progress[kid_name] = self.coordinator.get_kid_counter(
+                    kid_id, "completed_chores_today"
+                )
             else:
                 kids_progress[kid_name] = 0
 
@@ -1634,13 +1703,15 @@ class ChallengeSensor(CoordinatorEntity, SensorEntity):
         for kid_id in assigned_kids:
             progress_data = challenge.get("progress", {}).get(kid_id, {})
 
-            if challenge_type == CHALLENGE_TYPE_TOTAL_WITHIN_WINDOW:
+            if challenge_type in (
+                CHALLENGE_TYPE_TOTAL_WITHIN_WINDOW,
+                CHALLENGE_TYPE_RULE,
+            ):
                 total_progress += progress_data.get("count", 0)
 
             elif challenge_type == CHALLENGE_TYPE_DAILY_MIN:
                 if isinstance(progress_data, dict):
-                    daily_counts = progress_data.get("daily_counts", {})
-                    total_progress += sum(daily_counts.values())
+                    total_progress += progress_data.get("total_count", 0)
 
                 else:
                     total_progress += 0
@@ -1684,13 +1755,14 @@ class ChallengeSensor(CoordinatorEntity, SensorEntity):
         for kid_id in assigned_kids_ids:
             kid_name = self.coordinator._get_kid_name_by_id(kid_id) or kid_id
             progress_data = challenge.get("progress", {}).get(kid_id, {})
-            if challenge_type == CHALLENGE_TYPE_TOTAL_WITHIN_WINDOW:
+            if challenge_type in (
+                CHALLENGE_TYPE_TOTAL_WITHIN_WINDOW,
+                CHALLENGE_TYPE_RULE,
+            ):
                 kids_progress[kid_name] = progress_data.get("count", 0)
             elif challenge_type == CHALLENGE_TYPE_DAILY_MIN:
                 if isinstance(progress_data, dict):
-                    kids_progress[kid_name] = sum(
-                        progress_data.get("daily_counts", {}).values()
-                    )
+                    kids_progress[kid_name] = progress_data.get("total_count", 0)
                 else:
                     kids_progress[kid_name] = 0
             else:
@@ -1783,23 +1855,23 @@ class AchievementProgressSensor(CoordinatorEntity, SensorEntity):
             )
 
         elif ach_type == ACHIEVEMENT_TYPE_STREAK:
-            progress_data = achievement.get("progress", {}).get(self._kid_id, {})
-
-            progress = (
-                progress_data.get("current_streak", 0)
-                if isinstance(progress_data, dict)
-                else 0
+            progress = self.coordinator.get_streak(
+                self._kid_id, achievement.get("selected_chore_id")
             )
 
             percent = (progress / target * 100) if target > 0 else 0
 
         elif ach_type == ACHIEVEMENT_TYPE_DAILY_MIN:
-            daily = self.coordinator.kids_data.get(self._kid_id, {}).get(
-                "completed_chores_today", 0
+            daily = self.coordinator.get_kid_counter(
+                self._kid_id, "completed_chores_today"
             )
 
             percent = (daily / target * 100) if target > 0 else 0
 
+        elif ach_type == ACHIEVEMENT_TYPE_RULE:
+            progress_data = achievement.get("progress", {}).get(self._kid_id, {})
+            percent = 100 if progress_data.get("awarded", False) else 0
+
         else:
             percent = 0
 
@@ -1817,7 +1889,7 @@ class AchievementProgressSensor(CoordinatorEntity, SensorEntity):
             else False
         )
 
-        if achievement.get("type") == ACHIEVEMENT_TYPE_TOTAL:
+        if achievement.get("type") in (ACHIEVEMENT_TYPE_TOTAL, ACHIEVEMENT_TYPE_RULE):
             raw_progress = (
                 progress_data.get("current_value", 0)
                 if isinstance(progress_data, dict)
@@ -1825,15 +1897,13 @@ class AchievementProgressSensor(CoordinatorEntity, SensorEntity):
             )
 
         elif achievement.get("type") == ACHIEVEMENT_TYPE_STREAK:
-            raw_progress = (
-                progress_data.get("current_streak", 0)
-                if isinstance(progress_data, dict)
-                else 0
+            raw_progress = self.coordinator.get_streak(
+                self._kid_id, achievement.get("selected_chore_id")
             )
 
         elif achievement.get("type") == ACHIEVEMENT_TYPE_DAILY_MIN:
-            raw_progress = self.coordinator.kids_data.get(self._kid_id, {}).get(
-                "completed_chores_today", 0
+            raw_progress = self.coordinator.get_kid_counter(
+                self._kid_id, "completed_chores_today"
             )
 
         associated_chore = ""
@@ -1919,15 +1989,14 @@ class ChallengeProgressSensor(CoordinatorEntity, SensorEntity):
         challenge_type = challenge.get("type")
         progress_data = challenge.get("progress", {}).get(self._kid_id)
 
-        if challenge_type == CHALLENGE_TYPE_TOTAL_WITHIN_WINDOW:
+        if challenge_type in (CHALLENGE_TYPE_TOTAL_WITHIN_WINDOW, CHALLENGE_TYPE_RULE):
             raw_progress = (
                 progress_data.get("count", 0) if isinstance(progress_data, dict) else 0
             )
 
         elif challenge_type == CHALLENGE_TYPE_DAILY_MIN:
             if isinstance(progress_data, dict):
-                daily_counts = progress_data.get("daily_counts", {})
-                raw_progress = sum(daily_counts.values())
+                raw_progress = progress_data.get("total_count", 0)
                 # Optionally, compute target as required_daily * number_of_days:
                 start_date = dt_util.parse_datetime(challenge.get("start_date"))
                 end_date = dt_util.parse_datetime(challenge.get("end_date"))
@@ -1963,14 +2032,13 @@ class ChallengeProgressSensor(CoordinatorEntity, SensorEntity):
             else False
         )
 
-        if challenge_type == CHALLENGE_TYPE_TOTAL_WITHIN_WINDOW:
+        if challenge_type in (CHALLENGE_TYPE_TOTAL_WITHIN_WINDOW, CHALLENGE_TYPE_RULE):
             raw_progress = (
                 progress_data.get("count", 0) if isinstance(progress_data, dict) else 0
             )
         elif challenge_type == CHALLENGE_TYPE_DAILY_MIN:
             if isinstance(progress_data, dict):
-                daily_counts = progress_data.get("daily_counts", {})
-                raw_progress = sum(daily_counts.values())
+                raw_progress = progress_data.get("total_count", 0)
             else:
                 raw_progress = 0
         else:
@@ -2048,26 +2116,21 @@ class KidHighestStreakSensor(CoordinatorEntity, SensorEntity):
 
     @property
     def native_value(self) -> int:
-        """Return the highest current streak among all streak achievements for the kid."""
-        kid_info = self.coordinator.kids_data.get(self._kid_id, {})
-        return kid_info.get("overall_chore_streak", 0)
+        """Return the kid's overall streak of days with an approved chore."""
+        return self.coordinator.get_streak(self._kid_id)
 
     @property
     def extra_state_attributes(self) -> dict:
         """Return extra attributes including individual streaks per achievement."""
         streaks = {}
-        for achievement in self.coordinator.achievements_data.values():
-            if achievement.get("type") == ACHIEVEMENT_TYPE_STREAK:
-                achievement_name = achievement.get("name", "Unnamed Achievement")
-                progress_for_kid = achievement.get("progress", {}).get(self._kid_id)
-
-                if isinstance(progress_for_kid, dict):
-                    streaks[achievement_name] = progress_for_kid.get(
-                        "current_streak", 0
-                    )
-
-                elif isinstance(progress_for_kid, int):
-                    streaks[achievement_name] = progress_for_kid
+        for achievement_id in self.coordinator.rule_index.achievements.matching(
+            ACHIEVEMENT_TYPE_STREAK, self._kid_id
+        ):
+            achievement = self.coordinator.achievements_data[achievement_id]
+            achievement_name = achievement.get("name", "Unnamed Achievement")
+            streaks[achievement_name] = self.coordinator.get_streak(
+                self._kid_id, achievement.get("selected_chore_id")
+            )
 
         return {"streaks_by_achievement": streaks}
 
@@ -2101,6 +2164,9 @@ class ChoreStreakSensor(CoordinatorEntity, SensorEntity):
         self._chore_id = chore_id
         self._chore_name = chore_name
         self._attr_unique_id = f"{entry.entry_id}_{kid_id}_{chore_id}_streak"
+        self._attr_entity_registry_enabled_default = is_entity_family_enabled(
+            entry, ENTITY_FAMILY_CHORE_STREAK
+        )
         self._attr_native_unit_of_measurement = UnitOfTime.DAYS
         self._attr_translation_placeholders = {
             "kid_name": kid_name,
@@ -2111,32 +2177,17 @@ class ChoreStreakSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self) -> int:
         """Return the current streak (in days) for this kid and chore."""
-        kid_info = self.coordinator.kids_data.get(self._kid_id, {})
-        streaks = kid_info.get("chore_streaks", {})
-        streak_info = streaks.get(self._chore_id, {})
-        return streak_info.get("current_streak", 0)
+        return self.coordinator.get_streak(self._kid_id, self._chore_id)
 
     @property
     def extra_state_attributes(self) -> dict:
         """Return extra attributes such as the last approved date for this streak."""
-        attributes = {}
-        for achievement in self.coordinator.achievements_data.values():
-            if (
-                achievement.get("type") == ACHIEVEMENT_TYPE_STREAK
-                and achievement.get("selected_chore_id") == self._chore_id
-            ):
-                progress_for_kid = achievement.get("progress", {}).get(self._kid_id)
-
-                if isinstance(progress_for_kid, dict):
-                    attributes[ATTR_LAST_DATE] = progress_for_kid.get("last_date")
-                    attributes[ATTR_RAW_STREAK] = progress_for_kid.get(
-                        "current_streak", 0
-                    )
-
-                elif isinstance(progress_for_kid, int):
-                    attributes[ATTR_LAST_DATE] = None
-                    attributes[ATTR_RAW_STREAK] = progress_for_kid
-                break
+        attributes = {
+            ATTR_LAST_DATE: self.coordinator.get_streak_last_date(
+                self._kid_id, self._chore_id
+            ),
+            ATTR_RAW_STREAK: self.coordinator.get_streak(self._kid_id, self._chore_id),
+        }
         return attributes
 
     @property
@@ -2161,6 +2212,9 @@ class BonusAppliesSensor(CoordinatorEntity, SensorEntity):
         self._bonus_id = bonus_id
         self._bonus_name = bonus_name
         self._attr_unique_id = f"{entry.entry_id}_{kid_id}_{bonus_id}_bonus_applies"
+        self._attr_entity_registry_enabled_default = is_entity_family_enabled(
+            entry, ENTITY_FAMILY_BONUS_APPLIES
+        )
         self._attr_translation_placeholders = {
             "kid_name": kid_name,
             "bonus_name": bonus_name,
@@ -2196,3 +2250,127 @@ class BonusAppliesSensor(CoordinatorEntity, SensorEntity):
         """Return the bonus's custom icon if set, else fallback."""
         bonus_info = self.coordinator.bonuses_data.get(self._bonus_id, {})
         return bonus_info.get("icon", DEFAULT_BONUS_ICON)
+
+
+# ------------------------------------------------------------------------------------------
+class KidSummarySensor(CoordinatorEntity, SensorEntity):
+    """Compact mode sensor summarizing a kid's chores, rewards, penalties and bonuses.
+
+    Replaces the per-chore, per-reward, per-penalty and per-bonus sensors and
+    buttons; actions go through the KidsChores services instead. The state is the
+    number of assigned chores not yet approved.
+    """
+
+    _attr_has_entity_name = True
+    _attr_translation_key = "kid_summary_sensor"
+
+    # Keep the per-item maps out of the recorder; the state is recorded
+    _unrecorded_attributes = frozenset(
+        {ATTR_CHORES, ATTR_REWARDS, ATTR_PENALTIES, ATTR_BONUSES}
+    )
+
+    def __init__(
+        self,
+        coordinator: KidsChoresDataCoordinator,
+        entry: ConfigEntry,
+        kid_id: str,
+        kid_name: str,
+    ):
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._entry = entry
+        self._kid_id = kid_id
+        self._kid_name = kid_name
+        self._attr_unique_id = f"{entry.entry_id}_{kid_id}_summary"
+        self._attr_translation_placeholders = {
+            "kid_name": kid_name,
+        }
+        self.entity_id = f"sensor.kc_{kid_name}_summary"
+
+    def _chore_states(self) -> dict[str, str]:
+        """Return chore_id => the kid's state for each chore assigned to the kid."""
+        kid_info = self.coordinator.kids_data.get(self._kid_id, {})
+        return {
+            chore_id: self.coordinator._kid_chore_state(kid_info, chore_id)
+            for chore_id, chore_info in self.coordinator.chores_data.items()
+            if self._kid_id in chore_info.get("assigned_kids", [])
+        }
+
+    @property
+    def native_value(self) -> int:
+        """Return how many assigned chores the kid still has to get approved."""
+        return sum(
+            1
+            for state in self._chore_states().values()
+            if state != CHORE_STATE_APPROVED
+        )
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return per chore, reward, penalty and bonus details keyed by name."""
+        kid_info = self.coordinator.kids_data.get(self._kid_id, {})
+        chore_states = self._chore_states()
+
+        chores = {}
+        for chore_id, state in chore_states.items():
+            chore_info = self.coordinator.chores_data[chore_id]
+            chores[chore_info.get("name", chore_id)] = {
+                "state": state,
+                ATTR_CHORE_CLAIMS_COUNT: kid_info.get("chore_claims", {}).get(
+                    chore_id, 0
+                ),
+                ATTR_CHORE_APPROVALS_COUNT: kid_info.get("chore_approvals", {}).get(
+                    chore_id, 0
+                ),
+                ATTR_CHORE_CURRENT_STREAK: self.coordinator.get_streak(
+                    self._kid_id, chore_id
+                ),
+                ATTR_DUE_DATE: chore_info.get("due_date", DUE_DATE_NOT_SET),
+                ATTR_DEFAULT_POINTS: chore_info.get("default_points", 0),
+            }
+
+        rewards = {}
+        for reward_id, reward_info in self.coordinator.rewards_data.items():
+            if self.coordinator.get_pending_reward_count(self._kid_id, reward_id):
+                reward_state = REWARD_STATE_CLAIMED
+            elif reward_id in kid_info.get("redeemed_rewards", []):
+                reward_state = REWARD_STATE_APPROVED
+            else:
+                reward_state = REWARD_STATE_NOT_CLAIMED
+            rewards[reward_info.get("name", reward_id)] = {
+                "state": reward_state,
+                ATTR_COST: reward_info.get("cost", DEFAULT_REWARD_COST),
+                ATTR_REWARD_CLAIMS_COUNT: kid_info.get("reward_claims", {}).get(
+                    reward_id, 0
+                ),
+                ATTR_REWARD_APPROVALS_COUNT: kid_info.get("reward_approvals", {}).get(
+                    reward_id, 0
+                ),
+            }
+
+        penalty_applies = kid_info.get("penalty_applies", {})
+        bonus_applies = kid_info.get("bonus_applies", {})
+
+        return {
+            ATTR_KID_NAME: self._kid_name,
+            ATTR_OPEN_CHORES: [
+                self.coordinator.chores_data[chore_id].get("name", chore_id)
+                for chore_id, state in chore_states.items()
+                if state != CHORE_STATE_APPROVED
+            ],
+            ATTR_CHORES: chores,
+            ATTR_REWARDS: rewards,
+            ATTR_PENALTIES: {
+                penalty_info.get("name", penalty_id): penalty_applies.get(penalty_id, 0)
+                for penalty_id, penalty_info in self.coordinator.penalties_data.items()
+            },
+            ATTR_BONUSES: {
+                bonus_info.get("name", bonus_id): bonus_applies.get(bonus_id, 0)
+                for bonus_id, bonus_info in self.coordinator.bonuses_data.items()
+            },
+        }
+
+    @property
+    def icon(self) -> str:
+        """Return the kid summary icon."""
+        return DEFAULT_COMPACT_SUMMARY_ICON
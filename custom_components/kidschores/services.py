@@ -6,34 +6,52 @@ Includes UI editor support with selectors for dropdowns and text inputs.
 """
 
 import asyncio
+import copy
 import voluptuous as vol
 
 from typing import Optional
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv
 from homeassistant.util import dt as dt_util
 
 from .const import (
     CHORE_STATE_OVERDUE,
-    CHORE_STATE_PENDING,
     DATA_CHORES,
-    DATA_PENDING_CHORE_APPROVALS,
     DOMAIN,
+    FREQUENCY_DAILY,
+    FREQUENCY_MONTHLY,
+    FREQUENCY_WEEKLY,
     ERROR_CHORE_NOT_FOUND_FMT,
+    ERROR_ENTRY_AMBIGUOUS,
+    ERROR_ENTRY_NOT_FOUND_FMT,
     ERROR_KID_NOT_FOUND_FMT,
     ERROR_NOT_AUTHORIZED_FMT,
     FIELD_CHORE_ID,
     FIELD_CHORE_NAME,
+    FIELD_COMPLETE_CHORES,
+    FIELD_CONFIG_ENTRY_ID,
+    FIELD_DAYS,
     FIELD_DUE_DATE,
+    FIELD_END,
+    FIELD_EXPECTED_VERSION,
     FIELD_KID_NAME,
     FIELD_PARENT_NAME,
     FIELD_PENALTY_NAME,
+    FIELD_PERIOD,
     FIELD_POINTS_AWARDED,
+    FIELD_REDEMPTION_ID,
     FIELD_REWARD_NAME,
+    FIELD_START,
     FIELD_BONUS_NAME,
     LOGGER,
     MSG_NO_ENTRY_FOUND,
+    PROJECTION_MAX_DAYS,
     SERVICE_APPLY_PENALTY,
     SERVICE_APPLY_BONUS,
     SERVICE_APPROVE_CHORE,
@@ -41,6 +59,9 @@ from .const import (
     SERVICE_CLAIM_CHORE,
     SERVICE_DISAPPROVE_CHORE,
     SERVICE_DISAPPROVE_REWARD,
+    SERVICE_GET_CHORE_HISTORY,
+    SERVICE_GET_POINTS_HISTORY,
+    SERVICE_PROJECT,
     SERVICE_REDEEM_REWARD,
     SERVICE_RESET_ALL_CHORES,
     SERVICE_RESET_ALL_DATA,
@@ -49,11 +70,16 @@ from .const import (
     SERVICE_RESET_BONUSES,
     SERVICE_RESET_REWARDS,
     SERVICE_SET_CHORE_DUE_DATE,
+    SERVICE_SIMULATE,
     SERVICE_SKIP_CHORE_DUE_DATE,
+    SIMULATION_MAX_DAYS,
 )
 from .coordinator import KidsChoresDataCoordinator
+from .entry_router import async_get_entry_router
 from .kc_helpers import is_user_authorized_for_global_action, is_user_authorized_for_kid
 from .flow_helpers import ensure_utc_datetime
+from .projection import project_household
+from .simulation import simulate_household
 
 
 # --- Service Schemas ---
@@ -61,6 +87,7 @@ CLAIM_CHORE_SCHEMA = vol.Schema(
     {
         vol.Required(FIELD_KID_NAME): cv.string,
         vol.Required(FIELD_CHORE_NAME): cv.string,
+        vol.Optional(FIELD_CONFIG_ENTRY_ID): cv.string,
     }
 )
 
@@ -70,6 +97,8 @@ APPROVE_CHORE_SCHEMA = vol.Schema(
         vol.Required(FIELD_KID_NAME): cv.string,
         vol.Required(FIELD_CHORE_NAME): cv.string,
         vol.Optional(FIELD_POINTS_AWARDED): vol.Coerce(float),
+        vol.Optional(FIELD_EXPECTED_VERSION): vol.Coerce(int),
+        vol.Optional(FIELD_CONFIG_ENTRY_ID): cv.string,
     }
 )
 
@@ -78,6 +107,8 @@ DISAPPROVE_CHORE_SCHEMA = vol.Schema(
         vol.Required(FIELD_PARENT_NAME): cv.string,
         vol.Required(FIELD_KID_NAME): cv.string,
         vol.Required(FIELD_CHORE_NAME): cv.string,
+        vol.Optional(FIELD_EXPECTED_VERSION): vol.Coerce(int),
+        vol.Optional(FIELD_CONFIG_ENTRY_ID): cv.string,
     }
 )
 
@@ -86,6 +117,7 @@ REDEEM_REWARD_SCHEMA = vol.Schema(
         vol.Required(FIELD_PARENT_NAME): cv.string,
         vol.Required(FIELD_KID_NAME): cv.string,
         vol.Required(FIELD_REWARD_NAME): cv.string,
+        vol.Optional(FIELD_CONFIG_ENTRY_ID): cv.string,
     }
 )
 
@@ -94,6 +126,9 @@ APPROVE_REWARD_SCHEMA = vol.Schema(
         vol.Required(FIELD_PARENT_NAME): cv.string,
         vol.Required(FIELD_KID_NAME): cv.string,
         vol.Required(FIELD_REWARD_NAME): cv.string,
+        vol.Optional(FIELD_EXPECTED_VERSION): vol.Coerce(int),
+        vol.Optional(FIELD_REDEMPTION_ID): cv.string,
+        vol.Optional(FIELD_CONFIG_ENTRY_ID): cv.string,
     }
 )
 
@@ -102,6 +137,8 @@ DISAPPROVE_REWARD_SCHEMA = vol.Schema(
         vol.Required(FIELD_PARENT_NAME): cv.string,
         vol.Required(FIELD_KID_NAME): cv.string,
         vol.Required(FIELD_REWARD_NAME): cv.string,
+        vol.Optional(FIELD_REDEMPTION_ID): cv.string,
+        vol.Optional(FIELD_CONFIG_ENTRY_ID): cv.string,
     }
 )
 
@@ -110,6 +147,7 @@ APPLY_PENALTY_SCHEMA = vol.Schema(
         vol.Required(FIELD_PARENT_NAME): cv.string,
         vol.Required(FIELD_KID_NAME): cv.string,
         vol.Required(FIELD_PENALTY_NAME): cv.string,
+        vol.Optional(FIELD_CONFIG_ENTRY_ID): cv.string,
     }
 )
 
@@ -118,6 +156,7 @@ APPLY_BONUS_SCHEMA = vol.Schema(
         vol.Required(FIELD_PARENT_NAME): cv.string,
         vol.Required(FIELD_KID_NAME): cv.string,
         vol.Required(FIELD_BONUS_NAME): cv.string,
+        vol.Optional(FIELD_CONFIG_ENTRY_ID): cv.string,
     }
 )
 
@@ -126,6 +165,7 @@ RESET_OVERDUE_CHORES_SCHEMA = vol.Schema(
         vol.Optional(FIELD_CHORE_ID): cv.string,
         vol.Optional(FIELD_CHORE_NAME): cv.string,
         vol.Optional(FIELD_KID_NAME): cv.string,
+        vol.Optional(FIELD_CONFIG_ENTRY_ID): cv.string,
     }
 )
 
@@ -133,6 +173,7 @@ RESET_PENALTIES_SCHEMA = vol.Schema(
     {
         vol.Optional(FIELD_KID_NAME): cv.string,
         vol.Optional(FIELD_PENALTY_NAME): cv.string,
+        vol.Optional(FIELD_CONFIG_ENTRY_ID): cv.string,
     }
 )
 
@@ -140,6 +181,7 @@ RESET_BONUSES_SCHEMA = vol.Schema(
     {
         vol.Optional(FIELD_KID_NAME): cv.string,
         vol.Optional(FIELD_BONUS_NAME): cv.string,
+        vol.Optional(FIELD_CONFIG_ENTRY_ID): cv.string,
     }
 )
 
@@ -147,17 +189,70 @@ RESET_REWARDS_SCHEMA = vol.Schema(
     {
         vol.Optional(FIELD_KID_NAME): cv.string,
         vol.Optional(FIELD_REWARD_NAME): cv.string,
+        vol.Optional(FIELD_CONFIG_ENTRY_ID): cv.string,
+    }
+)
+
+RESET_ALL_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Optional(FIELD_CONFIG_ENTRY_ID): cv.string,
     }
 )
 
-RESET_ALL_DATA_SCHEMA = vol.Schema({})
+RESET_ALL_CHORES_SCHEMA = vol.Schema(
+    {
+        vol.Optional(FIELD_CONFIG_ENTRY_ID): cv.string,
+    }
+)
 
-RESET_ALL_CHORES_SCHEMA = vol.Schema({})
+GET_POINTS_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Required(FIELD_KID_NAME): cv.string,
+        vol.Optional(FIELD_PERIOD, default=FREQUENCY_DAILY): vol.In(
+            [FREQUENCY_DAILY, FREQUENCY_WEEKLY, FREQUENCY_MONTHLY]
+        ),
+        vol.Optional(FIELD_START): cv.datetime,
+        vol.Optional(FIELD_END): cv.datetime,
+        vol.Optional(FIELD_CONFIG_ENTRY_ID): cv.string,
+    }
+)
+
+GET_CHORE_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Required(FIELD_KID_NAME): cv.string,
+        vol.Required(FIELD_CHORE_NAME): cv.string,
+        vol.Optional(FIELD_START): cv.date,
+        vol.Optional(FIELD_END): cv.date,
+        vol.Optional(FIELD_CONFIG_ENTRY_ID): cv.string,
+    }
+)
+
+SIMULATE_SCHEMA = vol.Schema(
+    {
+        vol.Required(FIELD_DAYS): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=SIMULATION_MAX_DAYS)
+        ),
+        vol.Optional(FIELD_COMPLETE_CHORES, default=False): cv.boolean,
+        vol.Optional(FIELD_START): cv.datetime,
+        vol.Optional(FIELD_CONFIG_ENTRY_ID): cv.string,
+    }
+)
+
+PROJECT_SCHEMA = vol.Schema(
+    {
+        vol.Required(FIELD_DAYS): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=PROJECTION_MAX_DAYS)
+        ),
+        vol.Optional(FIELD_KID_NAME): cv.string,
+        vol.Optional(FIELD_CONFIG_ENTRY_ID): cv.string,
+    }
+)
 
 SET_CHORE_DUE_DATE_SCHEMA = vol.Schema(
     {
         vol.Required(FIELD_CHORE_NAME): cv.string,
         vol.Optional(FIELD_DUE_DATE): vol.Any(cv.string, None),
+        vol.Optional(FIELD_CONFIG_ENTRY_ID): cv.string,
     }
 )
 
@@ -165,6 +260,7 @@ SKIP_CHORE_DUE_DATE_SCHEMA = vol.Schema(
     {
         vol.Optional(FIELD_CHORE_ID): cv.string,
         vol.Optional(FIELD_CHORE_NAME): cv.string,
+        vol.Optional(FIELD_CONFIG_ENTRY_ID): cv.string,
     }
 )
 
@@ -174,14 +270,11 @@ def async_setup_services(hass: HomeAssistant):
 
     async def handle_claim_chore(call: ServiceCall):
         """Handle claiming a chore."""
-        entry_id = _get_first_kidschores_entry(hass)
-        if not entry_id:
+        coordinator = _get_coordinator_for_call(hass, call)
+        if not coordinator:
             LOGGER.warning("Claim Chore: %s", MSG_NO_ENTRY_FOUND)
             return
 
-        coordinator: KidsChoresDataCoordinator = hass.data[DOMAIN][entry_id][
-            "coordinator"
-        ]
         user_id = call.context.user_id
         kid_name = call.data[FIELD_KID_NAME]
         chore_name = call.data[FIELD_CHORE_NAME]
@@ -203,8 +296,11 @@ def async_setup_services(hass: HomeAssistant):
             raise HomeAssistantError(ERROR_NOT_AUTHORIZED_FMT.format("claim chores"))
 
         # Process chore claim
-        coordinator.claim_chore(
-            kid_id=kid_id, chore_id=chore_id, user_name=f"user:{user_id}"
+        await coordinator.command_queue.async_submit(
+            coordinator.claim_chore,
+            kid_id=kid_id,
+            chore_id=chore_id,
+            user_name=f"user:{user_id}",
         )
 
         LOGGER.info(
@@ -213,24 +309,21 @@ def async_setup_services(hass: HomeAssistant):
             kid_name,
             user_id,
         )
-        await coordinator.async_request_refresh()
+        await coordinator.async_request_refresh_if_needed()
 
     async def handle_approve_chore(call: ServiceCall):
         """Handle approving a claimed chore."""
-        entry_id = _get_first_kidschores_entry(hass)
-
-        if not entry_id:
+        coordinator = _get_coordinator_for_call(hass, call)
+        if not coordinator:
             LOGGER.warning("Approve Chore: %s", MSG_NO_ENTRY_FOUND)
             return
 
-        coordinator: KidsChoresDataCoordinator = hass.data[DOMAIN][entry_id][
-            "coordinator"
-        ]
         user_id = call.context.user_id
         parent_name = call.data[FIELD_PARENT_NAME]
         kid_name = call.data[FIELD_KID_NAME]
         chore_name = call.data[FIELD_CHORE_NAME]
         points_awarded = call.data.get(FIELD_POINTS_AWARDED)
+        expected_version = call.data.get(FIELD_EXPECTED_VERSION)
 
         # Map kid_name and chore_name to internal_ids
         kid_id = _get_kid_id_by_name(coordinator, kid_name)
@@ -245,7 +338,7 @@ def async_setup_services(hass: HomeAssistant):
 
         # Check if user is authorized
         if user_id and not await is_user_authorized_for_global_action(
-            hass, user_id, kid_id
+            hass, user_id, kid_id, entry_id=coordinator.config_entry.entry_id
         ):
             LOGGER.warning("Approve Chore: User not authorized")
             raise HomeAssistantError(
@@ -254,11 +347,13 @@ def async_setup_services(hass: HomeAssistant):
 
         # Approve chore and assign points
         try:
-            coordinator.approve_chore(
+            await coordinator.command_queue.async_submit(
+                coordinator.approve_chore,
                 parent_name=parent_name,
                 kid_id=kid_id,
                 chore_id=chore_id,
                 points_awarded=points_awarded,
+                expected_version=expected_version,
             )
             LOGGER.info(
                 "Chore '%s' approved for kid '%s' by parent '%s'. Points Awarded: %s",
@@ -267,7 +362,7 @@ def async_setup_services(hass: HomeAssistant):
                 parent_name,
                 points_awarded,
             )
-            await coordinator.async_request_refresh()
+            await coordinator.async_request_refresh_if_needed()
         except HomeAssistantError as e:
             LOGGER.error("Approve Chore: %s", e)
             raise
@@ -284,14 +379,11 @@ def async_setup_services(hass: HomeAssistant):
 
     async def handle_disapprove_chore(call: ServiceCall):
         """Handle disapproving a chore."""
-        entry_id = _get_first_kidschores_entry(hass)
-        if not entry_id:
+        coordinator = _get_coordinator_for_call(hass, call)
+        if not coordinator:
             LOGGER.warning("Disapprove Chore: %s", MSG_NO_ENTRY_FOUND)
             return
 
-        coordinator: KidsChoresDataCoordinator = hass.data[DOMAIN][entry_id][
-            "coordinator"
-        ]
         parent_name = call.data[FIELD_PARENT_NAME]
         kid_name = call.data[FIELD_KID_NAME]
         chore_name = call.data[FIELD_CHORE_NAME]
@@ -310,7 +402,7 @@ def async_setup_services(hass: HomeAssistant):
         # Check if user is authorized
         user_id = call.context.user_id
         if user_id and not await is_user_authorized_for_global_action(
-            hass, user_id, kid_id
+            hass, user_id, kid_id, entry_id=coordinator.config_entry.entry_id
         ):
             LOGGER.warning("Disapprove Chore: User not authorized")
             raise HomeAssistantError(
@@ -318,10 +410,12 @@ def async_setup_services(hass: HomeAssistant):
             )
 
         # Disapprove the chore
-        coordinator.disapprove_chore(
+        await coordinator.command_queue.async_submit(
+            coordinator.disapprove_chore,
             parent_name=parent_name,
             kid_id=kid_id,
             chore_id=chore_id,
+            expected_version=call.data.get(FIELD_EXPECTED_VERSION),
         )
         LOGGER.info(
             "Chore '%s' disapproved for kid '%s' by parent '%s'",
@@ -329,18 +423,15 @@ def async_setup_services(hass: HomeAssistant):
             kid_name,
             parent_name,
         )
-        await coordinator.async_request_refresh()
+        await coordinator.async_request_refresh_if_needed()
 
     async def handle_redeem_reward(call: ServiceCall):
         """Handle redeeming a reward (claiming without deduction)."""
-        entry_id = _get_first_kidschores_entry(hass)
-        if not entry_id:
+        coordinator = _get_coordinator_for_call(hass, call)
+        if not coordinator:
             LOGGER.warning("Redeem Reward: %s", MSG_NO_ENTRY_FOUND)
             return
 
-        coordinator: KidsChoresDataCoordinator = hass.data[DOMAIN][entry_id][
-            "coordinator"
-        ]
         parent_name = call.data[FIELD_PARENT_NAME]
         kid_name = call.data[FIELD_KID_NAME]
         reward_name = call.data[FIELD_REWARD_NAME]
@@ -383,8 +474,11 @@ def async_setup_services(hass: HomeAssistant):
 
         # Process reward claim without deduction
         try:
-            coordinator.redeem_reward(
-                parent_name=parent_name, kid_id=kid_id, reward_id=reward_id
+            await coordinator.command_queue.async_submit(
+                coordinator.redeem_reward,
+                parent_name=parent_name,
+                kid_id=kid_id,
+                reward_id=reward_id,
             )
             LOGGER.info(
                 "Reward '%s' claimed by kid '%s' and pending approval by parent '%s'",
@@ -392,7 +486,7 @@ def async_setup_services(hass: HomeAssistant):
                 kid_name,
                 parent_name,
             )
-            await coordinator.async_request_refresh()
+            await coordinator.async_request_refresh_if_needed()
         except HomeAssistantError as e:
             LOGGER.error("Redeem Reward: %s", e)
             raise
@@ -409,14 +503,11 @@ def async_setup_services(hass: HomeAssistant):
 
     async def handle_approve_reward(call: ServiceCall):
         """Handle approving a reward claimed by a kid."""
-        entry_id = _get_first_kidschores_entry(hass)
-        if not entry_id:
+        coordinator = _get_coordinator_for_call(hass, call)
+        if not coordinator:
             LOGGER.warning("Approve Reward: %s", MSG_NO_ENTRY_FOUND)
             return
 
-        coordinator: KidsChoresDataCoordinator = hass.data[DOMAIN][entry_id][
-            "coordinator"
-        ]
         user_id = call.context.user_id
         parent_name = call.data[FIELD_PARENT_NAME]
         kid_name = call.data[FIELD_KID_NAME]
@@ -435,7 +526,7 @@ def async_setup_services(hass: HomeAssistant):
 
         # Check if user is authorized
         if user_id and not await is_user_authorized_for_global_action(
-            hass, user_id, kid_id
+            hass, user_id, kid_id, entry_id=coordinator.config_entry.entry_id
         ):
             LOGGER.warning("Approve Reward: User not authorized")
             raise HomeAssistantError(
@@ -444,8 +535,13 @@ def async_setup_services(hass: HomeAssistant):
 
         # Approve reward redemption and deduct points
         try:
-            coordinator.approve_reward(
-                parent_name=parent_name, kid_id=kid_id, reward_id=reward_id
+            await coordinator.command_queue.async_submit(
+                coordinator.approve_reward,
+                parent_name=parent_name,
+                kid_id=kid_id,
+                reward_id=reward_id,
+                expected_version=call.data.get(FIELD_EXPECTED_VERSION),
+                redemption_id=call.data.get(FIELD_REDEMPTION_ID),
             )
             LOGGER.info(
                 "Reward '%s' approved for kid '%s' by parent '%s'",
@@ -453,7 +549,7 @@ def async_setup_services(hass: HomeAssistant):
                 kid_name,
                 parent_name,
             )
-            await coordinator.async_request_refresh()
+            await coordinator.async_request_refresh_if_needed()
         except HomeAssistantError as e:
             LOGGER.error("Approve Reward: %s", e)
             raise
@@ -470,14 +566,11 @@ def async_setup_services(hass: HomeAssistant):
 
     async def handle_disapprove_reward(call: ServiceCall):
         """Handle disapproving a reward."""
-        entry_id = _get_first_kidschores_entry(hass)
-        if not entry_id:
+        coordinator = _get_coordinator_for_call(hass, call)
+        if not coordinator:
             LOGGER.warning("Disapprove Reward: %s", MSG_NO_ENTRY_FOUND)
             return
 
-        coordinator: KidsChoresDataCoordinator = hass.data[DOMAIN][entry_id][
-            "coordinator"
-        ]
         parent_name = call.data[FIELD_PARENT_NAME]
         kid_name = call.data[FIELD_KID_NAME]
         reward_name = call.data[FIELD_REWARD_NAME]
@@ -496,7 +589,7 @@ def async_setup_services(hass: HomeAssistant):
         # Check if user is authorized
         user_id = call.context.user_id
         if user_id and not await is_user_authorized_for_global_action(
-            hass, user_id, kid_id
+            hass, user_id, kid_id, entry_id=coordinator.config_entry.entry_id
         ):
             LOGGER.warning("Disapprove Reward: User not authorized")
             raise HomeAssistantError(
@@ -504,10 +597,12 @@ def async_setup_services(hass: HomeAssistant):
             )
 
         # Disapprove the reward
-        coordinator.disapprove_reward(
+        await coordinator.command_queue.async_submit(
+            coordinator.disapprove_reward,
             parent_name=parent_name,
             kid_id=kid_id,
             reward_id=reward_id,
+            redemption_id=call.data.get(FIELD_REDEMPTION_ID),
         )
         LOGGER.info(
             "Reward '%s' disapproved for kid '%s' by parent '%s'",
@@ -515,18 +610,15 @@ def async_setup_services(hass: HomeAssistant):
             kid_name,
             parent_name,
         )
-        await coordinator.async_request_refresh()
+        await coordinator.async_request_refresh_if_needed()
 
     async def handle_apply_penalty(call: ServiceCall):
         """Handle applying a penalty."""
-        entry_id = _get_first_kidschores_entry(hass)
-        if not entry_id:
+        coordinator = _get_coordinator_for_call(hass, call)
+        if not coordinator:
             LOGGER.warning("Apply Penalty: %s", MSG_NO_ENTRY_FOUND)
             return
 
-        coordinator: KidsChoresDataCoordinator = hass.data[DOMAIN][entry_id][
-            "coordinator"
-        ]
         parent_name = call.data[FIELD_PARENT_NAME]
         kid_name = call.data[FIELD_KID_NAME]
         penalty_name = call.data[FIELD_PENALTY_NAME]
@@ -545,7 +637,7 @@ def async_setup_services(hass: HomeAssistant):
         # Check if user is authorized
         user_id = call.context.user_id
         if user_id and not await is_user_authorized_for_global_action(
-            hass, user_id, kid_id
+            hass, user_id, kid_id, entry_id=coordinator.config_entry.entry_id
         ):
             LOGGER.warning("Apply Penalty: User not authorized")
             raise HomeAssistantError(
@@ -554,8 +646,11 @@ def async_setup_services(hass: HomeAssistant):
 
         # Apply penalty
         try:
-            coordinator.apply_penalty(
-                parent_name=parent_name, kid_id=kid_id, penalty_id=penalty_id
+            await coordinator.command_queue.async_submit(
+                coordinator.apply_penalty,
+                parent_name=parent_name,
+                kid_id=kid_id,
+                penalty_id=penalty_id,
             )
             LOGGER.info(
                 "Penalty '%s' applied for kid '%s' by parent '%s'",
@@ -563,7 +658,7 @@ def async_setup_services(hass: HomeAssistant):
                 kid_name,
                 parent_name,
             )
-            await coordinator.async_request_refresh()
+            await coordinator.async_request_refresh_if_needed()
         except HomeAssistantError as e:
             LOGGER.error("Apply Penalty: %s", e)
             raise
@@ -580,15 +675,11 @@ def async_setup_services(hass: HomeAssistant):
 
     async def handle_reset_penalties(call: ServiceCall):
         """Handle resetting penalties."""
-        entry_id = _get_first_kidschores_entry(hass)
-        if not entry_id:
+        coordinator = _get_coordinator_for_call(hass, call)
+        if not coordinator:
             LOGGER.warning("Reset Penalties: %s", MSG_NO_ENTRY_FOUND)
             return
 
-        coordinator: KidsChoresDataCoordinator = hass.data[DOMAIN][entry_id][
-            "coordinator"
-        ]
-
         kid_name = call.data.get(FIELD_KID_NAME)
         penalty_name = call.data.get(FIELD_PENALTY_NAME)
 
@@ -608,7 +699,7 @@ def async_setup_services(hass: HomeAssistant):
         # Check if user is authorized
         user_id = call.context.user_id
         if user_id and not await is_user_authorized_for_global_action(
-            hass, user_id, kid_id
+            hass, user_id, kid_id, entry_id=coordinator.config_entry.entry_id
         ):
             LOGGER.warning("Reset Penalties: User not authorized.")
             raise HomeAssistantError("You are not authorized to reset penalties.")
@@ -624,20 +715,20 @@ def async_setup_services(hass: HomeAssistant):
             LOGGER.info("Resetting penalty '%s' for kid '%s'.", penalty_name, kid_name)
 
         # Reset penalties
-        coordinator.reset_penalties(kid_id=kid_id, penalty_id=penalty_id)
-        await coordinator.async_request_refresh()
+        await coordinator.command_queue.async_submit(
+            coordinator.reset_penalties,
+            kid_id=kid_id,
+            penalty_id=penalty_id,
+        )
+        await coordinator.async_request_refresh_if_needed()
 
     async def handle_reset_bonuses(call: ServiceCall):
         """Handle resetting bonuses."""
-        entry_id = _get_first_kidschores_entry(hass)
-        if not entry_id:
+        coordinator = _get_coordinator_for_call(hass, call)
+        if not coordinator:
             LOGGER.warning("Reset Bonuses: %s", MSG_NO_ENTRY_FOUND)
             return
 
-        coordinator: KidsChoresDataCoordinator = hass.data[DOMAIN][entry_id][
-            "coordinator"
-        ]
-
         kid_name = call.data.get(FIELD_KID_NAME)
         bonus_name = call.data.get(FIELD_BONUS_NAME)
 
@@ -657,7 +748,7 @@ def async_setup_services(hass: HomeAssistant):
         # Check if user is authorized
         user_id = call.context.user_id
         if user_id and not await is_user_authorized_for_global_action(
-            hass, user_id, kid_id
+            hass, user_id, kid_id, entry_id=coordinator.config_entry.entry_id
         ):
             LOGGER.warning("Reset Bonuses: User not authorized.")
             raise HomeAssistantError("You are not authorized to reset bonuses.")
@@ -673,20 +764,20 @@ def async_setup_services(hass: HomeAssistant):
             LOGGER.info("Resetting bonus '%s' for kid '%s'.", bonus_name, kid_name)
 
         # Reset bonuses
-        coordinator.reset_bonuses(kid_id=kid_id, bonus_id=bonus_id)
-        await coordinator.async_request_refresh()
+        await coordinator.command_queue.async_submit(
+            coordinator.reset_bonuses,
+            kid_id=kid_id,
+            bonus_id=bonus_id,
+        )
+        await coordinator.async_request_refresh_if_needed()
 
     async def handle_reset_rewards(call: ServiceCall):
         """Handle resetting rewards counts."""
-        entry_id = _get_first_kidschores_entry(hass)
-        if not entry_id:
+        coordinator = _get_coordinator_for_call(hass, call)
+        if not coordinator:
             LOGGER.warning("Reset Rewards: %s", MSG_NO_ENTRY_FOUND)
             return
 
-        coordinator: KidsChoresDataCoordinator = hass.data[DOMAIN][entry_id][
-            "coordinator"
-        ]
-
         kid_name = call.data.get(FIELD_KID_NAME)
         reward_name = call.data.get(FIELD_REWARD_NAME)
 
@@ -706,7 +797,7 @@ def async_setup_services(hass: HomeAssistant):
         # Check if user is authorized
         user_id = call.context.user_id
         if user_id and not await is_user_authorized_for_global_action(
-            hass, user_id, kid_id
+            hass, user_id, kid_id, entry_id=coordinator.config_entry.entry_id
         ):
             LOGGER.warning("Reset Rewards: User not authorized.")
             raise HomeAssistantError("You are not authorized to reset rewards.")
@@ -722,19 +813,20 @@ def async_setup_services(hass: HomeAssistant):
             LOGGER.info("Resetting reward '%s' for kid '%s'.", reward_name, kid_name)
 
         # Reset rewards
-        coordinator.reset_rewards(kid_id=kid_id, reward_id=reward_id)
-        await coordinator.async_request_refresh()
+        await coordinator.command_queue.async_submit(
+            coordinator.reset_rewards,
+            kid_id=kid_id,
+            reward_id=reward_id,
+        )
+        await coordinator.async_request_refresh_if_needed()
 
     async def handle_apply_bonus(call: ServiceCall):
         """Handle applying a bonus."""
-        entry_id = _get_first_kidschores_entry(hass)
-        if not entry_id:
+        coordinator = _get_coordinator_for_call(hass, call)
+        if not coordinator:
             LOGGER.warning("Apply Bonus: %s", MSG_NO_ENTRY_FOUND)
             return
 
-        coordinator: KidsChoresDataCoordinator = hass.data[DOMAIN][entry_id][
-            "coordinator"
-        ]
         parent_name = call.data[FIELD_PARENT_NAME]
         kid_name = call.data[FIELD_KID_NAME]
         bonus_name = call.data[FIELD_BONUS_NAME]
@@ -753,7 +845,7 @@ def async_setup_services(hass: HomeAssistant):
         # Check if user is authorized
         user_id = call.context.user_id
         if user_id and not await is_user_authorized_for_global_action(
-            hass, user_id, kid_id
+            hass, user_id, kid_id, entry_id=coordinator.config_entry.entry_id
         ):
             LOGGER.warning("Apply Bonus: User not authorized")
             raise HomeAssistantError(
@@ -762,8 +854,11 @@ def async_setup_services(hass: HomeAssistant):
 
         # Apply bonus
         try:
-            coordinator.apply_bonus(
-                parent_name=parent_name, kid_id=kid_id, bonus_id=bonus_id
+            await coordinator.command_queue.async_submit(
+                coordinator.apply_bonus,
+                parent_name=parent_name,
+                kid_id=kid_id,
+                bonus_id=bonus_id,
             )
             LOGGER.info(
                 "Bonus '%s' applied for kid '%s' by parent '%s'",
@@ -771,7 +866,7 @@ def async_setup_services(hass: HomeAssistant):
                 kid_name,
                 parent_name,
             )
-            await coordinator.async_request_refresh()
+            await coordinator.async_request_refresh_if_needed()
         except HomeAssistantError as e:
             LOGGER.error("Apply Bonus: %s", e)
             raise
@@ -788,73 +883,41 @@ def async_setup_services(hass: HomeAssistant):
 
     async def handle_reset_all_data(call: ServiceCall):
         """Handle manually resetting ALL data in KidsChores."""
-        entry_id = _get_first_kidschores_entry(hass)
-        if not entry_id:
-            LOGGER.warning("Reset All Data: No KidsChores entry found")
-            return
-
-        data = hass.data[DOMAIN].get(entry_id)
-        if not data:
-            LOGGER.warning("Reset All Data: No coordinator data found")
+        coordinator = _get_coordinator_for_call(hass, call)
+        if not coordinator:
+            LOGGER.warning("Reset All Data: %s", MSG_NO_ENTRY_FOUND)
             return
 
-        coordinator: KidsChoresDataCoordinator = data["coordinator"]
-
         # Clear everything from storage
         await coordinator.storage_manager.async_clear_data()
 
         # Re-init the coordinator with reload config entry
-        await hass.config_entries.async_reload(entry_id)
+        await hass.config_entries.async_reload(coordinator.config_entry.entry_id)
 
-        coordinator.async_set_updated_data(coordinator._data)
+        coordinator.async_set_updated_data(coordinator.engine.data)
         LOGGER.info("Manually reset all KidsChores data. Integration is now cleared")
 
     async def handle_reset_all_chores(call: ServiceCall):
         """Handle manually resetting all chores to pending, clearing claims/approvals."""
 
-        entry_id = _get_first_kidschores_entry(hass)
-        if not entry_id:
-            LOGGER.warning("Reset All Chores: No KidsChores entry found")
+        coordinator = _get_coordinator_for_call(hass, call)
+        if not coordinator:
+            LOGGER.warning("Reset All Chores: %s", MSG_NO_ENTRY_FOUND)
             return
 
-        data = hass.data[DOMAIN].get(entry_id)
-        if not data:
-            LOGGER.warning("Reset All Chores: No coordinator data found")
-            return
-
-        coordinator: KidsChoresDataCoordinator = data["coordinator"]
-
-        # Loop over all chores, reset them to pending
-        for chore_id, chore_info in coordinator.chores_data.items():
-            chore_info["state"] = CHORE_STATE_PENDING
-
-        # Remove all chore approvals/claims for each kid
-        for kid_id, kid_info in coordinator.kids_data.items():
-            kid_info["claimed_chores"] = []
-            kid_info["approved_chores"] = []
-            kid_info["overdue_chores"] = []
-            kid_info["overdue_notifications"] = {}
-
-        # Clear the pending approvals queue
-        coordinator._data[DATA_PENDING_CHORE_APPROVALS] = []
-
-        # Persist & notify
-        coordinator._persist()
-        coordinator.async_set_updated_data(coordinator._data)
+        await coordinator.command_queue.async_submit(coordinator.reset_all_chores)
         LOGGER.info("Manually reset all chores to pending, removed claims/approvals")
 
+        await coordinator.async_request_refresh_if_needed()
+
     async def handle_reset_overdue_chores(call: ServiceCall) -> None:
         """Handle resetting overdue chores."""
 
-        entry_id = _get_first_kidschores_entry(hass)
-        if not entry_id:
+        coordinator = _get_coordinator_for_call(hass, call)
+        if not coordinator:
             LOGGER.warning("Reset Overdue Chores: %s", MSG_NO_ENTRY_FOUND)
             return
 
-        coordinator: KidsChoresDataCoordinator = hass.data[DOMAIN][entry_id][
-            "coordinator"
-        ]
-
         # Get parameters
         chore_id = call.data.get(FIELD_CHORE_ID)
         chore_name = call.data.get(FIELD_CHORE_NAME)
@@ -877,23 +940,23 @@ def async_setup_services(hass: HomeAssistant):
                 LOGGER.warning("Reset Overdue Chores: Kid '%s' not found", kid_name)
                 raise HomeAssistantError(f"Kid '{kid_name}' not found.")
 
-        coordinator.reset_overdue_chores(chore_id=chore_id, kid_id=kid_id)
+        await coordinator.command_queue.async_submit(
+            coordinator.reset_overdue_chores,
+            chore_id=chore_id,
+            kid_id=kid_id,
+        )
 
         LOGGER.info("Reset overdue chores (chore_id=%s, kid_id=%s)", chore_id, kid_id)
 
-        await coordinator.async_request_refresh()
-        await coordinator._check_overdue_chores()
+        await coordinator.async_request_refresh_if_needed()
 
     async def handle_set_chore_due_date(call: ServiceCall):
         """Handle setting (or clearing) the due date of a chore."""
-        entry_id = _get_first_kidschores_entry(hass)
-        if not entry_id:
+        coordinator = _get_coordinator_for_call(hass, call)
+        if not coordinator:
             LOGGER.warning("Set Chore Due Date: %s", MSG_NO_ENTRY_FOUND)
             return
 
-        coordinator: KidsChoresDataCoordinator = hass.data[DOMAIN][entry_id][
-            "coordinator"
-        ]
         chore_name = call.data[FIELD_CHORE_NAME]
         due_date_input = call.data.get(FIELD_DUE_DATE)
 
@@ -908,7 +971,7 @@ def async_setup_services(hass: HomeAssistant):
                 # Convert the provided date
                 due_date_str = ensure_utc_datetime(hass, due_date_input)
                 due_dt = dt_util.parse_datetime(due_date_str)
-                if due_dt and due_dt < dt_util.utcnow():
+                if due_dt and due_dt < coordinator.now():
                     raise HomeAssistantError("Due date cannot be set in the past.")
 
             except Exception as err:
@@ -918,7 +981,11 @@ def async_setup_services(hass: HomeAssistant):
                 raise HomeAssistantError("Invalid due date provided.")
 
             # Update the chore’s due_date:
-            coordinator.set_chore_due_date(chore_id, due_dt)
+            await coordinator.command_queue.async_submit(
+                coordinator.set_chore_due_date,
+                chore_id=chore_id,
+                due_date=due_dt,
+            )
             LOGGER.info(
                 "Set due date for chore '%s' (ID: %s) to %s",
                 chore_name,
@@ -927,24 +994,24 @@ def async_setup_services(hass: HomeAssistant):
             )
         else:
             # Clear the due date by setting it to None
-            coordinator.set_chore_due_date(chore_id, None)
+            await coordinator.command_queue.async_submit(
+                coordinator.set_chore_due_date,
+                chore_id=chore_id,
+                due_date=None,
+            )
             LOGGER.info(
                 "Cleared due date for chore '%s' (ID: %s)", chore_name, chore_id
             )
 
-        await coordinator.async_request_refresh()
+        await coordinator.async_request_refresh_if_needed()
 
     async def handle_skip_chore_due_date(call: ServiceCall) -> None:
         """Handle skipping the due date on a chore by rescheduling it to the next due date."""
-        entry_id = _get_first_kidschores_entry(hass)
-        if not entry_id:
+        coordinator = _get_coordinator_for_call(hass, call)
+        if not coordinator:
             LOGGER.warning("Skip Chore Due Date: %s", MSG_NO_ENTRY_FOUND)
             return
 
-        coordinator: KidsChoresDataCoordinator = hass.data[DOMAIN][entry_id][
-            "coordinator"
-        ]
-
         # Get parameters: either chore_id or chore_name must be provided.
         chore_id = call.data.get(FIELD_CHORE_ID)
         chore_name = call.data.get(FIELD_CHORE_NAME)
@@ -960,9 +1027,113 @@ def async_setup_services(hass: HomeAssistant):
                 "You must provide either a chore_id or chore_name."
             )
 
-        coordinator.skip_chore_due_date(chore_id)
+        await coordinator.command_queue.async_submit(
+            coordinator.skip_chore_due_date,
+            chore_id=chore_id,
+        )
         LOGGER.info("Skipped due date for chore (chore_id=%s)", chore_id)
-        await coordinator.async_request_refresh()
+        await coordinator.async_request_refresh_if_needed()
+
+    async def handle_get_points_history(call: ServiceCall) -> ServiceResponse:
+        """Handle returning a kid's points history in daily, weekly or monthly buckets."""
+        coordinator = _get_coordinator_for_call(hass, call)
+        if not coordinator:
+            LOGGER.warning("Get Points History: %s", MSG_NO_ENTRY_FOUND)
+            raise HomeAssistantError(MSG_NO_ENTRY_FOUND)
+
+        kid_name = call.data[FIELD_KID_NAME]
+        period = call.data[FIELD_PERIOD]
+
+        kid_id = _get_kid_id_by_name(coordinator, kid_name)
+        if not kid_id:
+            LOGGER.warning("Get Points History: Kid '%s' not found", kid_name)
+            raise HomeAssistantError(f"Kid '{kid_name}' not found")
+
+        # Naive start/end values are taken as local time
+        bounds = {}
+        for field in (FIELD_START, FIELD_END):
+            if call.data.get(field):
+                bounds[field] = dt_util.parse_datetime(
+                    ensure_utc_datetime(hass, call.data[field])
+                )
+
+        buckets = coordinator.get_points_history(
+            kid_id,
+            period,
+            start=bounds.get(FIELD_START),
+            end=bounds.get(FIELD_END),
+        )
+        return {"kid_name": kid_name, "period": period, "buckets": buckets}
+
+    async def handle_get_chore_history(call: ServiceCall) -> ServiceResponse:
+        """Handle returning the days a kid completed a chore, with rate and gaps."""
+        coordinator = _get_coordinator_for_call(hass, call)
+        if not coordinator:
+            LOGGER.warning("Get Chore History: %s", MSG_NO_ENTRY_FOUND)
+            raise HomeAssistantError(MSG_NO_ENTRY_FOUND)
+
+        kid_name = call.data[FIELD_KID_NAME]
+        chore_name = call.data[FIELD_CHORE_NAME]
+
+        kid_id = _get_kid_id_by_name(coordinator, kid_name)
+        if not kid_id:
+            LOGGER.warning("Get Chore History: Kid '%s' not found", kid_name)
+            raise HomeAssistantError(f"Kid '{kid_name}' not found")
+
+        chore_id = _get_chore_id_by_name(coordinator, chore_name)
+        if not chore_id:
+            LOGGER.warning("Get Chore History: Chore '%s' not found", chore_name)
+            raise HomeAssistantError(f"Chore '{chore_name}' not found")
+
+        history = coordinator.get_chore_history(
+            kid_id,
+            chore_id,
+            start=call.data.get(FIELD_START),
+            end=call.data.get(FIELD_END),
+        )
+        return {"kid_name": kid_name, "chore_name": chore_name, **history}
+
+    async def handle_simulate(call: ServiceCall) -> ServiceResponse:
+        """Handle fast-forwarding a copy of the household and reporting each day."""
+        coordinator = _get_coordinator_for_call(hass, call)
+        if not coordinator:
+            LOGGER.warning("Simulate: %s", MSG_NO_ENTRY_FOUND)
+            raise HomeAssistantError(MSG_NO_ENTRY_FOUND)
+
+        # Naive start values are taken as local time
+        start = None
+        if call.data.get(FIELD_START):
+            start = dt_util.parse_datetime(
+                ensure_utc_datetime(hass, call.data[FIELD_START])
+            )
+
+        # The copy is taken here, on the event loop; the days run in an executor
+        return await hass.async_add_executor_job(
+            simulate_household,
+            copy.deepcopy(coordinator.engine.data),
+            call.data[FIELD_DAYS],
+            start or coordinator.now(),
+            call.data[FIELD_COMPLETE_CHORES],
+        )
+
+    async def handle_project(call: ServiceCall) -> ServiceResponse:
+        """Handle projecting points, badge crossings, streaks and challenge outcomes."""
+        coordinator = _get_coordinator_for_call(hass, call)
+        if not coordinator:
+            LOGGER.warning("Project: %s", MSG_NO_ENTRY_FOUND)
+            raise HomeAssistantError(MSG_NO_ENTRY_FOUND)
+
+        kid_ids = None
+        kid_name = call.data.get(FIELD_KID_NAME)
+        if kid_name:
+            kid_id = _get_kid_id_by_name(coordinator, kid_name)
+            if not kid_id:
+                LOGGER.warning("Project: Kid '%s' not found", kid_name)
+                raise HomeAssistantError(ERROR_KID_NOT_FOUND_FMT.format(kid_name))
+            kid_ids = [kid_id]
+
+        # Day-bucket arithmetic, fast enough to run on the event loop
+        return project_household(coordinator.engine, call.data[FIELD_DAYS], kid_ids)
 
     # --- Register Services ---
     hass.services.async_register(
@@ -1055,6 +1226,38 @@ def async_setup_services(hass: HomeAssistant):
         DOMAIN, SERVICE_APPLY_BONUS, handle_apply_bonus, schema=APPLY_BONUS_SCHEMA
     )
 
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_POINTS_HISTORY,
+        handle_get_points_history,
+        schema=GET_POINTS_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_CHORE_HISTORY,
+        handle_get_chore_history,
+        schema=GET_CHORE_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SIMULATE,
+        handle_simulate,
+        schema=SIMULATE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROJECT,
+        handle_project,
+        schema=PROJECT_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
     LOGGER.info("KidsChores services have been registered successfully")
 
 
@@ -1077,6 +1280,10 @@ async def async_unload_services(hass: HomeAssistant):
         SERVICE_RESET_REWARDS,
         SERVICE_SET_CHORE_DUE_DATE,
         SERVICE_SKIP_CHORE_DUE_DATE,
+        SERVICE_GET_POINTS_HISTORY,
+        SERVICE_GET_CHORE_HISTORY,
+        SERVICE_SIMULATE,
+        SERVICE_PROJECT,
     ]
 
     for service in services:
@@ -1086,12 +1293,47 @@ async def async_unload_services(hass: HomeAssistant):
     LOGGER.info("KidsChores services have been unregistered")
 
 
-def _get_first_kidschores_entry(hass: HomeAssistant) -> Optional[str]:
-    """Retrieve the first KidsChores config entry ID."""
-    domain_entries = hass.data.get(DOMAIN)
-    if not domain_entries:
+def _get_coordinator_for_call(
+    hass: HomeAssistant, call: ServiceCall
+) -> Optional[KidsChoresDataCoordinator]:
+    """Return the coordinator of the KidsChores entry a service call targets.
+
+    An explicit config_entry_id wins, then the entry owning a given chore_id. With
+    several entries loaded, the one entry holding the named kid and chore is used.
+    Returns None when no entry is loaded.
+    """
+    router = async_get_entry_router(hass)
+    coordinators = router.coordinators
+    if not coordinators:
         return None
-    return next(iter(domain_entries.keys()), None)
+
+    entry_id = call.data.get(FIELD_CONFIG_ENTRY_ID)
+    if entry_id:
+        coordinator = router.coordinator_for_entry(entry_id)
+        if not coordinator:
+            raise HomeAssistantError(ERROR_ENTRY_NOT_FOUND_FMT.format(entry_id))
+        return coordinator
+
+    chore_id = call.data.get(FIELD_CHORE_ID)
+    if chore_id and (coordinator := router.coordinator_for_id(chore_id)):
+        return coordinator
+
+    if len(coordinators) == 1:
+        return coordinators[0]
+
+    kid_name = call.data.get(FIELD_KID_NAME)
+    chore_name = call.data.get(FIELD_CHORE_NAME)
+    matches = [
+        coordinator
+        for coordinator in coordinators
+        if (not kid_name or _get_kid_id_by_name(coordinator, kid_name))
+        and (not chore_name or _get_chore_id_by_name(coordinator, chore_name))
+    ]
+    if len(matches) > 1:
+        raise HomeAssistantError(ERROR_ENTRY_AMBIGUOUS)
+
+    # When no entry holds the names, the handler reports what was not found
+    return matches[0] if matches else coordinators[0]
 
 
 def _get_kid_id_by_name(
@@ -20,6 +20,7 @@ from .const import (
     DATA_PENALTIES,
     DATA_PENDING_CHORE_APPROVALS,
     DATA_PENDING_REWARD_APPROVALS,
+    DATA_POINTS_LEDGER,
     DATA_REWARDS,
     LOGGER,
     STORAGE_KEY,
@@ -39,6 +40,7 @@ class KidsChoresStorageManager:
         Args:
             hass: Home Assistant core object.
             storage_key: Key to identify storage location (default: STORAGE_KEY).
+                Config entries use storage_key_for_entry to get their own key.
 
         """
         self.hass = hass
@@ -54,6 +56,9 @@ class KidsChoresStorageManager:
         LOGGER.debug("KidsChoresStorageManager: Loading data from storage")
         existing_data = await self._store.async_load()
 
+        if existing_data is None and self._storage_key != STORAGE_KEY:
+            existing_data = await self._async_adopt_legacy_storage()
+
         if existing_data is None:
             # No existing data, create a new default structure.
             LOGGER.info("No existing storage found; initializing new data")
@@ -68,13 +73,32 @@ class KidsChoresStorageManager:
                 DATA_ACHIEVEMENTS: {},  # Dictionary of achievements keyed by internal_id.
                 DATA_CHALLENGES: {},  # Dictionary of challenges keyed by internal_id.
                 DATA_PENDING_CHORE_APPROVALS: [],  # List of pending chore approvals keyed by internal_id.
-                DATA_PENDING_REWARD_APPROVALS: [],  # List of pending rewar approvals keyed by internal_id.
+                DATA_PENDING_REWARD_APPROVALS: {},  # Dictionary of pending reward approvals keyed by redemption_id.
+                DATA_POINTS_LEDGER: {},  # Dictionary of points ledgers keyed by kid internal_id.
             }
         else:
             # Load existing data into memory.
             self._data = existing_data
             LOGGER.info("Storage data loaded successfully")
 
+    async def _async_adopt_legacy_storage(self):
+        """Move data saved under the single-entry STORAGE_KEY to this entry's key.
+
+        Before entries had their own keys only one entry could exist, so the first
+        entry set up without data of its own takes over the legacy store.
+        """
+        legacy_store = Store(self.hass, STORAGE_VERSION, STORAGE_KEY)
+        legacy_data = await legacy_store.async_load()
+        if legacy_data is None:
+            return None
+
+        LOGGER.info(
+            "Moving KidsChores data from '%s' to '%s'", STORAGE_KEY, self._storage_key
+        )
+        await self._store.async_save(legacy_data)
+        await legacy_store.async_remove()
+        return legacy_data
+
     @property
     def data(self):
         """Retrieve the in-memory data cache."""
@@ -88,6 +112,11 @@ class KidsChoresStorageManager:
         """Replace the entire in-memory data structure."""
         self._data = new_data
 
+    def save(self, new_data: dict):
+        """Replace the data and schedule a save; the engine's storage adapter."""
+        self.set_data(new_data)
+        self.hass.add_job(self.async_save)
+
     def get_kids(self):
         """Retrieve the kids data."""
         return self._data.get(DATA_KIDS, {})
@@ -130,7 +159,7 @@ class KidsChoresStorageManager:
 
     def get_pending_reward_aprovals(self):
         """Retrieve the pending reward approvals data."""
-        return self._data.get(DATA_PENDING_REWARD_APPROVALS, [])
+        return self._data.get(DATA_PENDING_REWARD_APPROVALS, {})
 
     async def link_user_to_kid(self, user_id, kid_id):
         """Link a Home Assistant user ID to a specific kid by internal_id."""
@@ -174,8 +203,9 @@ class KidsChoresStorageManager:
             DATA_BONUSES: {},
             DATA_ACHIEVEMENTS: {},
             DATA_CHALLENGES: {},
-            DATA_PENDING_REWARD_APPROVALS: [],
+            DATA_PENDING_REWARD_APPROVALS: {},
             DATA_PENDING_CHORE_APPROVALS: [],
+            DATA_POINTS_LEDGER: {},
         }
         await self.async_save()
 
@@ -204,3 +234,8 @@ class KidsChoresStorageManager:
             await self.async_save()
         else:
             LOGGER.warning("Attempted to update unknown data key: %s", key)
+
+
+def storage_key_for_entry(entry_id: str) -> str:
+    """Return the storage key of a config entry's data."""
+    return f"{STORAGE_KEY}_{entry_id}"